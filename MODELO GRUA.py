@@ -1,9 +1,15 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# Tablas de carga de grúas (pluma × radio → capacidad) del paquete modulos
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Python Coursera'))
+from modulos.tablas_carga import catalogo_gruas
+
 # Función auxiliar para convertir grados a radianes
 def to_radians(angle):
     """Convierte un ángulo de grados a radianes."""
@@ -100,7 +106,9 @@ class LiftingPlanApp(tk.Tk):
         Todas las unidades se manejan internamente en kg, m, kPa para consistencia.
         """
         self.load_weight_var = tk.DoubleVar(value=10000) # Peso de la carga en kg
-        self.crane_capacity_var = tk.DoubleVar(value=20000) # Capacidad nominal de la grúa en kg
+        self.crane_catalog = catalogo_gruas() # Tablas de carga por grúa y configuración
+        self.crane_chart_options = [f"{grua} | {configuracion}" for grua, configuracion in self.crane_catalog.tablas]
+        self.crane_chart_var = tk.StringVar(value="TT-100 | contrapeso completo") # Grúa y configuración de la tabla de carga
         self.boom_length_var = tk.DoubleVar(value=30) # Longitud de la pluma en metros (m)
         self.radius_var = tk.DoubleVar(value=15) # Radio de operación en metros (m)
         self.sling_angle_horizontal_var = tk.DoubleVar(value=60) # Ángulo de la eslinga con la horizontal en grados (°)
@@ -120,7 +128,7 @@ class LiftingPlanApp(tk.Tk):
         self.derated_crane_capacity_str = tk.StringVar(value="0.00 kg") # Capacidad derateada de la grúa en kg
 
         # Registrar callbacks para que los cálculos se actualicen automáticamente al cambiar los inputs
-        for var in [self.load_weight_var, self.crane_capacity_var, self.boom_length_var, 
+        for var in [self.load_weight_var, self.crane_chart_var, self.boom_length_var, 
                     self.radius_var, self.sling_angle_horizontal_var, self.num_sling_legs_var,
                     self.outrigger_pad_length_var, self.outrigger_pad_width_var,
                     self.ground_bearing_capacity_var, self.crane_weight_var, self.safety_factor_var]:
@@ -335,7 +343,7 @@ Importancia de las Normas:
         # Definición de los campos de entrada con sus etiquetas, variables y tipos de widget
         input_fields = [
             ("Peso de la Carga (kg):", self.load_weight_var),
-            ("Capacidad Nominal Grúa (kg):", self.crane_capacity_var),
+            ("Grúa (tabla de carga):", self.crane_chart_var, self.crane_chart_options, "combobox"),
             ("Factor de Seguridad Izaje:", self.safety_factor_var), 
             ("Longitud de la Pluma (m):", self.boom_length_var),
             ("Radio de Operación (m):", self.radius_var),
@@ -365,7 +373,8 @@ Importancia de las Normas:
                 ttk.Label(scale_val_frame, textvariable=var, width=5).pack(side=tk.LEFT, padx=(5,0))
             elif len(item) > 3 and item[3] == "combobox": # Si es un combobox
                 options = item[2]
-                combo = ttk.Combobox(row_frame, textvariable=var, values=options, state="readonly", width=10)
+                combo = ttk.Combobox(row_frame, textvariable=var, values=options, state="readonly",
+                                     width=max(10, max(len(str(o)) for o in options)))
                 combo.pack(side=tk.LEFT, padx=5)
             else: # Si es un campo de entrada de texto normal
                 entry = ttk.Entry(row_frame, textvariable=var, width=15)
@@ -451,7 +460,7 @@ Importancia de las Normas:
         try:
             # Obtener valores de las variables de entrada
             load_w = self.load_weight_var.get() # kg
-            crane_cap = self.crane_capacity_var.get() # kg
+            crane, configuration = self.crane_chart_var.get().split(" | ")
             boom_l = self.boom_length_var.get() # m
             rad = self.radius_var.get() # m
             sling_angle_h = self.sling_angle_horizontal_var.get() # grados
@@ -466,10 +475,13 @@ Importancia de las Normas:
             if safety_f <= 0: safety_f = 1.0 
 
             # --- Cálculo de Capacidad de Grúa Derateada ---
-            # La capacidad derateada es la capacidad nominal dividida por el factor de seguridad.
+            # La capacidad de tabla depende de la longitud de pluma y del radio: se lee de la tabla de carga
+            # de forma conservadora (el menor valor de los puntos tabulados vecinos, 0 fuera de la tabla).
+            crane_cap = float(self.crane_catalog.capacidad(crane, configuration, boom_l, rad)) * 1000 # t -> kg
+            # La capacidad derateada es la capacidad de tabla dividida por el factor de seguridad.
             # Esto asegura que la grúa no se opere al 100% de su capacidad teórica, añadiendo un margen de seguridad.
             derated_crane_capacity = crane_cap / safety_f if crane_cap > 0 and safety_f > 0 else 0
-            self.derated_crane_capacity_str.set(f"{derated_crane_capacity:.2f} kg")
+            self.derated_crane_capacity_str.set(f"{derated_crane_capacity:.2f} kg (tabla: {crane_cap:.0f} kg a {rad:.1f} m)")
 
             # --- Cálculo del Porcentaje de Capacidad de Grúa Utilizada ---
             # Indica qué tan cerca está el peso de la carga de la capacidad derateada de la grúa.
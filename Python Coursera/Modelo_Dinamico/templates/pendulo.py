@@ -1,5 +1,10 @@
 
 from vpython import *
+import os
+import sys
+import queue
+import threading
+import numpy as np
 
 # Péndulo Doble - Versión Didáctica Mejorada y Corregida
 
@@ -7,6 +12,11 @@ from vpython import *
 # Las variables son el ángulo de la barra superior (theta1) y el ángulo de la
 # barra inferior (theta2), medidos desde la vertical.
 
+# La física se integra en un hilo aparte con el integrador simpléctico de
+# Yoshida (modulos/integradores.py); el bucle de vpython sólo dibuja.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from modulos.integradores import PenduloDoble, paso_yoshida4
+
 scene.width = 800
 scene.height = 600
 scene.range = 1.8
@@ -17,9 +27,15 @@ scene.caption = "\n<b>Controles de la Simulación:</b>\n"
 
 g = 9.8
 run = False  # La simulación comienza pausada
-dt = 2e-5    # Paso de tiempo: debe ser pequeño para estabilidad
+dt = 2e-3    # Paso de tiempo: el integrador simpléctico mantiene acotada la energía
+fps = 60     # Cuadros por segundo de la animación
 t = 0        # Tiempo de la simulación
 
+# Estados calculados por el hilo de física y consumidos por el bucle de dibujo
+estados = queue.Queue(maxsize=2*fps)
+hilo_fisica = None
+detener_fisica = threading.Event()
+
 # Variables para los objetos del péndulo (se declaran como None inicialmente)
 pedestal, base, axle1, bar1, bar1b, axle2, bar2 = (None,) * 7
 pendulum_objects = [] # Lista para contener todos los objetos y borrarlos fácilmente
@@ -70,6 +86,7 @@ def reset_simulation():
     p2 = 0
     
     crear_pendulo_visual()
+    iniciar_hilo_fisica()
     
     # Reiniciar gráficos (con la corrección del error)
     if energy_graph is not None:
@@ -148,36 +165,50 @@ def reset_graphs():
 
 # --- Funciones de Física y Actualización ---
 
+def integrar_en_segundo_plano(modelo, q, p, detener):
+    """Hilo de física: avanza el péndulo y publica un estado por cuadro."""
+    pasos_por_cuadro = max(1, round(1 / (fps * dt)))
+    t_hilo = 0.0
+    while not detener.is_set():
+        for _ in range(pasos_por_cuadro):
+            q, p = paso_yoshida4(modelo, q, p, dt)
+        t_hilo += pasos_por_cuadro * dt
+        estado = (t_hilo, q, modelo.velocidades(q, p), modelo.energias(q, p))
+        while not detener.is_set():
+            try:
+                estados.put(estado, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+def iniciar_hilo_fisica():
+    """Detiene el hilo anterior y arranca uno nuevo con los parámetros actuales."""
+    global hilo_fisica, detener_fisica
+    if hilo_fisica is not None:
+        detener_fisica.set()
+        hilo_fisica.join()
+    while not estados.empty():
+        estados.get_nowait()
+    
+    modelo = PenduloDoble(M1, M2, L1, L2, g)
+    q = np.array([theta1, theta2])
+    p = np.array([p1, p2], dtype=float)
+    detener_fisica = threading.Event()
+    hilo_fisica = threading.Thread(target=integrar_en_segundo_plano,
+                                   args=(modelo, q, p, detener_fisica), daemon=True)
+    hilo_fisica.start()
+
 def actualizar_fisica():
-    """Calcula un paso de la simulación física."""
-    global p1, p2, thetadot1, thetadot2, theta1, theta2
-    
-    # Ecuaciones de movimiento (Mecánica Lagrangiana)
-    I1 = (1/12) * M1 * L1**2
-    I2 = (1/12) * M2 * L2**2
-
-    # Actualizar momentos generalizados (p1, p2)
-    dp1_dt = -(1/2)*M2*L1*L2*thetadot1*thetadot2*sin(theta1-theta2) - ((1/2)*M1+M2)*g*L1*sin(theta1)
-    dp2_dt = (1/2)*M2*L1*L2*thetadot1*thetadot2*sin(theta1-theta2) - (1/2)*M2*g*L2*sin(theta2)
-    p1 += dp1_dt * dt
-    p2 += dp2_dt * dt
-    
-    # Calcular velocidades angulares (thetadot1, thetadot2)
-    den = 4*(M1+3*M2) - 9*M2*(cos(theta1-theta2))**2
-    thetadot1 = (6/(L1**2))*(2*p1 - 3*(L1/L2)*cos(theta1-theta2)*p2) / den
-    thetadot2 = (6/(M2*L2**2))*(2*p2*(M1+3*M2) - 3*M2*(L2/L1)*cos(theta1-theta2)*p1) / den
+    """Toma el siguiente estado calculado por el hilo de física."""
+    global t, thetadot1, thetadot2, theta1, theta2, energias
     
-    # Actualizar ángulos
-    theta1 += thetadot1 * dt
-    theta2 += thetadot2 * dt
+    t, q, w, energias = estados.get()
+    theta1, theta2 = q
+    thetadot1, thetadot2 = w
 
 def actualizar_visuales_y_graficos():
     """Actualiza la posición de los objetos 3D y los gráficos."""
     
-    # Guardar posiciones anteriores para calcular energía cinética
-    pos1_old = vec(bar1.pos)
-    pos2_old = vec(bar2.pos)
-
     # Actualizar posiciones y orientaciones
     pivot1 = vec(axle1.pos.x, axle1.pos.y, 0)
     bar1.axis = L1 * vec(sin(theta1), -cos(theta1), 0)
@@ -190,17 +221,11 @@ def actualizar_visuales_y_graficos():
     bar2.axis = L2 * vec(sin(theta2), -cos(theta2), 0)
     bar2.pos = pivot2 + bar2.axis / 2
     
-    # Calcular energías
-    I1 = (1/12) * M1 * L1**2
-    I2 = (1/12) * M2 * L2**2
-    
-    v1 = (bar1.pos - pos1_old) / dt
-    v2 = (bar2.pos - pos2_old) / dt
-    
-    K_trans = 0.5 * M1 * mag2(v1) + 0.5 * M2 * mag2(v2)
-    K_rot = 0.5 * I1 * thetadot1**2 + 0.5 * I2 * thetadot2**2
-    U_grav = M1 * g * bar1.pos.y + M2 * g * bar2.pos.y
-    E_total = K_trans + K_rot + U_grav
+    # Energías exactas a partir del estado hamiltoniano
+    K_trans = energias['K_trans']
+    K_rot = energias['K_rot']
+    U_grav = energias['U']
+    E_total = energias['total']
     
     # Graficar energías
     E_total_curve.plot(t, E_total)
@@ -213,11 +238,9 @@ def actualizar_visuales_y_graficos():
 reset_simulation() # Crear la configuración inicial
 
 while True:
-    rate(1 / dt)
+    rate(fps)
     if not run:
         continue  # Si está en pausa, no hacer nada
 
     actualizar_fisica()
-    actualizar_visuales_y_graficos()
-    
-    t += dt
\ No newline at end of file
+    actualizar_visuales_y_graficos()
\ No newline at end of file
@@ -2,10 +2,12 @@
 # Módulo: MODELO_GRUA.py
 # Propósito: Aplicación GUI para estudio y simulación de planes de izaje seguro con grúas
 # Aplicación: Ingeniería Mecánica / Seguridad Industrial
-# Dependencias: tkinter, numpy, matplotlib
+# Dependencias: tkinter, numpy, matplotlib, modulos.tablas_carga
 # Uso: Ejecutar el script para abrir la aplicación de simulación de grúas
 # -----------------------------------------------------------------------------
 
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import numpy as np
@@ -15,6 +17,10 @@ from matplotlib.figure import Figure
 import pandas as pd
 from datetime import datetime
 
+# Las capacidades salen de las tablas de carga del paquete modulos (raíz del curso)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from modulos.tablas_carga import catalogo_gruas
+
 class SimuladorGrua:
     """
     Aplicación GUI para simulación de operaciones de grúa
@@ -26,7 +32,10 @@ class SimuladorGrua:
         self.root.geometry("1400x900")
         
         # Variables de control
-        self.capacidad_grua = tk.DoubleVar(value=50)  # toneladas
+        self.catalogo = catalogo_gruas()
+        self.modelo_grua = tk.StringVar(value="OR-250")
+        self.configuracion_grua = tk.StringVar(value="contrapeso completo")
+        self.capacidad_grua = tk.DoubleVar(value=50)  # toneladas (nominal de la tabla)
         self.peso_carga = tk.DoubleVar(value=30)      # toneladas
         self.radio_izaje = tk.DoubleVar(value=20)     # metros
         self.altura_izaje = tk.DoubleVar(value=15)    # metros
@@ -103,21 +112,46 @@ class SimuladorGrua:
         grua_frame = ttk.LabelFrame(parent, text="Especificaciones de la Grúa", padding="10")
         grua_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Capacidad de la grúa
-        ttk.Label(grua_frame, text="Capacidad Máxima (ton):").grid(row=0, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(grua_frame, textvariable=self.capacidad_grua, width=15).grid(row=0, column=1, pady=2)
+        # Grúa y configuración (tabla de carga)
+        ttk.Label(grua_frame, text="Grúa (tabla de carga):").grid(row=0, column=0, sticky=tk.W, pady=2)
+        combo_grua = ttk.Combobox(grua_frame, textvariable=self.modelo_grua, values=self.catalogo.gruas,
+                                  state="readonly", width=20)
+        combo_grua.grid(row=0, column=1, pady=2)
+        combo_grua.bind("<<ComboboxSelected>>", self.actualizar_grua)
+        
+        ttk.Label(grua_frame, text="Configuración:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        self.combo_configuracion = ttk.Combobox(grua_frame, textvariable=self.configuracion_grua,
+                                                state="readonly", width=20)
+        self.combo_configuracion.grid(row=1, column=1, pady=2)
+        self.combo_configuracion.bind("<<ComboboxSelected>>", self.actualizar_grua)
+        
+        # Capacidad nominal de la tabla seleccionada
+        ttk.Label(grua_frame, text="Capacidad Nominal (ton):").grid(row=2, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(grua_frame, textvariable=self.capacidad_grua, width=15, state="readonly").grid(row=2, column=1, pady=2)
         
         # Radio de izaje
-        ttk.Label(grua_frame, text="Radio de Izaje (m):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(grua_frame, textvariable=self.radio_izaje, width=15).grid(row=1, column=1, pady=2)
+        ttk.Label(grua_frame, text="Radio de Izaje (m):").grid(row=3, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(grua_frame, textvariable=self.radio_izaje, width=15).grid(row=3, column=1, pady=2)
         
         # Altura de izaje
-        ttk.Label(grua_frame, text="Altura de Izaje (m):").grid(row=2, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(grua_frame, textvariable=self.altura_izaje, width=15).grid(row=2, column=1, pady=2)
+        ttk.Label(grua_frame, text="Altura de Izaje (m):").grid(row=4, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(grua_frame, textvariable=self.altura_izaje, width=15).grid(row=4, column=1, pady=2)
         
         # Ángulo de la pluma
-        ttk.Label(grua_frame, text="Ángulo de Pluma (°):").grid(row=3, column=0, sticky=tk.W, pady=2)
-        ttk.Entry(grua_frame, textvariable=self.angulo_pluma, width=15).grid(row=3, column=1, pady=2)
+        ttk.Label(grua_frame, text="Ángulo de Pluma (°):").grid(row=5, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(grua_frame, textvariable=self.angulo_pluma, width=15).grid(row=5, column=1, pady=2)
+        
+        self.actualizar_grua()
+        
+    def actualizar_grua(self, *args):
+        """
+        Actualiza configuraciones y capacidad nominal al cambiar de grúa
+        """
+        configuraciones = self.catalogo.configuraciones(self.modelo_grua.get())
+        self.combo_configuracion['values'] = configuraciones
+        if self.configuracion_grua.get() not in configuraciones:
+            self.configuracion_grua.set(configuraciones[0])
+        self.capacidad_grua.set(self.tabla_carga().nominal)
         
     def crear_controles_carga(self, parent):
         """
@@ -196,21 +230,24 @@ class SimuladorGrua:
         ttk.Label(results_inner, textvariable=self.resultado_recomendaciones, font=('Arial', 9), 
                  wraplength=800).grid(row=1, column=1, columnspan=3, sticky=tk.W, pady=(5, 0))
         
+    def tabla_carga(self):
+        """
+        Tabla de carga de la grúa y configuración seleccionadas
+        """
+        return self.catalogo.tabla(self.modelo_grua.get(), self.configuracion_grua.get())
+    
+    def calcular_longitud_pluma(self):
+        """
+        Longitud de pluma que ubica la punta sobre la carga: L = R / cos(ángulo)
+        """
+        return self.radio_izaje.get() / np.cos(np.radians(self.angulo_pluma.get()))
+    
     def calcular_capacidad_efectiva(self):
         """
         Calcula la capacidad efectiva de la grúa según el radio
         """
-        capacidad_max = self.capacidad_grua.get()
-        radio = self.radio_izaje.get()
-        
-        # Curva de capacidad típica (simplificada)
-        # Capacidad disminuye con el radio
-        radio_max = 30  # Radio máximo típico
-        factor_radio = max(0.3, 1 - (radio / radio_max) ** 1.5)
-        
-        capacidad_efectiva = capacidad_max * factor_radio
-        
-        return capacidad_efectiva
+        # Lectura conservadora de la tabla de carga (0 fuera de la tabla)
+        return float(self.tabla_carga().capacidad(self.calcular_longitud_pluma(), self.radio_izaje.get()))
     
     def calcular_factores_ambientales(self):
         """
@@ -265,7 +302,13 @@ class SimuladorGrua:
             
             # Análisis de seguridad
             margen_seguridad = capacidad_disponible - peso_carga
-            porcentaje_uso = (peso_carga / capacidad_disponible) * 100
+            porcentaje_uso = (peso_carga / capacidad_disponible) * 100 if capacidad_disponible > 0 else float('inf')
+            
+            # Radios tabulados en los que la carga es admisible con la pluma actual
+            radios = self.tabla_carga().radios
+            trayectoria = self.catalogo.verificar_trayectoria(
+                self.modelo_grua.get(), self.configuracion_grua.get(), self.calcular_longitud_pluma(),
+                radios, peso_carga, factor=factor_seguridad / factor_ambiental)
             
             # Actualizar resultados
             if margen_seguridad > 0:
@@ -277,6 +320,11 @@ class SimuladorGrua:
             
             # Generar recomendaciones
             recomendaciones = []
+            if capacidad_efectiva == 0:
+                recomendaciones.append("Radio o longitud de pluma fuera de la tabla de carga")
+            elif trayectoria['ok'].any():
+                radio_admisible = radios[trayectoria['ok']].max()
+                recomendaciones.append(f"Radio máximo admisible con esta pluma: {radio_admisible:.1f} m")
             if porcentaje_uso > 90:
                 recomendaciones.append("ALERTA: Operación en límite de capacidad")
             if porcentaje_uso > 80:
@@ -362,13 +410,14 @@ class SimuladorGrua:
         """
         Dibuja la curva de capacidad de la grúa
         """
-        radios = np.linspace(5, 35, 50)
-        capacidad_max = self.capacidad_grua.get()
+        tabla = self.tabla_carga()
+        longitud = self.calcular_longitud_pluma()
+        radios = np.linspace(tabla.radios[0], tabla.radios[-1], 400)
         
-        # Curva de capacidad
-        capacidades = capacidad_max * np.maximum(0.3, 1 - (radios / 30) ** 1.5)
+        # Curva de capacidad de la tabla para la pluma actual (escalones conservadores)
+        capacidades = tabla.capacidad(longitud, radios)
         
-        ax.plot(radios, capacidades, 'b-', linewidth=2, label='Capacidad Máxima')
+        ax.plot(radios, capacidades, 'b-', linewidth=2, label=f'Tabla de carga (pluma {longitud:.1f} m)')
         
         # Punto de operación actual
         radio_actual = self.radio_izaje.get()
@@ -482,7 +531,9 @@ REPORTE DE OPERACIÓN DE GRÚA
 Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ESPECIFICACIONES DE LA GRÚA:
-- Capacidad máxima: {self.capacidad_grua.get()} ton
+- Grúa: {self.modelo_grua.get()} ({self.configuracion_grua.get()})
+- Capacidad nominal: {self.capacidad_grua.get()} ton
+- Longitud de pluma: {self.calcular_longitud_pluma():.1f} m
 - Radio de izaje: {self.radio_izaje.get()} m
 - Altura de izaje: {self.altura_izaje.get()} m
 - Ángulo de pluma: {self.angulo_pluma.get()}°
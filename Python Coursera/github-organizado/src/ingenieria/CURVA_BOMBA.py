@@ -242,13 +242,11 @@ class SimuladorCurvaBomba:
                 Q_op = caudal_op.get()
                 Q, H, eta, P_eje, P_hidraulica = self.calcular_curvas()
                 
-                # Encontrar valores en el punto de operación
-                idx_op = np.argmin(np.abs(Q - Q_op))
-                
                 if Q_op <= Q[-1]:
-                    H_op = H[idx_op]
-                    eta_op = eta[idx_op]
-                    P_op = P_eje[idx_op]
+                    # Valores interpolados en el caudal exacto de operación
+                    H_op = np.interp(Q_op, Q, H)
+                    eta_op = np.interp(Q_op, Q, eta)
+                    P_op = np.interp(Q_op, Q, P_eje)
                     
                     resultado = f"""
                     PUNTO DE OPERACIÓN:
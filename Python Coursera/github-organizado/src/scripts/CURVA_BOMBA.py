@@ -80,12 +80,22 @@ def calcular_punto_operacion(curva_bomba, curva_sistema):
     f_sistema = interp1d(caudales_sistema, alturas_sistema, bounds_error=False, fill_value='extrapolate')
     alturas_sistema_interp = f_sistema(caudales_bomba)
     
-    # Encontrar punto de intersección
-    diferencia = np.abs(alturas_bomba - alturas_sistema_interp)
-    idx_intersection = np.argmin(diferencia)
-    
-    caudal_op = caudales_bomba[idx_intersection]
-    altura_op = alturas_bomba[idx_intersection]
+    # Intersección exacta de las curvas lineales a tramos: cambio de signo
+    # de la diferencia, interpolado dentro del tramo
+    diferencia = alturas_bomba - alturas_sistema_interp
+    cambios = np.flatnonzero(np.sign(diferencia[:-1]) * np.sign(diferencia[1:]) <= 0)
+    
+    if len(cambios) == 0:
+        # Sin intersección en el rango: se mantiene el punto más cercano
+        idx_intersection = np.argmin(np.abs(diferencia))
+        return caudales_bomba[idx_intersection], alturas_bomba[idx_intersection]
+    
+    # Con varias intersecciones se toma la de mayor caudal (la estable)
+    i = cambios[-1]
+    d0, d1 = diferencia[i], diferencia[i + 1]
+    fraccion = d0 / (d0 - d1) if d0 != d1 else 0.0
+    caudal_op = caudales_bomba[i] + fraccion * (caudales_bomba[i + 1] - caudales_bomba[i])
+    altura_op = alturas_bomba[i] + fraccion * (alturas_bomba[i + 1] - alturas_bomba[i])
     
     return caudal_op, altura_op
 
@@ -0,0 +1,218 @@
+# =============================================================================
+# MÓDULO DE AJUSTE ROBUSTO DE CURVAS DE BOMBA EN LOTE
+# =============================================================================
+# Propósito: Ajustar curvas polinómicas de altura, eficiencia y NPSHr a los
+#            puntos de banco de pruebas de cientos de bombas a la vez, como
+#            mínimos cuadrados lineales apilados con pesos de Huber (IRLS) para
+#            descartar lecturas atípicas, con bandas de confianza por bomba
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Los coeficientes se devuelven de mayor a menor grado (convención de
+# np.polyfit), listos para punto_operacion, ModeloBomba o RedTuberias.
+# Los puntos medidos a otra velocidad se llevan a la velocidad nominal con
+# las leyes de afinidad antes del ajuste (Q·n₀/n, H·(n₀/n)², NPSHr·(n₀/n)²),
+# de modo que todas las velocidades restringen una misma curva.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from typing import Dict, Optional
+
+HUBER_K = 1.345   # Constante de Huber (95 % de eficiencia con errores normales)
+
+EXPONENTE_AFINIDAD = {'altura': 2, 'eficiencia': 0, 'npshr': 2}
+
+
+def _agrupar(grupos):
+    """Índices para pasar de filas a un arreglo relleno (G, n_max)."""
+    etiquetas, codigos = np.unique(np.asarray(grupos), return_inverse=True)
+    conteo = np.bincount(codigos, minlength=len(etiquetas))
+    orden = np.argsort(codigos, kind='stable')
+    inicio = np.concatenate([[0], np.cumsum(conteo)[:-1]])
+    posicion = np.empty(len(codigos), dtype=int)
+    posicion[orden] = np.arange(len(codigos)) - inicio[codigos[orden]]
+    return etiquetas, codigos, posicion, conteo
+
+
+def ajustar_polinomios(x, y, grado: int = 2, grupos=None, huber: Optional[float] = HUBER_K,
+                       tol: float = 1e-10, max_iter: int = 50) -> Dict[str, np.ndarray]:
+    """
+    Ajuste polinómico robusto de muchos conjuntos de puntos en una sola solución.
+
+    Los puntos de cada grupo se acomodan en un arreglo relleno (G, n_max) y
+    se resuelven todos los mínimos cuadrados ponderados con una QR apilada.
+    Con huber se itera IRLS: escala robusta MAD de cada grupo y pesos
+    w = min(1, k·s/|r|). Los valores NaN se ignoran.
+
+    Args:
+        x: Variable independiente (n,), normalmente el caudal
+        y: Variable dependiente (n,)
+        grado: Grado del polinomio
+        grupos: Etiqueta de grupo de cada punto (n,); None para un solo grupo
+        huber: Constante de Huber; None para mínimos cuadrados ordinarios
+        tol: Tolerancia relativa en los coeficientes
+        max_iter: Iteraciones IRLS máximas
+
+    Returns:
+        Dict con grupos (G,), coeficientes (G, grado+1), sigma (G,),
+        gdl (G,) grados de libertad, r2 (G,), pesos (n,) finales de cada
+        punto, y los datos internos escala, covarianza_escalada (para
+        banda_confianza)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    grupos = np.zeros(len(x), dtype=int) if grupos is None else np.asarray(grupos)
+    etiquetas, codigos, posicion, _ = _agrupar(grupos)
+    G, p = len(etiquetas), grado + 1
+
+    valido = np.isfinite(x) & np.isfinite(y)
+    n_validos = np.bincount(codigos[valido], minlength=G)
+    if np.any(n_validos <= p):
+        faltan = etiquetas[n_validos <= p][:5].tolist()
+        raise ValueError(f"Grupos con {p} puntos o menos para un polinomio de grado {grado}: {faltan}")
+
+    n_max = posicion.max() + 1
+    X = np.zeros((G, n_max))
+    Y = np.zeros((G, n_max))
+    M = np.zeros((G, n_max))
+    X[codigos[valido], posicion[valido]] = x[valido]
+    Y[codigos[valido], posicion[valido]] = y[valido]
+    M[codigos[valido], posicion[valido]] = 1.0
+
+    # Escala de x por grupo para que la matriz de Vandermonde esté bien condicionada
+    escala = np.max(np.abs(X), axis=1)
+    escala = np.where(escala > 0, escala, 1.0)
+    V = (X / escala[:, None])[..., None] ** np.arange(grado, -1, -1)   # (G, n_max, p)
+
+    w = M.copy()
+    beta = np.zeros((G, p))
+    for _ in range(max_iter if huber else 1):
+        raiz = np.sqrt(w)[..., None]
+        Q, R = np.linalg.qr(V * raiz)
+        nuevo = np.linalg.solve(R, np.swapaxes(Q, -1, -2) @ (Y[..., None] * raiz))[..., 0]
+        cambio = np.max(np.abs(nuevo - beta) / (np.abs(nuevo).max(axis=1, keepdims=True) + 1e-300))
+        beta = nuevo
+        if not huber:
+            break
+        r = Y - (V @ beta[..., None])[..., 0]
+        r_nan = np.where(M > 0, np.abs(r), np.nan)
+        s = np.nanmedian(r_nan, axis=1) / 0.6745
+        s = np.where(s > 0, s, np.nanmax(r_nan, axis=1) + 1e-300)
+        with np.errstate(divide='ignore'):
+            w = M * np.minimum(1.0, huber * s[:, None] / np.abs(r))
+        if cambio <= tol:
+            break
+
+    # Varianza residual ponderada y covarianza en la escala interna
+    r = Y - (V @ beta[..., None])[..., 0]
+    gdl = np.sum(w, axis=1) - p
+    sigma2 = np.sum(w * r**2, axis=1) / gdl
+    R_inv = np.linalg.inv(R)
+    covarianza = sigma2[:, None, None] * (R_inv @ np.swapaxes(R_inv, -1, -2))
+
+    media = np.sum(M * Y, axis=1) / n_validos
+    ss_tot = np.sum(M * (Y - media[:, None])**2, axis=1)
+    r2 = 1 - np.sum(M * r**2, axis=1) / np.where(ss_tot > 0, ss_tot, 1.0)
+
+    pesos = np.full(len(x), np.nan)
+    pesos[valido] = w[codigos[valido], posicion[valido]]
+    return {
+        'grupos': etiquetas,
+        'coeficientes': beta / escala[:, None] ** np.arange(grado, -1, -1),
+        'sigma': np.sqrt(sigma2),
+        'gdl': gdl,
+        'r2': r2,
+        'pesos': pesos,
+        'escala': escala,
+        'covarianza_escalada': covarianza,
+    }
+
+
+def banda_confianza(ajuste: Dict[str, np.ndarray], x, nivel: float = 0.95,
+                    prediccion: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Curva ajustada y banda de confianza de cada grupo.
+
+    Args:
+        ajuste: Resultado de ajustar_polinomios
+        x: Puntos de evaluación (m,) comunes o (G, m) por grupo
+        nivel: Nivel de confianza
+        prediccion: Si es True, banda de predicción de una nueva lectura
+            (suma la varianza residual) en lugar de la banda de la media
+
+    Returns:
+        Dict con valor, inferior y superior (G, m)
+    """
+    escala = ajuste['escala']
+    G, p = ajuste['coeficientes'].shape
+    x = np.broadcast_to(np.asarray(x, dtype=float), (G,) + np.shape(x)[-1:])
+    V = (x / escala[:, None])[..., None] ** np.arange(p - 1, -1, -1)      # (G, m, p)
+    valor = np.einsum('gmp,gp->gm', x[..., None] ** np.arange(p - 1, -1, -1),
+                      ajuste['coeficientes'])
+    varianza = np.einsum('gmp,gpq,gmq->gm', V, ajuste['covarianza_escalada'], V)
+    if prediccion:
+        varianza = varianza + ajuste['sigma'][:, None]**2
+    t = stats.t.ppf(0.5 + nivel / 2, ajuste['gdl'])[:, None]
+    semi = t * np.sqrt(np.maximum(varianza, 0.0))
+    return {'valor': valor, 'inferior': valor - semi, 'superior': valor + semi}
+
+
+def ajustar_banco_pruebas(datos: pd.DataFrame, columna_bomba: str = 'bomba',
+                          columna_caudal: str = 'caudal',
+                          columnas: Optional[Dict[str, str]] = None,
+                          grados: Optional[Dict[str, int]] = None,
+                          columna_velocidad: Optional[str] = None,
+                          velocidad_nominal=None,
+                          huber: Optional[float] = HUBER_K) -> Dict[str, Dict]:
+    """
+    Ajusta altura, eficiencia y NPSHr de todas las bombas de un banco de pruebas.
+
+    Args:
+        datos: Una fila por punto medido
+        columna_bomba: Columna con la identificación de la bomba
+        columna_caudal: Columna de caudal
+        columnas: {'altura': col, 'eficiencia': col, 'npshr': col}; por
+            defecto las columnas con esos nombres que existan en datos
+        grados: Grado por curva (por defecto 2; 3 suele convenir a la eficiencia)
+        columna_velocidad: Columna con la velocidad de cada punto (rpm)
+        velocidad_nominal: Velocidad a la que se refieren las curvas; escalar
+            o Series indexada por bomba. Por defecto la máxima medida de cada bomba
+
+    Returns:
+        Dict por curva con el resultado de ajustar_polinomios más 'tabla', un
+        DataFrame de coeficientes (c0 = mayor grado), sigma y r2 por bomba
+    """
+    if columnas is None:
+        columnas = {c: c for c in ('altura', 'eficiencia', 'npshr') if c in datos.columns}
+    grados = {**{c: 2 for c in columnas}, **(grados or {})}
+
+    bombas = datos[columna_bomba].to_numpy()
+    caudal = datos[columna_caudal].to_numpy(dtype=float)
+    relacion = np.ones(len(datos))
+    if columna_velocidad is not None:
+        n = datos[columna_velocidad].to_numpy(dtype=float)
+        if velocidad_nominal is None:
+            n0 = datos.groupby(columna_bomba)[columna_velocidad].transform('max').to_numpy(dtype=float)
+        elif isinstance(velocidad_nominal, pd.Series):
+            n0 = datos[columna_bomba].map(velocidad_nominal).to_numpy(dtype=float)
+        else:
+            n0 = np.full(len(datos), float(velocidad_nominal))
+        relacion = n0 / n
+
+    resultados = {}
+    for curva, columna in columnas.items():
+        exponente = EXPONENTE_AFINIDAD.get(curva, 0)
+        ajuste = ajustar_polinomios(caudal * relacion,
+                                    datos[columna].to_numpy(dtype=float) * relacion**exponente,
+                                    grados[curva], bombas, huber)
+        tabla = pd.DataFrame(ajuste['coeficientes'], index=ajuste['grupos'],
+                             columns=[f'c{k}' for k in range(grados[curva] + 1)])
+        tabla['sigma'] = ajuste['sigma']
+        tabla['r2'] = ajuste['r2']
+        tabla.index.name = columna_bomba
+        ajuste['tabla'] = tabla
+        resultados[curva] = ajuste
+    return resultados
@@ -0,0 +1,244 @@
+# =============================================================================
+# MÓDULO DE ANIMACIÓN FUERA DE LÍNEA DE MECANISMOS
+# =============================================================================
+# Propósito: Renderizar animaciones de mecanismos sin el bucle del navegador
+#            de vpython: la trayectoria completa se precalcula con el solver
+#            vectorizado y los cuadros se dibujan con blitting de matplotlib
+#            (backend Agg, sin pantalla) y se envían a ffmpeg por tubería
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+
+import os
+import shutil
+import subprocess
+import numpy as np
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+def cinematica_4_barras(l1: float, l2: float, l3: float, l4: float,
+                        theta2, rama: int = 1) -> Dict[str, np.ndarray]:
+    """
+    Posición del mecanismo de 4 barras para todos los ángulos de entrada.
+
+    La manivela (l1) gira en A = (0, 0), la biela (l2) une B con C y el
+    balancín (l3) gira en D = (l4, 0). C se obtiene como intersección de las
+    circunferencias de centro B y D, sin bucles en Python.
+
+    Args:
+        l1, l2, l3, l4: Longitudes de manivela, biela, balancín y base
+        theta2: Ángulos de la manivela (rad), escalar o arreglo
+        rama: +1 para la configuración abierta, -1 para la cruzada
+
+    Returns:
+        Dict con A, B, C, D (N, 2), theta3, theta4 y valido (posiciones
+        alcanzables; en las demás C es NaN)
+    """
+    theta2 = np.atleast_1d(np.asarray(theta2, dtype=float))
+    B = np.column_stack([l1 * np.cos(theta2), l1 * np.sin(theta2)])
+    D = np.array([l4, 0.0])
+
+    BD = D - B
+    d = np.hypot(BD[:, 0], BD[:, 1])
+    a = (l2**2 - l3**2 + d**2) / (2 * d)
+    h2 = l2**2 - a**2
+    valido = h2 >= 0
+    h = np.sqrt(np.where(valido, h2, np.nan))
+
+    u = BD / d[:, None]
+    normal = np.column_stack([-u[:, 1], u[:, 0]])
+    C = B + a[:, None] * u + rama * h[:, None] * normal
+
+    return {
+        'A': np.zeros_like(B),
+        'B': B,
+        'C': C,
+        'D': np.broadcast_to(D, B.shape).copy(),
+        'theta2': theta2,
+        'theta3': np.arctan2(C[:, 1] - B[:, 1], C[:, 0] - B[:, 0]),
+        'theta4': np.arctan2(C[:, 1] - D[1], C[:, 0] - D[0]),
+        'valido': valido,
+    }
+
+
+class RenderizadorMecanismo:
+    """
+    Renderizador sin pantalla de trayectorias precalculadas.
+
+    Cada cuadro es una cadena de puntos (juntas) unidas por barras. El fondo
+    (ejes, rejilla, título y elementos fijos) se dibuja una sola vez; en cada
+    cuadro sólo se restaura el fondo y se redibujan las barras y el rastro.
+    """
+
+    def __init__(self, posiciones, fps: int = 30, tamano: Tuple[float, float] = (6, 6),
+                 dpi: int = 100, limites: Optional[Tuple[float, float, float, float]] = None,
+                 rastro: int = 0, punto_rastro: int = -1, titulo: str = "",
+                 fijos: Optional[Sequence[int]] = None):
+        """
+        Args:
+            posiciones: Arreglo (n_cuadros, n_puntos, 2) con las juntas de la cadena
+            fps: Cuadros por segundo del video
+            tamano: Tamaño de la figura (pulgadas)
+            dpi: Resolución de la figura
+            limites: (xmin, xmax, ymin, ymax); por defecto se ajustan a la trayectoria
+            rastro: Número de cuadros de rastro del punto_rastro (0 sin rastro)
+            punto_rastro: Índice de la junta que deja rastro
+            titulo: Título de la animación
+            fijos: Índices de juntas fijas (se dibujan como apoyos en el fondo)
+        """
+        self.posiciones = np.asarray(posiciones, dtype=float)
+        if self.posiciones.ndim != 3 or self.posiciones.shape[2] != 2:
+            raise ValueError("posiciones debe tener forma (n_cuadros, n_puntos, 2)")
+        self.fps = fps
+        self.rastro = rastro
+        self.punto_rastro = punto_rastro
+
+        self.figura = Figure(figsize=tamano, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figura)
+        self.ax = self.figura.add_subplot(111)
+
+        if limites is None:
+            minimo = np.nanmin(self.posiciones, axis=(0, 1))
+            maximo = np.nanmax(self.posiciones, axis=(0, 1))
+            margen = 0.1 * np.max(maximo - minimo) + 1e-9
+            limites = (minimo[0] - margen, maximo[0] + margen,
+                       minimo[1] - margen, maximo[1] + margen)
+        self.ax.set_xlim(limites[0], limites[1])
+        self.ax.set_ylim(limites[2], limites[3])
+        self.ax.set_aspect('equal')
+        self.ax.grid(True)
+        self.ax.set_title(titulo)
+        for i in fijos or []:
+            self.ax.plot(*self.posiciones[0, i], 'k^', markersize=12)
+
+        self.linea, = self.ax.plot([], [], 'o-', color='tab:blue', linewidth=3,
+                                   markersize=7, animated=True)
+        self.linea_rastro, = self.ax.plot([], [], '-', color='tab:orange',
+                                          linewidth=1, animated=True)
+
+        self.canvas.draw()
+        self.fondo = self.canvas.copy_from_bbox(self.figura.bbox)
+        self.ancho, self.alto = self.canvas.get_width_height()
+
+    @property
+    def n_cuadros(self) -> int:
+        return len(self.posiciones)
+
+    def cuadros(self) -> Iterator[np.ndarray]:
+        """
+        Genera los cuadros RGBA (alto, ancho, 4) usando blitting.
+
+        El arreglo entregado es una vista del buffer de Agg y se sobrescribe en
+        el cuadro siguiente; copiarlo si se necesita conservarlo.
+        """
+        for i, puntos in enumerate(self.posiciones):
+            self.canvas.restore_region(self.fondo)
+            self.linea.set_data(puntos[:, 0], puntos[:, 1])
+            self.ax.draw_artist(self.linea)
+            if self.rastro:
+                tramo = self.posiciones[max(0, i - self.rastro):i + 1, self.punto_rastro]
+                self.linea_rastro.set_data(tramo[:, 0], tramo[:, 1])
+                self.ax.draw_artist(self.linea_rastro)
+            yield np.asarray(self.canvas.buffer_rgba())
+
+    def guardar(self, ruta: str) -> str:
+        """
+        Escribe la animación.
+
+        Args:
+            ruta: Archivo .mp4 o .gif (por tubería a ffmpeg; el .gif usa Pillow
+                si ffmpeg no está instalado) o un directorio para cuadros PNG
+
+        Returns:
+            Ruta escrita
+        """
+        extension = os.path.splitext(ruta)[1].lower()
+        ffmpeg = shutil.which('ffmpeg')
+
+        if extension in ('.mp4', '.gif') and ffmpeg:
+            self._guardar_ffmpeg(ffmpeg, ruta, extension)
+        elif extension == '.gif':
+            self._guardar_gif_pillow(ruta)
+        elif extension == '.mp4':
+            raise RuntimeError("Se requiere ffmpeg en el PATH para escribir MP4")
+        else:
+            self._guardar_png(ruta)
+        return ruta
+
+    def _guardar_ffmpeg(self, ffmpeg: str, ruta: str, extension: str) -> None:
+        comando = [ffmpeg, '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                   '-s', f'{self.ancho}x{self.alto}', '-r', str(self.fps), '-i', '-']
+        if extension == '.mp4':
+            comando += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                        '-c:v', 'libx264', '-pix_fmt', 'yuv420p']
+        comando.append(ruta)
+
+        proceso = subprocess.Popen(comando, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for cuadro in self.cuadros():
+                proceso.stdin.write(cuadro.tobytes())
+        finally:
+            proceso.stdin.close()
+            error = proceso.stderr.read().decode(errors='replace')
+            proceso.wait()
+        if proceso.returncode != 0:
+            raise RuntimeError(f"ffmpeg terminó con error: {error}")
+
+    def _guardar_gif_pillow(self, ruta: str) -> None:
+        # Cada cuadro se cuantiza y se escribe al archivo en cuanto se dibuja
+        # (con su propia paleta local), sin acumular la animación en memoria
+        from PIL import GifImagePlugin, Image
+
+        duracion = int(1000 / self.fps)
+        with open(ruta, 'wb') as archivo:
+            for i, cuadro in enumerate(self.cuadros()):
+                imagen = Image.fromarray(cuadro).convert('RGB').quantize(64)
+                if i == 0:
+                    cabecera, _ = GifImagePlugin.getheader(imagen, info={'loop': 0})
+                    archivo.writelines(cabecera)
+                archivo.writelines(GifImagePlugin.getdata(imagen, duration=duracion,
+                                                          include_color_table=True))
+            archivo.write(b';')   # Fin del GIF
+
+    def _guardar_png(self, directorio: str) -> None:
+        from PIL import Image
+
+        os.makedirs(directorio, exist_ok=True)
+        digitos = len(str(self.n_cuadros))
+        for i, cuadro in enumerate(self.cuadros()):
+            Image.fromarray(cuadro).save(os.path.join(directorio, f'cuadro_{i:0{digitos}d}.png'))
+
+
+def animar_4_barras(l1: float, l2: float, l3: float, l4: float, omega: float,
+                    t_final: float, ruta: str, fps: int = 30, rama: int = 1,
+                    **opciones) -> str:
+    """
+    Precalcula y renderiza el mecanismo de 4 barras girando a omega constante.
+
+    Args:
+        l1, l2, l3, l4: Longitudes de manivela, biela, balancín y base
+        omega: Velocidad angular de la manivela (rad/s)
+        t_final: Duración de la animación (s)
+        ruta: Archivo .mp4/.gif o directorio de cuadros PNG
+        fps: Cuadros por segundo
+        rama: Configuración abierta (+1) o cruzada (-1)
+        **opciones: Argumentos adicionales para RenderizadorMecanismo
+
+    Returns:
+        Ruta escrita
+    """
+    t = np.arange(int(round(t_final * fps))) / fps
+    sol = cinematica_4_barras(l1, l2, l3, l4, omega * t, rama)
+    if not np.all(sol['valido']):
+        raise ValueError("La manivela no puede dar la vuelta completa con estas longitudes")
+
+    posiciones = np.stack([sol['A'], sol['B'], sol['C'], sol['D'], sol['A']], axis=1)
+    opciones.setdefault('titulo', 'Mecanismo de 4 Barras')
+    opciones.setdefault('rastro', fps)
+    opciones.setdefault('punto_rastro', 2)
+    opciones.setdefault('fijos', [0, 3])
+    return RenderizadorMecanismo(posiciones, fps=fps, **opciones).guardar(ruta)
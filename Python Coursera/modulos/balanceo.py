@@ -0,0 +1,159 @@
+# =============================================================================
+# MÓDULO DE BALANCEO POR COEFICIENTES DE INFLUENCIA
+# =============================================================================
+# Propósito: Balanceo en varios planos y velocidades a partir de lecturas
+#            complejas (amplitud/fase) de corridas con pesos de prueba, con
+#            mínimos cuadrados ponderados en lote para toda una flota
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Convención de formas (las dimensiones "..." son el lote de máquinas):
+#   V0           (..., M)      vibración original en M puntos de medición
+#   V_prueba     (..., N, M)   vibración con el peso de prueba en cada plano
+#   pesos_prueba (..., N)      peso de prueba de cada plano (fasor, kg o g)
+#   alpha        (..., M, N)   coeficientes de influencia
+#
+# Cada punto de medición es una combinación sensor/velocidad, de modo que
+# el balanceo en varias velocidades se obtiene apilando las lecturas de todas
+# las velocidades en el eje M.
+# =============================================================================
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+
+def fasor(amplitud, fase_grados):
+    """Convierte lecturas amplitud/fase (grados) en fasores complejos."""
+    return np.asarray(amplitud) * np.exp(1j * np.deg2rad(fase_grados))
+
+
+def polar(z) -> Tuple[np.ndarray, np.ndarray]:
+    """Convierte fasores en (amplitud, fase en grados dentro de [0, 360))."""
+    z = np.asarray(z)
+    return np.abs(z), np.mod(np.rad2deg(np.angle(z)), 360)
+
+
+def coeficientes_influencia(V0, V_prueba, pesos_prueba) -> np.ndarray:
+    """
+    Calcula los coeficientes de influencia alpha = (V_k - V0) / T_k.
+
+    Args:
+        V0: Vibración original (..., M)
+        V_prueba: Vibración con peso de prueba en cada plano (..., N, M)
+        pesos_prueba: Fasor del peso de prueba de cada plano (..., N)
+
+    Returns:
+        Matriz de coeficientes de influencia (..., M, N)
+    """
+    V0 = np.asarray(V0, dtype=complex)
+    V_prueba = np.asarray(V_prueba, dtype=complex)
+    pesos_prueba = np.asarray(pesos_prueba, dtype=complex)
+    alpha = (V_prueba - V0[..., None, :]) / pesos_prueba[..., :, None]
+    return np.swapaxes(alpha, -1, -2)
+
+
+def calcular_correccion(alpha, V0, pesos=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resuelve los pesos de corrección por mínimos cuadrados ponderados.
+
+    Minimiza sum(w_m |V0_m + (alpha W)_m|²) en todo el lote a la vez mediante
+    una factorización QR apilada de la matriz ponderada.
+
+    Args:
+        alpha: Coeficientes de influencia (..., M, N) con M >= N
+        V0: Vibración original (..., M)
+        pesos: Peso de cada punto de medición (..., M); por defecto 1
+
+    Returns:
+        Tuple (W, residual): fasores de corrección (..., N) y vibración
+        residual prevista (..., M)
+    """
+    alpha = np.asarray(alpha, dtype=complex)
+    V0 = np.asarray(V0, dtype=complex)
+    if alpha.shape[-2] < alpha.shape[-1]:
+        raise ValueError("Se requieren al menos tantas mediciones como planos de corrección")
+
+    raiz_w = np.ones(V0.shape) if pesos is None else np.sqrt(np.asarray(pesos, dtype=float))
+    raiz_w = np.broadcast_to(raiz_w, V0.shape)
+
+    Q, R = np.linalg.qr(alpha * raiz_w[..., None])
+    b = -(raiz_w * V0)[..., None]
+    W = np.linalg.solve(R, np.swapaxes(Q.conj(), -1, -2) @ b)[..., 0]
+
+    residual = V0 + (alpha @ W[..., None])[..., 0]
+    return W, residual
+
+
+def balancear(V0, V_prueba, pesos_prueba, pesos=None,
+              radio_correccion=None) -> Dict[str, np.ndarray]:
+    """
+    Balanceo completo por coeficientes de influencia.
+
+    Args:
+        V0: Vibración original (..., M)
+        V_prueba: Vibración con peso de prueba en cada plano (..., N, M)
+        pesos_prueba: Fasor del peso de prueba de cada plano (..., N)
+        pesos: Peso de cada punto de medición (..., M)
+        radio_correccion: Radio de montaje de las masas (..., N); si se da,
+            los pesos de prueba se interpretan como desbalance (masa·radio)
+
+    Returns:
+        Dict con alpha, correccion (fasor), masa, angulo (grados) y
+        residual (vibración prevista tras corregir)
+    """
+    alpha = coeficientes_influencia(V0, V_prueba, pesos_prueba)
+    W, residual = calcular_correccion(alpha, V0, pesos)
+    if radio_correccion is not None:
+        W = W / np.asarray(radio_correccion)
+    masa, angulo = polar(W)
+    return {
+        'alpha': alpha,
+        'correccion': W,
+        'masa': masa,
+        'angulo': angulo,
+        'residual': residual,
+    }
+
+
+def balancear_flota(registros: List[Dict]) -> List[Dict]:
+    """
+    Procesa los registros de balanceo de varias máquinas.
+
+    Los registros con el mismo número de planos y puntos de medición se
+    apilan y resuelven en un solo cálculo complejo por lotes.
+
+    Args:
+        registros: Lista de dicts con 'maquina', 'V0' (M,), 'V_prueba' (N, M),
+            'pesos_prueba' (N,) y opcionalmente 'pesos' (M,)
+
+    Returns:
+        Lista de dicts (en el orden de entrada) con maquina, masa, angulo,
+        correccion, residual y reduccion (fracción de vibración eliminada)
+    """
+    grupos = {}
+    for i, registro in enumerate(registros):
+        forma = np.shape(registro['V_prueba'])
+        grupos.setdefault(forma, []).append(i)
+
+    resultados: List[Optional[Dict]] = [None] * len(registros)
+    for indices in grupos.values():
+        lote = [registros[i] for i in indices]
+        V0 = np.array([r['V0'] for r in lote], dtype=complex)
+        pesos = np.array([r.get('pesos', np.ones(V0.shape[-1])) for r in lote], dtype=float)
+        res = balancear(V0,
+                        np.array([r['V_prueba'] for r in lote], dtype=complex),
+                        np.array([r['pesos_prueba'] for r in lote], dtype=complex),
+                        pesos)
+
+        reduccion = 1 - np.linalg.norm(res['residual'], axis=-1) / np.linalg.norm(V0, axis=-1)
+        for k, i in enumerate(indices):
+            resultados[i] = {
+                'maquina': registros[i].get('maquina', i),
+                'masa': res['masa'][k],
+                'angulo': res['angulo'][k],
+                'correccion': res['correccion'][k],
+                'residual': res['residual'][k],
+                'reduccion': reduccion[k],
+            }
+    return resultados
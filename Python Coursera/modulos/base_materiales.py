@@ -0,0 +1,278 @@
+# =============================================================================
+# MÓDULO DE BASE DE DATOS DE MATERIALES Y SELECCIÓN MULTICRITERIO
+# =============================================================================
+# Propósito: Catálogo de varios cientos de grados de ingeniería (aceros,
+#            inoxidables, fundiciones, aleaciones no ferrosas, polímeros,
+#            compuestos y cerámicas) almacenado por columnas, cargado una sola
+#            vez e indexado por nombre, con índices de desempeño de Ashby
+#            vectorizados y filtros de restricción sobre todo el catálogo
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Unidades de las columnas:
+#   E (GPa), nu (-), Sy, Su, Se, sigma_f (MPa), rho (kg/m³),
+#   alpha (10⁻⁶/K), k (W/m·K), costo (USD/kg, referencia), N_e (ciclos), b (-)
+# Sy vacío (NaN) en materiales frágiles sin fluencia definida.
+# Los valores son típicos de manuales para preselección; el diseño final
+# debe usar los mínimos garantizados de la norma o del certificado.
+#
+# Fatiga: si el catálogo no tabula Se se estima con la regla de la familia
+#   Se = min(f · Su, tope)  a N_e ciclos
+# y la recta de Basquin pasa por (10³, 0.9·Su) y (N_e, Se):
+#   S = sigma_f · N^b,   b = log10(Se / 0.9Su) / log10(N_e / 10³)
+# Índice de desempeño (Ashby): M = Π p_i^(e_i), p. ej. E^½/ρ para vigas
+# livianas y rígidas; se evalúa como exp(Σ e_i ln p_i).
+# =============================================================================
+
+import os
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+DIRECTORIO_DATOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datos')
+RUTA_CSV = os.path.join(DIRECTORIO_DATOS, 'materiales.csv')
+RUTA_BASE = os.path.join(DIRECTORIO_DATOS, 'materiales.npz')
+
+COLUMNAS_TEXTO = ('nombre', 'familia', 'condicion')
+COLUMNAS_NUMERICAS = ('E', 'nu', 'Sy', 'Su', 'rho', 'alpha', 'k', 'costo', 'Se', 'N_e', 'sigma_f', 'b')
+
+# Regla de fatiga por familia: (fracción de Su, ciclos N_e, tope de Se en MPa)
+FATIGA_FAMILIA = {
+    'acero_carbono': (0.5, 1e6, 700.0),
+    'acero_aleado': (0.5, 1e6, 700.0),
+    'acero_fundido': (0.4, 1e6, 700.0),
+    'acero_herramientas': (0.5, 1e6, 700.0),
+    'inoxidable_austenitico': (0.4, 1e6, 700.0),
+    'inoxidable_ferritico_martensitico': (0.45, 1e6, 700.0),
+    'inoxidable_duplex': (0.45, 1e6, 700.0),
+    'inoxidable_ph': (0.45, 1e6, 700.0),
+    'fundicion_gris': (0.4, 1e6, np.inf),
+    'fundicion_nodular': (0.45, 1e6, np.inf),
+    'fundicion_maleable': (0.45, 1e6, np.inf),
+    'aluminio_forjado': (0.4, 5e8, 130.0),
+    'aluminio_fundido': (0.3, 5e8, 100.0),
+    'cobre': (0.35, 1e8, np.inf),
+    'laton': (0.35, 1e8, np.inf),
+    'bronce': (0.35, 1e8, np.inf),
+    'titanio': (0.5, 1e7, np.inf),
+    'niquel': (0.4, 1e8, np.inf),
+    'magnesio': (0.35, 5e8, np.inf),
+    'zinc': (0.2, 5e8, np.inf),
+    'refractario_especial': (0.4, 1e7, np.inf),
+    'polimero': (0.25, 1e7, np.inf),
+    'compuesto': (0.4, 1e7, np.inf),
+}
+
+# Índices de desempeño clásicos (exponentes de cada propiedad, a maximizar)
+INDICES = {
+    'tirante_rigidez': {'E': 1.0, 'rho': -1.0},
+    'viga_rigidez': {'E': 0.5, 'rho': -1.0},
+    'placa_rigidez': {'E': 1 / 3, 'rho': -1.0},
+    'tirante_resistencia': {'Sy': 1.0, 'rho': -1.0},
+    'viga_resistencia': {'Sy': 2 / 3, 'rho': -1.0},
+    'placa_resistencia': {'Sy': 0.5, 'rho': -1.0},
+    'viga_rigidez_costo': {'E': 0.5, 'rho': -1.0, 'costo': -1.0},
+    'viga_resistencia_costo': {'Sy': 2 / 3, 'rho': -1.0, 'costo': -1.0},
+    'resorte': {'Sy': 2.0, 'E': -1.0},
+    'fatiga_liviana': {'Se': 1.0, 'rho': -1.0},
+    'choque_termico': {'Su': 1.0, 'E': -1.0, 'alpha': -1.0},
+    'distorsion_termica': {'k': 1.0, 'alpha': -1.0},
+}
+
+Restriccion = Union[Tuple[Optional[float], Optional[float]], Sequence[str], str]
+
+
+def _completar_fatiga(familia: np.ndarray, Su: np.ndarray, Se: np.ndarray) -> Dict[str, np.ndarray]:
+    """Completa Se y la recta de Basquin con la regla de cada familia."""
+    reglas = np.array([FATIGA_FAMILIA.get(f, (np.nan, np.nan, np.nan)) for f in familia])
+    fraccion, N_e, tope = reglas.T
+    Se = np.where(np.isnan(Se), np.minimum(fraccion * Su, tope), Se)
+    N_e = np.where(np.isnan(Se), np.nan, N_e)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        b = np.log10(Se / (0.9 * Su)) / np.log10(N_e / 1e3)
+        sigma_f = 0.9 * Su / 1e3 ** b
+    return {'Se': Se, 'N_e': N_e, 'sigma_f': sigma_f, 'b': b}
+
+
+def construir_base_materiales(ruta_csv: str = RUTA_CSV, ruta_base: Optional[str] = RUTA_BASE) -> 'BaseMateriales':
+    """
+    Compila el catálogo en texto a la base columnar (.npz comprimido).
+
+    Args:
+        ruta_csv: Catálogo fuente (una fila por grado, columnas de COLUMNAS_TEXTO
+                  y propiedades; Se vacío se estima con FATIGA_FAMILIA)
+        ruta_base: Archivo .npz de salida (None para no guardar)
+
+    Returns:
+        BaseMateriales lista para consultar
+    """
+    tabla = pd.read_csv(ruta_csv, dtype={c: str for c in COLUMNAS_TEXTO})
+    faltantes = [c for c in COLUMNAS_TEXTO + COLUMNAS_NUMERICAS[:9] if c not in tabla.columns]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en el catálogo: {faltantes}")
+    columnas = {c: tabla[c].to_numpy(dtype=str) for c in COLUMNAS_TEXTO}
+    columnas.update({c: tabla[c].to_numpy(dtype=float) for c in COLUMNAS_NUMERICAS[:9]})
+    columnas.update(_completar_fatiga(columnas['familia'], columnas['Su'], columnas['Se']))
+    base = BaseMateriales(columnas)
+    if ruta_base is not None:
+        base.guardar(ruta_base)
+    return base
+
+
+class BaseMateriales:
+    """Catálogo de materiales en columnas con índice por nombre y familia."""
+
+    def __init__(self, columnas: Dict[str, np.ndarray]):
+        """
+        Args:
+            columnas: Arreglos 1D de igual longitud para COLUMNAS_TEXTO y
+                      COLUMNAS_NUMERICAS
+        """
+        faltantes = [c for c in COLUMNAS_TEXTO + COLUMNAS_NUMERICAS if c not in columnas]
+        if faltantes:
+            raise ValueError(f"Faltan columnas en la base de materiales: {faltantes}")
+        self.columnas = {c: np.asarray(columnas[c], dtype=str) for c in COLUMNAS_TEXTO}
+        self.columnas.update({c: np.asarray(columnas[c], dtype=float) for c in COLUMNAS_NUMERICAS})
+        n = len(self.columnas['nombre'])
+        if any(v.shape != (n,) for v in self.columnas.values()):
+            raise ValueError("Todas las columnas deben ser 1D y de la misma longitud")
+        self.indice = pd.Index(self.columnas['nombre'])
+        if not self.indice.is_unique:
+            raise ValueError("Los nombres de los materiales deben ser únicos")
+        self.familias, self.codigo_familia = np.unique(self.columnas['familia'], return_inverse=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._logaritmos = {c: np.log(v) for c, v in self.columnas.items() if c in COLUMNAS_NUMERICAS}
+
+    # --- persistencia --------------------------------------------------------
+    def guardar(self, ruta: str):
+        """Guarda las columnas en un archivo .npz comprimido."""
+        np.savez_compressed(ruta, **self.columnas)
+
+    @classmethod
+    def cargar(cls, ruta: str = RUTA_BASE) -> 'BaseMateriales':
+        """Carga una base guardada con guardar (sin volver a leer el catálogo)."""
+        with np.load(ruta, allow_pickle=False) as datos:
+            return cls({c: datos[c] for c in datos.files})
+
+    # --- consulta ------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.indice)
+
+    def __getitem__(self, columna: str) -> np.ndarray:
+        return self.columnas[columna]
+
+    @property
+    def nombres(self) -> List[str]:
+        return self.indice.tolist()
+
+    def filas(self, nombres) -> np.ndarray:
+        """Posiciones de los materiales indicados (ValueError si alguno no existe)."""
+        posiciones = self.indice.get_indexer(np.atleast_1d(nombres))
+        if np.any(posiciones < 0):
+            desconocidos = np.atleast_1d(nombres)[posiciones < 0].tolist()
+            raise ValueError(f"Materiales no encontrados: {desconocidos}")
+        return posiciones
+
+    def propiedades(self, nombre: str) -> Dict[str, Union[str, float]]:
+        """Todas las propiedades de un material como diccionario."""
+        i = self.filas(nombre)[0]
+        return {c: (str(v[i]) if c in COLUMNAS_TEXTO else float(v[i])) for c, v in self.columnas.items()}
+
+    def como_dataframe(self, filas=None) -> pd.DataFrame:
+        filas = slice(None) if filas is None else filas
+        return pd.DataFrame({c: v[filas] for c, v in self.columnas.items()})
+
+    # --- selección -----------------------------------------------------------
+    def filtrar(self, restricciones: Optional[Dict[str, Restriccion]] = None) -> np.ndarray:
+        """
+        Máscara booleana de los materiales que cumplen todas las restricciones.
+
+        Args:
+            restricciones: {columna: (mínimo, máximo)} con None para un lado
+                           abierto en columnas numéricas, o {columna: valor o
+                           lista de valores admitidos} en columnas de texto.
+                           Un valor NaN nunca cumple una cota numérica.
+
+        Returns:
+            Arreglo booleano de longitud len(self)
+        """
+        mascara = np.ones(len(self), dtype=bool)
+        for columna, limite in (restricciones or {}).items():
+            if columna not in self.columnas:
+                raise ValueError(f"Columna desconocida en las restricciones: '{columna}'")
+            valores = self.columnas[columna]
+            if columna in COLUMNAS_TEXTO:
+                mascara &= np.isin(valores, np.atleast_1d(limite))
+                continue
+            minimo, maximo = limite
+            if minimo is not None:
+                mascara &= valores >= minimo
+            if maximo is not None:
+                mascara &= valores <= maximo
+        return mascara
+
+    def indice_desempeno(self, indice: Union[str, Dict[str, float]]) -> np.ndarray:
+        """
+        Índice de desempeño M = Π p^e para todo el catálogo.
+
+        Args:
+            indice: Nombre de INDICES o diccionario {columna: exponente}
+
+        Returns:
+            Arreglo de M (NaN donde falta alguna propiedad o no es positiva)
+        """
+        exponentes = INDICES[indice] if isinstance(indice, str) and indice in INDICES else indice
+        if not isinstance(exponentes, dict) or not exponentes:
+            raise ValueError(f"Índice de desempeño desconocido: {indice!r}")
+        log_M = np.zeros(len(self))
+        for columna, exponente in exponentes.items():
+            if columna not in self._logaritmos:
+                raise ValueError(f"Columna no numérica o desconocida en el índice: '{columna}'")
+            log_M = log_M + exponente * self._logaritmos[columna]
+        return np.exp(log_M)
+
+    def seleccionar(self, indice: Union[str, Dict[str, float]], n: int = 10,
+                    restricciones: Optional[Dict[str, Restriccion]] = None,
+                    maximizar: bool = True) -> pd.DataFrame:
+        """
+        Los n mejores candidatos del catálogo según un índice de desempeño.
+
+        Args:
+            indice: Nombre de INDICES o diccionario {columna: exponente}
+            n: Número de candidatos
+            restricciones: Filtros como en filtrar
+            maximizar: False para ordenar de menor a mayor índice
+
+        Returns:
+            DataFrame ordenado con el índice, su valor relativo al mejor y las
+            propiedades de cada candidato
+        """
+        if n < 1:
+            raise ValueError("n debe ser al menos 1")
+        M = self.indice_desempeno(indice)
+        validos = np.flatnonzero(self.filtrar(restricciones) & np.isfinite(M))
+        clave = -M[validos] if maximizar else M[validos]
+        if len(validos) > n:
+            parte = np.argpartition(clave, n - 1)[:n]
+            validos, clave = validos[parte], clave[parte]
+        orden = validos[np.argsort(clave, kind='stable')]
+        tabla = self.como_dataframe(orden)
+        tabla.insert(3, 'indice', M[orden])
+        tabla.insert(4, 'relativo', M[orden] / M[orden[0]] if len(orden) else [])
+        return tabla.reset_index(drop=True)
+
+    def vida_fatiga(self, nombre: str, amplitud) -> np.ndarray:
+        """Ciclos a la falla por Basquin (inf por debajo del límite Se)."""
+        p = self.propiedades(nombre)
+        amplitud = np.asarray(amplitud, dtype=float)
+        with np.errstate(divide='ignore'):
+            N = (amplitud / p['sigma_f']) ** (1.0 / p['b'])
+        return np.where(amplitud <= p['Se'], np.inf, N)
+
+
+@lru_cache(maxsize=None)
+def base_materiales(ruta: str = RUTA_BASE) -> BaseMateriales:
+    """Base de materiales compartida por el proceso (se carga una sola vez)."""
+    return BaseMateriales.cargar(ruta)
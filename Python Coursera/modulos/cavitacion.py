@@ -0,0 +1,252 @@
+# =============================================================================
+# MÓDULO DE NPSH Y RIESGO DE CAVITACIÓN
+# =============================================================================
+# Propósito: Comparar el NPSH disponible de la línea de succión con el NPSH
+#            requerido de la bomba sobre toda la envolvente de operación
+#            (caudal × velocidad × nivel del sumidero) en una sola evaluación
+#            vectorizada, y generar mapas de riesgo de cavitación para bombas
+#            de agua y de pulpa
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+#   NPSHa = (P_atm - P_v) / (ρ g) + (z_sumidero - z_bomba) - h_f,succión
+#   NPSHr(Q, s) = s² · NPSHr₁(Q / s)          (leyes de afinidad)
+#
+# Caudal en m³/h, cotas y alturas en m, temperatura en °C; la velocidad es
+# relativa a la nominal (s = n / n_nominal) como en estacion_bombeo.
+# =============================================================================
+
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+from modulos.friccion import perdida_carga
+from modulos.propiedades import presion_saturacion
+
+G = 9.81
+
+# Clases de riesgo de los mapas
+SEGURO, MARGINAL, CAVITACION = 0, 1, 2
+
+
+def presion_vapor(temperatura):
+    """
+    Presión de vapor del agua (Pa), ecuación de saturación IAPWS-IF97.
+
+    Args:
+        temperatura: Temperatura (°C), entre 0 y 373.9
+
+    Returns:
+        Presión de saturación (Pa)
+    """
+    return presion_saturacion(np.asarray(temperatura, dtype=float) + 273.15) * 1000
+
+
+def densidad_agua(temperatura):
+    """Densidad del agua líquida (kg/m³) a 1 atm, correlación de Kell (0-150 °C)."""
+    t = np.asarray(temperatura, dtype=float)
+    return (999.83952 + 16.945176 * t - 7.9870401e-3 * t**2 - 46.170461e-6 * t**3
+            + 105.56302e-9 * t**4 - 280.54253e-12 * t**5) / (1 + 16.879850e-3 * t)
+
+
+def viscosidad_cinematica_agua(temperatura):
+    """Viscosidad cinemática del agua (m²/s), ecuación de Vogel."""
+    T = np.asarray(temperatura, dtype=float) + 273.15
+    return 2.414e-5 * 10**(247.8 / (T - 140)) / densidad_agua(temperatura)
+
+
+def presion_atmosferica(altitud):
+    """Presión atmosférica estándar (Pa) a la altitud dada (m s.n.m.)."""
+    return 101325.0 * (1 - 2.25577e-5 * np.asarray(altitud, dtype=float))**5.25588
+
+
+def npshr_velocidad_especifica(caudal, velocidad_rpm, S: float = 200.0, ojos: int = 1):
+    """
+    NPSHr estimado con la velocidad específica de succión S = n √Q / NPSHr^¾.
+
+    Reemplaza la constante empírica de calcular_cavitation_npsh cuando no hay
+    curva de NPSHr del fabricante.
+
+    Args:
+        caudal: Caudal (m³/h)
+        velocidad_rpm: Velocidad de giro (rpm)
+        S: Velocidad específica de succión en unidades SI (rpm, m³/s, m);
+            ~150-250 para bombas centrífugas convencionales
+        ojos: Número de ojos del impulsor (2 para doble succión)
+
+    Returns:
+        NPSH requerido (m)
+    """
+    Q = np.asarray(caudal, dtype=float) / 3600 / ojos
+    return (np.asarray(velocidad_rpm, dtype=float) * np.sqrt(Q) / S)**(4 / 3)
+
+
+class LineaSuccion:
+    """Geometría de la succión entre el sumidero y la brida de la bomba."""
+
+    def __init__(self, longitud: float, diametro: float, cota_bomba: float = 0.0,
+                 rugosidad: float = 4.5e-5, perdidas_menores: float = 0.0,
+                 factor_pulpa: float = 1.0):
+        """
+        Args:
+            longitud: Longitud de la tubería de succión (m)
+            diametro: Diámetro interno (m)
+            cota_bomba: Cota del eje de la bomba (m, misma referencia del nivel)
+            rugosidad: Rugosidad absoluta (m)
+            perdidas_menores: Suma de coeficientes K (entrada, codos, válvula)
+            factor_pulpa: Multiplicador de la pérdida por fricción del agua
+                para pulpas (1 para agua)
+        """
+        self.longitud = longitud
+        self.diametro = diametro
+        self.cota_bomba = cota_bomba
+        self.rugosidad = rugosidad
+        self.perdidas_menores = perdidas_menores
+        self.factor_pulpa = factor_pulpa
+
+    def perdidas(self, caudal, temperatura=20.0):
+        """Pérdida total de la succión (m) para caudales en m³/h."""
+        Q = np.asarray(caudal, dtype=float) / 3600
+        nu = viscosidad_cinematica_agua(temperatura)
+        area = np.pi * self.diametro**2 / 4
+        friccion = perdida_carga(Q, self.diametro, self.longitud, self.rugosidad, nu)
+        menores = self.perdidas_menores * (Q / area)**2 / (2 * G)
+        return self.factor_pulpa * friccion + menores
+
+
+def npsh_disponible(caudal, nivel_sumidero, succion: LineaSuccion, temperatura=20.0,
+                    gravedad_especifica=1.0, altitud=0.0, presion_superficie=None):
+    """
+    NPSH disponible (m de columna del fluido bombeado).
+
+    Args:
+        caudal: Caudal (m³/h)
+        nivel_sumidero: Cota de la superficie libre en el sumidero (m)
+        succion: Geometría de la succión
+        temperatura: Temperatura del agua o del líquido portador (°C)
+        gravedad_especifica: SG de la pulpa (1 para agua)
+        altitud: Altitud de la planta (m s.n.m.)
+        presion_superficie: Presión absoluta sobre la superficie (Pa); por
+            defecto la atmosférica a la altitud dada (sumidero abierto)
+
+    Returns:
+        NPSHa con la forma del broadcasting de las entradas
+    """
+    P = presion_atmosferica(altitud) if presion_superficie is None else \
+        np.asarray(presion_superficie, dtype=float)
+    rho = np.asarray(gravedad_especifica, dtype=float) * densidad_agua(temperatura)
+    carga_presion = (P - presion_vapor(temperatura)) / (rho * G)
+    estatica = np.asarray(nivel_sumidero, dtype=float) - succion.cota_bomba
+    return carga_presion + estatica - succion.perdidas(caudal, temperatura)
+
+
+def npsh_requerido(caudal, velocidad, curva_npshr: Sequence[float]):
+    """
+    NPSHr por leyes de afinidad a partir de la curva nominal.
+
+    Args:
+        caudal: Caudal (m³/h)
+        velocidad: Velocidad relativa s = n / n_nominal
+        curva_npshr: Coeficientes de NPSHr₁(Q) de mayor a menor grado
+            (p. ej. la tabla 'npshr' de ajustar_banco_pruebas)
+    """
+    s = np.asarray(velocidad, dtype=float)
+    return s**2 * np.polyval(np.asarray(curva_npshr, dtype=float), np.asarray(caudal) / s)
+
+
+def mapa_cavitacion(caudales, velocidades, niveles, succion: LineaSuccion,
+                    curva_npshr: Sequence[float], temperatura=20.0,
+                    gravedad_especifica=1.0, altitud=0.0,
+                    margen_requerido: float = 1.3,
+                    margen_minimo: float = 0.6) -> Dict[str, np.ndarray]:
+    """
+    Margen de NPSH sobre la malla caudal × velocidad × nivel del sumidero.
+
+    Un punto es SEGURO si NPSHa ≥ margen_requerido·NPSHr y además
+    NPSHa - NPSHr ≥ margen_minimo (m), MARGINAL si sólo NPSHa ≥ NPSHr y
+    CAVITACION en otro caso. Para bombas de pulpa suele exigirse una razón
+    de 1.3 o más por el desgaste acelerado que produce la cavitación.
+
+    Args:
+        caudales: (n_q,) caudales (m³/h)
+        velocidades: (n_s,) velocidades relativas
+        niveles: (n_z,) cotas del nivel del sumidero (m)
+        succion, curva_npshr, temperatura, gravedad_especifica, altitud:
+            ver npsh_disponible y npsh_requerido
+        margen_requerido: Razón NPSHa/NPSHr mínima para operación segura
+        margen_minimo: Diferencia NPSHa - NPSHr mínima (m)
+
+    Returns:
+        Dict con caudales, velocidades, niveles, npsha (n_q, n_z),
+        npshr (n_q, n_s), margen, razon y riesgo (n_q, n_s, n_z), y
+        caudal_limite (n_s, n_z): mayor caudal seguro (NaN si ninguno)
+    """
+    Q = np.asarray(caudales, dtype=float)
+    s = np.asarray(velocidades, dtype=float)
+    z = np.asarray(niveles, dtype=float)
+
+    # NPSHa no depende de la velocidad ni NPSHr del nivel: se evalúan en 2D
+    npsha = npsh_disponible(Q[:, None], z[None, :], succion, temperatura,
+                            gravedad_especifica, altitud)
+    npshr = npsh_requerido(Q[:, None], s[None, :], curva_npshr)
+
+    margen = npsha[:, None, :] - npshr[:, :, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        razon = npsha[:, None, :] / npshr[:, :, None]
+    seguro = (razon >= margen_requerido) & (margen >= margen_minimo)
+    riesgo = np.where(seguro, SEGURO, np.where(margen >= 0, MARGINAL, CAVITACION))
+
+    # Mayor caudal seguro de cada (velocidad, nivel), interpolado en el borde
+    caudal_limite = np.full((len(s), len(z)), np.nan)
+    exceso = np.minimum(razon - margen_requerido, (margen - margen_minimo) / margen_minimo)
+    ultimo = len(Q) - 1 - np.argmax(seguro[::-1], axis=0)
+    hay = seguro.any(axis=0)
+    interior = hay & (ultimo < len(Q) - 1)
+    caudal_limite[hay] = Q[ultimo[hay]]
+    i_s, i_z = np.nonzero(interior)
+    k = ultimo[interior]
+    e0, e1 = exceso[k, i_s, i_z], exceso[k + 1, i_s, i_z]
+    fraccion = np.where(e0 > e1, e0 / (e0 - e1), 0.0)
+    caudal_limite[i_s, i_z] = Q[k] + np.clip(fraccion, 0, 1) * (Q[k + 1] - Q[k])
+
+    return {
+        'caudales': Q,
+        'velocidades': s,
+        'niveles': z,
+        'npsha': npsha,
+        'npshr': npshr,
+        'margen': margen,
+        'razon': razon,
+        'riesgo': riesgo,
+        'caudal_limite': caudal_limite,
+    }
+
+
+def graficar_mapa_cavitacion(mapa: Dict[str, np.ndarray], indice_nivel: int = 0,
+                             titulo: Optional[str] = None):
+    """
+    Mapa de riesgo caudal × velocidad para un nivel del sumidero.
+
+    Returns:
+        Figure de matplotlib (sin pantalla; guardar con savefig)
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.colors import ListedColormap
+
+    figura = Figure(figsize=(8, 6))
+    ax = figura.add_subplot(111)
+    Q, s = mapa['caudales'], mapa['velocidades']
+    riesgo = mapa['riesgo'][:, :, indice_nivel].T
+    ax.pcolormesh(Q, s, riesgo, shading='nearest', vmin=0, vmax=2,
+                  cmap=ListedColormap(['#4caf50', '#ffc107', '#f44336']))
+    curvas = ax.contour(Q, s, mapa['razon'][:, :, indice_nivel].T,
+                        levels=[1.0, 1.3, 1.5, 2.0], colors='k', linewidths=0.8)
+    ax.clabel(curvas, fmt='%.1f')
+    ax.plot(mapa['caudal_limite'][:, indice_nivel], s, 'k--', linewidth=1.5,
+            label='Caudal límite seguro')
+    ax.set_xlabel('Caudal (m³/h)')
+    ax.set_ylabel('Velocidad relativa n/n₀')
+    nivel = mapa['niveles'][indice_nivel]
+    ax.set_title(titulo or f'Riesgo de cavitación (nivel sumidero {nivel:.2f} m)')
+    ax.legend(loc='upper right')
+    return figura
@@ -0,0 +1,298 @@
+# =============================================================================
+# MÓDULO DE CICLOS TERMODINÁMICOS
+# =============================================================================
+# Propósito: Resolver ciclos Rankine, Brayton, Otto, Diesel y Carnot punto
+#            por punto (P, T, h, s, v) con propiedades reales, eficiencias de
+#            componentes, recalentamiento y regeneración. Todos los parámetros
+#            admiten arreglos y se combinan por broadcasting, de modo que un
+#            barrido de 200×200 es una sola evaluación vectorizada
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Presiones en kPa, temperaturas en K, energías en kJ/kg de fluido de
+# trabajo (en el Rankine, por kg que pasa por la caldera).
+# El agua usa Agua() (IF97 exacto) salvo que se pase otro backend, p. ej.
+# tabla_agua() para barridos grandes; los gases usan MezclaGasIdeal (aire).
+# Cada resultado incluye 'estados': {nombre: estado del backend}.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+from modulos.propiedades import Agua, MezclaGasIdeal
+
+
+def _expandir(fluido, entrada: Dict[str, np.ndarray], P_salida, eta) -> Dict[str, np.ndarray]:
+    """Expansión adiabática con eficiencia isentrópica eta (turbina)."""
+    ideal = fluido.estado_ps(P_salida, entrada['s'])
+    return fluido.estado_ph(P_salida, entrada['h'] - eta * (entrada['h'] - ideal['h']))
+
+
+def _comprimir(fluido, entrada: Dict[str, np.ndarray], P_salida, eta) -> Dict[str, np.ndarray]:
+    """Compresión adiabática con eficiencia isentrópica eta (bomba o compresor)."""
+    ideal = fluido.estado_ps(P_salida, entrada['s'])
+    return fluido.estado_ph(P_salida, entrada['h'] + (ideal['h'] - entrada['h']) / eta)
+
+
+def _liquido_saturado(fluido, P) -> Dict[str, np.ndarray]:
+    """Estado de líquido saturado (x = 0) a la presión P."""
+    sat = fluido.saturacion(P)
+    P = np.broadcast_to(np.asarray(P, dtype=float), np.shape(sat['T']))
+    return {'T': sat['T'], 'P': P, 'h': sat['h_f'], 'u': sat['h_f'] - P * sat['v_f'],
+            's': sat['s_f'], 'v': sat['v_f'], 'rho': 1 / sat['v_f'], 'x': np.zeros_like(P),
+            'cp': np.full_like(P, np.nan)}
+
+
+def ciclo_rankine(P_caldera, T_turbina, P_condensador, eta_turbina=1.0, eta_bomba=1.0,
+                  P_recalentamiento=None, T_recalentamiento=None, P_regeneracion=None,
+                  fluido=None) -> Dict:
+    """
+    Ciclo Rankine con recalentamiento y un calentador abierto de agua de alimentación.
+
+    Estados: 1 líquido saturado a la salida del condensador, 2 salida de la
+    bomba de condensado (a P_regeneracion), 3 líquido saturado a la salida
+    del calentador, 4 salida de la bomba de alimentación, 5 entrada a la
+    turbina, 6 salida de alta presión (a P_recalentamiento), 7 salida del
+    recalentador, 8 extracción (a P_regeneracion), 9 escape al condensador.
+    Sin recalentamiento 6 y 7 coinciden con 5; sin regeneración 2 y 3
+    coinciden con 1 y 8 con 9.
+
+    Args:
+        P_caldera: Presión de la caldera (kPa)
+        T_turbina: Temperatura de entrada a la turbina (K)
+        P_condensador: Presión del condensador (kPa)
+        eta_turbina, eta_bomba: Eficiencias isentrópicas
+        P_recalentamiento, T_recalentamiento: Recalentamiento (kPa, K); la
+            temperatura por defecto es T_turbina
+        P_regeneracion: Presión del calentador abierto (kPa); la extracción
+            sale de la etapa de alta si P_regeneracion ≥ P_recalentamiento
+        fluido: Backend del agua (Agua o TablaAgua)
+
+    Returns:
+        Dict con estados, eficiencia, trabajo_neto, trabajo_turbina,
+        trabajo_bomba, calor_entrada, calor_salida, relacion_trabajo
+        (trabajo de bombeo / trabajo de turbina), fraccion_extraccion y
+        titulo_escape (con el escape sobrecalentado se extiende con la
+        entalpía, (h - h_f) / (h_g - h_f) > 1, en lugar de quedar en NaN)
+    """
+    agua = fluido or Agua()
+    Pb = np.asarray(P_caldera, dtype=float)
+    Pc = np.asarray(P_condensador, dtype=float)
+    Prh = Pb if P_recalentamiento is None else np.asarray(P_recalentamiento, dtype=float)
+    Trh = T_turbina if T_recalentamiento is None else T_recalentamiento
+    Pr = Pc if P_regeneracion is None else np.asarray(P_regeneracion, dtype=float)
+
+    e1 = _liquido_saturado(agua, Pc)
+    e2 = _comprimir(agua, e1, Pr, eta_bomba)
+    e3 = _liquido_saturado(agua, Pr)
+    e4 = _comprimir(agua, e3, Pb, eta_bomba)
+    e5 = agua.estado_pt(Pb, T_turbina)
+
+    # La extracción sale antes o después del recalentamiento según su presión
+    antes = Pr >= Prh
+    extraccion_ap = _expandir(agua, e5, np.maximum(Pr, Prh), eta_turbina)
+    e6 = _expandir(agua, {c: np.where(antes, extraccion_ap[c], e5[c]) for c in ('h', 's')},
+                   Prh, eta_turbina)
+    e7 = agua.estado_pt(Prh, Trh)
+    extraccion_bp = _expandir(agua, e7, np.minimum(Pr, Prh), eta_turbina)
+    e8 = {c: np.where(antes, extraccion_ap[c], extraccion_bp[c]) for c in extraccion_ap}
+    e9 = _expandir(agua, {c: np.where(antes, e7[c], e8[c]) for c in ('h', 's')}, Pc, eta_turbina)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = np.where(e8['h'] > e2['h'], (e3['h'] - e2['h']) / (e8['h'] - e2['h']), 0.0)
+    trabajo_turbina = np.where(antes,
+                               (e5['h'] - e8['h']) + (1 - y) * (e8['h'] - e6['h'])
+                               + (1 - y) * (e7['h'] - e9['h']),
+                               (e5['h'] - e6['h']) + (e7['h'] - e8['h'])
+                               + (1 - y) * (e8['h'] - e9['h']))
+    trabajo_bomba = (1 - y) * (e2['h'] - e1['h']) + (e4['h'] - e3['h'])
+    calor_entrada = (e5['h'] - e4['h']) + np.where(antes, 1 - y, 1.0) * (e7['h'] - e6['h'])
+    calor_salida = (1 - y) * (e9['h'] - e1['h'])
+    trabajo_neto = trabajo_turbina - trabajo_bomba
+    sat = agua.saturacion(Pc)
+    with np.errstate(invalid='ignore'):
+        titulo_escape = np.where(np.isnan(e9['x']), (e9['h'] - sat['h_f']) / (sat['h_g'] - sat['h_f']), e9['x'])
+    return {
+        'estados': dict(zip('123456789', (e1, e2, e3, e4, e5, e6, e7, e8, e9))),
+        'eficiencia': trabajo_neto / calor_entrada,
+        'trabajo_neto': trabajo_neto,
+        'trabajo_turbina': trabajo_turbina,
+        'trabajo_bomba': trabajo_bomba,
+        'calor_entrada': calor_entrada,
+        'calor_salida': calor_salida,
+        'relacion_trabajo': trabajo_bomba / trabajo_turbina,
+        'fraccion_extraccion': y,
+        'titulo_escape': titulo_escape,
+    }
+
+
+def ciclo_brayton(relacion_presion, T_turbina, T_entrada=300.0, P_entrada=100.0,
+                  eta_compresor=1.0, eta_turbina=1.0, efectividad_regenerador=0.0,
+                  recalentamiento: bool = False, gas: Optional[MezclaGasIdeal] = None) -> Dict:
+    """
+    Ciclo Brayton con regenerador y recalentamiento opcionales.
+
+    Estados: 1 entrada al compresor, 2 salida del compresor, 'r' salida del
+    regenerador (lado frío), 3 entrada a la turbina, 4 salida de la primera
+    etapa, 5 salida del recalentador, 6 escape de la turbina, 7 escape tras
+    el regenerador. Con recalentamiento la expansión se divide en la media
+    geométrica de presiones y se recalienta hasta T_turbina.
+
+    Args:
+        relacion_presion: P2/P1
+        T_turbina: Temperatura de entrada a la turbina (K)
+        T_entrada, P_entrada: Estado de entrada al compresor (K, kPa)
+        eta_compresor, eta_turbina: Eficiencias isentrópicas
+        efectividad_regenerador: 0 sin regenerador; sólo actúa si el
+            escape está más caliente que la descarga del compresor
+        recalentamiento: Dos etapas de turbina con recalentamiento
+        gas: Fluido de trabajo (por defecto aire con cp(T))
+
+    Returns:
+        Dict con estados, eficiencia, trabajo_neto, trabajo_compresor,
+        trabajo_turbina, calor_entrada, calor_salida y relacion_trabajo
+    """
+    gas = gas or MezclaGasIdeal()
+    P1 = np.asarray(P_entrada, dtype=float)
+    P2 = P1 * np.asarray(relacion_presion, dtype=float)
+    Pm = np.sqrt(P1 * P2) if recalentamiento else P2
+
+    e1 = gas.estado_pt(P1, T_entrada)
+    e2 = _comprimir(gas, e1, P2, eta_compresor)
+    e3 = gas.estado_pt(P2, T_turbina)
+    e4 = _expandir(gas, e3, Pm, eta_turbina)
+    e5 = gas.estado_pt(Pm, T_turbina)
+    e6 = _expandir(gas, e5, P1, eta_turbina)
+
+    recuperado = np.asarray(efectividad_regenerador) * np.maximum(e6['h'] - e2['h'], 0.0)
+    er = gas.estado_ph(P2, e2['h'] + recuperado)
+    e7 = gas.estado_ph(P1, e6['h'] - recuperado)
+
+    trabajo_compresor = e2['h'] - e1['h']
+    trabajo_turbina = (e3['h'] - e4['h']) + (e5['h'] - e6['h'])
+    calor_entrada = (e3['h'] - er['h']) + (e5['h'] - e4['h'])
+    trabajo_neto = trabajo_turbina - trabajo_compresor
+    return {
+        'estados': {'1': e1, '2': e2, 'r': er, '3': e3, '4': e4, '5': e5, '6': e6, '7': e7},
+        'eficiencia': trabajo_neto / calor_entrada,
+        'trabajo_neto': trabajo_neto,
+        'trabajo_compresor': trabajo_compresor,
+        'trabajo_turbina': trabajo_turbina,
+        'calor_entrada': calor_entrada,
+        'calor_salida': e7['h'] - e1['h'],
+        'relacion_trabajo': trabajo_compresor / trabajo_turbina,
+    }
+
+
+def _ciclo_piston(e1, e2, e3, e4, calor_entrada) -> Dict:
+    """Balance de un ciclo de pistón con rechazo de calor a volumen constante."""
+    calor_salida = e4['u'] - e1['u']
+    trabajo_neto = calor_entrada - calor_salida
+    return {
+        'estados': {'1': e1, '2': e2, '3': e3, '4': e4},
+        'eficiencia': trabajo_neto / calor_entrada,
+        'trabajo_neto': trabajo_neto,
+        'calor_entrada': calor_entrada,
+        'calor_salida': calor_salida,
+        'presion_media_efectiva': trabajo_neto / (e1['v'] - e2['v']),
+        'presion_maxima': e3['P'],
+    }
+
+
+def ciclo_otto(relacion_compresion, T_maxima, T_entrada=300.0, P_entrada=100.0,
+               gas: Optional[MezclaGasIdeal] = None) -> Dict:
+    """
+    Ciclo Otto de aire estándar con cp(T).
+
+    Estados: 1 inicio de la compresión, 2 fin de la compresión isentrópica,
+    3 fin de la combustión a volumen constante (T_maxima), 4 fin de la
+    expansión isentrópica.
+
+    Returns:
+        Dict con estados, eficiencia, trabajo_neto, calor_entrada,
+        calor_salida, presion_media_efectiva (kPa) y presion_maxima (kPa)
+    """
+    gas = gas or MezclaGasIdeal()
+    e1 = gas.estado_pt(P_entrada, T_entrada)
+    e2 = gas.estado_vs(e1['v'] / np.asarray(relacion_compresion, dtype=float), e1['s'])
+    e3 = gas.estado_tv(T_maxima, e2['v'])
+    e4 = gas.estado_vs(e1['v'], e3['s'])
+    return _ciclo_piston(e1, e2, e3, e4, e3['u'] - e2['u'])
+
+
+def ciclo_diesel(relacion_compresion, T_maxima=None, relacion_corte=None, T_entrada=300.0,
+                 P_entrada=100.0, gas: Optional[MezclaGasIdeal] = None) -> Dict:
+    """
+    Ciclo Diesel de aire estándar con cp(T).
+
+    La combustión 2-3 es a presión constante y termina en T_maxima o en
+    v3 = relacion_corte·v2 (uno de los dos).
+
+    Returns:
+        Dict como ciclo_otto más relacion_corte
+    """
+    if (T_maxima is None) == (relacion_corte is None):
+        raise ValueError("Indique T_maxima o relacion_corte, no ambos")
+    gas = gas or MezclaGasIdeal()
+    e1 = gas.estado_pt(P_entrada, T_entrada)
+    e2 = gas.estado_vs(e1['v'] / np.asarray(relacion_compresion, dtype=float), e1['s'])
+    T3 = T_maxima if T_maxima is not None else e2['T'] * np.asarray(relacion_corte, dtype=float)
+    e3 = gas.estado_pt(e2['P'], T3)
+    e4 = gas.estado_vs(e1['v'], e3['s'])
+    resultado = _ciclo_piston(e1, e2, e3, e4, e3['h'] - e2['h'])
+    resultado['relacion_corte'] = e3['v'] / e2['v']
+    return resultado
+
+
+def ciclo_carnot(T_alta, T_baja, P_alta, P_baja, gas: Optional[MezclaGasIdeal] = None) -> Dict:
+    """
+    Ciclo de Carnot de gas ideal entre las temperaturas T_alta y T_baja.
+
+    La expansión isoterma va de 3 (P_alta, T_alta) a 4 (P_baja, T_alta); las
+    presiones de los extremos fríos salen de las isentrópicas hasta T_baja:
+    1 (T_baja, s4) tras la expansión isentrópica y 2 (T_baja, s3) al final
+    de la compresión isoterma. Así cualquier P_alta > P_baja da un ciclo
+    válido; la presión mínima del ciclo (estado 1) queda por debajo de P_baja.
+    """
+    if np.any(np.asarray(P_alta) <= np.asarray(P_baja)):
+        raise ValueError("P_alta debe ser mayor que P_baja en un ciclo de Carnot")
+    if np.any(np.asarray(T_alta) <= np.asarray(T_baja)):
+        raise ValueError("T_alta debe ser mayor que T_baja en un ciclo de Carnot")
+    gas = gas or MezclaGasIdeal()
+    e3 = gas.estado_pt(P_alta, T_alta)
+    e4 = gas.estado_pt(P_baja, T_alta)
+    e1 = gas.estado_ts(T_baja, e4['s'])
+    e2 = gas.estado_ts(T_baja, e3['s'])
+    calor_entrada = np.asarray(T_alta) * (e4['s'] - e3['s'])
+    calor_salida = np.asarray(T_baja) * (e4['s'] - e3['s'])
+    trabajo_neto = calor_entrada - calor_salida
+    return {
+        'estados': {'1': e1, '2': e2, '3': e3, '4': e4},
+        'eficiencia': trabajo_neto / calor_entrada,
+        'trabajo_neto': trabajo_neto,
+        'calor_entrada': calor_entrada,
+        'calor_salida': calor_salida,
+    }
+
+
+def tabla_estados(resultado: Dict, indice=()) -> pd.DataFrame:
+    """
+    Tabla de puntos de estado de un ciclo.
+
+    Args:
+        resultado: Resultado de una función ciclo_*
+        indice: Índice del punto de un barrido (p. ej. (i, j)); () si es escalar
+
+    Returns:
+        DataFrame con una fila por estado y columnas P, T, h, s, v y x
+    """
+    forma = np.broadcast_shapes(*(np.shape(e[c]) for e in resultado['estados'].values()
+                                  for c in ('P', 'T', 'h', 's', 'v', 'x')))
+    filas = {nombre: {c: float(np.broadcast_to(e[c], forma)[indice])
+                      for c in ('P', 'T', 'h', 's', 'v', 'x')}
+             for nombre, e in resultado['estados'].items()}
+    tabla = pd.DataFrame.from_dict(filas, orient='index')
+    tabla.index.name = 'estado'
+    return tabla
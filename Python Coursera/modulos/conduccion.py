@@ -0,0 +1,442 @@
+# =============================================================================
+# MÓDULO DE CONDUCCIÓN EN PAREDES COMPUESTAS
+# =============================================================================
+# Propósito: Conducción unidimensional transitoria y estacionaria en paredes
+#            planas y cilíndricas (tuberías, hornos, hornos rotatorios) de
+#            varias capas, con convección y radiación en las superficies, y
+#            optimización del espesor de aislamiento (costo de la energía
+#            perdida contra costo del aislamiento) evaluada en una malla
+#            espesor × material vectorizada
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Temperaturas en K, longitudes en m. Flujos por unidad: W/m² de pared en
+# geometría 'plana' y W/m de longitud en 'cilindrica'; las resistencias
+# térmicas correspondientes en m²·K/W y m·K/W.
+# Transitorio: volúmenes finitos centrados en celdas (ninguna celda cruza
+# una interfaz entre capas) y Euler implícito; el sistema de cada paso es
+# tridiagonal y se resuelve con solve_banded. La radiación se linealiza con
+# h_r = εσ(T_s² + T_alr²)(T_s + T_alr), reevaluado en cada subiteración.
+# La conductividad de cada capa es constante (valor a la temperatura media).
+# =============================================================================
+
+import numpy as np
+from scipy.linalg import solve_banded
+from typing import Callable, Dict, Optional, Sequence, Union
+
+SIGMA = 5.670374419e-8   # Constante de Stefan-Boltzmann (W/m²·K⁴)
+
+# Propiedades típicas: k (W/m·K), rho (kg/m³), cp (J/kg·K); los aislantes
+# incluyen la temperatura máxima de servicio T_max (K) y el costo instalado
+# por volumen (unidades monetarias/m³)
+MATERIALES = {
+    'acero_carbono': {'k': 45.0, 'rho': 7850.0, 'cp': 475.0},
+    'acero_inoxidable': {'k': 16.0, 'rho': 8000.0, 'cp': 500.0},
+    'ladrillo_refractario': {'k': 1.0, 'rho': 2000.0, 'cp': 960.0},
+    'concreto': {'k': 1.4, 'rho': 2300.0, 'cp': 880.0},
+    'lana_mineral': {'k': 0.040, 'rho': 100.0, 'cp': 840.0, 'T_max': 923.0, 'costo': 120.0},
+    'lana_vidrio': {'k': 0.038, 'rho': 48.0, 'cp': 840.0, 'T_max': 723.0, 'costo': 80.0},
+    'silicato_calcio': {'k': 0.060, 'rho': 240.0, 'cp': 840.0, 'T_max': 923.0, 'costo': 450.0},
+    'fibra_ceramica': {'k': 0.090, 'rho': 128.0, 'cp': 1070.0, 'T_max': 1533.0, 'costo': 600.0},
+    'vidrio_celular': {'k': 0.045, 'rho': 120.0, 'cp': 840.0, 'T_max': 703.0, 'costo': 500.0},
+    'poliuretano': {'k': 0.025, 'rho': 40.0, 'cp': 1400.0, 'T_max': 383.0, 'costo': 200.0},
+}
+
+AISLANTES = [nombre for nombre, p in MATERIALES.items() if 'costo' in p]
+
+
+def _area(geometria: str, r):
+    """Área de transferencia por unidad (1 m² o 2πr por metro de longitud)."""
+    r = np.asarray(r, dtype=float)
+    return np.ones_like(r) if geometria == 'plana' else 2 * np.pi * r
+
+
+def _resistencia(geometria: str, r1, r2, k):
+    """Resistencia de conducción entre las posiciones r1 y r2."""
+    r1, r2, k = (np.asarray(a, dtype=float) for a in (r1, r2, k))
+    if geometria == 'plana':
+        return (r2 - r1) / k
+    return np.log(r2 / r1) / (2 * np.pi * k)
+
+
+def _volumen(geometria: str, r1, r2):
+    """Volumen entre r1 y r2 por unidad (m³/m² o m³/m)."""
+    r1, r2 = np.asarray(r1, dtype=float), np.asarray(r2, dtype=float)
+    return r2 - r1 if geometria == 'plana' else np.pi * (r2**2 - r1**2)
+
+
+class Capa:
+    """Capa homogénea de una pared compuesta."""
+
+    def __init__(self, espesor: float, conductividad: float, densidad: Optional[float] = None,
+                 calor_especifico: Optional[float] = None, nombre: str = ""):
+        """
+        Args:
+            espesor: Espesor de la capa (m)
+            conductividad: Conductividad térmica (W/m·K)
+            densidad: Densidad (kg/m³); sólo necesaria para el transitorio
+            calor_especifico: Calor específico (J/kg·K); sólo para el transitorio
+            nombre: Identificación de la capa
+        """
+        if espesor <= 0 or conductividad <= 0:
+            raise ValueError("El espesor y la conductividad de la capa deben ser positivos")
+        self.espesor = espesor
+        self.conductividad = conductividad
+        self.densidad = densidad
+        self.calor_especifico = calor_especifico
+        self.nombre = nombre
+
+    @classmethod
+    def de_material(cls, material: str, espesor: float) -> 'Capa':
+        """Capa con las propiedades de MATERIALES."""
+        p = MATERIALES[material]
+        return cls(espesor, p['k'], p['rho'], p['cp'], material)
+
+
+class Frontera:
+    """Condición de convección y radiación en una superficie."""
+
+    def __init__(self, T_fluido: Union[float, Callable[[float], float]], h: float,
+                 emisividad: float = 0.0, T_alrededores: Optional[float] = None):
+        """
+        Args:
+            T_fluido: Temperatura del fluido (K), constante o función del tiempo (s)
+            h: Coeficiente de convección (W/m²·K); np.inf impone T_fluido en la
+                superficie y 0 (sin radiación) la deja adiabática
+            emisividad: Emisividad de la superficie (0 sin radiación)
+            T_alrededores: Temperatura de los alrededores para radiación
+                (K); por defecto la del fluido
+        """
+        self.T_fluido = T_fluido
+        self.h = h
+        self.emisividad = emisividad
+        self.T_alrededores = T_alrededores
+
+    def temperatura(self, t: float = 0.0) -> float:
+        """Temperatura del fluido en el instante t."""
+        return self.T_fluido(t) if callable(self.T_fluido) else self.T_fluido
+
+    def coeficientes(self, T_superficie, t: float = 0.0):
+        """
+        Coeficiente combinado h_c + h_r y temperatura equivalente del medio.
+
+        Returns:
+            (h_total, T_equivalente) con q'' = h_total (T_equivalente - T_s)
+        """
+        T_f = self.temperatura(t)
+        if np.isinf(self.h):
+            return np.inf, T_f
+        T_alr = T_f if self.T_alrededores is None else self.T_alrededores
+        T_s = np.asarray(T_superficie, dtype=float)
+        h_r = self.emisividad * SIGMA * (T_s**2 + T_alr**2) * (T_s + T_alr)
+        h_total = self.h + h_r
+        with np.errstate(invalid='ignore'):
+            T_eq = np.where(h_total > 0, (self.h * T_f + h_r * T_alr) / h_total, T_f)
+        return h_total, T_eq
+
+
+def _red_estacionaria(R_conduccion, A_interior, A_exterior, interior: Frontera,
+                      exterior: Frontera, tol: float = 1e-10, max_iter: int = 100) -> Dict[str, np.ndarray]:
+    """
+    Flujo estacionario a través de la red convección-conducción-convección.
+
+    Los coeficientes de radiación se actualizan por sustitución sucesiva con
+    las temperaturas de superficie; todas las entradas se combinan por
+    broadcasting.
+
+    Returns:
+        Dict con q, T_superficie_interior, T_superficie_exterior,
+        R_interior y R_exterior (resistencias superficiales)
+    """
+    T_i, T_e = interior.temperatura(), exterior.temperatura()
+    forma = np.broadcast_shapes(np.shape(R_conduccion), np.shape(A_interior), np.shape(A_exterior))
+    Ts_i = np.full(forma, T_i, dtype=float)
+    Ts_e = np.full(forma, T_e, dtype=float)
+    for _ in range(max_iter):
+        h_i, Teq_i = interior.coeficientes(Ts_i)
+        h_e, Teq_e = exterior.coeficientes(Ts_e)
+        with np.errstate(divide='ignore'):
+            R_i = 1 / (h_i * A_interior)
+            R_e = 1 / (h_e * A_exterior)
+        R_total = R_i + R_conduccion + R_e
+        q = (Teq_i - Teq_e) / R_total
+        # Expresadas así siguen siendo finitas con R_i o R_e nulas o infinitas
+        nuevo_i = Teq_e + (Teq_i - Teq_e) * (R_conduccion + R_e) / R_total
+        nuevo_e = Teq_i - (Teq_i - Teq_e) * (R_i + R_conduccion) / R_total
+        cambio = np.max(np.abs(nuevo_i - Ts_i) + np.abs(nuevo_e - Ts_e), initial=0.0)
+        Ts_i, Ts_e = nuevo_i, nuevo_e
+        if cambio <= tol * max(abs(T_i), abs(T_e), 1.0):
+            break
+    return {'q': q, 'T_superficie_interior': Ts_i, 'T_superficie_exterior': Ts_e,
+            'R_interior': R_i, 'R_exterior': R_e}
+
+
+class ParedCompuesta:
+    """Pared plana o cilíndrica de varias capas, de adentro hacia afuera."""
+
+    def __init__(self, capas: Sequence[Capa], geometria: str = 'plana',
+                 radio_interior: Optional[float] = None, nodos_por_capa: int = 20):
+        """
+        Args:
+            capas: Capas desde la superficie interior (caliente) a la exterior
+            geometria: 'plana' o 'cilindrica'
+            radio_interior: Radio de la superficie interior (m), requerido
+                en geometría cilíndrica
+            nodos_por_capa: Celdas de volumen finito por capa (entero o
+                secuencia con un valor por capa)
+        """
+        if geometria not in ('plana', 'cilindrica'):
+            raise ValueError(f"Geometría no reconocida: {geometria}")
+        if geometria == 'cilindrica' and not radio_interior:
+            raise ValueError("La geometría cilíndrica requiere radio_interior")
+        self.capas = list(capas)
+        self.geometria = geometria
+        self.radio_interior = radio_interior if geometria == 'cilindrica' else 0.0
+        self.nodos_por_capa = np.broadcast_to(nodos_por_capa, (len(self.capas),)).astype(int)
+        self.interfaces = self.radio_interior + np.concatenate(
+            [[0.0], np.cumsum([c.espesor for c in self.capas])])
+
+    @property
+    def radio_exterior(self) -> float:
+        """Posición de la superficie exterior (radio o espesor total)."""
+        return self.interfaces[-1]
+
+    def resistencias(self) -> np.ndarray:
+        """Resistencia de conducción de cada capa."""
+        k = [c.conductividad for c in self.capas]
+        return _resistencia(self.geometria, self.interfaces[:-1], self.interfaces[1:], k)
+
+    def estacionario(self, interior: Frontera, exterior: Frontera,
+                     puntos_por_capa: int = 50) -> Dict[str, np.ndarray]:
+        """
+        Solución estacionaria exacta de la red de resistencias.
+
+        Args:
+            interior, exterior: Condiciones de superficie (se usa T_fluido(0))
+            puntos_por_capa: Puntos del perfil de temperatura por capa
+
+        Returns:
+            Dict con q (W/m² o W/m), T_interfaces (n_capas + 1),
+            resistencias (por capa), R_interior, R_exterior, R_total y el
+            perfil posicion, T
+        """
+        R = self.resistencias()
+        A_i = _area(self.geometria, self.interfaces[0])
+        A_e = _area(self.geometria, self.interfaces[-1])
+        red = _red_estacionaria(R.sum(), A_i, A_e, interior, exterior)
+        q = red['q']
+        T_interfaces = red['T_superficie_interior'] - q * np.concatenate([[0.0], np.cumsum(R)])
+
+        posicion, T = [], []
+        for i, capa in enumerate(self.capas):
+            r = np.linspace(self.interfaces[i], self.interfaces[i + 1], puntos_por_capa)
+            caida = q * _resistencia(self.geometria, self.interfaces[i], r, capa.conductividad)
+            posicion.append(r)
+            T.append(T_interfaces[i] - caida)
+        return {
+            'q': q,
+            'T_interfaces': T_interfaces,
+            'resistencias': R,
+            'R_interior': red['R_interior'],
+            'R_exterior': red['R_exterior'],
+            'R_total': red['R_interior'] + R.sum() + red['R_exterior'],
+            'posicion': np.concatenate(posicion),
+            'T': np.concatenate(T),
+        }
+
+    def _malla(self):
+        """Caras, centros y propiedades por celda."""
+        caras, k, rho_cp = [self.interfaces[:1]], [], []
+        for i, (capa, n) in enumerate(zip(self.capas, self.nodos_por_capa)):
+            if capa.densidad is None or capa.calor_especifico is None:
+                raise ValueError(f"La capa {i} ({capa.nombre}) no tiene densidad y calor específico")
+            caras.append(np.linspace(self.interfaces[i], self.interfaces[i + 1], n + 1)[1:])
+            k.append(np.full(n, capa.conductividad))
+            rho_cp.append(np.full(n, capa.densidad * capa.calor_especifico))
+        caras = np.concatenate(caras)
+        if self.geometria == 'plana':
+            centros = 0.5 * (caras[:-1] + caras[1:])
+        else:   # centro de volumen del anillo
+            centros = np.sqrt(0.5 * (caras[:-1]**2 + caras[1:]**2))
+        return caras, centros, np.concatenate(k), np.concatenate(rho_cp)
+
+    def transitorio(self, interior: Frontera, exterior: Frontera, T_inicial, duracion: float,
+                    paso: float, guardar_cada: int = 1,
+                    iteraciones_radiacion: int = 3) -> Dict[str, np.ndarray]:
+        """
+        Evolución temporal de la temperatura con Euler implícito.
+
+        Args:
+            interior, exterior: Condiciones de superficie
+            T_inicial: Temperatura inicial (K), escalar o una por celda
+            duracion: Tiempo simulado (s)
+            paso: Paso de tiempo (s); el esquema es incondicionalmente estable
+            guardar_cada: Guardar uno de cada tantos pasos
+            iteraciones_radiacion: Subiteraciones por paso para actualizar
+                h_r (1 basta sin radiación)
+
+        Returns:
+            Dict con t (n_t,), posicion (centros de celda), T (n_t, n),
+            T_superficie_interior, T_superficie_exterior, q_interior
+            (entrando por la superficie interior) y q_exterior (saliendo
+            por la exterior) (n_t,), y energia_almacenada (n_t,) (J/m² o
+            J/m) relativa al estado inicial
+        """
+        caras, centros, k, rho_cp = self._malla()
+        g = self.geometria
+        C = rho_cp * _volumen(g, caras[:-1], caras[1:]) / paso
+        R_izq = _resistencia(g, caras[:-1], centros, k)
+        R_der = _resistencia(g, centros, caras[1:], k)
+        G = 1 / (R_der[:-1] + R_izq[1:])          # conductancias entre celdas
+        A_i, A_e = _area(g, caras[0]), _area(g, caras[-1])
+
+        n = len(centros)
+        T = np.broadcast_to(np.asarray(T_inicial, dtype=float), (n,)).copy()
+        E0 = np.sum(C * paso * T)
+        Ts_i, Ts_e = T[0], T[-1]
+        banda = np.zeros((3, n))
+        banda[0, 1:] = -G
+        banda[2, :-1] = -G
+        diagonal = C + np.concatenate([G, [0.0]]) + np.concatenate([[0.0], G])
+
+        def superficies(t, Ts_i, Ts_e):
+            h_i, Teq_i = interior.coeficientes(Ts_i, t)
+            h_e, Teq_e = exterior.coeficientes(Ts_e, t)
+            with np.errstate(divide='ignore'):
+                R_si, R_se = 1 / (h_i * A_i), 1 / (h_e * A_e)
+            return Teq_i, Teq_e, R_si, R_se, 1 / (R_si + R_izq[0]), 1 / (R_se + R_der[-1])
+
+        def temperatura_superficie(T_celda, T_eq, R_s, R_medio):
+            return T_celda - (T_celda - T_eq) * R_medio / (R_s + R_medio)
+
+        registros = {c: [] for c in ('t', 'T', 'T_superficie_interior', 'T_superficie_exterior',
+                                     'q_interior', 'q_exterior')}
+
+        def guardar(t, T, Ts_i, Ts_e, q_i, q_e):
+            for clave, valor in zip(registros, (t, T.copy(), Ts_i, Ts_e, q_i, q_e)):
+                registros[clave].append(valor)
+
+        Teq_i, Teq_e, R_si, R_se, U_i, U_e = superficies(0.0, Ts_i, Ts_e)
+        Ts_i = temperatura_superficie(T[0], Teq_i, R_si, R_izq[0])
+        Ts_e = temperatura_superficie(T[-1], Teq_e, R_se, R_der[-1])
+        guardar(0.0, T, Ts_i, Ts_e, U_i * (Teq_i - T[0]), U_e * (T[-1] - Teq_e))
+
+        pasos = int(np.ceil(duracion / paso - 1e-9))
+        for j in range(1, pasos + 1):
+            t = j * paso
+            for _ in range(max(iteraciones_radiacion, 1)):
+                Teq_i, Teq_e, R_si, R_se, U_i, U_e = superficies(t, Ts_i, Ts_e)
+                banda[1] = diagonal
+                banda[1, 0] += U_i
+                banda[1, -1] += U_e
+                b = C * T
+                b[0] += U_i * Teq_i
+                b[-1] += U_e * Teq_e
+                nuevo = solve_banded((1, 1), banda, b)
+                Ts_i = temperatura_superficie(nuevo[0], Teq_i, R_si, R_izq[0])
+                Ts_e = temperatura_superficie(nuevo[-1], Teq_e, R_se, R_der[-1])
+            T = nuevo
+            if j % guardar_cada == 0 or j == pasos:
+                guardar(t, T, Ts_i, Ts_e, U_i * (Teq_i - T[0]), U_e * (T[-1] - Teq_e))
+
+        resultado = {clave: np.array(valor, dtype=float) for clave, valor in registros.items()}
+        resultado['posicion'] = centros
+        resultado['energia_almacenada'] = resultado['T'] @ (C * paso) - E0
+        return resultado
+
+
+def factor_recuperacion_capital(tasa, vida_util):
+    """Anualidad por unidad de inversión: i(1+i)ⁿ / ((1+i)ⁿ - 1)."""
+    tasa = np.asarray(tasa, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frc = tasa * (1 + tasa)**vida_util / ((1 + tasa)**vida_util - 1)
+    return np.where(tasa == 0, 1.0 / vida_util, frc)
+
+
+def optimizar_aislamiento(pared: ParedCompuesta, interior: Frontera, exterior: Frontera,
+                          espesores, materiales: Optional[Sequence[str]] = None,
+                          costo_energia: float = 0.08, horas_anuales: float = 8760.0,
+                          eficiencia_generacion: float = 1.0, vida_util: float = 10.0,
+                          tasa: float = 0.08, T_superficie_max: Optional[float] = None,
+                          propiedades: Optional[Dict[str, Dict]] = None) -> Dict:
+    """
+    Espesor económico de aislamiento sobre la cara exterior de una pared.
+
+    Para cada espesor y material se resuelve la red estacionaria (con la
+    radiación exterior recalculada para la nueva superficie) y se suman el
+    costo anual de la energía perdida y el costo anualizado del aislamiento.
+    En geometría cilíndrica el área exterior crece con el espesor, de modo
+    que aparece el radio crítico de aislamiento.
+
+    Args:
+        pared: Pared o tubería sin aislar
+        interior, exterior: Condiciones de superficie
+        espesores: Espesores a evaluar (n,) (m); incluir 0 para el caso sin aislar
+        materiales: Nombres de aislantes (por defecto AISLANTES)
+        costo_energia: Costo de la energía térmica (por kWh)
+        horas_anuales: Horas de operación por año
+        eficiencia_generacion: Eficiencia de la caldera u horno que repone el calor
+        vida_util: Años de amortización del aislamiento
+        tasa: Tasa de descuento anual
+        T_superficie_max: Temperatura máxima de la superficie exterior (K),
+            p. ej. 333 K por protección del personal
+        propiedades: Materiales adicionales con claves k, costo y T_max,
+            con el formato de MATERIALES
+
+    Returns:
+        Dict con espesores (n,), materiales (m,), q, T_superficie,
+        T_cara_caliente (temperatura bajo el aislamiento), costo_energia,
+        costo_aislamiento, costo_total y factible (n, m); espesor_optimo y
+        costo_optimo (m,) (NaN si ningún espesor es factible) y optimo
+        {'material', 'espesor', 'costo_total', 'q'}
+    """
+    catalogo = {**MATERIALES, **(propiedades or {})}
+    materiales = list(materiales or AISLANTES)
+    k = np.array([catalogo[m]['k'] for m in materiales])
+    costo_m3 = np.array([catalogo[m]['costo'] for m in materiales])
+    T_max = np.array([catalogo[m].get('T_max', np.inf) for m in materiales])
+
+    e = np.asarray(espesores, dtype=float)[:, None]
+    g = pared.geometria
+    r1 = pared.radio_exterior
+    r2 = r1 + e
+    R_aislante = _resistencia(g, r1, r2, k[None, :])
+    red = _red_estacionaria(pared.resistencias().sum() + R_aislante,
+                            _area(g, pared.interfaces[0]), _area(g, r2), interior, exterior)
+    q = red['q']
+    T_cara = red['T_superficie_exterior'] + q * R_aislante
+
+    costo_energia_anual = q * horas_anuales / 1000 * costo_energia / eficiencia_generacion
+    costo_aislamiento = _volumen(g, r1, r2) * costo_m3 * factor_recuperacion_capital(tasa, vida_util)
+    costo_total = costo_energia_anual + costo_aislamiento
+
+    factible = (T_cara <= T_max) | (e == 0)
+    if T_superficie_max is not None:
+        factible &= red['T_superficie_exterior'] <= T_superficie_max
+    candidato = np.where(factible, costo_total, np.inf)
+    i_opt = np.argmin(candidato, axis=0)
+    hay = np.isfinite(candidato.min(axis=0))
+    columnas = np.arange(len(materiales))
+    espesor_optimo = np.where(hay, e[i_opt, 0], np.nan)
+    costo_optimo = np.where(hay, candidato[i_opt, columnas], np.nan)
+
+    optimo = None
+    if hay.any():
+        j = int(np.nanargmin(costo_optimo))
+        optimo = {'material': materiales[j], 'espesor': float(espesor_optimo[j]),
+                  'costo_total': float(costo_optimo[j]), 'q': float(q[i_opt[j], j])}
+    return {
+        'espesores': e[:, 0],
+        'materiales': materiales,
+        'q': q,
+        'T_superficie': red['T_superficie_exterior'],
+        'T_cara_caliente': T_cara,
+        'costo_energia': costo_energia_anual,
+        'costo_aislamiento': costo_aislamiento,
+        'costo_total': costo_total,
+        'factible': factible,
+        'espesor_optimo': espesor_optimo,
+        'costo_optimo': costo_optimo,
+        'optimo': optimo,
+    }
@@ -0,0 +1,314 @@
+# =============================================================================
+# MÓDULO DE CONFIABILIDAD ESTRUCTURAL
+# =============================================================================
+# Propósito: Probabilidad de falla de verificaciones de resistencia y fatiga
+#            ante la dispersión de cargas, dimensiones y propiedades, para
+#            cualquier función de estado límite vectorizada de la capa de
+#            cálculo: Monte Carlo simple y por hipercubo latino, muestreo por
+#            importancia centrado en el punto de diseño, FORM y SORM, con
+#            intervalos de confianza
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Estado límite g(x) con falla para g ≤ 0. Las variables son independientes
+# y se llevan al espacio normal estándar con la transformación de Rosenblatt
+#   x = F⁻¹(Φ(u)),   G(u) = g(x(u))
+# FORM (Hasofer-Lind / Rackwitz-Fiessler):
+#   u_{k+1} = [(∇G·u_k - G) / |∇G|²] ∇G,   β = |u*|,   pf ≈ Φ(-β)
+#   α = -∇G/|∇G| (factores de importancia, Σα² = 1)
+# SORM: curvaturas κ_i de la superficie en u* (autovalores de R·H·Rᵀ/|∇G|
+# en el plano tangente)
+#   Breitung             pf ≈ Φ(-β) Π (1 + β κ_i)^(-½)
+#   Hohenbichler-Rackwitz pf ≈ Φ(-β) Π (1 + κ_i φ(β)/Φ(-β))^(-½)
+# Muestreo por importancia: u ~ N(u*, I), peso w = φ(u)/φ(u - u*)
+#   pf = E[1(G ≤ 0) · w]
+# Intervalos: Wilson para Monte Carlo simple, medias por lote (t de Student)
+# para hipercubo latino y normal para muestreo por importancia.
+# =============================================================================
+
+import numpy as np
+from scipy import stats
+from scipy.optimize import brentq
+from scipy.special import gamma
+from typing import Callable, Dict, Optional
+
+DISTRIBUCIONES = ('normal', 'lognormal', 'gumbel', 'weibull', 'uniforme')
+EULER = 0.5772156649015329
+
+
+class VariableAleatoria:
+    """Variable aleatoria definida por su media y desviación estándar."""
+
+    def __init__(self, distribucion: str, media: float, desviacion: float):
+        """
+        Args:
+            distribucion: Una de DISTRIBUCIONES ('gumbel' de máximos para
+                          cargas, 'weibull' de mínimos para resistencias)
+            media: Valor medio
+            desviacion: Desviación estándar (> 0)
+        """
+        if distribucion not in DISTRIBUCIONES:
+            raise ValueError(f"Distribución desconocida: '{distribucion}'. Use una de {DISTRIBUCIONES}")
+        if desviacion <= 0:
+            raise ValueError("La desviación estándar debe ser positiva")
+        if distribucion in ('lognormal', 'weibull') and media <= 0:
+            raise ValueError(f"La distribución {distribucion} requiere media positiva")
+        self.distribucion, self.media, self.desviacion = distribucion, media, desviacion
+        if distribucion == 'normal':
+            self.dist = stats.norm(loc=media, scale=desviacion)
+        elif distribucion == 'lognormal':
+            zeta = np.sqrt(np.log1p((desviacion / media) ** 2))
+            self.dist = stats.lognorm(s=zeta, scale=media * np.exp(-0.5 * zeta ** 2))
+        elif distribucion == 'gumbel':
+            escala = desviacion * np.sqrt(6.0) / np.pi
+            self.dist = stats.gumbel_r(loc=media - EULER * escala, scale=escala)
+        elif distribucion == 'weibull':
+            cov2 = (desviacion / media) ** 2
+            k = brentq(lambda k: gamma(1 + 2 / k) / gamma(1 + 1 / k) ** 2 - 1 - cov2, 0.05, 500.0)
+            self.dist = stats.weibull_min(c=k, scale=media / gamma(1 + 1 / k))
+        else:
+            mitad = np.sqrt(3.0) * desviacion
+            self.dist = stats.uniform(loc=media - mitad, scale=2 * mitad)
+
+    def desde_normal(self, u) -> np.ndarray:
+        """Transformación x = F⁻¹(Φ(u)) (usa la cola superior para u > 0)."""
+        u = np.asarray(u, dtype=float)
+        return np.where(u > 0, self.dist.isf(stats.norm.sf(u)), self.dist.ppf(stats.norm.cdf(u)))
+
+    def a_normal(self, x) -> np.ndarray:
+        """Transformación inversa u = Φ⁻¹(F(x))."""
+        return stats.norm.ppf(self.dist.cdf(np.asarray(x, dtype=float)))
+
+
+class _EstadoLimite:
+    """Evalúa G(u) por lotes y cuenta las evaluaciones de g."""
+
+    def __init__(self, funcion: Callable, variables: Dict[str, VariableAleatoria], fijos: Optional[dict]):
+        if not variables:
+            raise ValueError("Se requiere al menos una variable aleatoria")
+        self.funcion, self.variables, self.fijos = funcion, variables, dict(fijos or {})
+        self.nombres = list(variables)
+        self.evaluaciones = 0
+
+    def fisico(self, u: np.ndarray) -> Dict[str, np.ndarray]:
+        return {n: self.variables[n].desde_normal(u[:, i]) for i, n in enumerate(self.nombres)}
+
+    def __call__(self, u: np.ndarray) -> np.ndarray:
+        u = np.atleast_2d(u)
+        self.evaluaciones += len(u)
+        g = np.asarray(self.funcion(**self.fisico(u), **self.fijos), dtype=float)
+        return np.broadcast_to(g, (len(u),)).copy()
+
+    def gradiente(self, u: np.ndarray, h: float):
+        """G y ∇G por diferencias centrales en una sola evaluación por lote."""
+        n = len(u)
+        puntos = np.vstack([u, u + h * np.eye(n), u - h * np.eye(n)])
+        G = self(puntos)
+        return G[0], (G[1:n + 1] - G[n + 1:]) / (2 * h)
+
+
+def _intervalo_wilson(fallas: float, n: int, z: float):
+    p = fallas / n
+    centro = (p + z * z / (2 * n)) / (1 + z * z / n)
+    semi = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return max(centro - semi, 0.0), min(centro + semi, 1.0)
+
+
+def _resumen(pf: float, ic, n: int, desviacion_pf: float, metodo: str, evaluaciones: int, **extra) -> Dict:
+    with np.errstate(divide='ignore'):
+        cov = desviacion_pf / pf if pf > 0 else np.inf
+    salida = {'pf': pf, 'ic': tuple(float(v) for v in ic), 'cov': float(cov),
+              'beta': float(-stats.norm.ppf(pf)) if 0 < pf < 1 else (np.inf if pf == 0 else -np.inf),
+              'n': n, 'metodo': metodo, 'evaluaciones': evaluaciones}
+    salida.update(extra)
+    return salida
+
+
+def monte_carlo(funcion: Callable, variables: Dict[str, VariableAleatoria], n: int = 1_000_000,
+                lote: int = 1 << 17, metodo: str = 'simple', fijos: Optional[dict] = None,
+                confianza: float = 0.95, semilla: Optional[int] = None) -> Dict:
+    """
+    Probabilidad de falla por Monte Carlo en lotes grandes.
+
+    Args:
+        funcion: Estado límite vectorizado g(**variables, **fijos), falla g ≤ 0
+        variables: {nombre: VariableAleatoria}
+        n: Número total de muestras
+        lote: Muestras por llamada a la función
+        metodo: 'simple' o 'lhs' (hipercubo latino estratificado por lote)
+        fijos: Argumentos deterministas de la función
+        confianza: Nivel del intervalo de confianza
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        Diccionario con pf, ic, cov, beta equivalente, n, fallas, método y
+        evaluaciones
+    """
+    if metodo not in ('simple', 'lhs'):
+        raise ValueError("metodo debe ser 'simple' o 'lhs'")
+    estado = _EstadoLimite(funcion, variables, fijos)
+    rng = np.random.default_rng(semilla)
+    m = len(variables)
+    tamanos = [lote] * (n // lote) + ([n % lote] if n % lote else [])
+    fallas_lote = []
+    for tam in tamanos:
+        if metodo == 'lhs':
+            estratos = np.argsort(rng.random((m, tam)), axis=1).T
+            u = stats.norm.ppf((estratos + rng.random((tam, m))) / tam)
+        else:
+            u = rng.standard_normal((tam, m))
+        fallas_lote.append(np.count_nonzero(estado(u) <= 0))
+    fallas = float(np.sum(fallas_lote))
+    pf = fallas / n
+    z = stats.norm.ppf(0.5 + confianza / 2)
+    if metodo == 'simple' or len(tamanos) < 2:
+        ic = _intervalo_wilson(fallas, n, z)
+        desviacion = np.sqrt(pf * (1 - pf) / n)
+    else:
+        # Las muestras de un hipercubo no son independientes: varianza entre lotes
+        pf_lotes = np.array(fallas_lote) / np.array(tamanos)
+        desviacion = np.sqrt(np.average((pf_lotes - pf) ** 2, weights=tamanos) / (len(tamanos) - 1))
+        t = stats.t.ppf(0.5 + confianza / 2, len(tamanos) - 1)
+        ic = (max(pf - t * desviacion, 0.0), min(pf + t * desviacion, 1.0))
+    return _resumen(pf, ic, n, desviacion, metodo, estado.evaluaciones, fallas=int(fallas))
+
+
+def form(funcion: Callable, variables: Dict[str, VariableAleatoria], fijos: Optional[dict] = None,
+         tol: float = 1e-6, max_iter: int = 100, paso: float = 1e-5) -> Dict:
+    """
+    Método de confiabilidad de primer orden (HL-RF).
+
+    Args:
+        funcion: Estado límite vectorizado g(**variables, **fijos)
+        variables: {nombre: VariableAleatoria}
+        fijos: Argumentos deterministas de la función
+        tol: Tolerancia en la posición del punto de diseño (espacio u)
+        max_iter: Iteraciones máximas
+        paso: Paso de las diferencias centrales en el espacio u
+
+    Returns:
+        Diccionario con beta, pf, punto de diseño en u y en x, factores de
+        importancia alfa, gradiente, convergencia e iteraciones
+    """
+    estado = _EstadoLimite(funcion, variables, fijos)
+    u = np.array([variables[n].a_normal(variables[n].media) for n in estado.nombres])
+    G0 = None
+    convergio = False
+    for iteracion in range(1, max_iter + 1):
+        G, grad = estado.gradiente(u, paso)
+        G0 = G if G0 is None else G0
+        norma = np.linalg.norm(grad)
+        if norma == 0:
+            raise ValueError("El gradiente del estado límite es nulo: no se puede ubicar el punto de diseño")
+        nuevo = (grad @ u - G) / norma ** 2 * grad
+        cambio = np.linalg.norm(nuevo - u)
+        u = nuevo
+        if cambio < tol * max(1.0, np.linalg.norm(u)) and abs(G) <= 1e-6 * max(abs(G0), 1.0):
+            convergio = True
+            break
+    G, grad = estado.gradiente(u, paso)
+    alfa = -grad / np.linalg.norm(grad)
+    beta = float(np.copysign(np.linalg.norm(u), alfa @ u))
+    x = {n: float(v[0]) for n, v in estado.fisico(u[None, :]).items()}
+    return {'beta': beta, 'pf': float(stats.norm.cdf(-beta)), 'u': u, 'x': x,
+            'alfa': dict(zip(estado.nombres, alfa.tolist())), 'gradiente': grad, 'G': float(G),
+            'convergio': convergio, 'iteraciones': iteracion, 'evaluaciones': estado.evaluaciones}
+
+
+def sorm(funcion: Callable, variables: Dict[str, VariableAleatoria], fijos: Optional[dict] = None,
+         resultado_form: Optional[Dict] = None, paso: float = 1e-3, **opciones_form) -> Dict:
+    """
+    Corrección de segundo orden sobre el punto de diseño de FORM.
+
+    Args:
+        funcion: Estado límite vectorizado g(**variables, **fijos)
+        variables: {nombre: VariableAleatoria}
+        fijos: Argumentos deterministas de la función
+        resultado_form: Resultado previo de form (se calcula si es None)
+        paso: Paso de la hessiana por diferencias finitas en el espacio u
+        **opciones_form: Opciones de form si hay que calcularlo
+
+    Returns:
+        Resultado de FORM más curvaturas, pf de Breitung y de
+        Hohenbichler-Rackwitz ('pf_breitung', 'pf_hohenbichler')
+    """
+    r = resultado_form or form(funcion, variables, fijos, **opciones_form)
+    estado = _EstadoLimite(funcion, variables, fijos)
+    u, beta = r['u'], r['beta']
+    m = len(u)
+    # Hessiana con todos los puntos del estencil en un solo lote
+    E = np.eye(m) * paso
+    i, j = np.triu_indices(m, 1)
+    puntos = np.vstack([u, u + E, u - E, u + E[i] + E[j], u + E[i] - E[j], u - E[i] + E[j], u - E[i] - E[j]])
+    G = estado(puntos)
+    G0, Gp, Gm = G[0], G[1:m + 1], G[m + 1:2 * m + 1]
+    k = len(i)
+    Gpp, Gpm, Gmp, Gmm = (G[2 * m + 1 + s * k:2 * m + 1 + (s + 1) * k] for s in range(4))
+    H = np.diag((Gp - 2 * G0 + Gm) / paso ** 2)
+    H[i, j] = H[j, i] = (Gpp - Gpm - Gmp + Gmm) / (4 * paso ** 2)
+    grad = (Gp - Gm) / (2 * paso)
+    alfa = -grad / np.linalg.norm(grad)
+    # Base ortonormal con el último eje en la dirección de α
+    Q = np.linalg.qr(np.column_stack([alfa, np.eye(m)]))[0]
+    R = np.vstack([Q[:, 1:].T, alfa])
+    A = R @ H @ R.T / np.linalg.norm(grad)
+    curvaturas = np.linalg.eigvalsh(A[:-1, :-1]) if m > 1 else np.empty(0)
+    pf1 = stats.norm.cdf(-beta)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        breitung = pf1 * np.prod((1 + beta * curvaturas) ** -0.5)
+        psi = stats.norm.pdf(beta) / pf1
+        hohenbichler = pf1 * np.prod((1 + psi * curvaturas) ** -0.5)
+    salida = dict(r)
+    salida.update({'curvaturas': curvaturas, 'hessiana': H, 'pf_breitung': float(breitung),
+                   'pf_hohenbichler': float(hohenbichler),
+                   'evaluaciones': r['evaluaciones'] + estado.evaluaciones})
+    return salida
+
+
+def muestreo_importancia(funcion: Callable, variables: Dict[str, VariableAleatoria], n: int = 100_000,
+                         lote: int = 1 << 17, punto_diseno: Optional[np.ndarray] = None,
+                         fijos: Optional[dict] = None, confianza: float = 0.95,
+                         semilla: Optional[int] = None, **opciones_form) -> Dict:
+    """
+    Muestreo por importancia con densidad normal centrada en el punto de diseño.
+
+    Args:
+        funcion: Estado límite vectorizado g(**variables, **fijos)
+        variables: {nombre: VariableAleatoria}
+        n: Número total de muestras
+        lote: Muestras por llamada a la función
+        punto_diseno: Centro en el espacio u (se obtiene con form si es None)
+        fijos: Argumentos deterministas de la función
+        confianza: Nivel del intervalo de confianza
+        semilla: Semilla del generador aleatorio
+        **opciones_form: Opciones de form si hay que calcularlo
+
+    Returns:
+        Diccionario con pf, ic, cov, beta equivalente, n, método,
+        evaluaciones (incluidas las de FORM) y el punto de diseño usado
+    """
+    evaluaciones_form = 0
+    if punto_diseno is None:
+        r = form(funcion, variables, fijos, **opciones_form)
+        punto_diseno, evaluaciones_form = r['u'], r['evaluaciones']
+    centro = np.asarray(punto_diseno, dtype=float)
+    if centro.shape != (len(variables),):
+        raise ValueError("El punto de diseño debe tener una componente por variable")
+    estado = _EstadoLimite(funcion, variables, fijos)
+    rng = np.random.default_rng(semilla)
+    suma = suma2 = 0.0
+    restantes = n
+    while restantes > 0:
+        tam = min(lote, restantes)
+        u = centro + rng.standard_normal((tam, len(centro)))
+        w = np.exp(-u @ centro + 0.5 * centro @ centro) * (estado(u) <= 0)
+        suma += w.sum()
+        suma2 += (w * w).sum()
+        restantes -= tam
+    pf = float(suma / n)
+    desviacion = np.sqrt(max(suma2 / n - pf * pf, 0.0) / n)
+    z = stats.norm.ppf(0.5 + confianza / 2)
+    ic = (max(pf - z * desviacion, 0.0), min(pf + z * desviacion, 1.0))
+    return _resumen(pf, ic, n, desviacion, 'importancia', estado.evaluaciones + evaluaciones_form,
+                    punto_diseno=centro)
@@ -199,6 +199,19 @@ class DinamicaMaquinasApp:
         self.radio_rotor_var = tk.StringVar(value="0.5")
         ttk.Entry(rotor_frame, textvariable=self.radio_rotor_var, width=10).grid(row=2, column=1, padx=5)
         
+        # Eje y cojinetes del modelo de velocidades críticas (disco centrado)
+        ttk.Label(rotor_frame, text="Distancia entre cojinetes (m):").grid(row=3, column=0, sticky=tk.W)
+        self.longitud_eje_var = tk.StringVar(value="1.0")
+        ttk.Entry(rotor_frame, textvariable=self.longitud_eje_var, width=10).grid(row=3, column=1, padx=5)
+        
+        ttk.Label(rotor_frame, text="Diámetro del eje (m):").grid(row=4, column=0, sticky=tk.W)
+        self.diametro_eje_var = tk.StringVar(value="0.1")
+        ttk.Entry(rotor_frame, textvariable=self.diametro_eje_var, width=10).grid(row=4, column=1, padx=5)
+        
+        ttk.Label(rotor_frame, text="Rigidez de cada cojinete (N/m):").grid(row=5, column=0, sticky=tk.W)
+        self.rigidez_cojinete_var = tk.StringVar(value="1e8")
+        ttk.Entry(rotor_frame, textvariable=self.rigidez_cojinete_var, width=10).grid(row=5, column=1, padx=5)
+        
         # Desbalance
         ttk.Label(left_frame, text="Desbalance:").pack(anchor=tk.W, pady=(10, 0))
         
@@ -345,24 +358,13 @@ class DinamicaMaquinasApp:
             else:
                 tipo = "Mecanismo no-Grashof"
             
-            # Calcular ángulos para una revolución completa
+            # Calcular ángulos para una revolución completa (solver vectorizado)
+            from modulos.animacion import cinematica_4_barras
+            
             theta2 = np.linspace(0, 2*np.pi, 100)
-            theta3 = []
-            theta4 = []
-            
-            for t2 in theta2:
-                # Análisis de posición usando ecuaciones de cierre
-                A = 2*l3*l4 - 2*l1*l3*np.cos(t2)
-                B = -2*l1*l3*np.sin(t2)
-                C = l1**2 + l3**2 + l4**2 - l2**2 - 2*l1*l4*np.cos(t2)
-                
-                # Resolver para theta4
-                cos_theta4 = (-B*np.sqrt(B**2 - A**2 + C**2) + A*C) / (A**2 + B**2)
-                theta4.append(np.arccos(cos_theta4))
-                
-                # Calcular theta3
-                cos_theta3 = (l1*np.cos(t2) + l4*np.cos(theta4[-1]) - l2) / l3
-                theta3.append(np.arccos(cos_theta3))
+            posicion = cinematica_4_barras(l1, l2, l3, l4, theta2)
+            theta3 = posicion['theta3']
+            theta4 = posicion['theta4']
             
             # Guardar resultados
             self.datos_mecanismo = {
@@ -577,8 +579,10 @@ Análisis completado exitosamente.
             # Calcular momento de inercia
             I = 0.5 * m_rotor * r_rotor**2
             
-            # Calcular velocidad crítica
-            omega_critica = np.sqrt(1e6 / m_rotor)  # Asumiendo rigidez de 1e6 N/m
+            # Calcular velocidad crítica con el modelo de rotor por elementos viga
+            # (None si no hay ninguna en el rango analizado)
+            criticas = self.calcular_velocidades_criticas(m_rotor, r_rotor, omega*60/(2*np.pi))
+            omega_critica = criticas[0]['velocidad_rpm'] * 2*np.pi/60 if criticas else None
             
             # Guardar resultados
             self.resultados_balanceo = {
@@ -600,6 +604,18 @@ Análisis completado exitosamente.
         """Muestra los resultados del balanceo"""
         if not hasattr(self, 'resultados_balanceo'):
             return
+        
+        omega = self.resultados_balanceo['omega']
+        omega_critica = self.resultados_balanceo['omega_critica']
+        if omega_critica is None:
+            linea_critica = (f"- Velocidad crítica: ninguna hasta {2*omega*60/(2*np.pi):.1f} rpm "
+                             f"(2 veces la de operación)")
+            recomendacion = 'No hay velocidades críticas en el rango analizado.'
+        else:
+            linea_critica = f"- Velocidad crítica: {omega_critica*60/(2*np.pi):.1f} rpm"
+            recomendacion = ('El rotor está operando cerca de su velocidad crítica. Considerar reducción de velocidad.'
+                             if abs(omega - omega_critica) < 0.1*omega_critica
+                             else 'El rotor opera lejos de su velocidad crítica.')
             
         resultados = f"""
 === ANÁLISIS DE BALANCEO ===
@@ -611,10 +627,10 @@ Parámetros del rotor:
 Resultados del desbalance:
 - Desbalance estático: {self.resultados_balanceo['U']:.4f} kg·m
 - Fuerza de desbalance: {self.resultados_balanceo['F_desb']:.1f} N
-- Velocidad crítica: {self.resultados_balanceo['omega_critica']*60/(2*np.pi):.1f} rpm
+{linea_critica}
 
 Recomendaciones:
-- {'El rotor está operando cerca de su velocidad crítica. Considerar reducción de velocidad.' if abs(self.resultados_balanceo['omega'] - self.resultados_balanceo['omega_critica']) < 0.1*self.resultados_balanceo['omega_critica'] else 'El rotor opera lejos de su velocidad crítica.'}
+- {recomendacion}
 - {'Se requiere balanceo para reducir vibraciones.' if self.resultados_balanceo['F_desb'] > 100 else 'El desbalance es aceptable.'}
 
 Análisis completado exitosamente.
@@ -631,19 +647,164 @@ Análisis completado exitosamente.
         messagebox.showinfo("En Desarrollo", "Análisis de respuesta forzada en desarrollo")
     
     def analisis_frecuencias(self):
-        messagebox.showinfo("En Desarrollo", "Análisis de frecuencias en desarrollo")
+        """Procesa un registro de acelerómetro (WAV, CSV o binario) por bloques"""
+        try:
+            from tkinter import simpledialog
+            from modulos.senales_vibracion import FuenteSenal, ProcesadorVibracion
+            
+            ruta = filedialog.askopenfilename(
+                filetypes=[("Registros de vibración", "*.wav *.csv *.bin *.dat"),
+                           ("Todos los archivos", "*.*")]
+            )
+            if not ruta:
+                return
+            
+            extension = os.path.splitext(ruta)[1].lower()
+            if extension == '.wav':
+                fuente = FuenteSenal.desde_wav(ruta)
+            else:
+                fs = simpledialog.askfloat("Frecuencia de muestreo", "Frecuencia de muestreo (Hz):",
+                                           minvalue=1.0)
+                if not fs:
+                    return
+                if extension == '.csv':
+                    fuente = FuenteSenal.desde_csv(ruta, fs)
+                else:
+                    fuente = FuenteSenal.desde_binario(ruta, fs)
+            
+            resumen = ProcesadorVibracion(fuente.fs).procesar_todo(fuente)
+            
+            # Espectro de Welch y espectro de envolvente
+            self.ax_desplazamiento.clear()
+            self.ax_velocidad.clear()
+            self.ax_desplazamiento.semilogy(resumen['frecuencias'], resumen['psd'], 'b-')
+            self.ax_desplazamiento.set_xlabel('Frecuencia (Hz)')
+            self.ax_desplazamiento.set_ylabel('PSD')
+            self.ax_desplazamiento.set_title('Espectro de Welch')
+            self.ax_desplazamiento.grid(True)
+            self.ax_velocidad.plot(resumen['frecuencias'], resumen['envolvente'], 'r-')
+            self.ax_velocidad.set_xlabel('Frecuencia (Hz)')
+            self.ax_velocidad.set_ylabel('PSD envolvente')
+            self.ax_velocidad.set_title('Espectro de Envolvente')
+            self.ax_velocidad.grid(True)
+            self.fig_vibracion.tight_layout()
+            self.canvas_vibracion.draw()
+            
+            resultados = f"""
+=== ANÁLISIS DE FRECUENCIAS ===
+Archivo: {os.path.basename(ruta)}
+- Frecuencia de muestreo: {fuente.fs:.0f} Hz
+- Bloques procesados: {resumen['n_bloques']}
+- RMS global: {resumen['rms']:.4f}
+- Curtosis: {resumen['curtosis']:.2f}
+- Valor pico: {resumen['pico']:.4f}
+- Frecuencia dominante: {resumen['frecuencias'][np.argmax(resumen['psd'][1:]) + 1]:.1f} Hz
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en el análisis de frecuencias: {str(e)}")
     
     def proponer_correccion(self):
-        messagebox.showinfo("En Desarrollo", "Propuesta de corrección en desarrollo")
+        """Propone la masa de corrección en un plano ubicada en el radio del rotor"""
+        try:
+            from modulos.balanceo import fasor, polar
+            
+            r_rotor = float(self.radio_rotor_var.get())
+            m_desb = float(self.masa_desb_var.get())
+            r_desb = float(self.radio_desb_var.get())
+            angulo_desb = float(self.angulo_desb_var.get())
+            
+            # La corrección cancela el desbalance: W·r = -U
+            U = fasor(m_desb * r_desb, angulo_desb)
+            masa, angulo = polar(-U / r_rotor)
+            
+            resultados = f"""
+=== PROPUESTA DE CORRECCIÓN (UN PLANO) ===
+- Masa de corrección: {masa*1000:.1f} g
+- Radio de montaje: {r_rotor} m
+- Ángulo de montaje: {angulo:.1f}°
+
+Para balanceo en dos o más planos con corridas de peso de prueba use
+modulos.balanceo.balancear (coeficientes de influencia).
+"""
+            self.texto_balanceo.insert(tk.END, resultados)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al proponer la corrección: {str(e)}")
+    
+    def calcular_velocidades_criticas(self, m_rotor, r_rotor, rpm_operacion):
+        """
+        Velocidades críticas 1X hasta el doble de la velocidad de operación.
+
+        Modelo: disco centrado entre dos cojinetes iguales, con la distancia
+        entre cojinetes, el diámetro del eje y la rigidez de los cojinetes
+        tomados de la pestaña de balanceo.
+        """
+        from modulos.rotordinamica import ModeloRotor
+
+        rotor = ModeloRotor.rotor_simple(m_rotor, r_rotor,
+                                         longitud=float(self.longitud_eje_var.get()),
+                                         diametro_eje=float(self.diametro_eje_var.get()),
+                                         k_cojinete=float(self.rigidez_cojinete_var.get()))
+        self.campbell = rotor.diagrama_campbell(np.linspace(0, 2*rpm_operacion, 200), n_modos=4)
+        return rotor.velocidades_criticas(self.campbell)
     
     def analisis_velocidades_criticas(self):
-        messagebox.showinfo("En Desarrollo", "Análisis de velocidades críticas en desarrollo")
+        """Construye el diagrama de Campbell del rotor y lista sus velocidades críticas"""
+        try:
+            from modulos.rotordinamica import graficar_campbell
+
+            m_rotor = float(self.masa_rotor_var.get())
+            r_rotor = float(self.radio_rotor_var.get())
+            rpm = float(self.velocidad_rotor_var.get())
+            
+            criticas = self.calcular_velocidades_criticas(m_rotor, r_rotor, rpm)
+            
+            resultados = "\n=== VELOCIDADES CRÍTICAS (DIAGRAMA DE CAMPBELL) ===\n"
+            for critica in criticas:
+                resultados += (f"- Modo {critica['modo'] + 1}: {critica['velocidad_rpm']:.1f} rpm "
+                               f"(precesión {critica['precesion']})\n")
+            if not criticas:
+                resultados += (f"- No hay velocidades críticas en el rango analizado "
+                               f"(0 a {2*rpm:.0f} rpm)\n")
+            self.texto_balanceo.insert(tk.END, resultados)
+            
+            graficar_campbell(self.campbell)
+            plt.show()
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en el análisis de velocidades críticas: {str(e)}")
     
     def analisis_cinematico(self):
         messagebox.showinfo("En Desarrollo", "Análisis cinemático en desarrollo")
     
     def generar_animacion(self):
-        messagebox.showinfo("En Desarrollo", "Generación de animación en desarrollo")
+        """Renderiza fuera de línea la animación del mecanismo de 4 barras"""
+        try:
+            from modulos.animacion import animar_4_barras
+            
+            if not self.datos_mecanismo:
+                messagebox.showwarning("Advertencia", "Primero analice el mecanismo")
+                return
+            
+            ruta = filedialog.asksaveasfilename(
+                defaultextension=".gif",
+                filetypes=[("Animación GIF", "*.gif"), ("Video MP4 (requiere ffmpeg)", "*.mp4")]
+            )
+            if not ruta:
+                return
+            
+            duracion = float(self.tf_var.get()) - float(self.ti_var.get())
+            fps = max(1, int(round(float(self.pasos_var.get()) / duracion)))
+            d = self.datos_mecanismo
+            animar_4_barras(d['l1'], d['l2'], d['l3'], d['l4'], d['omega'], duracion, ruta, fps=fps)
+            
+            messagebox.showinfo("Éxito", f"Animación guardada en: {ruta}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al generar la animación: {str(e)}")
     
     def exportar_datos_cinematica(self):
         messagebox.showinfo("En Desarrollo", "Exportación de datos en desarrollo")
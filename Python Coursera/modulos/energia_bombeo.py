@@ -0,0 +1,210 @@
+# =============================================================================
+# MÓDULO DE OPTIMIZACIÓN ENERGÉTICA DE ESTACIONES DE BOMBEO
+# =============================================================================
+# Propósito: Recorrer una serie de demanda (p. ej. 8760 horas de un año) con
+#            una EstacionBombeo y elegir cada hora la combinación de bombas y
+#            la velocidad de mínima potencia, con costo por periodos tarifarios.
+#            Las curvas se resuelven una sola vez sobre una malla de puntos de
+#            trabajo y cada hora sólo se interpola en esas superficies
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+
+from modulos.estacion_bombeo import EstacionBombeo
+
+
+def tarifa_por_periodos(periodos: Dict[str, Tuple[float, Sequence[int]]],
+                        n_horas: int = 8760) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precio horario a partir de periodos tarifarios por hora del día.
+
+    Args:
+        periodos: {nombre: (precio por kWh, horas del día 0-23)}; cada hora
+            del día debe pertenecer a un solo periodo
+        n_horas: Longitud de la serie (la hora 0 es la medianoche)
+
+    Returns:
+        Tuple (precio (n_horas,), periodo (n_horas,) con el nombre de cada hora)
+    """
+    precio_dia = np.full(24, np.nan)
+    nombre_dia = np.empty(24, dtype=object)
+    for nombre, (precio, horas) in periodos.items():
+        horas = np.asarray(horas, dtype=int)
+        if np.any(~np.isnan(precio_dia[horas])):
+            raise ValueError(f"El periodo '{nombre}' repite horas de otro periodo")
+        precio_dia[horas] = precio
+        nombre_dia[horas] = nombre
+    if np.any(np.isnan(precio_dia)):
+        raise ValueError(f"Horas sin periodo tarifario: {np.flatnonzero(np.isnan(precio_dia)).tolist()}")
+
+    hora_dia = np.arange(n_horas) % 24
+    return precio_dia[hora_dia], nombre_dia[hora_dia].astype(str)
+
+
+def _ejes_interpolacion(malla: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Índice inferior y peso lineal de x sobre una malla creciente (admite un solo punto)."""
+    if len(malla) == 1:
+        return np.zeros(len(x), dtype=int), np.zeros(len(x))
+    i = np.clip(np.searchsorted(malla, x) - 1, 0, len(malla) - 2)
+    w = (x - malla[i]) / (malla[i + 1] - malla[i])
+    return i, w
+
+
+class OptimizadorEnergia:
+    """
+    Superficies precalculadas de potencia mínima y velocidad de cada
+    combinación de bombas sobre una malla de caudal × altura requeridos.
+
+    Cada nodo de la malla se resuelve una vez con EstacionBombeo.optimizar;
+    después cada hora se obtiene por interpolación bilineal para todas las
+    combinaciones a la vez y se elige la de menor potencia. Un nodo no
+    factible contamina las celdas vecinas (se toman como no factibles), de
+    modo que la interpolación nunca propone una combinación imposible. Los
+    puntos fuera de la malla se resuelven directamente con la estación.
+    """
+
+    def __init__(self, estacion: EstacionBombeo, caudales: Sequence[float],
+                 alturas: Sequence[float], n_velocidades: int = 41):
+        """
+        Args:
+            estacion: Estación de bombeo
+            caudales: Malla creciente de caudales (unidad de la estación)
+            alturas: Malla creciente de alturas (m); un solo valor para altura fija
+            n_velocidades: Malla de velocidades de EstacionBombeo.optimizar
+        """
+        self.estacion = estacion
+        self.n_velocidades = n_velocidades
+        self.caudales = np.asarray(caudales, dtype=float)
+        self.alturas = np.atleast_1d(np.asarray(alturas, dtype=float))
+        if len(self.caudales) < 2:
+            raise ValueError("La malla de caudales necesita al menos dos puntos")
+
+        Q, H = np.meshgrid(self.caudales, self.alturas, indexing='ij')
+        res = estacion.optimizar(Q.ravel(), H.ravel(), n_velocidades)
+        forma = (len(self.caudales), len(self.alturas), -1)
+        # Superficies (C, n_caudal, n_altura)
+        self.potencia = np.moveaxis(res['potencia'].reshape(forma), -1, 0)
+        self.velocidad = np.moveaxis(res['velocidad'].reshape(forma), -1, 0)
+        self.combinaciones = res['combinaciones']
+
+    @classmethod
+    def desde_demanda(cls, estacion: EstacionBombeo, caudal, altura,
+                      n_caudal: int = 60, n_altura: int = 15,
+                      percentiles: Tuple[float, float] = (0.5, 99.5),
+                      **opciones) -> 'OptimizadorEnergia':
+        """
+        Crea la malla que cubre el rango habitual de la serie de demanda.
+
+        La malla va entre los percentiles dados de caudal y altura, de modo
+        que unas pocas horas atípicas no estiran la malla de todo el año;
+        esas horas quedan fuera y evaluar las resuelve directamente.
+        """
+        caudal = np.asarray(caudal, dtype=float)
+        altura = np.asarray(altura, dtype=float)
+        q_min, q_max = np.percentile(caudal, percentiles)
+        h_min, h_max = np.percentile(altura, percentiles)
+        if q_max <= q_min:
+            q_min, q_max = caudal.min(), caudal.max()
+        alturas = np.linspace(h_min, h_max, n_altura) if h_max > h_min else np.array([h_min])
+        return cls(estacion, np.linspace(q_min, q_max, n_caudal), alturas, **opciones)
+
+    def evaluar(self, caudal, altura) -> Dict[str, np.ndarray]:
+        """
+        Combinación y velocidad óptimas para cada punto de la serie.
+
+        Args:
+            caudal: Caudales requeridos (T,)
+            altura: Alturas requeridas (T,) o escalar
+
+        Los puntos fuera de la malla se resuelven con EstacionBombeo.optimizar.
+
+        Returns:
+            Dict con combinacion (T,) índice en combinaciones (-1 si ninguna
+            cumple), bombas (T, N), velocidad y potencia (T,) en kW, y
+            factible (T,)
+        """
+        caudal, altura = np.broadcast_arrays(np.atleast_1d(np.asarray(caudal, dtype=float)),
+                                             np.atleast_1d(np.asarray(altura, dtype=float)))
+        fuera = (caudal < self.caudales[0]) | (caudal > self.caudales[-1]) | \
+                (altura < self.alturas[0]) | (altura > self.alturas[-1])
+        i, wi = _ejes_interpolacion(self.caudales, caudal)
+        j, wj = _ejes_interpolacion(self.alturas, altura)
+        j1 = np.minimum(j + 1, len(self.alturas) - 1)
+
+        def bilineal(S):
+            # S (C, nq, nh) -> (T, C); inf en un vértice deja la celda en inf
+            v00, v10 = S[:, i, j], S[:, i + 1, j]
+            v01, v11 = S[:, i, j1], S[:, i + 1, j1]
+            with np.errstate(invalid='ignore'):
+                v = ((1 - wi) * (1 - wj) * v00 + wi * (1 - wj) * v10
+                     + (1 - wi) * wj * v01 + wi * wj * v11)
+            malo = ~(np.isfinite(v00) & np.isfinite(v10) & np.isfinite(v01) & np.isfinite(v11))
+            return np.where(malo, np.inf, v).T
+
+        potencia = bilineal(self.potencia)
+        velocidad = bilineal(np.nan_to_num(self.velocidad, nan=np.inf))
+        if fuera.any():
+            directo = self.estacion.optimizar(caudal[fuera], altura[fuera], self.n_velocidades)
+            potencia[fuera] = directo['potencia']
+            velocidad[fuera] = directo['velocidad']
+
+        mejor = np.argmin(potencia, axis=1)
+        filas = np.arange(len(caudal))
+        factible = np.isfinite(potencia[filas, mejor])
+        return {
+            'combinacion': np.where(factible, mejor, -1),
+            'bombas': np.where(factible[:, None], self.combinaciones[mejor], False),
+            'velocidad': np.where(factible, velocidad[filas, mejor], np.nan),
+            'potencia': np.where(factible, potencia[filas, mejor], np.nan),
+            'factible': factible,
+        }
+
+    def simular(self, caudal, altura, precio, periodo: Optional[Sequence[str]] = None,
+                paso_horas: float = 1.0) -> Dict:
+        """
+        Energía y costo de operar la estación sobre una serie de demanda.
+
+        Args:
+            caudal: Caudal requerido por intervalo (T,)
+            altura: Altura requerida por intervalo (T,) o escalar
+            precio: Precio de la energía por intervalo (T,) o escalar
+            periodo: Nombre del periodo tarifario de cada intervalo (T,)
+            paso_horas: Duración de cada intervalo (h)
+
+        Returns:
+            Dict con energia_kwh, costo, horas_no_factibles, por_periodo
+            {periodo: {energia_kwh, costo, horas}}, horas_por_combinacion
+            (C,) y horario (resultado de evaluar más energia_kwh y costo).
+            Los intervalos no factibles quedan en NaN, de modo que los
+            totales (y los del periodo que los contiene) son NaN cuando
+            horas_no_factibles > 0 en lugar de subestimar energía y costo
+        """
+        horario = self.evaluar(caudal, altura)
+        energia = horario['potencia'] * paso_horas
+        costo = energia * np.broadcast_to(np.asarray(precio, dtype=float), energia.shape)
+        horario['energia_kwh'] = energia
+        horario['costo'] = costo
+
+        por_periodo = {}
+        if periodo is not None:
+            periodo = np.asarray(periodo)
+            for nombre in np.unique(periodo):
+                m = periodo == nombre
+                por_periodo[str(nombre)] = {'energia_kwh': float(energia[m].sum()),
+                                            'costo': float(costo[m].sum()),
+                                            'horas': float(m.sum() * paso_horas)}
+
+        validas = horario['combinacion'] >= 0
+        horas_por_combinacion = np.bincount(horario['combinacion'][validas],
+                                            minlength=len(self.combinaciones)) * paso_horas
+        return {
+            'energia_kwh': float(energia.sum()),
+            'costo': float(costo.sum()),
+            'horas_no_factibles': float((~horario['factible']).sum() * paso_horas),
+            'por_periodo': por_periodo,
+            'horas_por_combinacion': horas_por_combinacion,
+            'horario': horario,
+        }
@@ -0,0 +1,310 @@
+# =============================================================================
+# MÓDULO DE ESTACIONES DE BOMBEO
+# =============================================================================
+# Propósito: Componer N bombas en paralelo o en serie a velocidad variable
+#            (leyes de afinidad) y elegir la combinación de bombas en marcha y
+#            la velocidad que entregan un caudal/altura requeridos con la menor
+#            potencia, evaluando todas las combinaciones y una malla de
+#            velocidades en una sola operación vectorizada
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Leyes de afinidad con velocidad relativa s = n / n_nominal:
+#   Q(s) = s·Q₁     H(s) = s²·H₁(Q/s)     η(s) = η₁(Q/s)
+# Las curvas nominales son polinomios de mayor a menor grado (np.polyfit);
+# la eficiencia es una fracción (dividir por 100 las curvas en %).
+# Restricción: las bombas en marcha de una combinación comparten una sola
+# velocidad (un variador por colector). Con bombas idénticas ese reparto es
+# el de mínima potencia; con bombas distintas el óptimo con velocidades
+# independientes puede ser menor y no se busca aquí.
+# =============================================================================
+
+import itertools
+import numpy as np
+from typing import Dict, List, Sequence
+
+from modulos.punto_operacion import evaluar_polinomio, puntos_operacion
+
+G = 9.81
+FACTORES_CAUDAL = {'m3/h': 3600.0, 'L/min': 60000.0, 'L/s': 1000.0, 'm3/s': 1.0}
+ETA_MIN = 1e-3   # Eficiencia mínima para evitar divisiones por cero
+
+
+class ModeloBomba:
+    """Curvas nominales de altura y eficiencia de una bomba."""
+
+    def __init__(self, curva_altura: Sequence[float], curva_eficiencia: Sequence[float],
+                 nombre: str = ""):
+        """
+        Args:
+            curva_altura: Coeficientes de H(Q) a velocidad nominal
+            curva_eficiencia: Coeficientes de η(Q) (fracción) a velocidad nominal
+            nombre: Identificación de la bomba
+        """
+        self.curva_altura = np.asarray(curva_altura, dtype=float)
+        self.curva_eficiencia = np.asarray(curva_eficiencia, dtype=float)
+        self.nombre = nombre
+
+    @classmethod
+    def desde_ajuste(cls, parametros: Dict, nombre: str = "") -> 'ModeloBomba':
+        """Crea la bomba a partir de ajustar_curva_bomba_datos (eficiencia en %)."""
+        return cls(parametros['parametros_altura'],
+                   np.asarray(parametros['parametros_eficiencia']) / 100, nombre)
+
+    def altura(self, caudal, velocidad=1.0):
+        """Altura H(Q, s) por leyes de afinidad."""
+        s = np.asarray(velocidad, dtype=float)
+        return s**2 * np.polyval(self.curva_altura, np.asarray(caudal) / s)
+
+    def eficiencia(self, caudal, velocidad=1.0):
+        """Eficiencia η(Q, s) = η₁(Q/s)."""
+        return np.polyval(self.curva_eficiencia, np.asarray(caudal) / np.asarray(velocidad))
+
+
+class EstacionBombeo:
+    """
+    Estación de N bombas en paralelo (misma altura) o en serie (mismo caudal).
+
+    Las bombas en marcha de una combinación giran a una velocidad común,
+    como en el control habitual con variadores de un colector común.
+    """
+
+    def __init__(self, bombas: List[ModeloBomba], configuracion: str = 'paralelo',
+                 velocidad_min: float = 0.6, velocidad_max: float = 1.0,
+                 unidad_caudal: str = 'm3/h', rho: float = 1000.0):
+        """
+        Args:
+            bombas: Modelos de las bombas instaladas
+            configuracion: 'paralelo' o 'serie'
+            velocidad_min, velocidad_max: Límites de los variadores (s relativa)
+            unidad_caudal: Unidad de caudal de las curvas
+            rho: Densidad del fluido (kg/m³)
+        """
+        if configuracion not in ('paralelo', 'serie'):
+            raise ValueError(f"Configuración desconocida: {configuracion}")
+        if unidad_caudal not in FACTORES_CAUDAL:
+            raise ValueError(f"Unidad de caudal desconocida: {unidad_caudal}")
+        self.bombas = bombas
+        self.configuracion = configuracion
+        self.velocidad_min = velocidad_min
+        self.velocidad_max = velocidad_max
+        self.factor_caudal = FACTORES_CAUDAL[unidad_caudal]
+        self.rho = rho
+
+        grado_h = max(len(b.curva_altura) for b in bombas)
+        grado_e = max(len(b.curva_eficiencia) for b in bombas)
+        self._curvas_h = np.array([np.pad(b.curva_altura, (grado_h - len(b.curva_altura), 0))
+                                   for b in bombas])
+        self._curvas_e = np.array([np.pad(b.curva_eficiencia, (grado_e - len(b.curva_eficiencia), 0))
+                                   for b in bombas])
+
+        # Todas las combinaciones no vacías de bombas en marcha (C, N)
+        n = len(bombas)
+        self.combinaciones = np.array([c for c in itertools.product([False, True], repeat=n)
+                                       if any(c)])
+        self.combinaciones = self.combinaciones[np.argsort(self.combinaciones.sum(axis=1),
+                                                           kind='stable')]
+
+    @property
+    def n_bombas(self) -> int:
+        return len(self.bombas)
+
+    def potencia(self, caudal, altura, eficiencia):
+        """Potencia al eje (kW) para caudal en la unidad de la estación."""
+        Q = np.asarray(caudal) / self.factor_caudal
+        return self.rho * G * Q * altura / (np.maximum(eficiencia, ETA_MIN) * 1000)
+
+    # ------------------------------------------------------------------
+    # Respuesta de cada bomba sobre una malla de velocidades
+    # ------------------------------------------------------------------
+
+    def _caudales_paralelo(self, altura, velocidades) -> np.ndarray:
+        """
+        Caudal de cada bomba a la altura común dada.
+
+        Args:
+            altura: (D,) alturas requeridas
+            velocidades: (D, K) o (K,) velocidades relativas
+
+        Returns:
+            (D, K, N) caudales; NaN si la bomba no alcanza la altura
+        """
+        altura = np.asarray(altura, dtype=float)
+        s = np.broadcast_to(velocidades, altura.shape + np.shape(velocidades)[-1:])
+        D, K, N = s.shape[0], s.shape[1], self.n_bombas
+        # H₁(x) = H / s²  con x = Q / s, resuelto como punto de operación
+        objetivo = np.broadcast_to((altura[:, None] / s**2)[..., None], (D, K, N))
+        curvas = np.broadcast_to(self._curvas_h, (D, K) + self._curvas_h.shape)
+        res = puntos_operacion(curvas.reshape(-1, self._curvas_h.shape[1]),
+                               objetivo.reshape(-1, 1))
+        x = res['caudal_principal'].reshape(D, K, N)
+        return x * s[..., None]
+
+    def _respuesta(self, caudal, altura, velocidades):
+        """
+        Caudales, alturas y potencias de cada bomba en la malla (D, K, N).
+
+        En paralelo todas trabajan a la altura requerida y se calcula su
+        caudal; en serie todas llevan el caudal requerido y se calcula su altura.
+        """
+        caudal = np.asarray(caudal, dtype=float)
+        altura = np.asarray(altura, dtype=float)
+        s = np.broadcast_to(velocidades, caudal.shape + np.shape(velocidades)[-1:])
+        N = self.n_bombas
+        if self.configuracion == 'paralelo':
+            q = self._caudales_paralelo(altura, s)
+            h = np.broadcast_to(altura[:, None, None], q.shape)
+        else:
+            q = np.broadcast_to(caudal[:, None, None], s.shape + (N,))
+            x = (q / s[..., None]).reshape(-1, N).T
+            h = (s[..., None]**2 * evaluar_polinomio(self._curvas_h, x)[0].T.reshape(q.shape))
+        x = (np.nan_to_num(q) / s[..., None]).reshape(-1, N).T
+        eta = evaluar_polinomio(self._curvas_e, x)[0].T.reshape(q.shape)
+        P = self.potencia(q, h, eta)
+        return q, h, eta, P
+
+    def _entrega(self, q, h):
+        """Magnitud que se compara con el requisito: caudal (paralelo) o altura (serie)."""
+        valor = q if self.configuracion == 'paralelo' else h
+        # Una bomba en marcha que no entrega (caudal o altura no positivos) invalida el punto
+        util = np.isfinite(valor) & (valor > 0) & np.isfinite(q)
+        return np.where(util, valor, 0.0), util
+
+    # ------------------------------------------------------------------
+    # Optimización de combinación y velocidad
+    # ------------------------------------------------------------------
+
+    def optimizar(self, caudal, altura, n_velocidades: int = 41, iteraciones: int = 60,
+                  tol: float = 1e-10) -> Dict[str, np.ndarray]:
+        """
+        Combinación de bombas y velocidad de mínima potencia para cada punto.
+
+        Para todas las combinaciones (C) y una malla de K velocidades se
+        evalúa la entrega de la estación de una sola vez; el intervalo de la
+        malla donde la entrega cruza el requisito se refina con regula falsi
+        (variante de Illinois), también vectorizada. Una bomba que no alcanza
+        la altura entrega cero, así que un requisito justo por encima del
+        cierre de las bombas queda encerrado entre el último punto de la malla
+        que no llega y el primero que sí.
+
+        Todas las bombas en marcha giran a la misma velocidad: el resultado
+        es el óptimo entre combinaciones con velocidad común, que coincide
+        con el óptimo global sólo si las bombas en marcha son idénticas.
+
+        Args:
+            caudal: Caudal requerido (escalar o (D,))
+            altura: Altura requerida al caudal (escalar o (D,)), p. ej. la
+                curva del sistema evaluada en el caudal
+            n_velocidades: Puntos de la malla de velocidades
+            iteraciones: Máximo de iteraciones de regula falsi
+            tol: Tolerancia relativa de la entrega frente al requisito
+
+        Returns:
+            Dict con combinaciones (C, N); velocidad, potencia y factible
+            (D, C); caudales_bomba (D, C, N); mejor (D,) índice de la
+            combinación óptima; potencia_optima, velocidad_optima (D,) y
+            bombas_optimas (D, N)
+        """
+        caudal, altura = np.broadcast_arrays(np.atleast_1d(np.asarray(caudal, dtype=float)),
+                                             np.atleast_1d(np.asarray(altura, dtype=float)))
+        D = len(caudal)
+        M = self.combinaciones.astype(float)                      # (C, N)
+        requisito = caudal if self.configuracion == 'paralelo' else altura
+
+        # Malla de velocidades: entrega de cada combinación (D, C, K)
+        malla = np.linspace(self.velocidad_min, self.velocidad_max, n_velocidades)
+        q, h, _, _ = self._respuesta(caudal, altura, malla)
+        valor, util = self._entrega(q, h)
+        entrega = np.einsum('dkn,cn->dck', valor, M)
+        valida = np.einsum('dkn,cn->dck', (~util).astype(float), M) == 0
+
+        # Primer cruce del requisito sobre la malla (la entrega, con cero para
+        # las bombas que no alcanzan la altura, crece con s); basta que el
+        # extremo superior sea válido
+        r = requisito[:, None, None]
+        cruza = valida[..., 1:] & (entrega[..., :-1] < r) & (entrega[..., 1:] >= r)
+        en_minimo = valida[..., 0] & (entrega[..., 0] >= r[..., 0])
+        k = np.argmax(cruza, axis=-1)
+        factible = cruza.any(axis=-1) | en_minimo
+
+        # Regula falsi (Illinois) sobre [s_bajo, s_alto] con f_bajo < 0 <= f_alto
+        r = r[..., 0]
+        s_bajo, s_alto = malla[k], malla[k + 1]
+        f_bajo = np.take_along_axis(entrega, k[..., None], -1)[..., 0] - r
+        f_alto = np.take_along_axis(entrega, k[..., None] + 1, -1)[..., 0] - r
+        lado = np.zeros(s_bajo.shape, dtype=int)
+        activa = factible & ~en_minimo & (f_alto > tol * np.abs(r))
+        for _ in range(iteraciones):
+            if not activa.any():
+                break
+            denominador = np.where(activa, f_alto - f_bajo, 1.0)
+            s = np.where(activa, s_alto - f_alto * (s_alto - s_bajo) / denominador, s_alto)
+            f = self._entrega_combinaciones(caudal, altura, s, M) - r
+            alto = f >= 0
+            # Si el mismo extremo se mantiene dos veces se reduce su peso
+            f_bajo = np.where(activa & alto & (lado == 1), 0.5 * f_bajo, f_bajo)
+            f_alto = np.where(activa & ~alto & (lado == -1), 0.5 * f_alto, f_alto)
+            s_alto = np.where(activa & alto, s, s_alto)
+            f_alto = np.where(activa & alto, f, f_alto)
+            s_bajo = np.where(activa & ~alto, s, s_bajo)
+            f_bajo = np.where(activa & ~alto, f, f_bajo)
+            lado = np.where(activa, np.where(alto, 1, -1), lado)
+            activa &= ~(alto & (f <= tol * np.abs(r))) & (s_alto - s_bajo > 1e-14)
+        # El extremo superior cumple el requisito; con entrega excedente a
+        # velocidad mínima se opera en el mínimo
+        s = np.where(en_minimo, self.velocidad_min, s_alto)
+
+        # Estado final de cada combinación a su velocidad. Con bombas distintas
+        # el cruce puede caer donde una bomba en marcha aún no entrega: esa
+        # combinación no es factible (la misma sin esa bomba ya se evalúa)
+        q, h, eta, P = self._respuesta(caudal, altura, s)
+        _, util = self._entrega(q, h)
+        factible &= ~((~util) & self.combinaciones[None]).any(axis=-1)
+        potencia = np.where(self.combinaciones[None], P, 0.0).sum(axis=-1)
+        caudales_bomba = np.where(self.combinaciones[None], q, 0.0)
+        potencia = np.where(factible, potencia, np.inf)
+
+        mejor = np.argmin(potencia, axis=1)
+        filas = np.arange(D)
+        hay = np.isfinite(potencia[filas, mejor])
+        return {
+            'combinaciones': self.combinaciones,
+            'velocidad': np.where(factible, s, np.nan),
+            'potencia': potencia,
+            'factible': factible,
+            'caudales_bomba': caudales_bomba,
+            'mejor': np.where(hay, mejor, -1),
+            'potencia_optima': np.where(hay, potencia[filas, mejor], np.nan),
+            'velocidad_optima': np.where(hay, s[filas, mejor], np.nan),
+            'bombas_optimas': np.where(hay[:, None], self.combinaciones[mejor], False),
+        }
+
+    def _entrega_combinaciones(self, caudal, altura, s, M):
+        """Entrega de cada combinación a su propia velocidad s (D, C)."""
+        q, h, _, _ = self._respuesta(caudal, altura, s)
+        valor, _ = self._entrega(q, h)
+        return np.einsum('dcn,cn->dc', valor, M)
+
+    def curva_combinada(self, bombas_en_marcha: Sequence[bool], velocidad: float = 1.0,
+                        n_puntos: int = 50) -> Dict[str, np.ndarray]:
+        """
+        Curva H-Q de la estación para una combinación y velocidad dadas.
+
+        Returns:
+            Dict con caudales y alturas de la curva combinada
+        """
+        activas = [b for b, m in zip(self.bombas, bombas_en_marcha) if m]
+        if not activas:
+            raise ValueError("Debe haber al menos una bomba en marcha")
+        h0 = max(b.altura(0.0, velocidad) for b in activas)
+        if self.configuracion == 'paralelo':
+            alturas = np.linspace(h0, 0.0, n_puntos)
+            subestacion = EstacionBombeo(activas, 'paralelo', unidad_caudal='m3/s')
+            q = subestacion._caudales_paralelo(alturas, np.array([velocidad]))[:, 0, :]
+            return {'caudales': np.nansum(q, axis=1), 'alturas': alturas}
+        runout = min(np.nanmax(puntos_operacion(b.curva_altura, [0.0])['caudal'])
+                     for b in activas) * velocidad
+        caudales = np.linspace(0.0, runout, n_puntos)
+        return {'caudales': caudales,
+                'alturas': sum(b.altura(caudales, velocidad) for b in activas)}
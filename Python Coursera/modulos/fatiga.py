@@ -0,0 +1,280 @@
+# =============================================================================
+# MÓDULO DE FATIGA POR HISTORIAS DE CARGA
+# =============================================================================
+# Propósito: Conteo rainflow de historias de esfuerzo largas (registros de
+#            galgas extensiométricas de varios días, leídos por bloques),
+#            corrección por esfuerzo medio (Goodman, Gerber, Morrow, SWT),
+#            curvas S-N de Basquin y acumulación lineal de daño de Miner
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Esfuerzos en MPa. Rainflow según ASTM E1049 (método de tres puntos con
+# pila): cada reversión entra y sale de la pila a lo sumo una vez, por lo que
+# el conteo es lineal en el número de muestras y admite bloques sucesivos
+# sin guardar la historia completa. Lo que queda en la pila al final se
+# cuenta como medios ciclos.
+# Amplitud equivalente completamente invertida (S_m < 0 no se acredita):
+#   Goodman   S_ar = S_a / (1 - S_m/S_u)
+#   Gerber    S_ar = S_a / (1 - (S_m/S_u)²)
+#   Morrow    S_ar = S_a / (1 - S_m/σ'_f)
+#   SWT       S_ar = √(S_max · S_a),  sin daño si S_max ≤ 0
+# Basquin: S_ar = σ'_f · N^b; por debajo de S_e la vida es infinita.
+# Miner: D = Σ n_i / N_i, falla en D = 1.
+# =============================================================================
+
+import numpy as np
+from typing import Dict, Iterable, Optional
+
+CORRECCIONES = ('ninguna', 'goodman', 'gerber', 'morrow', 'swt')
+
+
+class CurvaSN:
+    """Curva S-N de Basquin con límite de fatiga opcional."""
+
+    def __init__(self, sigma_f: float, b: float, Se: Optional[float] = None, Su: Optional[float] = None):
+        """
+        Args:
+            sigma_f: Coeficiente de Basquin (MPa), S = sigma_f · N^b
+            b: Exponente de Basquin (negativo)
+            Se: Límite de fatiga (MPa); None para extender la recta sin límite
+            Su: Resistencia última (MPa), necesaria para Goodman y Gerber
+        """
+        if sigma_f <= 0 or b >= 0:
+            raise ValueError("La curva S-N requiere sigma_f > 0 y b < 0")
+        self.sigma_f, self.b, self.Se, self.Su = sigma_f, b, Se, Su
+
+    @classmethod
+    def desde_puntos(cls, Su: float, Se: float, N_e: float = 1e6, f: float = 0.9) -> 'CurvaSN':
+        """Recta de Basquin por (10³, f·Su) y (N_e, Se) (procedimiento de Shigley)."""
+        b = np.log10(Se / (f * Su)) / np.log10(N_e / 1e3)
+        return cls(f * Su / 1e3 ** b, b, Se=Se, Su=Su)
+
+    @classmethod
+    def de_material(cls, nombre: str, factor_Se: float = 1.0) -> 'CurvaSN':
+        """
+        Curva de un material de la base de materiales.
+
+        Args:
+            nombre: Nombre del material en modulos.base_materiales
+            factor_Se: Producto de factores de Marin (superficie, tamaño,
+                       carga...) aplicado al límite de fatiga
+        """
+        from modulos.base_materiales import base_materiales
+        p = base_materiales().propiedades(nombre)
+        if not np.isfinite(p['Se']):
+            raise ValueError(f"El material '{nombre}' no tiene constantes de fatiga")
+        return cls.desde_puntos(p['Su'], p['Se'] * factor_Se, p['N_e'])
+
+    def ciclos(self, amplitud) -> np.ndarray:
+        """Ciclos a la falla para una amplitud completamente invertida."""
+        amplitud = np.asarray(amplitud, dtype=float)
+        with np.errstate(divide='ignore'):
+            N = (amplitud / self.sigma_f) ** (1.0 / self.b)
+        if self.Se is not None:
+            N = np.where(amplitud <= self.Se, np.inf, N)
+        return N
+
+    def amplitud(self, N) -> np.ndarray:
+        """Amplitud resistente a N ciclos (acotada por Se si existe)."""
+        S = self.sigma_f * np.asarray(N, dtype=float) ** self.b
+        return S if self.Se is None else np.maximum(S, self.Se)
+
+
+def amplitud_equivalente(amplitud, media, correccion: str = 'goodman', Su: Optional[float] = None,
+                         sigma_f: Optional[float] = None) -> np.ndarray:
+    """
+    Amplitud completamente invertida equivalente a (S_a, S_m).
+
+    Args:
+        amplitud: Amplitud S_a (MPa)
+        media: Esfuerzo medio S_m (MPa)
+        correccion: Uno de CORRECCIONES
+        Su: Resistencia última (Goodman, Gerber)
+        sigma_f: Coeficiente de Basquin (Morrow)
+
+    Returns:
+        Arreglo de S_ar (inf si S_m alcanza la resistencia del criterio)
+    """
+    Sa, Sm = np.broadcast_arrays(np.asarray(amplitud, dtype=float), np.asarray(media, dtype=float))
+    if correccion not in CORRECCIONES:
+        raise ValueError(f"Corrección desconocida: '{correccion}'. Use una de {CORRECCIONES}")
+    if correccion == 'ninguna':
+        return Sa.copy()
+    if correccion == 'swt':
+        Smax = Sm + Sa
+        return np.sqrt(np.where(Smax > 0, Smax * Sa, 0.0))
+    referencia = sigma_f if correccion == 'morrow' else Su
+    if referencia is None:
+        raise ValueError(f"La corrección '{correccion}' requiere {'sigma_f' if correccion == 'morrow' else 'Su'}")
+    r = np.maximum(Sm, 0.0) / referencia
+    denominador = 1.0 - (r ** 2 if correccion == 'gerber' else r)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominador > 0, Sa / denominador, np.inf)
+
+
+class ContadorRainflow:
+    """Conteo rainflow incremental: la historia se entrega por bloques."""
+
+    def __init__(self):
+        self._pila = []           # reversiones aún sin cerrar
+        self._cola = np.empty(0)  # última reversión emitida y punto final pendiente
+        self._iniciado = False
+        self.muestras = 0
+        self.reversiones = 0
+
+    def _reversiones(self, bloque: np.ndarray) -> np.ndarray:
+        """Reversiones nuevas del bloque; el último punto queda pendiente."""
+        x = np.concatenate([self._cola, bloque])
+        if len(x) == 0:
+            return x
+        x = x[np.concatenate([[True], np.diff(x) != 0])]
+        d = np.diff(x)
+        interiores = np.flatnonzero(d[:-1] * d[1:] < 0) + 1
+        nuevas = x[interiores]
+        if not self._iniciado:
+            nuevas = np.concatenate([x[:1], nuevas])
+            self._iniciado = True
+        ultima = x[interiores[-1]] if len(interiores) else x[0]
+        self._cola = np.array([ultima, x[-1]]) if len(x) > 1 else x[:1]
+        return nuevas
+
+    def _procesar(self, reversiones, cerrar: bool = False) -> Dict[str, np.ndarray]:
+        pila = self._pila
+        desde, hasta, cuenta = [], [], []
+        for p in reversiones:
+            pila.append(p)
+            while len(pila) >= 3:
+                X = abs(pila[-1] - pila[-2])
+                Y = abs(pila[-2] - pila[-3])
+                if X < Y:
+                    break
+                if len(pila) == 3:
+                    desde.append(pila[0])
+                    hasta.append(pila[1])
+                    cuenta.append(0.5)
+                    del pila[0]
+                else:
+                    desde.append(pila[-3])
+                    hasta.append(pila[-2])
+                    cuenta.append(1.0)
+                    del pila[-3:-1]
+        if cerrar:
+            desde.extend(pila[:-1])
+            hasta.extend(pila[1:])
+            cuenta.extend([0.5] * max(len(pila) - 1, 0))
+            pila.clear()
+        desde, hasta = np.array(desde, dtype=float), np.array(hasta, dtype=float)
+        return {'rango': np.abs(hasta - desde), 'media': 0.5 * (desde + hasta),
+                'cuenta': np.array(cuenta, dtype=float)}
+
+    def agregar(self, bloque) -> Dict[str, np.ndarray]:
+        """
+        Procesa un bloque de la historia.
+
+        Args:
+            bloque: Muestras consecutivas de esfuerzo (MPa)
+
+        Returns:
+            Ciclos cerrados por el bloque: {'rango', 'media', 'cuenta'}
+            (cuenta 1 para ciclos completos y 0.5 para medios ciclos)
+        """
+        bloque = np.asarray(bloque, dtype=float).ravel()
+        if not np.all(np.isfinite(bloque)):
+            raise ValueError("La historia de esfuerzos contiene valores no finitos")
+        self.muestras += len(bloque)
+        nuevas = self._reversiones(bloque)
+        self.reversiones += len(nuevas)
+        return self._procesar(nuevas.tolist())
+
+    def finalizar(self) -> Dict[str, np.ndarray]:
+        """Cierra la historia: el punto final y el residuo de la pila como medios ciclos."""
+        pendiente = self._cola[1:]
+        self.reversiones += len(pendiente)
+        self._cola = np.empty(0)
+        self._iniciado = False
+        return self._procesar(pendiente.tolist(), cerrar=True)
+
+
+def contar_ciclos(historia) -> Dict[str, np.ndarray]:
+    """Conteo rainflow de una historia completa en memoria."""
+    contador = ContadorRainflow()
+    partes = [contador.agregar(historia), contador.finalizar()]
+    return {c: np.concatenate([p[c] for p in partes]) for c in ('rango', 'media', 'cuenta')}
+
+
+def dano_miner(rango, media, cuenta, curva: CurvaSN, correccion: str = 'goodman') -> np.ndarray:
+    """
+    Daño de Miner n/N de cada grupo de ciclos.
+
+    Args:
+        rango, media, cuenta: Ciclos del conteo rainflow
+        curva: CurvaSN del material
+        correccion: Corrección por esfuerzo medio (CORRECCIONES)
+
+    Returns:
+        Arreglo de daño por grupo (sumar para el daño total)
+    """
+    Sar = amplitud_equivalente(0.5 * np.asarray(rango, dtype=float), media, correccion,
+                               Su=curva.Su, sigma_f=curva.sigma_f)
+    N = curva.ciclos(Sar)
+    with np.errstate(divide='ignore'):
+        return np.where(np.isinf(Sar), np.inf, np.asarray(cuenta, dtype=float) / N)
+
+
+def analizar_historia(bloques: Iterable, curva: CurvaSN, correccion: str = 'goodman',
+                      bordes_rango=None, bordes_media=None) -> Dict[str, object]:
+    """
+    Rainflow y daño de Miner de una historia entregada por bloques.
+
+    Args:
+        bloques: Iterable de arreglos consecutivos de esfuerzo (MPa), p. ej.
+                 pandas.read_csv(..., chunksize=n) o rebanadas de np.memmap
+        curva: CurvaSN del material
+        correccion: Corrección por esfuerzo medio (CORRECCIONES)
+        bordes_rango, bordes_media: Bordes de la matriz rainflow (opcional);
+                 sin bordes de media la matriz es el histograma de rangos
+
+    Returns:
+        Diccionario con daño total, repeticiones de la historia hasta la falla,
+        daño de los ciclos cerrados en cada bloque y del residuo final,
+        número de ciclos, muestras, reversiones, rango máximo
+        y matriz rainflow (None si no se dan bordes)
+    """
+    if correccion not in CORRECCIONES:
+        raise ValueError(f"Corrección desconocida: '{correccion}'. Use una de {CORRECCIONES}")
+    contador = ContadorRainflow()
+    matriz = None
+    if bordes_rango is not None:
+        forma = (len(bordes_rango) - 1,) if bordes_media is None else (len(bordes_rango) - 1, len(bordes_media) - 1)
+        matriz = np.zeros(forma)
+    dano_bloques, ciclos, rango_maximo = [], 0.0, 0.0
+
+    def acumular(c) -> float:
+        nonlocal ciclos, rango_maximo
+        dano = float(np.sum(dano_miner(c['rango'], c['media'], c['cuenta'], curva, correccion)))
+        ciclos += float(c['cuenta'].sum())
+        if len(c['rango']):
+            rango_maximo = max(rango_maximo, float(c['rango'].max()))
+        if matriz is not None and bordes_media is None:
+            matriz[...] += np.histogram(c['rango'], bins=bordes_rango, weights=c['cuenta'])[0]
+        elif matriz is not None:
+            matriz[...] += np.histogram2d(c['rango'], c['media'], bins=[bordes_rango, bordes_media],
+                                          weights=c['cuenta'])[0]
+        return dano
+
+    for bloque in bloques:
+        dano_bloques.append(acumular(contador.agregar(np.asarray(bloque, dtype=float))))
+    dano_residuo = acumular(contador.finalizar())
+    dano = float(np.sum(dano_bloques)) + dano_residuo
+    return {
+        'dano': dano,
+        'repeticiones': 1.0 / dano if dano > 0 else np.inf,
+        'dano_por_bloque': np.array(dano_bloques),
+        'dano_residuo': dano_residuo,
+        'ciclos': ciclos,
+        'muestras': contador.muestras,
+        'reversiones': contador.reversiones,
+        'rango_maximo': rango_maximo,
+        'matriz': matriz,
+    }
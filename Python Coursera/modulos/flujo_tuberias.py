@@ -0,0 +1,248 @@
+# =============================================================================
+# MÓDULO DE PERFILES DE VELOCIDAD Y PÉRDIDAS EN TRAMOS DE TUBERÍA
+# =============================================================================
+# Propósito: Evaluar miles de tramos de tubería o ducto (racks de tuberías,
+#            redes de ventilación) en una sola operación vectorizada:
+#            régimen, fricción, acumulación de pérdidas menores desde una
+#            tabla de accesorios, caída de presión y perfiles de velocidad
+#            (Poiseuille, ley de potencia y ley logarítmica), con exportación
+#            a Parquet para los reportes
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Pérdidas menores por el método de Crane (TP-410): cada accesorio tiene un
+# K fijo (entradas, salidas) o una longitud equivalente L/D, con
+#   K = (L/D) · f_T,     f_T = 0.25 / log10(e / 3.7D)²
+# el factor de fricción de turbulencia completa del tramo.
+#   h = (f·L/D + ΣK) · V² / 2g        ΔP = ρ g (h + Δz)
+# Perfiles en función de r/R (0 en el eje, 1 en la pared):
+#   Poiseuille    u = 2V (1 - (r/R)²)
+#   Potencia      u = u_max (1 - r/R)^(1/n),  n = 1/√f
+#   Logarítmico   u⁺ = min(y⁺, ln(y⁺ / (1 + 0.3 k_s⁺)) / κ + B),  u_τ = V √(f/8)
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Union
+
+from modulos.friccion import RE_LAMINAR, RE_TURBULENTO, factor_friccion
+
+G = 9.81
+KAPPA = 0.41   # Constante de von Kármán
+B_LOG = 5.0    # Constante aditiva de la ley logarítmica en pared lisa
+
+# Accesorios: {'K': coeficiente fijo} o {'L_D': longitud equivalente}
+ACCESORIOS = {
+    'entrada_borde_agudo': {'K': 0.5},
+    'entrada_redondeada': {'K': 0.04},
+    'salida': {'K': 1.0},
+    'codo_90_estandar': {'L_D': 30.0},
+    'codo_90_radio_largo': {'L_D': 16.0},
+    'codo_45_estandar': {'L_D': 16.0},
+    'curva_180': {'L_D': 50.0},
+    'tee_paso_directo': {'L_D': 20.0},
+    'tee_derivacion': {'L_D': 60.0},
+    'valvula_compuerta': {'L_D': 8.0},
+    'valvula_bola': {'L_D': 3.0},
+    'valvula_globo': {'L_D': 340.0},
+    'valvula_mariposa': {'L_D': 45.0},
+    'valvula_retencion_clapeta': {'L_D': 100.0},
+    'filtro_y': {'L_D': 200.0},
+}
+
+
+def factor_turbulento(diametro, rugosidad):
+    """Factor de fricción de turbulencia completa f_T (Colebrook con Re → ∞)."""
+    rr = np.asarray(rugosidad, dtype=float) / np.asarray(diametro, dtype=float)
+    return 0.25 / np.log10(np.maximum(rr, 1e-7) / 3.7)**2
+
+
+def acumular_accesorios(accesorios: pd.DataFrame, segmentos, diametro, rugosidad,
+                        catalogo: Optional[Dict[str, Dict[str, float]]] = None) -> np.ndarray:
+    """
+    Suma de coeficientes K de los accesorios de cada tramo.
+
+    Args:
+        accesorios: Tabla larga con columnas segmento, accesorio y
+            (opcional) cantidad; una fila por tipo de accesorio y tramo
+        segmentos: Identificadores de los tramos (N,)
+        diametro, rugosidad: Del tramo (N,) (m)
+        catalogo: Accesorios adicionales o que reemplazan a ACCESORIOS
+
+    Returns:
+        ΣK por tramo (N,)
+    """
+    catalogo = {**ACCESORIOS, **(catalogo or {})}
+    segmentos = pd.Index(np.asarray(segmentos))
+    nombres = accesorios['accesorio'].to_numpy()
+    faltan = sorted(set(nombres) - set(catalogo))
+    if faltan:
+        raise ValueError(f"Accesorios no definidos en el catálogo: {faltan}")
+    fila = segmentos.get_indexer(accesorios['segmento'].to_numpy())
+    if np.any(fila < 0):
+        raise ValueError("La tabla de accesorios referencia tramos inexistentes")
+
+    cantidad = accesorios['cantidad'].to_numpy(dtype=float) if 'cantidad' in accesorios \
+        else np.ones(len(accesorios))
+    K_fijo = np.array([catalogo[a].get('K', 0.0) for a in nombres])
+    L_D = np.array([catalogo[a].get('L_D', 0.0) for a in nombres])
+    f_T = factor_turbulento(np.asarray(diametro, dtype=float), np.asarray(rugosidad, dtype=float))
+    f_T = np.broadcast_to(f_T, (len(segmentos),))
+    K = cantidad * (K_fijo + L_D * f_T[fila])
+    return np.bincount(fila, weights=K, minlength=len(segmentos))
+
+
+def evaluar_tramos(tramos: Union[pd.DataFrame, Dict], accesorios: Optional[pd.DataFrame] = None,
+                   densidad=1000.0, viscosidad=1.0e-3, g: float = G,
+                   catalogo: Optional[Dict[str, Dict[str, float]]] = None) -> pd.DataFrame:
+    """
+    Régimen, fricción y pérdidas de todos los tramos en una sola evaluación.
+
+    Args:
+        tramos: Una fila por tramo con segmento, diametro (m), longitud (m),
+            caudal (m³/s) y opcionalmente rugosidad (m, 4.5e-5 por
+            defecto), desnivel (m, cota de salida menos cota de entrada),
+            densidad (kg/m³) y viscosidad (Pa·s)
+        accesorios: Tabla larga segmento, accesorio, cantidad (ver
+            acumular_accesorios); None si no hay accesorios
+        densidad, viscosidad: Valores para los tramos sin esas columnas
+        g: Gravedad (m/s²)
+        catalogo: Ver acumular_accesorios
+
+    Returns:
+        DataFrame por tramo con segmento, velocidad, Re, regimen, f,
+        K_accesorios, perdida_friccion, perdida_menores, perdida_total (m),
+        caida_presion (Pa, incluye el desnivel), velocidad_friccion,
+        subcapa_viscosa (m), exponente_potencia y velocidad_maxima
+    """
+    tramos = pd.DataFrame(tramos)
+    N = len(tramos)
+
+    def columna(nombre, defecto):
+        if nombre in tramos:
+            return tramos[nombre].to_numpy(dtype=float)
+        return np.full(N, defecto, dtype=float)
+
+    D = columna('diametro', np.nan)
+    L = columna('longitud', np.nan)
+    Q = columna('caudal', np.nan)
+    if np.any(np.isnan(D) | np.isnan(L) | np.isnan(Q)):
+        raise ValueError("Los tramos requieren diametro, longitud y caudal")
+    e = columna('rugosidad', 4.5e-5)
+    dz = columna('desnivel', 0.0)
+    rho = columna('densidad', densidad)
+    mu = columna('viscosidad', viscosidad)
+    segmentos = tramos['segmento'].to_numpy() if 'segmento' in tramos else np.arange(N)
+
+    V = Q / (np.pi * D**2 / 4)
+    Re = rho * np.abs(V) * D / mu
+    f = factor_friccion(Re, e / D)
+    K = np.zeros(N) if accesorios is None or len(accesorios) == 0 else \
+        acumular_accesorios(accesorios, segmentos, D, e, catalogo)
+
+    carga = V * np.abs(V) / (2 * g)
+    h_f = f * L / D * carga
+    h_m = K * carga
+    u_tau = np.abs(V) * np.sqrt(f / 8)
+    n = 1 / np.sqrt(f)
+    regimen = np.select([Re < RE_LAMINAR, Re <= RE_TURBULENTO], ['laminar', 'transicion'], 'turbulento')
+    with np.errstate(divide='ignore'):
+        subcapa = 5 * mu / rho / u_tau
+    u_max = np.where(Re < RE_LAMINAR, 2.0, (n + 1) * (2 * n + 1) / (2 * n**2)) * np.abs(V)
+
+    return pd.DataFrame({
+        'segmento': segmentos,
+        'velocidad': V,
+        'Re': Re,
+        'regimen': regimen,
+        'f': f,
+        'K_accesorios': K,
+        'perdida_friccion': h_f,
+        'perdida_menores': h_m,
+        'perdida_total': h_f + h_m,
+        'caida_presion': rho * g * (h_f + h_m + dz),
+        'velocidad_friccion': u_tau,
+        'subcapa_viscosa': subcapa,
+        'exponente_potencia': n,
+        'velocidad_maxima': u_max,
+    })
+
+
+def perfiles_velocidad(velocidad, diametro, Re, f, r_relativo=None, modelo: str = 'auto',
+                       rugosidad=0.0, viscosidad_cinematica=None) -> Dict[str, np.ndarray]:
+    """
+    Perfiles u(r) de N tramos sobre una malla común de r/R.
+
+    Args:
+        velocidad: Velocidad media (N,) (m/s)
+        diametro: Diámetro (N,) (m)
+        Re, f: Número de Reynolds y factor de fricción (N,) (p. ej. de evaluar_tramos)
+        r_relativo: Posiciones r/R (P,); por defecto 50 puntos de 0 a 1
+        modelo: 'poiseuille', 'potencia', 'logaritmico' o 'auto'
+            (Poiseuille si Re < 2000 y ley de potencia en otro caso)
+        rugosidad: Rugosidad absoluta (N,) (m), sólo para la ley logarítmica
+        viscosidad_cinematica: ν (N,) (m²/s); por defecto V·D/Re
+
+    Returns:
+        Dict con r_relativo (P,) y u (N, P) (m/s)
+    """
+    if modelo not in ('auto', 'poiseuille', 'potencia', 'logaritmico'):
+        raise ValueError(f"Modelo de perfil no reconocido: {modelo}")
+    r = np.linspace(0.0, 1.0, 50) if r_relativo is None else np.asarray(r_relativo, dtype=float)
+    V = np.atleast_1d(np.asarray(velocidad, dtype=float))[:, None]
+    D = np.atleast_1d(np.asarray(diametro, dtype=float))[:, None]
+    Re = np.atleast_1d(np.asarray(Re, dtype=float))[:, None]
+    f = np.atleast_1d(np.asarray(f, dtype=float))[:, None]
+    s = r[None, :]
+
+    poiseuille = 2 * V * (1 - s**2)
+    n = 1 / np.sqrt(f)
+    potencia = V * (n + 1) * (2 * n + 1) / (2 * n**2) * (1 - s)**(1 / n)
+
+    nu = np.abs(V) * D / Re if viscosidad_cinematica is None else \
+        np.atleast_1d(np.asarray(viscosidad_cinematica, dtype=float))[:, None]
+    u_tau = np.abs(V) * np.sqrt(f / 8)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y_mas = (1 - s) * D / 2 * u_tau / nu
+        ks_mas = np.atleast_1d(np.asarray(rugosidad, dtype=float))[:, None] * u_tau / nu
+        ley_log = np.log(y_mas / (1 + 0.3 * ks_mas)) / KAPPA + B_LOG
+    u_mas = np.maximum(np.minimum(y_mas, np.nan_to_num(ley_log, nan=0.0, neginf=0.0)), 0.0)
+    logaritmico = np.sign(V) * u_tau * u_mas
+
+    if modelo == 'poiseuille':
+        u = poiseuille
+    elif modelo == 'potencia':
+        u = potencia
+    elif modelo == 'logaritmico':
+        u = logaritmico
+    else:
+        u = np.where(Re < RE_LAMINAR, poiseuille, potencia)
+    return {'r_relativo': r, 'u': np.broadcast_to(u, (len(V), len(r))).copy()}
+
+
+def tabla_perfiles(segmentos, perfiles: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Perfiles en formato largo (segmento, r_relativo, u) para exportar."""
+    segmentos = np.asarray(segmentos)
+    r = perfiles['r_relativo']
+    return pd.DataFrame({
+        'segmento': np.repeat(segmentos, len(r)),
+        'r_relativo': np.tile(r, len(segmentos)),
+        'u': perfiles['u'].ravel(),
+    })
+
+
+def exportar_parquet(tabla: pd.DataFrame, ruta: str, compresion: str = 'snappy') -> str:
+    """
+    Guarda una tabla de resultados en Parquet (requiere pyarrow).
+
+    Returns:
+        Ruta del archivo escrito
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError("La exportación a Parquet requiere pyarrow. "
+                          "Instale con: pip install pyarrow") from e
+    tabla.to_parquet(ruta, engine='pyarrow', compression=compresion, index=False)
+    return ruta
@@ -0,0 +1,158 @@
+# =============================================================================
+# MÓDULO DE FACTOR DE FRICCIÓN (DARCY-WEISBACH)
+# =============================================================================
+# Propósito: Factor de fricción de Darcy vectorizado para arreglos completos
+#            de tramos de tubería: Colebrook-White exacto por Newton a partir
+#            de Swamee-Jain, régimen laminar y mezcla suave en la transición
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+
+import numpy as np
+from typing import Tuple, Union
+
+RE_LAMINAR = 2000.0      # Límite superior del régimen laminar
+RE_TURBULENTO = 4000.0   # Límite inferior del régimen turbulento
+
+_C = 2 / np.log(10)      # -2·log10(z) = -_C·ln(z)
+
+
+def swamee_jain(Re, rugosidad_relativa):
+    """
+    Aproximación explícita de Swamee-Jain a la ecuación de Colebrook.
+
+    Args:
+        Re: Número de Reynolds (arreglo)
+        rugosidad_relativa: e/D (arreglo)
+
+    Returns:
+        Factor de fricción de Darcy (error < 1% frente a Colebrook)
+    """
+    Re = np.asarray(Re, dtype=float)
+    rr = np.asarray(rugosidad_relativa, dtype=float)
+    return 0.25 / np.log10(rr / 3.7 + 5.74 / Re**0.9)**2
+
+
+def colebrook(Re, rugosidad_relativa, tol: float = 1e-12, max_iter: int = 20,
+              derivada: bool = False):
+    """
+    Resuelve Colebrook-White 1/√f = -2 log10(e/3.7D + 2.51/(Re √f)).
+
+    Se resuelve en x = 1/√f con Newton, partiendo de Swamee-Jain; la función
+    es monótona y convexa en x, por lo que converge en 2-3 iteraciones sobre
+    todo el arreglo.
+
+    Args:
+        Re: Número de Reynolds (arreglo, > 0)
+        rugosidad_relativa: e/D (arreglo)
+        tol: Tolerancia relativa en x
+        max_iter: Iteraciones máximas de Newton
+        derivada: Si es True devuelve también df/dRe
+
+    Returns:
+        f, o (f, df/dRe) si derivada=True
+    """
+    Re, rr = np.broadcast_arrays(np.asarray(Re, dtype=float),
+                                 np.asarray(rugosidad_relativa, dtype=float))
+    a = 2.51 / Re
+    b = rr / 3.7
+    x = 1 / np.sqrt(swamee_jain(Re, rr))
+
+    for _ in range(max_iter):
+        z = b + a * x
+        g = x + _C * np.log(z)
+        dg = 1 + _C * a / z
+        paso = g / dg
+        x = x - paso
+        if np.all(np.abs(paso) <= tol * np.abs(x)):
+            break
+
+    f = 1 / x**2
+    if not derivada:
+        return f
+
+    z = b + a * x
+    dx_dRe = (_C * x * a / (Re * z)) / (1 + _C * a / z)
+    return f, -2 * dx_dRe / x**3
+
+
+def factor_friccion(Re, rugosidad_relativa, metodo: str = 'colebrook',
+                    derivada: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Factor de fricción de Darcy para cualquier régimen.
+
+    Laminar (Re < 2000): f = 64/Re. Turbulento (Re > 4000): Colebrook o
+    Swamee-Jain. En la transición se mezclan ambos con un polinomio suave
+    (derivada continua), de modo que los solvers de redes no oscilen.
+
+    Args:
+        Re: Número de Reynolds (arreglo, admite ceros)
+        rugosidad_relativa: e/D (arreglo)
+        metodo: 'colebrook' (exacto) o 'swamee_jain' (explícito)
+        derivada: Si es True devuelve también df/dRe (sólo 'colebrook')
+
+    Returns:
+        f, o (f, df/dRe) si derivada=True
+    """
+    if metodo not in ('colebrook', 'swamee_jain'):
+        raise ValueError(f"Método desconocido: {metodo}")
+    if derivada and metodo != 'colebrook':
+        raise ValueError("La derivada sólo está disponible con metodo='colebrook'")
+
+    Re, rr = np.broadcast_arrays(np.asarray(Re, dtype=float),
+                                 np.asarray(rugosidad_relativa, dtype=float))
+    forma = Re.shape
+    Re, rr = Re.ravel(), rr.ravel()
+    # Re = 0 (caudal nulo) se limita para que f·V² siga siendo 0 y finito
+    Re = np.maximum(np.abs(Re), 1e-9)
+
+    f_lam = 64 / Re
+    df_lam = -64 / Re**2
+
+    turbulento = Re > RE_LAMINAR
+    f = f_lam.copy()
+    df = df_lam.copy()
+    if not np.any(turbulento):
+        return (f.reshape(forma), df.reshape(forma)) if derivada else f.reshape(forma)
+
+    Re_t, rr_t = Re[turbulento], rr[turbulento]
+    if metodo == 'colebrook':
+        f_t, df_t = colebrook(Re_t, rr_t, derivada=True)
+    else:
+        f_t, df_t = swamee_jain(Re_t, rr_t), np.zeros_like(Re_t)
+
+    # Mezcla con smoothstep entre 2000 y 4000
+    s = np.clip((Re_t - RE_LAMINAR) / (RE_TURBULENTO - RE_LAMINAR), 0, 1)
+    w = s**2 * (3 - 2*s)
+    dw = np.where((s > 0) & (s < 1), 6*s*(1 - s) / (RE_TURBULENTO - RE_LAMINAR), 0.0)
+
+    f_l, df_l = f_lam[turbulento], df_lam[turbulento]
+    f[turbulento] = (1 - w) * f_l + w * f_t
+    df[turbulento] = dw * (f_t - f_l) + (1 - w) * df_l + w * df_t
+    return (f.reshape(forma), df.reshape(forma)) if derivada else f.reshape(forma)
+
+
+def perdida_carga(caudal, diametro, longitud, rugosidad, nu: float = 1.0e-6,
+                  g: float = 9.81, metodo: str = 'colebrook'):
+    """
+    Pérdida de carga por fricción (m) en arreglos de tramos (Darcy-Weisbach).
+
+    Args:
+        caudal: Caudal (m³/s), admite signo
+        diametro: Diámetro interno (m)
+        longitud: Longitud del tramo (m)
+        rugosidad: Rugosidad absoluta (m)
+        nu: Viscosidad cinemática (m²/s)
+        g: Gravedad (m/s²)
+        metodo: Método de factor_friccion
+
+    Returns:
+        Pérdida de carga con el signo del caudal
+    """
+    caudal = np.asarray(caudal, dtype=float)
+    diametro = np.asarray(diametro, dtype=float)
+    area = np.pi * diametro**2 / 4
+    V = caudal / area
+    Re = np.abs(V) * diametro / nu
+    f = factor_friccion(Re, np.asarray(rugosidad) / diametro, metodo)
+    return f * np.asarray(longitud) / diametro * V * np.abs(V) / (2 * g)
@@ -0,0 +1,329 @@
+# =============================================================================
+# MÓDULO DE INTERCAMBIADORES DE CALOR
+# =============================================================================
+# Propósito: Evaluar (rating) y dimensionar intercambiadores de carcasa y
+#            tubos y de placas con ensuciamiento por los métodos ε-NTU y
+#            DTML, para una tabla completa de equipos (enfriadores de aceite,
+#            unidades de lubricación) bajo muchas condiciones de operación en
+#            una sola llamada vectorizada (N equipos × M condiciones)
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Flujos másicos en kg/s, cp en J/kg·K, temperaturas en K o °C (sólo se usan
+# diferencias), áreas en m², U en W/m²·K y resistencias de ensuciamiento
+# en m²·K/W referidas al área de transferencia.
+#   C = ṁ·cp     Cr = C_min / C_max     NTU = U·A / C_min
+#   q = ε·C_min·(T_h,e - T_c,e) = U·A·F·DTML_contraflujo
+# El factor F se obtiene de la equivalencia exacta entre ambos métodos,
+# F = NTU_contraflujo(ε, Cr) / NTU. Los intercambiadores de placas de un
+# paso se tratan como contraflujo puro.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Union
+
+TIPOS = ('contraflujo', 'paralelo', 'carcasa_tubos', 'placas', 'cruzado')
+NTU_MAXIMO = 50.0   # Límite superior de la búsqueda de NTU al dimensionar
+
+
+def efectividad(NTU, Cr, tipo='contraflujo', pasos_carcasa=1):
+    """
+    Efectividad ε(NTU, Cr) de la configuración de flujo.
+
+    Args:
+        NTU: Número de unidades de transferencia
+        Cr: Relación de capacidades C_min / C_max (0 a 1)
+        tipo: Uno de TIPOS, escalar o arreglo (un tipo por elemento)
+            'carcasa_tubos' es 1 paso por carcasa y 2, 4, ... pasos por
+            tubos; 'cruzado' es flujo cruzado con ambos fluidos sin mezclar
+        pasos_carcasa: Número de carcasas en serie (sólo carcasa_tubos)
+
+    Returns:
+        ε con la forma del broadcasting de las entradas
+    """
+    NTU = np.asarray(NTU, dtype=float)
+    Cr = np.asarray(Cr, dtype=float)
+    tipo = np.asarray(tipo)
+    desconocidos = set(np.unique(tipo).tolist()) - set(TIPOS)
+    if desconocidos:
+        raise ValueError(f"Tipos de intercambiador no reconocidos: {sorted(desconocidos)}")
+    N = np.asarray(pasos_carcasa, dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Contraflujo (y placas); límite Cr → 1 por separado
+        e = np.exp(-NTU * (1 - Cr))
+        contraflujo = np.where(np.abs(1 - Cr) < 1e-9, NTU / (1 + NTU), (1 - e) / (1 - Cr * e))
+        paralelo = (1 - np.exp(-NTU * (1 + Cr))) / (1 + Cr)
+
+        # Carcasa y tubos: una carcasa con NTU/N y N carcasas en serie
+        raiz = np.sqrt(1 + Cr**2)
+        x = np.exp(-NTU / N * raiz)
+        e1 = 2 / (1 + Cr + raiz * (1 + x) / (1 - x))
+        razon = ((1 - e1 * Cr) / (1 - e1))**N
+        carcasa = np.where(np.abs(1 - Cr) < 1e-9, N * e1 / (1 + (N - 1) * e1),
+                           (razon - 1) / (razon - Cr))
+        carcasa = np.where(N == 1, e1, carcasa)
+
+        cruzado = 1 - np.exp(NTU**0.22 / Cr * (np.exp(-Cr * NTU**0.78) - 1))
+
+    resultado = np.select([(tipo == 'contraflujo') | (tipo == 'placas'), tipo == 'paralelo',
+                           tipo == 'carcasa_tubos'], [contraflujo, paralelo, carcasa], cruzado)
+    # Cr = 0 (condensación/evaporación): todas las configuraciones coinciden
+    resultado = np.where(Cr == 0, 1 - np.exp(-NTU), resultado)
+    return np.where(NTU == 0, 0.0, resultado)
+
+
+def ntu_contraflujo(epsilon, Cr):
+    """NTU de un contraflujo puro con efectividad ε (inversa exacta)."""
+    epsilon = np.asarray(epsilon, dtype=float)
+    Cr = np.asarray(Cr, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        general = np.log((1 - epsilon * Cr) / (1 - epsilon)) / (1 - Cr)
+        unitario = epsilon / (1 - epsilon)
+    return np.where(np.abs(1 - Cr) < 1e-9, unitario, general)
+
+
+def ntu_requerido(epsilon, Cr, tipo='contraflujo', pasos_carcasa=1, tol: float = 1e-12,
+                  max_iter: int = 200):
+    """
+    NTU necesario para alcanzar la efectividad ε (raíz vectorizada).
+
+    ε(NTU) es creciente en todas las configuraciones, así que se usa
+    bisección sobre ln NTU para todos los elementos a la vez. Si ε no es
+    alcanzable (supera el máximo de la configuración) se devuelve NaN.
+
+    Returns:
+        NTU con la forma del broadcasting de las entradas
+    """
+    epsilon, Cr, tipo, N = np.broadcast_arrays(np.asarray(epsilon, dtype=float),
+                                               np.asarray(Cr, dtype=float), np.asarray(tipo),
+                                               np.asarray(pasos_carcasa, dtype=float))
+    bajo = np.full(epsilon.shape, np.log(1e-8))
+    alto = np.full(epsilon.shape, np.log(NTU_MAXIMO))
+    alcanzable = (epsilon >= 0) & (epsilon < efectividad(NTU_MAXIMO, Cr, tipo, N))
+    for _ in range(max_iter):
+        medio = 0.5 * (bajo + alto)
+        debajo = efectividad(np.exp(medio), Cr, tipo, N) < epsilon
+        bajo = np.where(debajo, medio, bajo)
+        alto = np.where(debajo, alto, medio)
+        if np.all(alto - bajo < tol):
+            break
+    return np.where(alcanzable, np.where(epsilon == 0, 0.0, np.exp(0.5 * (bajo + alto))), np.nan)
+
+
+def dtml(T_caliente_entrada, T_caliente_salida, T_fria_entrada, T_fria_salida,
+         flujo: str = 'contraflujo'):
+    """
+    Diferencia de temperatura media logarítmica.
+
+    Args:
+        flujo: 'contraflujo' o 'paralelo'
+
+    Returns:
+        DTML (con el límite ΔT₁ = ΔT₂ resuelto)
+    """
+    Th1, Th2, Tc1, Tc2 = (np.asarray(a, dtype=float) for a in
+                          (T_caliente_entrada, T_caliente_salida, T_fria_entrada, T_fria_salida))
+    if flujo == 'contraflujo':
+        dT1, dT2 = Th1 - Tc2, Th2 - Tc1
+    elif flujo == 'paralelo':
+        dT1, dT2 = Th1 - Tc1, Th2 - Tc2
+    else:
+        raise ValueError(f"Flujo no reconocido para la DTML: {flujo}")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        media = (dT1 - dT2) / np.log(dT1 / dT2)
+    return np.where(np.isclose(dT1, dT2, rtol=1e-9), 0.5 * (dT1 + dT2), media)
+
+
+def coeficiente_global(h_caliente, h_fria, ensuciamiento_caliente=0.0, ensuciamiento_fria=0.0,
+                       resistencia_pared=0.0):
+    """
+    Coeficiente global U con ensuciamiento (pared delgada, áreas iguales).
+
+        1/U = 1/h_h + R_f,h + R_pared + R_f,c + 1/h_c
+
+    Args:
+        h_caliente, h_fria: Coeficientes de película (W/m²·K)
+        ensuciamiento_caliente, ensuciamiento_fria: R_f (m²·K/W)
+        resistencia_pared: Espesor / conductividad de la pared (m²·K/W)
+    """
+    return 1 / (1 / np.asarray(h_caliente, dtype=float) + ensuciamiento_caliente
+                + resistencia_pared + ensuciamiento_fria + 1 / np.asarray(h_fria, dtype=float))
+
+
+def coeficiente_tubos(Re, Pr, conductividad, diametro):
+    """
+    Coeficiente de película dentro de tubos (W/m²·K).
+
+    Gnielinski con el factor de Petukhov para Re > 2300 y Nu = 3.66
+    (pared a temperatura uniforme, flujo desarrollado) en laminar.
+    """
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = (0.790 * np.log(np.maximum(Re, 2300.0)) - 1.64)**-2
+        Nu = (f / 8) * (Re - 1000) * Pr / (1 + 12.7 * np.sqrt(f / 8) * (Pr**(2 / 3) - 1))
+    Nu = np.where(Re > 2300, np.maximum(Nu, 3.66), 3.66)
+    return Nu * np.asarray(conductividad, dtype=float) / np.asarray(diametro, dtype=float)
+
+
+def coeficiente_placas(Re, Pr, conductividad, diametro_hidraulico, C: float = 0.2,
+                       exponente: float = 0.67):
+    """
+    Coeficiente de película en canales de placas corrugadas (W/m²·K).
+
+    Nu = C · Re^n · Pr^(1/3); C ≈ 0.2 y n ≈ 0.67 son valores típicos de
+    placas tipo chevron de ángulo intermedio (ajustar con datos del fabricante).
+    """
+    Nu = C * np.asarray(Re, dtype=float)**exponente * np.asarray(Pr, dtype=float)**(1 / 3)
+    return Nu * np.asarray(conductividad, dtype=float) / np.asarray(diametro_hidraulico, dtype=float)
+
+
+def _columna(tabla, nombre, defecto=None) -> np.ndarray:
+    """Columna de un DataFrame o dict como arreglo (n,), con valor por defecto."""
+    if nombre in tabla:
+        return np.atleast_1d(np.asarray(tabla[nombre]))
+    if defecto is None:
+        raise ValueError(f"Falta la columna '{nombre}'")
+    return np.atleast_1d(np.asarray(defecto))
+
+
+def _capacidades(condiciones):
+    """C_caliente, C_fria y temperaturas de entrada (M,) de la tabla de condiciones."""
+    C_h = _columna(condiciones, 'flujo_caliente').astype(float) * \
+        _columna(condiciones, 'cp_caliente').astype(float)
+    C_c = _columna(condiciones, 'flujo_frio').astype(float) * \
+        _columna(condiciones, 'cp_frio').astype(float)
+    return (C_h, C_c, _columna(condiciones, 'T_caliente_entrada').astype(float),
+            _columna(condiciones, 'T_fria_entrada').astype(float))
+
+
+def evaluar_intercambiadores(equipos: Union[pd.DataFrame, Dict],
+                             condiciones: Union[pd.DataFrame, Dict]) -> Dict[str, np.ndarray]:
+    """
+    Rating de N intercambiadores bajo M condiciones de operación.
+
+    Args:
+        equipos: Una fila por equipo con columnas
+            tipo: uno de TIPOS
+            area: área de transferencia (m²)
+            U: coeficiente global limpio (W/m²·K), o bien h_caliente y
+                h_fria (W/m²·K) para calcularlo con coeficiente_global
+            ensuciamiento_caliente, ensuciamiento_fria: R_f (opcional, 0)
+            resistencia_pared (opcional, 0), pasos_carcasa (opcional, 1)
+            flujo_caliente_nominal, flujo_frio_nominal (opcional): caudales
+                a los que se dieron h_caliente y h_fria; fuera de ellos se
+                escalan como h ∝ ṁ^exponente_flujo (columna opcional, 0.8)
+        condiciones: Una fila por condición con flujo_caliente, cp_caliente,
+            T_caliente_entrada, flujo_frio, cp_frio y T_fria_entrada
+
+    Returns:
+        Dict de arreglos (N, M): U, U_limpio, NTU, Cr, efectividad, q (W),
+        q_limpio, factor_limpieza (q / q_limpio), T_caliente_salida,
+        T_fria_salida, dtml (contraflujo) y F
+    """
+    tipo = _columna(equipos, 'tipo').astype(str)[:, None]
+    area = _columna(equipos, 'area').astype(float)[:, None]
+    N = _columna(equipos, 'pasos_carcasa', 1).astype(float)[:, None]
+    R_h = _columna(equipos, 'ensuciamiento_caliente', 0.0).astype(float)[:, None]
+    R_c = _columna(equipos, 'ensuciamiento_fria', 0.0).astype(float)[:, None]
+    R_w = _columna(equipos, 'resistencia_pared', 0.0).astype(float)[:, None]
+    C_h, C_c, Th1, Tc1 = (a[None, :] for a in _capacidades(condiciones))
+
+    if 'h_caliente' in equipos:
+        h_h = _columna(equipos, 'h_caliente').astype(float)[:, None]
+        h_c = _columna(equipos, 'h_fria').astype(float)[:, None]
+        if 'flujo_caliente_nominal' in equipos:
+            n = _columna(equipos, 'exponente_flujo', 0.8).astype(float)[:, None]
+            m_h = _columna(condiciones, 'flujo_caliente').astype(float)[None, :]
+            m_c = _columna(condiciones, 'flujo_frio').astype(float)[None, :]
+            h_h = h_h * (m_h / _columna(equipos, 'flujo_caliente_nominal').astype(float)[:, None])**n
+            h_c = h_c * (m_c / _columna(equipos, 'flujo_frio_nominal').astype(float)[:, None])**n
+        U_limpio = coeficiente_global(h_h, h_c, resistencia_pared=R_w)
+    else:
+        U_limpio = 1 / (1 / _columna(equipos, 'U').astype(float)[:, None] + R_w)
+    U = 1 / (1 / U_limpio + R_h + R_c)
+
+    C_min, C_max = np.minimum(C_h, C_c), np.maximum(C_h, C_c)
+    Cr = C_min / C_max
+    q_max = C_min * (Th1 - Tc1)
+    NTU = U * area / C_min
+    eps = efectividad(NTU, Cr, tipo, N)
+    eps_limpio = efectividad(U_limpio * area / C_min, Cr, tipo, N)
+    q = eps * q_max
+    Th2 = Th1 - q / C_h
+    Tc2 = Tc1 + q / C_c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        F = np.where(NTU > 0, ntu_contraflujo(eps, Cr) / NTU, 1.0)
+    return {
+        'U': U,
+        'U_limpio': np.broadcast_to(U_limpio, q.shape),
+        'NTU': NTU,
+        'Cr': Cr,
+        'efectividad': eps,
+        'q': q,
+        'q_limpio': eps_limpio * q_max,
+        'factor_limpieza': eps / eps_limpio,
+        'T_caliente_salida': Th2,
+        'T_fria_salida': Tc2,
+        'dtml': dtml(Th1, Th2, Tc1, Tc2),
+        'F': F,
+    }
+
+
+def dimensionar_intercambiador(condiciones: Union[pd.DataFrame, Dict], U, tipo='contraflujo',
+                               q=None, T_caliente_salida=None, T_fria_salida=None,
+                               pasos_carcasa=1, margen_area: float = 0.0) -> Dict[str, np.ndarray]:
+    """
+    Área requerida para una carga térmica dada (raíz en NTU, vectorizada).
+
+    La carga se da directamente (q) o mediante una temperatura de salida.
+    U debe incluir el ensuciamiento de diseño (usar coeficiente_global).
+
+    Args:
+        condiciones: Como en evaluar_intercambiadores, M filas
+        U: Coeficiente global de diseño (W/m²·K), escalar o (M,)
+        tipo: Configuración (ver efectividad), escalar o (M,)
+        q: Carga térmica requerida (W)
+        T_caliente_salida: Temperatura de salida del fluido caliente
+        T_fria_salida: Temperatura de salida del fluido frío
+        pasos_carcasa: Carcasas en serie (carcasa_tubos)
+        margen_area: Sobrediseño de área (fracción), p. ej. 0.1
+
+    Returns:
+        Dict (M,) con area (NaN si la carga no es alcanzable con la
+        configuración), NTU, efectividad, Cr, q, T_caliente_salida,
+        T_fria_salida, dtml y F
+    """
+    C_h, C_c, Th1, Tc1 = _capacidades(condiciones)
+    dadas = [v is not None for v in (q, T_caliente_salida, T_fria_salida)]
+    if sum(dadas) != 1:
+        raise ValueError("Indique exactamente uno de q, T_caliente_salida o T_fria_salida")
+    if T_caliente_salida is not None:
+        q = C_h * (Th1 - np.asarray(T_caliente_salida, dtype=float))
+    elif T_fria_salida is not None:
+        q = C_c * (np.asarray(T_fria_salida, dtype=float) - Tc1)
+    q = np.asarray(q, dtype=float) * np.ones_like(C_h)
+
+    C_min = np.minimum(C_h, C_c)
+    Cr = C_min / np.maximum(C_h, C_c)
+    eps = q / (C_min * (Th1 - Tc1))
+    NTU = ntu_requerido(eps, Cr, tipo, pasos_carcasa)
+    area = NTU * C_min / np.asarray(U, dtype=float) * (1 + margen_area)
+    Th2 = Th1 - q / C_h
+    Tc2 = Tc1 + q / C_c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        F = np.where(NTU > 0, ntu_contraflujo(eps, Cr) / NTU, 1.0)
+    return {
+        'area': area,
+        'NTU': NTU,
+        'efectividad': eps,
+        'Cr': Cr,
+        'q': q,
+        'T_caliente_salida': Th2,
+        'T_fria_salida': Tc2,
+        'dtml': dtml(Th1, Th2, Tc1, Tc2),
+        'F': F,
+    }
@@ -55,12 +55,14 @@ class MaterialesResistenciaApp:
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
         # Base de datos de materiales
+        from modulos.base_materiales import INDICES, base_materiales
+        self.base_materiales = base_materiales()
+        
         ttk.Label(left_frame, text="Material:").pack(anchor=tk.W)
         self.material_seleccionado = ttk.Combobox(left_frame, 
-                                                values=["Acero AISI 1020", "Acero AISI 1045", "Aluminio 6061-T6", 
-                                                       "Titanio Ti-6Al-4V", "Cobre C11000", "Personalizado"])
+                                                values=self.base_materiales.nombres + ["Personalizado"])
         self.material_seleccionado.pack(fill=tk.X, pady=(0, 10))
-        self.material_seleccionado.set("Acero AISI 1020")
+        self.material_seleccionado.set("ASTM A36")
         self.material_seleccionado.bind('<<ComboboxSelected>>', self.cargar_propiedades_material)
         
         # Propiedades del material
@@ -107,6 +109,11 @@ class MaterialesResistenciaApp:
         ttk.Button(left_frame, text="Analizar Material", 
                   command=self.analizar_material).pack(fill=tk.X, pady=5)
         
+        ttk.Label(left_frame, text="Índice de desempeño:").pack(anchor=tk.W)
+        self.indice_desempeno = ttk.Combobox(left_frame, values=list(INDICES), state="readonly")
+        self.indice_desempeno.pack(fill=tk.X, pady=(0, 5))
+        self.indice_desempeno.set("viga_rigidez")
+        
         ttk.Button(left_frame, text="Comparar Materiales", 
                   command=self.comparar_materiales).pack(fill=tk.X, pady=5)
         
@@ -156,6 +163,14 @@ class MaterialesResistenciaApp:
         self.I_var = tk.StringVar(value="10000")
         ttk.Entry(geo_frame, textvariable=self.I_var, width=10).grid(row=2, column=1, padx=5)
         
+        ttk.Label(geo_frame, text="Radio exterior c (mm):").grid(row=3, column=0, sticky=tk.W)
+        self.c_var = tk.StringVar(value="10")
+        ttk.Entry(geo_frame, textvariable=self.c_var, width=10).grid(row=3, column=1, padx=5)
+        
+        ttk.Label(geo_frame, text="Momento polar J (mm⁴):").grid(row=4, column=0, sticky=tk.W)
+        self.J_var = tk.StringVar(value="20000")
+        ttk.Entry(geo_frame, textvariable=self.J_var, width=10).grid(row=4, column=1, padx=5)
+        
         # Cargas aplicadas
         ttk.Label(left_frame, text="Cargas Aplicadas:").pack(anchor=tk.W, pady=(10, 0))
         
@@ -242,6 +257,12 @@ class MaterialesResistenciaApp:
         self.kc_var = tk.StringVar(value="0.9")
         ttk.Entry(fact_frame, textvariable=self.kc_var, width=10).grid(row=2, column=1, padx=5)
         
+        ttk.Label(left_frame, text="Corrección por esfuerzo medio:").pack(anchor=tk.W, pady=(10, 0))
+        self.correccion_fatiga = ttk.Combobox(left_frame, values=["goodman", "gerber", "morrow", "swt", "ninguna"],
+                                              state="readonly")
+        self.correccion_fatiga.pack(fill=tk.X, pady=(0, 5))
+        self.correccion_fatiga.set("goodman")
+        
         # Botones de análisis
         ttk.Button(left_frame, text="Análisis de Fatiga", 
                   command=self.analisis_fatiga).pack(fill=tk.X, pady=5)
@@ -296,39 +317,15 @@ class MaterialesResistenciaApp:
         """Carga las propiedades del material seleccionado"""
         material = self.material_seleccionado.get()
         
-        # Base de datos de materiales
-        materiales_db = {
-            "Acero AISI 1020": {
-                "E": 200, "nu": 0.3, "Sy": 250, "Su": 400, "rho": 7850,
-                "alpha": 12e-6, "k_thermal": 50
-            },
-            "Acero AISI 1045": {
-                "E": 200, "nu": 0.3, "Sy": 450, "Su": 600, "rho": 7850,
-                "alpha": 12e-6, "k_thermal": 50
-            },
-            "Aluminio 6061-T6": {
-                "E": 69, "nu": 0.33, "Sy": 240, "Su": 310, "rho": 2700,
-                "alpha": 23e-6, "k_thermal": 167
-            },
-            "Titanio Ti-6Al-4V": {
-                "E": 114, "nu": 0.34, "Sy": 825, "Su": 950, "rho": 4430,
-                "alpha": 8.6e-6, "k_thermal": 7
-            },
-            "Cobre C11000": {
-                "E": 110, "nu": 0.34, "Sy": 70, "Su": 220, "rho": 8960,
-                "alpha": 17e-6, "k_thermal": 401
-            }
-        }
-        
-        if material in materiales_db:
-            props = materiales_db[material]
-            self.E_var.set(str(props["E"]))
-            self.nu_var.set(str(props["nu"]))
-            self.Sy_var.set(str(props["Sy"]))
-            self.Su_var.set(str(props["Su"]))
-            self.rho_var.set(str(props["rho"]))
-            self.alpha_var.set(str(props["alpha"]))
-            self.k_thermal_var.set(str(props["k_thermal"]))
+        if material in self.base_materiales.indice:
+            props = self.base_materiales.propiedades(material)
+            self.E_var.set(f"{props['E']:g}")
+            self.nu_var.set(f"{props['nu']:g}")
+            self.Sy_var.set(f"{props['Sy']:g}" if np.isfinite(props['Sy']) else f"{props['Su']:g}")
+            self.Su_var.set(f"{props['Su']:g}")
+            self.rho_var.set(f"{props['rho']:g}")
+            self.alpha_var.set(f"{props['alpha']:g}e-6")
+            self.k_thermal_var.set(f"{props['k']:g}")
     
     def analizar_material(self):
         """Analiza las propiedades del material"""
@@ -435,46 +432,41 @@ Análisis completado exitosamente.
             F_axial = float(self.F_axial_var.get())
             M_flexion = float(self.M_flexion_var.get())
             M_torsion = float(self.M_torsion_var.get())
+            c = float(self.c_var.get()) * 1e-3  # Convertir a m
+            J = float(self.J_var.get()) * 1e-12  # Convertir a m⁴
             
             # Obtener propiedades del material
             E = float(self.E_var.get()) * 1e9
             Sy = float(self.Sy_var.get()) * 1e6
             
-            # Calcular esfuerzos según el tipo de carga
+            # Cargas activas según el tipo de carga
             if tipo == "Tracción":
-                sigma_axial = F_axial / A
-                sigma_flexion = 0
-                tau_torsion = 0
-                
+                M_flexion = M_torsion = 0
             elif tipo == "Flexión":
-                sigma_axial = 0
-                c = 0.01  # Distancia al eje neutro (m)
-                sigma_flexion = M_flexion * c / I
-                tau_torsion = 0
-                
+                F_axial = M_torsion = 0
             elif tipo == "Torsión":
-                sigma_axial = 0
-                sigma_flexion = 0
-                J = 2 * I  # Momento polar de inercia (aproximación)
-                r = 0.01  # Radio (m)
-                tau_torsion = M_torsion * r / J
-                
-            else:  # Combinada
-                sigma_axial = F_axial / A
-                c = 0.01
-                sigma_flexion = M_flexion * c / I
-                J = 2 * I
-                r = 0.01
-                tau_torsion = M_torsion * r / J
-            
-            # Esfuerzo normal total
-            sigma_total = sigma_axial + sigma_flexion
+                F_axial = M_flexion = 0
             
-            # Esfuerzo de von Mises (para materiales dúctiles)
-            sigma_vm = np.sqrt(sigma_total**2 + 3*tau_torsion**2)
+            sigma_axial = F_axial / A
+            sigma_flexion = M_flexion * c / I
+            tau_torsion = M_torsion * c / J
+            sigma_total = sigma_axial + sigma_flexion
             
-            # Factor de seguridad
-            FS = Sy / sigma_vm if sigma_vm > 0 else float('inf')
+            # Campo de esfuerzos en la sección circular de radio c (flexión alrededor de z,
+            # torsión alrededor del eje x) evaluado con el motor de tensores
+            from modulos.tensor_esfuerzos import analizar_campo
+            r, phi = np.meshgrid(np.linspace(0, c, 41), np.linspace(0, 2 * np.pi, 73))
+            y, z = (r * np.sin(phi)).ravel(), (r * np.cos(phi)).ravel()
+            tensores = np.zeros((len(y), 6))
+            tensores[:, 0] = sigma_axial + M_flexion * y / I
+            tensores[:, 3] = -M_torsion * z / J
+            tensores[:, 5] = M_torsion * y / J
+            campo = analizar_campo(tensores, Sy=Sy)
+            critico = campo['critico']['von_mises']
+            sigma_vm = campo['von_mises'][critico]
+            FS = campo['fs_von_mises'][critico]
+            FS_tresca = campo['fs_tresca'].min()
+            sigma_1, _, sigma_3 = campo['principales'][critico]
             
             # Deformación
             epsilon = sigma_total / E
@@ -488,7 +480,10 @@ Análisis completado exitosamente.
                 'tau_torsion': tau_torsion,
                 'sigma_total': sigma_total,
                 'sigma_vm': sigma_vm,
+                'sigma_1': sigma_1,
+                'sigma_3': sigma_3,
                 'FS': FS,
+                'FS_tresca': FS_tresca,
                 'epsilon': epsilon,
                 'delta_L': delta_L
             }
@@ -546,9 +541,11 @@ Esfuerzos calculados:
 - Esfuerzo cortante por torsión: {self.datos_esfuerzo['tau_torsion']/1e6:.1f} MPa
 - Esfuerzo normal total: {self.datos_esfuerzo['sigma_total']/1e6:.1f} MPa
 - Esfuerzo de von Mises: {self.datos_esfuerzo['sigma_vm']/1e6:.1f} MPa
+- Principales en el punto crítico: σ1 = {self.datos_esfuerzo['sigma_1']/1e6:.1f} MPa, σ3 = {self.datos_esfuerzo['sigma_3']/1e6:.1f} MPa
 
 Análisis de resistencia:
 - Factor de seguridad: {self.datos_esfuerzo['FS']:.2f}
+- Factor de seguridad (Tresca): {self.datos_esfuerzo['FS_tresca']:.2f}
 - Estado: {'Seguro' if self.datos_esfuerzo['FS'] > 1 else 'Crítico'}
 
 Deformación:
@@ -669,7 +666,54 @@ Análisis completado exitosamente.
     
     # Métodos adicionales (placeholder)
     def comparar_materiales(self):
-        messagebox.showinfo("En Desarrollo", "Comparación de materiales en desarrollo")
+        """Selecciona los mejores materiales del catálogo según el índice elegido"""
+        try:
+            base = self.base_materiales
+            indice = self.indice_desempeno.get()
+            Sy_min = float(self.Sy_var.get())
+            candidatos = base.seleccionar(indice, n=10, restricciones={'Sy': (Sy_min, None)})
+            if candidatos.empty:
+                messagebox.showwarning("Advertencia", f"Ningún material del catálogo tiene Sy ≥ {Sy_min:g} MPa")
+                return
+            
+            # Mapa de Ashby E-ρ de todo el catálogo con los candidatos resaltados
+            self.ax_material.clear()
+            colores = plt.cm.tab20(np.linspace(0, 1, len(base.familias)))
+            for codigo, (familia, color) in enumerate(zip(base.familias, colores)):
+                m = base.codigo_familia == codigo
+                self.ax_material.scatter(base['rho'][m], base['E'][m], s=12, color=color, alpha=0.6, label=familia)
+            self.ax_material.scatter(candidatos['rho'], candidatos['E'], s=70, facecolors='none',
+                                     edgecolors='k', linewidths=1.5, label='Candidatos')
+            for _, fila in candidatos.head(5).iterrows():
+                self.ax_material.annotate(fila['nombre'], (fila['rho'], fila['E']), fontsize=7,
+                                          xytext=(4, 4), textcoords='offset points')
+            self.ax_material.set_xscale('log')
+            self.ax_material.set_yscale('log')
+            self.ax_material.set_xlabel('Densidad (kg/m³)')
+            self.ax_material.set_ylabel('Módulo de elasticidad (GPa)')
+            self.ax_material.set_title(f'Mapa de Ashby - índice {indice}')
+            self.ax_material.legend(fontsize=6, ncol=2, loc='lower right')
+            self.ax_material.grid(True, which='both', alpha=0.3)
+            self.canvas_material.draw()
+            
+            lineas = "\n".join(
+                f"{i + 1:2d}. {fila['nombre']:<32s} M = {fila['indice']:.4g} ({fila['relativo']:.1%})  "
+                f"Sy = {fila['Sy']:.0f} MPa  ρ = {fila['rho']:.0f} kg/m³  costo ≈ {fila['costo']:.1f} USD/kg"
+                for i, fila in candidatos.iterrows())
+            resultados = f"""
+=== COMPARACIÓN DE MATERIALES ===
+Catálogo: {len(base)} materiales, {len(base.familias)} familias
+Índice de desempeño: {indice}
+Restricción: Sy ≥ {Sy_min:g} MPa
+
+Mejores candidatos:
+{lineas}
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en comparación de materiales: {str(e)}")
     
     def guardar_material(self):
         messagebox.showinfo("En Desarrollo", "Guardado de material en desarrollo")
@@ -678,13 +722,177 @@ Análisis completado exitosamente.
         messagebox.showinfo("En Desarrollo", "Análisis de deformación en desarrollo")
     
     def verificar_resistencia(self):
-        messagebox.showinfo("En Desarrollo", "Verificación de resistencia en desarrollo")
+        """Probabilidad de fluencia en la fibra crítica ante la dispersión de cargas y resistencia"""
+        try:
+            from modulos.confiabilidad import (VariableAleatoria, monte_carlo, muestreo_importancia, sorm)
+            from modulos.tensor_esfuerzos import von_mises
+            
+            tipo = self.tipo_carga.get()
+            A = float(self.area_var.get()) * 1e-6
+            I = float(self.I_var.get()) * 1e-12
+            c = float(self.c_var.get()) * 1e-3
+            J = float(self.J_var.get()) * 1e-12
+            Sy = float(self.Sy_var.get())
+            cargas = {'F': float(self.F_axial_var.get()), 'M': float(self.M_flexion_var.get()),
+                      'T': float(self.M_torsion_var.get())}
+            activas = {"Tracción": ('F',), "Flexión": ('M',), "Torsión": ('T',)}.get(tipo, ('F', 'M', 'T'))
+            
+            # Dispersión típica: fluencia lognormal (CoV 7%), cargas extremas Gumbel (CoV 15%)
+            variables = {'Sy': VariableAleatoria('lognormal', Sy, 0.07 * Sy)}
+            fijos = {}
+            for nombre, valor in cargas.items():
+                if nombre in activas and valor != 0:
+                    variables[nombre] = VariableAleatoria('gumbel', valor, 0.15 * abs(valor))
+                else:
+                    fijos[nombre] = 0.0
+            
+            def estado_limite(Sy, F, M, T):
+                F, M, T = np.broadcast_arrays(F, M, T)
+                tensores = np.zeros(F.shape + (6,))
+                tensores[..., 0] = (F / A + M * c / I) / 1e6
+                tensores[..., 5] = T * c / J / 1e6
+                return Sy - von_mises(tensores.reshape(-1, 6)).reshape(F.shape)
+            
+            r_sorm = sorm(estado_limite, variables, fijos)
+            r_is = muestreo_importancia(estado_limite, variables, n=200000, punto_diseno=r_sorm['u'],
+                                        fijos=fijos, semilla=0)
+            r_mc = monte_carlo(estado_limite, variables, n=1000000, fijos=fijos, semilla=0)
+            
+            self.ax_esfuerzos.clear()
+            nombres = list(r_sorm['alfa'])
+            importancia = [r_sorm['alfa'][n] ** 2 for n in nombres]
+            self.ax_esfuerzos.bar(nombres, importancia, color='teal')
+            self.ax_esfuerzos.set_ylabel('Factor de importancia α²')
+            self.ax_esfuerzos.set_title(f'Confiabilidad - β = {r_sorm["beta"]:.2f}')
+            self.ax_esfuerzos.grid(True, axis='y')
+            self.canvas_esfuerzos.draw()
+            
+            def linea(r):
+                return f"pf = {r['pf']:.3e}  IC95% [{r['ic'][0]:.3e}, {r['ic'][1]:.3e}]  ({r['evaluaciones']:,} evaluaciones)"
+            
+            punto = ", ".join(f"{n} = {v:.4g}" for n, v in r_sorm['x'].items())
+            resultados = f"""
+=== VERIFICACIÓN PROBABILÍSTICA DE RESISTENCIA ===
+Tipo de carga: {tipo}
+Variables: Sy lognormal (CoV 7%), cargas Gumbel (CoV 15%)
+Estado límite: g = Sy - σ_vm en la fibra crítica
+
+FORM: β = {r_sorm['beta']:.3f}, pf = {r_sorm['pf']:.3e}
+SORM (Hohenbichler-Rackwitz): pf = {r_sorm['pf_hohenbichler']:.3e}
+Muestreo por importancia: {linea(r_is)}
+Monte Carlo: {linea(r_mc)}
+Punto de diseño: {punto}
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la verificación de resistencia: {str(e)}")
+    
+    def _curva_sn_material(self):
+        """Curva de Basquin por (10³, 0.9·Su) y el límite de fatiga corregido a 10⁶ ciclos"""
+        from modulos.fatiga import CurvaSN
+        Su = float(self.Su_var.get())
+        Se = float(self.Sf_var.get()) * float(self.ka_var.get()) * float(self.kb_var.get()) * float(self.kc_var.get())
+        return CurvaSN.desde_puntos(Su, Se)
     
     def curva_sn(self):
-        messagebox.showinfo("En Desarrollo", "Curva S-N en desarrollo")
+        """Curva S-N de Basquin y vida del punto de operación con cada corrección de esfuerzo medio"""
+        try:
+            from modulos.fatiga import amplitud_equivalente
+            
+            curva = self._curva_sn_material()
+            Smax = float(self.Smax_var.get())
+            Smin = float(self.Smin_var.get())
+            Sa, Sm = (Smax - Smin) / 2, (Smax + Smin) / 2
+            
+            self.ax_fatiga.clear()
+            N = np.logspace(3, 8, 200)
+            self.ax_fatiga.loglog(N, curva.amplitud(N), 'b-', linewidth=2, label='Basquin')
+            
+            lineas = []
+            for correccion, marcador in zip(["ninguna", "goodman", "gerber", "morrow", "swt"], "osD^v"):
+                Sar = float(amplitud_equivalente(Sa, Sm, correccion, Su=curva.Su, sigma_f=curva.sigma_f))
+                vida = float(curva.ciclos(Sar))
+                lineas.append(f"- {correccion:<8s} S_ar = {Sar:8.1f} MPa   N = "
+                              + ("infinita" if np.isinf(vida) else f"{vida:.3e} ciclos"))
+                if np.isfinite(vida) and 1e3 <= vida <= 1e8:
+                    self.ax_fatiga.loglog(vida, Sar, marcador, markersize=8, label=correccion)
+            
+            self.ax_fatiga.axhline(curva.Se, color='gray', linestyle='--', label=f'Se = {curva.Se:.0f} MPa')
+            self.ax_fatiga.set_xlabel('Número de ciclos')
+            self.ax_fatiga.set_ylabel('Amplitud equivalente (MPa)')
+            self.ax_fatiga.set_title('Curva S-N - Basquin')
+            self.ax_fatiga.legend()
+            self.ax_fatiga.grid(True, which='both', alpha=0.3)
+            self.canvas_fatiga.draw()
+            
+            resultados = f"""
+=== CURVA S-N ===
+Basquin: S = {curva.sigma_f:.1f} · N^({curva.b:.4f}) MPa
+Límite de fatiga corregido: {curva.Se:.1f} MPa
+
+Punto de operación: Sa = {Sa:.1f} MPa, Sm = {Sm:.1f} MPa
+""" + "\n".join(lineas) + "\n"
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la curva S-N: {str(e)}")
     
     def vida_fatiga(self):
-        messagebox.showinfo("En Desarrollo", "Vida a fatiga en desarrollo")
+        """Rainflow y daño de Miner de un registro de esfuerzos leído por bloques"""
+        try:
+            import pandas as pd
+            from modulos.fatiga import analizar_historia
+            
+            ruta = filedialog.askopenfilename(
+                title="Historia de esfuerzos (MPa, última columna)",
+                filetypes=[("CSV", "*.csv"), ("Texto", "*.txt *.dat"), ("Todos", "*.*")])
+            if not ruta:
+                return
+            
+            with open(ruta, encoding='utf-8') as f:
+                primera = f.readline().strip()
+            separador = ';' if ';' in primera else (',' if ',' in primera else r'\s+')
+            try:
+                float(primera.replace(';', ' ').replace(',', ' ').split()[-1])
+                encabezado = None
+            except ValueError:
+                encabezado = 0
+            lector = pd.read_csv(ruta, header=encabezado, sep=separador, chunksize=500000)
+            
+            curva = self._curva_sn_material()
+            bordes = np.linspace(0, 2 * curva.Su, 41)
+            r = analizar_historia((bloque.iloc[:, -1].to_numpy(dtype=float) for bloque in lector),
+                                  curva, self.correccion_fatiga.get(), bordes_rango=bordes)
+            
+            self.ax_fatiga.clear()
+            centros = 0.5 * (bordes[1:] + bordes[:-1])
+            self.ax_fatiga.bar(centros, r['matriz'], width=np.diff(bordes), color='steelblue', edgecolor='k')
+            self.ax_fatiga.set_yscale('log')
+            self.ax_fatiga.set_xlabel('Rango de esfuerzo (MPa)')
+            self.ax_fatiga.set_ylabel('Ciclos')
+            self.ax_fatiga.set_title('Histograma rainflow')
+            self.ax_fatiga.grid(True, alpha=0.3)
+            self.canvas_fatiga.draw()
+            
+            resultados = f"""
+=== VIDA A FATIGA (RAINFLOW + MINER) ===
+Archivo: {ruta}
+Muestras: {r['muestras']:,}   Reversiones: {r['reversiones']:,}
+Ciclos contados: {r['ciclos']:,.1f}   Rango máximo: {r['rango_maximo']:.1f} MPa
+Corrección por esfuerzo medio: {self.correccion_fatiga.get()}
+
+Daño acumulado (Miner): {r['dano']:.4e}
+Repeticiones del registro hasta la falla: {r['repeticiones']:.3e}
+Estado: {"Falla (D ≥ 1)" if r['dano'] >= 1 else "Seguro"}
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en vida a fatiga: {str(e)}")
     
     def generar_reporte(self):
         """Genera un reporte completo de los análisis"""
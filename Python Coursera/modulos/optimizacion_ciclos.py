@@ -0,0 +1,295 @@
+# =============================================================================
+# MÓDULO DE OPTIMIZACIÓN DE CICLOS TERMODINÁMICOS
+# =============================================================================
+# Propósito: Elegir las variables de diseño de un ciclo (relación de
+#            presiones, presión de recalentamiento, presión de extracción...)
+#            que maximizan la eficiencia o el trabajo neto con restricciones
+#            sobre el resultado (título de escape, temperaturas), con una
+#            búsqueda por población evaluada en lote sobre modulos.ciclos y un
+#            refinamiento por gradiente (SLSQP) con evaluaciones en caché
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Las variables se normalizan a u ∈ [0, 1]; las que abarcan una década o
+# más (presiones) se normalizan en escala logarítmica.
+# Fase 1: evolución diferencial DE/rand/1/bin; cada generación es UNA
+#   llamada al ciclo con arreglos (n_población,). Las restricciones se
+#   manejan con las reglas de factibilidad de Deb (un punto factible gana a
+#   uno infactible; entre infactibles gana el de menor violación).
+# Fase 2: SLSQP desde el mejor individuo; el objetivo, las restricciones y
+#   sus gradientes (diferencias centrales, 2·d puntos en una llamada) salen
+#   de la misma evaluación en caché.
+# Cada generación o iteración agrega un registro al historial y, si se da,
+# llama a callback(registro) para graficar la convergencia en vivo.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from scipy.stats import qmc
+from typing import Callable, Dict, Optional, Tuple
+
+PENALIZACION_INVALIDO = 1e6   # Violación asignada a puntos fuera de rango (NaN)
+
+
+class _EvaluadorCiclo:
+    """Evalúa el ciclo en lote sobre puntos normalizados y guarda los resultados."""
+
+    def __init__(self, ciclo: Callable, limites: Dict[str, Tuple[float, float]],
+                 fijos: Dict, objetivo: str, maximizar: bool,
+                 restricciones: Dict[str, Tuple[Optional[float], Optional[float]]]):
+        self.ciclo = ciclo
+        self.nombres = list(limites)
+        self.fijos = fijos
+        self.objetivo = objetivo
+        self.signo = -1.0 if maximizar else 1.0
+        self.restricciones = restricciones
+        bajo = np.array([limites[n][0] for n in self.nombres], dtype=float)
+        alto = np.array([limites[n][1] for n in self.nombres], dtype=float)
+        if np.any(alto <= bajo):
+            raise ValueError("Cada límite debe ser (mínimo, máximo) con mínimo < máximo")
+        self.logaritmica = (bajo > 0) & (alto / np.where(bajo > 0, bajo, 1.0) >= 10)
+        self.bajo = np.where(self.logaritmica, np.log(np.where(self.logaritmica, bajo, 1.0)), bajo)
+        self.alto = np.where(self.logaritmica, np.log(np.where(self.logaritmica, alto, 1.0)), alto)
+        self.cache = {}
+        self.evaluaciones = 0
+
+    def variables(self, U) -> np.ndarray:
+        """Valores físicos de las variables para puntos normalizados U (..., d)."""
+        X = self.bajo + np.clip(U, 0.0, 1.0) * (self.alto - self.bajo)
+        X[..., self.logaritmica] = np.exp(X[..., self.logaritmica])
+        return X
+
+    def _evaluar_lote(self, U: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        X = self.variables(U)
+        entradas = {n: X[:, k] for k, n in enumerate(self.nombres)}
+        with np.errstate(all='ignore'):
+            resultado = self.ciclo(**self.fijos, **entradas)
+        forma = (len(U),)
+        f = self.signo * np.broadcast_to(resultado[self.objetivo], forma)
+        g = []
+        for clave, (minimo, maximo) in self.restricciones.items():
+            valor = np.broadcast_to(resultado[clave], forma)
+            if minimo is not None:
+                g.append(valor - minimo)
+            if maximo is not None:
+                g.append(maximo - valor)
+        g = np.stack(g, axis=1) if g else np.zeros((len(U), 0))
+        self.evaluaciones += len(U)
+        return f, g
+
+    def __call__(self, U) -> Tuple[np.ndarray, np.ndarray]:
+        """Objetivo (a minimizar) (m,) y márgenes g ≥ 0 (m, k); sólo calcula lo nuevo."""
+        U = np.atleast_2d(np.clip(np.asarray(U, dtype=float), 0.0, 1.0))
+        claves = [u.tobytes() for u in U]
+        nuevos = [i for i, c in enumerate(claves) if c not in self.cache]
+        nuevos = list({claves[i]: i for i in nuevos}.values())
+        if nuevos:
+            f, g = self._evaluar_lote(U[nuevos])
+            for j, i in enumerate(nuevos):
+                self.cache[claves[i]] = (f[j], g[j])
+        f = np.array([self.cache[c][0] for c in claves])
+        g = np.array([self.cache[c][1] for c in claves]).reshape(len(U), -1)
+        return f, g
+
+
+def _violacion(f: np.ndarray, g: np.ndarray) -> np.ndarray:
+    """Suma de violaciones de restricción; los puntos inválidos (NaN) reciben una penalización."""
+    violacion = np.sum(np.maximum(-np.nan_to_num(g, nan=-PENALIZACION_INVALIDO), 0.0), axis=1)
+    return violacion + np.where(np.isfinite(f) & np.all(np.isfinite(g), axis=1), 0.0,
+                                PENALIZACION_INVALIDO)
+
+
+def _mejor_que(f_a, v_a, f_b, v_b) -> np.ndarray:
+    """Reglas de Deb: ¿es a mejor que b?"""
+    f_a = np.where(np.isfinite(f_a), f_a, np.inf)
+    f_b = np.where(np.isfinite(f_b), f_b, np.inf)
+    return np.where((v_a == 0) & (v_b == 0), f_a <= f_b, v_a < v_b) | ((v_a == 0) & (v_b > 0))
+
+
+def _indice_mejor(f: np.ndarray, v: np.ndarray) -> int:
+    """Índice del mejor individuo según las reglas de Deb."""
+    factible = (v == 0) & np.isfinite(f)
+    if factible.any():
+        return int(np.argmin(np.where(factible, f, np.inf)))
+    return int(np.argmin(v))
+
+
+def optimizar_ciclo(ciclo: Callable, limites: Dict[str, Tuple[float, float]],
+                    objetivo: str = 'eficiencia', maximizar: bool = True,
+                    restricciones: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+                    fijos: Optional[Dict] = None, poblacion: int = 30, generaciones: int = 40,
+                    mutacion: float = 0.7, cruce: float = 0.9, tol: float = 1e-6,
+                    refinar: bool = True, paso_gradiente: float = 1e-5,
+                    semilla: Optional[int] = None,
+                    callback: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Optimiza las variables de diseño de un ciclo de modulos.ciclos.
+
+    Args:
+        ciclo: Función del ciclo (ciclo_rankine, ciclo_brayton, ...)
+        limites: {argumento: (mínimo, máximo)} de las variables de diseño
+        objetivo: Clave del resultado a optimizar ('eficiencia', 'trabajo_neto', ...)
+        maximizar: False para minimizar el objetivo
+        restricciones: {clave del resultado: (mínimo, máximo)}, None en un
+            extremo para dejarlo libre; p. ej. {'titulo_escape': (0.88, None)}
+        fijos: Argumentos fijos del ciclo (temperaturas, eficiencias, fluido)
+        poblacion: Individuos por generación
+        generaciones: Generaciones máximas de la búsqueda por población
+        mutacion, cruce: Parámetros F y CR de la evolución diferencial
+        tol: Se detiene la población cuando la dispersión del objetivo de
+            los individuos factibles es menor que tol·|mejor|
+        refinar: Aplicar SLSQP desde el mejor individuo
+        paso_gradiente: Paso de las diferencias centrales en u
+        semilla: Semilla del generador aleatorio
+        callback: Función llamada con cada registro del historial
+
+    Returns:
+        Dict con variables (dict del óptimo), objetivo, factible, resultado
+        (ciclo evaluado en el óptimo), historial (DataFrame con fase,
+        iteracion, mejor, media, factibles, evaluaciones y las variables del
+        mejor punto) y evaluaciones (puntos de ciclo calculados)
+    """
+    restricciones = restricciones or {}
+    fijos = fijos or {}
+    evaluar = _EvaluadorCiclo(ciclo, limites, fijos, objetivo, maximizar, restricciones)
+    d = len(evaluar.nombres)
+    rng = np.random.default_rng(semilla)
+    historial = []
+
+    def registrar(fase, iteracion, u, f_mejor, v_mejor, f_todos, v_todos):
+        x = evaluar.variables(u)
+        factibles = v_todos == 0
+        registro = {
+            'fase': fase,
+            'iteracion': iteracion,
+            'mejor': evaluar.signo * f_mejor,
+            'media': evaluar.signo * np.mean(f_todos[factibles]) if factibles.any() else np.nan,
+            'factibles': int(factibles.sum()),
+            'violacion': v_mejor,
+            'evaluaciones': evaluar.evaluaciones,
+            **{n: x[k] for k, n in enumerate(evaluar.nombres)},
+        }
+        historial.append(registro)
+        if callback is not None:
+            callback(registro)
+
+    # Fase 1: evolución diferencial con la población completa en cada llamada
+    U = qmc.LatinHypercube(d=d, seed=rng).random(poblacion)
+    f, g = evaluar(U)
+    v = _violacion(f, g)
+    for generacion in range(generaciones):
+        mejor = _indice_mejor(f, v)
+        registrar('poblacion', generacion, U[mejor], f[mejor], v[mejor], f, v)
+        factibles = (v == 0) & np.isfinite(f)
+        if factibles.sum() == poblacion and np.ptp(f) <= tol * max(abs(f[mejor]), 1e-12):
+            break
+
+        # Tres individuos distintos de i por fila
+        indices = np.argsort(rng.random((poblacion, poblacion - 1)), axis=1)[:, :3]
+        indices = indices + (indices >= np.arange(poblacion)[:, None])
+        a, b, c = U[indices[:, 0]], U[indices[:, 1]], U[indices[:, 2]]
+        mutante = a + mutacion * (b - c)
+        # Reflejo en los bordes para no acumular individuos sobre ellos
+        mutante = np.where(mutante < 0, -mutante, mutante)
+        mutante = np.where(mutante > 1, 2 - mutante, mutante)
+        mutante = np.clip(mutante, 0.0, 1.0)
+        cruza = rng.random((poblacion, d)) < cruce
+        cruza[np.arange(poblacion), rng.integers(0, d, poblacion)] = True
+        prueba = np.where(cruza, mutante, U)
+
+        f_p, g_p = evaluar(prueba)
+        v_p = _violacion(f_p, g_p)
+        gana = _mejor_que(f_p, v_p, f, v)
+        U = np.where(gana[:, None], prueba, U)
+        f = np.where(gana, f_p, f)
+        v = np.where(gana, v_p, v)
+
+    mejor = _indice_mejor(f, v)
+    u_opt, f_opt, v_opt = U[mejor], f[mejor], v[mejor]
+
+    # Fase 2: SLSQP en u con gradientes por diferencias centrales en lote
+    if refinar and v_opt == 0:
+        escala = max(abs(f_opt), 1e-12)
+        h = paso_gradiente
+
+        def gradientes(u):
+            pasos = np.eye(d) * h
+            fp, gp = evaluar(np.vstack([u + pasos, u - pasos]))
+            # Diferencias de un lado donde el paso sale de [0, 1]
+            u_mas, u_menos = np.minimum(u + h, 1.0), np.maximum(u - h, 0.0)
+            den = (u_mas - u_menos)
+            df = (fp[:d] - fp[d:]) / den
+            dg = (gp[:d] - gp[d:]) / den[:, None]
+            return df, dg.T
+
+        def fun(u):
+            return evaluar(u)[0][0] / escala
+
+        def jac(u):
+            return gradientes(u)[0] / escala
+
+        iteracion = [0]
+
+        def al_iterar(u):
+            iteracion[0] += 1
+            fu, gu = evaluar(u)
+            vu = _violacion(fu, gu)
+            registrar('gradiente', iteracion[0], u, fu[0], vu[0], fu, vu)
+
+        restricciones_slsqp = []
+        if evaluar.restricciones:
+            restricciones_slsqp.append({'type': 'ineq', 'fun': lambda u: evaluar(u)[1][0],
+                                        'jac': lambda u: gradientes(u)[1]})
+        refinado = minimize(fun, u_opt, jac=jac, method='SLSQP', bounds=[(0.0, 1.0)] * d,
+                            constraints=restricciones_slsqp, callback=al_iterar,
+                            options={'ftol': 1e-12, 'maxiter': 50})
+        u_ref = np.clip(refinado.x, 0.0, 1.0)
+        f_ref, g_ref = evaluar(u_ref)
+        v_ref = _violacion(f_ref, g_ref)
+        if _mejor_que(f_ref[0], v_ref[0], f_opt, v_opt):
+            u_opt, f_opt, v_opt = u_ref, f_ref[0], v_ref[0]
+
+    x_opt = evaluar.variables(u_opt)
+    variables = {n: float(x_opt[k]) for k, n in enumerate(evaluar.nombres)}
+    with np.errstate(all='ignore'):
+        resultado = ciclo(**fijos, **variables)
+    return {
+        'variables': variables,
+        'objetivo': float(evaluar.signo * f_opt),
+        'factible': bool(v_opt == 0),
+        'resultado': resultado,
+        'historial': pd.DataFrame(historial),
+        'evaluaciones': evaluar.evaluaciones,
+    }
+
+
+def graficar_convergencia(historial: pd.DataFrame, ax=None, etiqueta: str = 'Objetivo'):
+    """
+    Curva de convergencia (mejor y media de la población) contra evaluaciones.
+
+    Args:
+        historial: DataFrame 'historial' de optimizar_ciclo (o lista de registros)
+        ax: Ejes de matplotlib donde dibujar; si es None se crea una Figure
+        etiqueta: Nombre del objetivo para el eje y
+
+    Returns:
+        Ejes usados
+    """
+    historial = pd.DataFrame(historial)
+    if ax is None:
+        from matplotlib.figure import Figure
+        ax = Figure(figsize=(8, 5)).add_subplot(111)
+    for fase, estilo in (('poblacion', 'b'), ('gradiente', 'r')):
+        tramo = historial[historial['fase'] == fase]
+        if len(tramo):
+            ax.plot(tramo['evaluaciones'], tramo['mejor'], estilo + '-o', markersize=3,
+                    label=f'Mejor ({fase})')
+            if fase == 'poblacion':
+                ax.plot(tramo['evaluaciones'], tramo['media'], estilo + ':', label='Media población')
+    ax.set_xlabel('Evaluaciones del ciclo')
+    ax.set_ylabel(etiqueta)
+    ax.grid(True)
+    ax.legend()
+    return ax
@@ -0,0 +1,788 @@
+# =============================================================================
+# MÓDULO DE PROPIEDADES DE FLUIDOS REALES
+# =============================================================================
+# Propósito: Proveer propiedades termodinámicas de agua/vapor (IAPWS-IF97,
+#            regiones 1 a 4) y de mezclas de gases ideales con cp(T), con
+#            evaluación exacta y tablas adaptativas (P, T)/(P, h)/(P, s) con
+#            interpolación bicúbica para consultas masivas repetidas
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Todos los fluidos exponen la misma interfaz vectorizada:
+#   estado_pt(P, T)   estado_ph(P, h)   estado_ps(P, s)
+# que devuelve un dict con T (K), P (kPa), h (kJ/kg), s (kJ/kg·K),
+# u (kJ/kg), v (m³/kg) y x (título; NaN fuera de la zona bifásica).
+# Los gases ideales admiten además estado_tv, estado_vs y estado_ts para
+# los ciclos de pistón (procesos a volumen constante e isotermos).
+# Entalpía y entropía del agua con la referencia de IF97 (líquido saturado en
+# el punto triple); las de los gases, cero a 298.15 K y 100 kPa.
+# =============================================================================
+
+import os
+import warnings
+import numpy as np
+from functools import lru_cache
+from scipy.interpolate import PchipInterpolator, RectBivariateSpline
+from typing import Dict, Optional
+
+R_AGUA = 0.461526     # kJ/kg·K
+T_CRITICA = 647.096   # K
+P_CRITICA = 22064.0   # kPa
+RHO_CRITICA = 322.0   # kg/m³
+T_MIN, T_MAX = 273.15, 1073.15
+P_MAX = 100000.0      # kPa
+# Caché de la tabla compartida en el directorio de caché del usuario (no en el
+# código fuente). Subir VERSION_TABLA_AGUA si cambia el formato de la tabla
+DIRECTORIO_CACHE = os.path.join(os.environ.get('XDG_CACHE_HOME') or
+                                os.path.join(os.path.expanduser('~'), '.cache'),
+                                'ingenieria_mecanica')
+RUTA_TABLA_AGUA = os.path.join(DIRECTORIO_CACHE, 'tabla_agua.npz')
+VERSION_TABLA_AGUA = 1
+
+# --- Región 1: líquido comprimido (energía de Gibbs) ------------------------
+_I1 = np.array([0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4,
+                4, 5, 8, 8, 21, 23, 29, 30, 31, 32])
+_J1 = np.array([-2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1, 3, 17, -4, 0,
+                6, -5, -2, 10, -8, -11, -6, -29, -31, -38, -39, -40, -41])
+_N1 = np.array([
+    0.14632971213167, -0.84548187169114, -0.37563603672040e1, 0.33855169168385e1,
+    -0.95791963387872, 0.15772038513228, -0.16616417199501e-1, 0.81214629983568e-3,
+    0.28319080123804e-3, -0.60706301565874e-3, -0.18990068218419e-1, -0.32529748770505e-1,
+    -0.21841717175414e-1, -0.52838357969930e-4, -0.47184321073267e-3, -0.30001780793026e-3,
+    0.47661393906987e-4, -0.44141845330846e-5, -0.72694996297594e-15, -0.31679644845054e-4,
+    -0.28270797985312e-5, -0.85205128120103e-9, -0.22425281908000e-5, -0.65171222895601e-6,
+    -0.14341729937924e-12, -0.40516996860117e-6, -0.12734301741641e-8, -0.17424871230634e-9,
+    -0.68762131295531e-18, 0.14478307828521e-19, 0.26335781662795e-22, -0.11947622640071e-22,
+    0.18228094581404e-23, -0.93537087292458e-25])
+
+# --- Región 2: vapor (parte de gas ideal y residual) -------------------------
+_J0 = np.array([0, 1, -5, -4, -3, -2, -1, 2, 3])
+_N0 = np.array([-0.96927686500217e1, 0.10086655968018e2, -0.56087911283020e-2,
+                0.71452738081455e-1, -0.40710498223928, 0.14240819171444e1,
+                -0.43839511319450e1, -0.28408632460772, 0.21268463753307e-1])
+_I2 = np.array([1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4, 5, 6, 6, 6, 7, 7,
+                7, 8, 8, 9, 10, 10, 10, 16, 16, 18, 20, 20, 20, 21, 22, 23, 24, 24, 24])
+_J2 = np.array([0, 1, 2, 3, 6, 1, 2, 4, 7, 36, 0, 1, 3, 6, 35, 1, 2, 3, 7, 3, 16, 35, 0,
+                11, 25, 8, 36, 13, 4, 10, 14, 29, 50, 57, 20, 35, 48, 21, 53, 39, 26, 40, 58])
+_N2 = np.array([
+    -0.17731742473213e-2, -0.17834862292358e-1, -0.45996013696365e-1, -0.57581259083432e-1,
+    -0.50325278727930e-1, -0.33032641670203e-4, -0.18948987516315e-3, -0.39392777243355e-2,
+    -0.43797295650573e-1, -0.26674547914087e-4, 0.20481737692309e-7, 0.43870667284435e-6,
+    -0.32277677238570e-4, -0.15033924542148e-2, -0.40668253562649e-1, -0.78847309559367e-9,
+    0.12790717852285e-7, 0.48225372718507e-6, 0.22922076337661e-5, -0.16714766451061e-10,
+    -0.21171472321355e-2, -0.23895741934104e2, -0.59059564324270e-17, -0.12621808899101e-5,
+    -0.38946842435739e-1, 0.11256211360459e-10, -0.82311340897998e1, 0.19809712802088e-7,
+    0.10406965210174e-18, -0.10234747095929e-12, -0.10018179379511e-8, -0.80882908646985e-10,
+    0.10693031879409, -0.33662250574171, 0.89185845355421e-24, 0.30629316876232e-12,
+    -0.42002467698208e-5, -0.59056029685639e-25, 0.37826947613457e-5, -0.12768608934681e-14,
+    0.73087610595061e-28, 0.55414715350778e-16, -0.94369707241210e-6])
+
+# --- Región 3: zona crítica (energía de Helmholtz en ρ, T) -------------------
+_N3_LN = 0.10658070028513e1
+_I3 = np.array([0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4,
+                4, 4, 5, 5, 5, 6, 6, 6, 7, 8, 9, 9, 10, 10, 11])
+_J3 = np.array([0, 1, 2, 7, 10, 12, 23, 2, 6, 15, 17, 0, 2, 6, 7, 22, 26, 0, 2, 4, 16,
+                26, 0, 2, 4, 26, 1, 3, 26, 0, 2, 26, 2, 26, 2, 26, 0, 1, 26])
+_N3 = np.array([
+    -0.15732845290239e2, 0.20944396974307e2, -0.76867707878716e1, 0.26185947787954e1,
+    -0.28080781148620e1, 0.12053369696517e1, -0.84566812812502e-2, -0.12654315477714e1,
+    -0.11524407806681e1, 0.88521043984318, -0.64207765181607, 0.38493460186671,
+    -0.85214708824206, 0.48972281541877e1, -0.30502617256965e1, 0.39420536879154e-1,
+    0.12558408424308, -0.27999329698710, 0.13899799569460e1, -0.20189915023570e1,
+    -0.82147637173963e-2, -0.47596035734923, 0.43984074473500e-1, -0.44476435428739,
+    0.90572070719733, 0.70522450087967, 0.10770512626332, -0.32913623258954,
+    -0.50871062041158, -0.22175400873096e-1, 0.94260751665092e-1, 0.16436278447961,
+    -0.13503372241348e-1, -0.14834345352472e-1, 0.57922953628084e-3, 0.32308904703711e-2,
+    0.80964802996215e-4, -0.16557679795037e-3, -0.44923899061815e-4])
+
+# --- Región 4: línea de saturación y frontera B23 ----------------------------
+_N4 = (0.11670521452767e4, -0.72421316703206e6, -0.17073846940092e2,
+       0.12020824702470e5, -0.32325550322333e7, 0.14915108613530e2,
+       -0.48232657361591e4, 0.40511340542057e6, -0.23855557567849,
+       0.65017534844798e3)
+_B23 = (0.34805185628969e3, -0.11671859879975e1, 0.10192970039326e-2,
+        0.57254459862746e3, 0.13918839778870e2)
+
+
+def presion_saturacion(T):
+    """Presión de saturación del agua (kPa) para T en K (IF97, región 4)."""
+    n = _N4
+    T = np.asarray(T, dtype=float)
+    theta = T + n[8] / (T - n[9])
+    A = theta**2 + n[0] * theta + n[1]
+    B = n[2] * theta**2 + n[3] * theta + n[4]
+    C = n[5] * theta**2 + n[6] * theta + n[7]
+    return (2 * C / (-B + np.sqrt(B**2 - 4 * A * C)))**4 * 1000
+
+
+def temperatura_saturacion(P):
+    """Temperatura de saturación del agua (K) para P en kPa (IF97, región 4)."""
+    n = _N4
+    beta = (np.asarray(P, dtype=float) / 1000)**0.25
+    E = beta**2 + n[2] * beta + n[5]
+    F = n[0] * beta**2 + n[3] * beta + n[6]
+    G = n[1] * beta**2 + n[4] * beta + n[7]
+    D = 2 * G / (-F - np.sqrt(F**2 - 4 * E * G))
+    return (n[9] + D - np.sqrt((n[9] + D)**2 - 4 * (n[8] + n[9] * D))) / 2
+
+
+def _presion_b23(T):
+    """Frontera entre las regiones 2 y 3 (kPa)."""
+    return (_B23[0] + _B23[1] * T + _B23[2] * T**2) * 1000
+
+
+def _region1(P, T):
+    pi, tau = P / 16530.0, 1386.0 / T
+    a = (7.1 - pi)[:, None]
+    b = (tau - 1.222)[:, None]
+    termino = _N1 * a**_I1 * b**_J1
+    g = termino.sum(axis=1)
+    g_p = (-_N1 * _I1 * a**(_I1 - 1) * b**_J1).sum(axis=1)
+    g_t = (termino * _J1 / b).sum(axis=1)
+    g_tt = (termino * _J1 * (_J1 - 1) / b**2).sum(axis=1)
+    return {'v': R_AGUA * T * pi * g_p / P, 'h': R_AGUA * T * tau * g_t,
+            's': R_AGUA * (tau * g_t - g), 'cp': -R_AGUA * tau**2 * g_tt}
+
+
+def _region2(P, T):
+    pi, tau = P / 1000.0, 540.0 / T
+    t = tau[:, None]
+    g0 = np.log(pi) + (_N0 * t**_J0).sum(axis=1)
+    g0_t = (_N0 * _J0 * t**(_J0 - 1)).sum(axis=1)
+    g0_tt = (_N0 * _J0 * (_J0 - 1) * t**(_J0 - 2)).sum(axis=1)
+    a = pi[:, None]
+    b = (tau - 0.5)[:, None]
+    termino = _N2 * a**_I2 * b**_J2
+    gr = termino.sum(axis=1)
+    gr_p = (termino * _I2 / a).sum(axis=1)
+    gr_t = (termino * _J2 / b).sum(axis=1)
+    gr_tt = (termino * _J2 * (_J2 - 1) / b**2).sum(axis=1)
+    return {'v': R_AGUA * T * pi * (1 / pi + gr_p) / P,
+            'h': R_AGUA * T * tau * (g0_t + gr_t),
+            's': R_AGUA * (tau * (g0_t + gr_t) - (g0 + gr)),
+            'cp': -R_AGUA * tau**2 * (g0_tt + gr_tt)}
+
+
+def _helmholtz3(rho, T):
+    """Derivadas de φ(δ, τ) de la región 3."""
+    delta, tau = rho / RHO_CRITICA, T_CRITICA / T
+    d = delta[:, None]
+    t = tau[:, None]
+    termino = _N3 * d**_I3 * t**_J3
+    return {
+        'delta': delta, 'tau': tau,
+        'f': _N3_LN * np.log(delta) + termino.sum(axis=1),
+        'f_d': _N3_LN / delta + (termino * _I3 / d).sum(axis=1),
+        'f_dd': -_N3_LN / delta**2 + (termino * _I3 * (_I3 - 1) / d**2).sum(axis=1),
+        'f_t': (termino * _J3 / t).sum(axis=1),
+        'f_tt': (termino * _J3 * (_J3 - 1) / t**2).sum(axis=1),
+        'f_dt': (termino * _I3 * _J3 / (d * t)).sum(axis=1),
+    }
+
+
+def _presion3(rho, T):
+    """Presión (kPa) y dP/dρ de la región 3."""
+    f = _helmholtz3(rho, T)
+    P = rho * R_AGUA * T * f['delta'] * f['f_d']
+    dP = R_AGUA * T * (2 * f['delta'] * f['f_d'] + f['delta']**2 * f['f_dd'])
+    return P, dP
+
+
+def _densidad_liquido_saturado(T):
+    """Ecuación auxiliar de Wagner-Pruss para ρ' (sólo para acotar la región 3)."""
+    t = 1 - np.minimum(T, T_CRITICA) / T_CRITICA
+    return RHO_CRITICA * (1 + 1.99274064 * t**(1 / 3) + 1.09965342 * t**(2 / 3)
+                          - 0.510839303 * t**(5 / 3) - 1.75493479 * t**(16 / 3)
+                          - 45.5170352 * t**(43 / 3) - 6.74694450e5 * t**(110 / 3))
+
+
+def _densidad_vapor_saturado(T):
+    """Ecuación auxiliar de Wagner-Pruss para ρ'' (sólo para acotar la región 3)."""
+    t = 1 - np.minimum(T, T_CRITICA) / T_CRITICA
+    return RHO_CRITICA * np.exp(-2.03150240 * t**(2 / 6) - 2.68302940 * t**(4 / 6)
+                                - 5.38626492 * t**(8 / 6) - 17.2991605 * t**(18 / 6)
+                                - 44.7586581 * t**(37 / 6) - 63.9201063 * t**(71 / 6))
+
+
+def _densidad_region3(P, T, fase, tol: float = 1e-12, max_iter: int = 100):
+    """
+    Densidad de la región 3 para (P, T) con Newton acotado por bisección.
+
+    fase: +1 rama líquida, -1 rama de vapor, 0 según P frente a P_sat(T).
+    """
+    subcritica = T < T_CRITICA
+    fase = np.where(fase == 0, np.where(subcritica & (P < presion_saturacion(np.minimum(T, T_CRITICA))), -1, 1), fase)
+    a = np.where(subcritica & (fase > 0), 0.98 * _densidad_liquido_saturado(T), 20.0)
+    b = np.where(subcritica & (fase < 0), 1.02 * _densidad_vapor_saturado(T), 900.0)
+    fa, _ = _presion3(a, T)
+    fb, _ = _presion3(b, T)
+    sin_cambio = (fa - P) * (fb - P) > 0
+    a = np.where(sin_cambio, 20.0, a)
+    b = np.where(sin_cambio, 900.0, b)
+
+    rho = 0.5 * (a + b)
+    for _ in range(max_iter):
+        p, dp = _presion3(rho, T)
+        f = p - P
+        bajo = f < 0
+        a = np.where(bajo, rho, a)
+        b = np.where(bajo, b, rho)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            nuevo = rho - f / dp
+        fuera = ~np.isfinite(nuevo) | (nuevo <= a) | (nuevo >= b)
+        nuevo = np.where(fuera, 0.5 * (a + b), nuevo)
+        paso = np.abs(nuevo - rho)
+        rho = nuevo
+        if np.all(paso <= tol * rho):
+            break
+    return rho
+
+
+def _region3(P, T, fase):
+    rho = _densidad_region3(P, T, fase)
+    f = _helmholtz3(rho, T)
+    d, t = f['delta'], f['tau']
+    cv = -R_AGUA * t**2 * f['f_tt']
+    cp = cv + R_AGUA * (d * f['f_d'] - d * t * f['f_dt'])**2 / (2 * d * f['f_d'] + d**2 * f['f_dd'])
+    return {'v': 1 / rho, 'h': R_AGUA * T * (t * f['f_t'] + d * f['f_d']),
+            's': R_AGUA * (t * f['f_t'] - f['f']), 'cp': cp}
+
+
+def _estado(P, h, s, v, T, x=None, cp=None) -> Dict[str, np.ndarray]:
+    return {'T': T, 'P': P, 'h': h, 'u': h - P * v, 's': s, 'v': v, 'rho': 1 / v,
+            'x': np.full(np.shape(T), np.nan) if x is None else x,
+            'cp': np.full(np.shape(T), np.nan) if cp is None else cp}
+
+
+class Agua:
+    """Agua y vapor según IAPWS-IF97 (regiones 1, 2, 3 y 4), evaluación exacta."""
+
+    def region(self, P, T, fase=0):
+        """Región IF97 de cada punto (0 fuera del dominio)."""
+        P, T, fase = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(T, dtype=float),
+                                         np.asarray(fase))
+        baja = T <= 623.15
+        liquido = np.where(fase == 0, P >= presion_saturacion(np.minimum(T, 623.15)), fase > 0)
+        region = np.where(baja, np.where(liquido, 1, 2),
+                          np.where((T <= 863.15) & (P > _presion_b23(T)), 3, 2))
+        valido = (T >= T_MIN) & (T <= T_MAX) & (P > 0) & (P <= P_MAX * (1 + 1e-12))
+        return np.where(valido, region, 0)
+
+    def _pt(self, P, T, fase=0) -> Dict[str, np.ndarray]:
+        P, T, fase = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(T, dtype=float),
+                                         np.asarray(fase))
+        forma = P.shape
+        P, T, fase = P.ravel(), T.ravel(), fase.ravel()
+        region = self.region(P, T, fase)
+        salida = {c: np.full(P.shape, np.nan) for c in ('v', 'h', 's', 'cp')}
+        for k, funcion in ((1, _region1), (2, _region2)):
+            m = region == k
+            if np.any(m):
+                for c, valor in funcion(P[m], T[m]).items():
+                    salida[c][m] = valor
+        m = region == 3
+        if np.any(m):
+            for c, valor in _region3(P[m], T[m], fase[m]).items():
+                salida[c][m] = valor
+        salida = {c: valor.reshape(forma) for c, valor in salida.items()}
+        return _estado(P.reshape(forma), salida['h'], salida['s'], salida['v'],
+                       T.reshape(forma), cp=salida['cp'])
+
+    def estado_pt(self, P, T) -> Dict[str, np.ndarray]:
+        """Estado a partir de presión (kPa) y temperatura (K)."""
+        return self._pt(P, T)
+
+    def saturacion(self, P) -> Dict[str, np.ndarray]:
+        """
+        Propiedades de saturación a la presión P (kPa) < P crítica.
+
+        Returns:
+            Dict con T y, para líquido (_f) y vapor (_g), h, s y v
+        """
+        P = np.asarray(P, dtype=float)
+        T = temperatura_saturacion(np.minimum(P, P_CRITICA))
+        T = np.where(P < P_CRITICA, T, np.nan)
+        liquido = self._pt(P, T, 1)
+        vapor = self._pt(P, T, -1)
+        salida = {'T': T}
+        for c in ('h', 's', 'v'):
+            salida[c + '_f'] = liquido[c]
+            salida[c + '_g'] = vapor[c]
+        return salida
+
+    def _invertir(self, P, objetivo, propiedad: str, tol: float = 1e-10,
+                  max_iter: int = 100) -> Dict[str, np.ndarray]:
+        """Estado dado P y h o s: zona bifásica directa, T por regula falsi fuera de ella."""
+        P, objetivo = np.broadcast_arrays(np.asarray(P, dtype=float),
+                                          np.asarray(objetivo, dtype=float))
+        forma = P.shape
+        P, objetivo = P.ravel(), objetivo.ravel()
+        sat = self.saturacion(np.minimum(P, 0.999999 * P_CRITICA))
+        subcritica = P < P_CRITICA
+        Ts = np.clip(np.where(subcritica, sat['T'], T_MAX), T_MIN, T_MAX)
+        f_liq = np.where(subcritica, sat[propiedad + '_f'], np.inf)
+        f_vap = np.where(subcritica, sat[propiedad + '_g'], np.inf)
+
+        bifasico = subcritica & (objetivo >= f_liq) & (objetivo <= f_vap)
+        liquido = subcritica & (objetivo < f_liq)
+        fase = np.where(liquido, 1, np.where(subcritica, -1, 0))
+        a = np.where(liquido | ~subcritica, T_MIN, Ts)
+        b = np.where(liquido, Ts, T_MAX)
+
+        fa = self._pt(P, a, fase)[propiedad] - objetivo
+        fb = self._pt(P, b, fase)[propiedad] - objetivo
+        # Un objetivo a redondeo de un extremo se toma en el extremo
+        holgura = 1e-6 * (1 + np.abs(objetivo))
+        en_a, en_b = np.abs(fa) <= holgura, np.abs(fb) <= holgura
+        fa, fb = np.where(en_a, 0.0, fa), np.where(en_b & ~en_a, 0.0, fb)
+        resuelto = ~bifasico & (en_a | en_b)
+        T = np.where(en_a, a, np.where(en_b, b, np.nan))
+        activo = ~bifasico & ~resuelto & (fa * fb <= 0)
+        lado = np.zeros(P.shape)
+        for _ in range(max_iter):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c = np.where(fb != fa, b - fb * (b - a) / (fb - fa), 0.5 * (a + b))
+            c = np.where(activo, c, a)
+            fc = self._pt(P, c, fase)[propiedad] - objetivo
+            mismo_b = fc * fb > 0
+            # Illinois: reduce el valor del extremo que se repite
+            fa = np.where(mismo_b & (lado == 1), 0.5 * fa, fa)
+            fb = np.where(~mismo_b & (lado == -1), 0.5 * fb, fb)
+            a_n = np.where(mismo_b, a, c)
+            fa_n = np.where(mismo_b, fa, fc)
+            b, fb = np.where(mismo_b, c, b), np.where(mismo_b, fc, fb)
+            a, fa = a_n, fa_n
+            lado = np.where(mismo_b, 1, -1)
+            T = np.where(activo, c, T)
+            if np.all(~activo | (np.abs(b - a) <= tol * b) | (fc == 0)):
+                break
+
+        activo |= resuelto
+        estado = self._pt(P, np.where(activo, T, T_MIN), fase)
+        estado = {c: np.where(activo, valor, np.nan) for c, valor in estado.items()}
+        estado['P'] = P
+        if np.any(bifasico):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x = (objetivo - f_liq) / (f_vap - f_liq)
+                for c in ('h', 's', 'v'):
+                    valor = sat[c + '_f'] + x * (sat[c + '_g'] - sat[c + '_f'])
+                    estado[c] = np.where(bifasico, valor, estado[c])
+            estado['T'] = np.where(bifasico, sat['T'], estado['T'])
+            estado['x'] = np.where(bifasico, x, np.nan)
+            estado['rho'] = 1 / estado['v']
+        return {c: valor.reshape(forma) for c, valor in estado.items()}
+
+    def estado_ph(self, P, h) -> Dict[str, np.ndarray]:
+        """Estado a partir de presión (kPa) y entalpía (kJ/kg)."""
+        return self._invertir(P, h, 'h')
+
+    def estado_ps(self, P, s) -> Dict[str, np.ndarray]:
+        """Estado a partir de presión (kPa) y entropía (kJ/kg·K)."""
+        return self._invertir(P, s, 's')
+
+
+def _temperatura_frontera(P):
+    """T_sat(P) bajo la presión crítica y la isoterma crítica por encima."""
+    return np.where(P < P_CRITICA, temperatura_saturacion(np.minimum(P, P_CRITICA)), T_CRITICA)
+
+
+def _intervalos_a_dividir(error, tol: float, libres: int) -> np.ndarray:
+    """Intervalos con error sobre tol, los peores primero, sin pasar de los nodos libres."""
+    dividir = error > tol
+    if dividir.sum() > max(libres, 0):
+        dividir[:] = False
+        if libres > 0:
+            dividir[np.argsort(error)[::-1][:libres]] = True
+    return dividir
+
+
+class TablaAgua:
+    """
+    Tablas adaptativas de agua/vapor con interpolación bicúbica.
+
+    Cada fase se tabula en coordenadas (ln P, ξ), con ξ ∈ [0, 1] la posición
+    entre el borde del dominio y la curva de saturación (la isoterma crítica
+    por encima de P_c), de modo que ninguna celda cruza el cambio de fase.
+    La malla parte de 9×9 nodos y se subdividen los intervalos cuyas celdas
+    superan la tolerancia relativa en el centro frente a Agua. Si al llegar
+    a max_nodos alguna celda sigue sobre la tolerancia (cerca del punto
+    crítico), las consultas que caen en ella se evalúan con Agua en lugar
+    de interpolarse. La zona bifásica de (P, h) y (P, s) es lineal en el
+    título y se obtiene de las propiedades de saturación interpoladas en 1D.
+    """
+
+    VARIABLES = {'T': ('h', 's', 'v'), 'h': ('T', 's', 'v'), 's': ('T', 'h', 'v')}
+
+    def __init__(self, P_min: float = 1.0, P_max: float = P_MAX, tol: float = 1e-5,
+                 max_nodos: int = 96, entradas=('T', 'h', 's'), agua: Optional[Agua] = None):
+        """
+        Args:
+            P_min, P_max: Rango de presión tabulado (kPa)
+            tol: Error relativo máximo admitido en los centros de celda
+            max_nodos: Nodos máximos por eje
+            entradas: Segundas variables a tabular junto con P
+            agua: Modelo exacto (por defecto Agua())
+        """
+        self.agua = agua or Agua()
+        self.P_min, self.P_max = P_min, P_max
+        self.tol, self.max_nodos = tol, max_nodos
+        self._saturacion_1d()
+        self.tablas = {}
+        for entrada in entradas:
+            self.tablas[entrada] = {zona: self._construir(entrada, zona)
+                                    for zona in ('liquido', 'vapor')}
+        self._splines()
+
+    # --- construcción --------------------------------------------------------
+    def _saturacion_1d(self):
+        """Bordes de las zonas en función de ln P (PCHIP sobre 400 nodos)."""
+        u = np.linspace(np.log(self.P_min), np.log(self.P_max), 400)
+        u = np.unique(np.append(u, np.log(P_CRITICA)))
+        P = np.exp(u)
+        sub = P < P_CRITICA
+        sat = self.agua.saturacion(np.where(sub, P, 0.5 * P_CRITICA))
+        critica = self.agua._pt(P, T_CRITICA)
+        bordes = {}
+        for c in ('h', 's', 'v'):
+            bordes[c + '_f'] = np.where(sub, sat[c + '_f'], critica[c])
+            bordes[c + '_g'] = np.where(sub, sat[c + '_g'], critica[c])
+        bordes['v_f'], bordes['v_g'] = np.log(bordes['v_f']), np.log(bordes['v_g'])
+        self._u_borde = u
+        self.bordes = {c: PchipInterpolator(u, valor) for c, valor in bordes.items()}
+
+    def _limites(self, entrada: str, zona: str, u):
+        """Extremos de la zona; T_sat y las isotermas T_MIN/T_MAX son exactas."""
+        P = np.exp(u)
+        if entrada == 'T':
+            f = g = _temperatura_frontera(P)
+            extremo = np.full_like(P, T_MIN if zona == 'liquido' else T_MAX)
+        else:
+            f, g = self.bordes[entrada + '_f'](u), self.bordes[entrada + '_g'](u)
+            extremo = self.agua._pt(P, T_MIN, 1)[entrada] if zona == 'liquido' else \
+                self.agua._pt(P, T_MAX, -1)[entrada]
+        return (extremo, f) if zona == 'liquido' else (g, extremo)
+
+    def _exacto(self, entrada: str, zona: str, u, xi):
+        """Salidas exactas (con ln v) en los puntos (u, ξ) de una zona."""
+        bajo, alto = self._limites(entrada, zona, u)
+        X = bajo + xi * (alto - bajo)
+        P = np.exp(u)
+        fase = 1 if zona == 'liquido' else -1
+        if entrada == 'T':
+            estado = self.agua._pt(P, X, np.where(P < P_CRITICA, fase, 0))
+        else:
+            estado = self.agua._invertir(P, X, entrada)
+        return np.stack([np.log(estado[c]) if c == 'v' else estado[c]
+                         for c in self.VARIABLES[entrada]])
+
+    def _construir(self, entrada: str, zona: str) -> Dict[str, np.ndarray]:
+        u = np.linspace(np.log(self.P_min), np.log(self.P_max), 9)
+        xi = np.linspace(0.0, 1.0, 9)
+        U, XI = np.meshgrid(u, xi, indexing='ij')
+        valores = self._exacto(entrada, zona, U.ravel(), XI.ravel()).reshape(-1, len(u), len(xi))
+        uc_previo = xc_previo = exacto_previo = None
+        while True:
+            uc, xc = 0.5 * (u[1:] + u[:-1]), 0.5 * (xi[1:] + xi[:-1])
+            Uc, Xc = np.meshgrid(uc, xc, indexing='ij')
+            # Los centros de celdas no subdivididas conservan su valor exacto
+            exacto = np.empty((len(valores),) + Uc.shape)
+            pendiente = np.ones(Uc.shape, dtype=bool)
+            if exacto_previo is not None:
+                mu, mx = np.isin(uc, uc_previo), np.isin(xc, xc_previo)
+                exacto[(slice(None),) + np.ix_(mu, mx)] = exacto_previo[
+                    (slice(None),) + np.ix_(np.isin(uc_previo, uc), np.isin(xc_previo, xc))]
+                pendiente = ~np.outer(mu, mx)
+            exacto[:, pendiente] = self._exacto(entrada, zona, Uc[pendiente], Xc[pendiente])
+            uc_previo, xc_previo, exacto_previo = uc, xc, exacto
+            error = np.zeros(Uc.shape)
+            for k in range(len(valores)):
+                spline = RectBivariateSpline(u, xi, valores[k])
+                escala = np.maximum(np.abs(exacto[k]), 1.0)
+                error = np.maximum(error, np.abs(spline(uc, xc) - exacto[k]) / escala)
+            error = np.nan_to_num(error, nan=np.inf)
+            dividir_u = _intervalos_a_dividir(error.max(axis=1), self.tol, self.max_nodos - len(u))
+            dividir_xi = _intervalos_a_dividir(error.max(axis=0), self.tol, self.max_nodos - len(xi))
+            if not (dividir_u.any() or dividir_xi.any()):
+                break
+            # Los nodos nuevos se evalúan de una vez sobre la malla ampliada
+            u_n = np.sort(np.concatenate([u, uc[dividir_u]]))
+            xi_n = np.sort(np.concatenate([xi, xc[dividir_xi]]))
+            U, XI = np.meshgrid(u_n, xi_n, indexing='ij')
+            nuevos = ~(np.isin(U, u) & np.isin(XI, xi))
+            completo = np.empty((len(valores), len(u_n), len(xi_n)))
+            viejo = np.ix_(np.isin(u_n, u), np.isin(xi_n, xi))
+            completo[(slice(None),) + viejo] = valores
+            completo[:, nuevos] = self._exacto(entrada, zona, U[nuevos], XI[nuevos])
+            u, xi, valores = u_n, xi_n, completo
+        # Celdas que no alcanzaron la tolerancia: se consultan con el modelo exacto
+        return {'u': u, 'xi': xi, 'valores': valores.astype(np.float64),
+                'exactas': error > self.tol, 'error_maximo': float(error.max())}
+
+    def _splines(self):
+        self._interpoladores = {
+            (entrada, zona): [RectBivariateSpline(t['u'], t['xi'], z) for z in t['valores']]
+            for entrada, zonas in self.tablas.items() for zona, t in zonas.items()}
+
+    # --- persistencia --------------------------------------------------------
+    def guardar(self, ruta: str):
+        """
+        Guarda las mallas en un archivo .npz para no reconstruirlas.
+
+        El archivo lleva VERSION_TABLA_AGUA y la huella del modelo exacto con
+        que se construyó; cargar lo rechaza si alguna no coincide.
+        """
+        datos = {'P_rango': np.array([self.P_min, self.P_max, self.tol, self.max_nodos]),
+                 'version': np.array(VERSION_TABLA_AGUA), 'huella': _huella_agua(self.agua)}
+        for entrada, zonas in self.tablas.items():
+            for zona, t in zonas.items():
+                for c in ('u', 'xi', 'valores', 'exactas', 'error_maximo'):
+                    datos[f'{entrada}_{zona}_{c}'] = t[c]
+        np.savez_compressed(ruta, **datos)
+
+    @classmethod
+    def cargar(cls, ruta: str, agua: Optional[Agua] = None) -> 'TablaAgua':
+        """
+        Reconstruye la tabla desde un archivo de guardar (sin evaluar IF97 en 2D).
+
+        Raises:
+            ValueError: Si el archivo es de otra versión o de otro modelo exacto
+        """
+        datos = np.load(ruta, allow_pickle=False)
+        agua = agua or Agua()
+        if 'version' not in datos.files or int(datos['version']) != VERSION_TABLA_AGUA:
+            raise ValueError(f"{ruta}: tabla de otra versión (se espera {VERSION_TABLA_AGUA})")
+        if not np.allclose(datos['huella'], _huella_agua(agua), rtol=1e-12, atol=0):
+            raise ValueError(f"{ruta}: tabla construida con otro modelo IF97")
+        tabla = cls.__new__(cls)
+        tabla.agua = agua
+        P_min, P_max, tol, max_nodos = datos['P_rango']
+        tabla.P_min, tabla.P_max, tabla.tol, tabla.max_nodos = P_min, P_max, tol, int(max_nodos)
+        tabla._saturacion_1d()
+        tabla.tablas = {}
+        for clave in datos.files:
+            if clave.endswith('_valores'):
+                entrada, zona = clave.split('_')[:2]
+                t = {c: datos[f'{entrada}_{zona}_{c}'] for c in ('u', 'xi', 'valores', 'exactas')}
+                t['error_maximo'] = float(datos[f'{entrada}_{zona}_error_maximo'])
+                tabla.tablas.setdefault(entrada, {})[zona] = t
+        tabla._splines()
+        return tabla
+
+    # --- consulta ------------------------------------------------------------
+    def saturacion(self, P) -> Dict[str, np.ndarray]:
+        """Propiedades de saturación interpoladas (mismas claves que Agua.saturacion)."""
+        P = np.asarray(P, dtype=float)
+        u = np.log(P)
+        salida = {'T': np.where(P < P_CRITICA, _temperatura_frontera(P), np.nan)}
+        for c in ('h_f', 'h_g', 's_f', 's_g', 'v_f', 'v_g'):
+            valor = self.bordes[c](u)
+            salida[c] = np.exp(valor) if c[0] == 'v' else valor
+        return salida
+
+    def _consultar(self, P, X, entrada: str) -> Dict[str, np.ndarray]:
+        if entrada not in self.tablas:
+            raise ValueError(f"La tabla no incluye la entrada '{entrada}'")
+        P, X = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(X, dtype=float))
+        forma = P.shape
+        P, X = P.ravel(), X.ravel()
+        u = np.log(P)
+        salida = {c: np.full(P.shape, np.nan) for c in self.VARIABLES[entrada]}
+        salida[entrada] = X
+        dentro = (P >= self.P_min) & (P <= self.P_max)
+        for zona in ('liquido', 'vapor'):
+            bajo, alto = self._limites(entrada, zona, u)
+            xi = (X - bajo) / (alto - bajo)
+            m = dentro & (xi >= 0) & (xi <= 1)
+            if entrada == 'T':
+                m &= (xi < 1) if zona == 'liquido' else True
+            t = self.tablas[entrada][zona]
+            valores = np.stack([spline.ev(u[m], xi[m]) for spline in self._interpoladores[(entrada, zona)]])
+            iu = np.clip(np.searchsorted(t['u'], u[m], side='right') - 1, 0, len(t['u']) - 2)
+            ix = np.clip(np.searchsorted(t['xi'], xi[m], side='right') - 1, 0, len(t['xi']) - 2)
+            exacta = t['exactas'][iu, ix]
+            if exacta.any():
+                valores[:, exacta] = self._exacto(entrada, zona, u[m][exacta], xi[m][exacta])
+            for c, valor in zip(self.VARIABLES[entrada], valores):
+                salida[c][m] = np.exp(valor) if c == 'v' else valor
+        x = np.full(P.shape, np.nan)
+        if entrada != 'T':
+            f, g = self.bordes[entrada + '_f'](u), self.bordes[entrada + '_g'](u)
+            bif = dentro & (P < P_CRITICA) & (X > f) & (X < g)
+            x[bif] = (X[bif] - f[bif]) / (g[bif] - f[bif])
+            salida['T'][bif] = _temperatura_frontera(P[bif])
+            otra = 'h' if entrada == 's' else 's'
+            for c in (otra, 'v'):
+                cf, cg = self.bordes[c + '_f'](u[bif]), self.bordes[c + '_g'](u[bif])
+                if c == 'v':
+                    cf, cg = np.exp(cf), np.exp(cg)
+                salida[c][bif] = cf + x[bif] * (cg - cf)
+        estado = _estado(P, salida['h'], salida['s'], salida['v'], salida['T'], x)
+        return {c: valor.reshape(forma) for c, valor in estado.items()}
+
+    def estado_pt(self, P, T) -> Dict[str, np.ndarray]:
+        """Estado interpolado a partir de presión (kPa) y temperatura (K)."""
+        return self._consultar(P, T, 'T')
+
+    def estado_ph(self, P, h) -> Dict[str, np.ndarray]:
+        """Estado interpolado a partir de presión (kPa) y entalpía (kJ/kg)."""
+        return self._consultar(P, h, 'h')
+
+    def estado_ps(self, P, s) -> Dict[str, np.ndarray]:
+        """Estado interpolado a partir de presión (kPa) y entropía (kJ/kg·K)."""
+        return self._consultar(P, s, 's')
+
+
+def _huella_agua(agua: Agua) -> np.ndarray:
+    """h, s y v exactos en puntos de las regiones 1, 2 y 3 para identificar el modelo."""
+    estado = agua.estado_pt(np.array([3000.0, 3500.0, 25000.0]), np.array([300.0, 700.0, 650.0]))
+    return np.concatenate([estado['h'], estado['s'], estado['v']])
+
+
+@lru_cache(maxsize=None)
+def tabla_agua(tol: float = 1e-5, max_nodos: int = 96, ruta: Optional[str] = RUTA_TABLA_AGUA) -> TablaAgua:
+    """
+    Tabla de agua compartida por el proceso.
+
+    Se carga de ruta (por defecto en el directorio de caché del usuario,
+    ver DIRECTORIO_CACHE) si el archivo es de la misma versión, del mismo
+    modelo IF97 y de la misma malla (P_min, P_max, tol, max_nodos). Si no
+    existe o no coincide se construye (del orden de 20 s) y se guarda allí para los
+    procesos siguientes; basta borrar el archivo para regenerarlo.
+    ruta=None construye la tabla sin usar el disco.
+    """
+    if ruta is not None and os.path.exists(ruta):
+        try:
+            tabla = TablaAgua.cargar(ruta)
+        except (ValueError, KeyError, OSError):
+            tabla = None
+        if tabla is not None and \
+                (tabla.P_min, tabla.P_max, tabla.tol, tabla.max_nodos) == (1.0, P_MAX, tol, max_nodos):
+            return tabla
+    tabla = TablaAgua(tol=tol, max_nodos=max_nodos)
+    if ruta is not None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+            # Escritura atómica: otro proceso nunca lee un archivo a medias
+            temporal = f'{ruta}.{os.getpid()}.tmp.npz'
+            tabla.guardar(temporal)
+            os.replace(temporal, ruta)
+        except OSError as error:
+            warnings.warn(f"No se pudo guardar la tabla de agua en {ruta} ({error}); "
+                          f"se reconstruirá en cada proceso")
+    return tabla
+
+
+# =============================================================================
+# GASES IDEALES CON cp(T)
+# =============================================================================
+
+R_UNIVERSAL = 8.314462   # kJ/kmol·K
+T_REF, P_REF = 298.15, 100.0
+
+# cp = a + bT + cT² + dT³ (kJ/kmol·K, 273-1800 K) y masa molar (kg/kmol)
+GASES = {
+    'N2': ((28.90, -0.1571e-2, 0.8081e-5, -2.873e-9), 28.013),
+    'O2': ((25.48, 1.520e-2, -0.7155e-5, 1.312e-9), 31.999),
+    'Ar': ((20.786, 0.0, 0.0, 0.0), 39.948),
+    'CO2': ((22.26, 5.981e-2, -3.501e-5, 7.469e-9), 44.010),
+    'H2O': ((32.24, 0.1923e-2, 1.055e-5, -3.595e-9), 18.015),
+    'CO': ((28.16, 0.1675e-2, 0.5372e-5, -2.222e-9), 28.010),
+    'H2': ((29.11, -0.1916e-2, 0.4003e-5, -0.8704e-9), 2.016),
+    'CH4': ((19.89, 5.024e-2, 1.269e-5, -11.01e-9), 16.043),
+}
+
+AIRE = {'N2': 0.7808, 'O2': 0.2095, 'Ar': 0.0093, 'CO2': 0.0004}
+
+
+class MezclaGasIdeal:
+    """
+    Mezcla de gases ideales de composición fija con cp(T) polinómico.
+
+    h(T) y s°(T) tienen forma cerrada, de modo que la evaluación exacta ya es
+    tan barata como una tabla; las inversas T(h) y T(s) usan Newton.
+    """
+
+    def __init__(self, fracciones_molares: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            fracciones_molares: {gas: fracción} con gases de GASES (se
+                normalizan); por defecto aire seco
+        """
+        fracciones = fracciones_molares or AIRE
+        desconocidos = [g for g in fracciones if g not in GASES]
+        if desconocidos:
+            raise ValueError(f"Gases sin datos de cp: {desconocidos}")
+        y = np.array(list(fracciones.values()), dtype=float)
+        y = y / y.sum()
+        coef = np.array([GASES[g][0] for g in fracciones])
+        self.composicion = dict(zip(fracciones, y))
+        self.masa_molar = float(y @ np.array([GASES[g][1] for g in fracciones]))
+        self.R = R_UNIVERSAL / self.masa_molar
+        self._coef = (y @ coef) / self.masa_molar      # cp por kg
+
+    def cp(self, T):
+        """Calor específico a presión constante (kJ/kg·K)."""
+        a, b, c, d = self._coef
+        T = np.asarray(T, dtype=float)
+        return a + b * T + c * T**2 + d * T**3
+
+    def gamma(self, T):
+        """Relación de calores específicos cp/cv."""
+        cp = self.cp(T)
+        return cp / (cp - self.R)
+
+    def _h(self, T):
+        a, b, c, d = self._coef
+        prim = lambda t: a * t + b * t**2 / 2 + c * t**3 / 3 + d * t**4 / 4
+        return prim(np.asarray(T, dtype=float)) - prim(T_REF)
+
+    def _s0(self, T):
+        a, b, c, d = self._coef
+        prim = lambda t: a * np.log(t) + b * t + c * t**2 / 2 + d * t**3 / 3
+        return prim(np.asarray(T, dtype=float)) - prim(T_REF)
+
+    def _temperatura(self, objetivo, funcion, derivada, T0=None, tol: float = 1e-12):
+        T = np.full(np.shape(objetivo), 500.0) if T0 is None else np.asarray(T0, dtype=float)
+        for _ in range(50):
+            paso = (funcion(T) - objetivo) / derivada(T)
+            T = np.maximum(T - paso, 50.0)
+            if np.all(np.abs(paso) <= tol * T):
+                break
+        return T
+
+    def estado_pt(self, P, T) -> Dict[str, np.ndarray]:
+        """Estado a partir de presión (kPa) y temperatura (K)."""
+        P, T = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(T, dtype=float))
+        s = self._s0(T) - self.R * np.log(P / P_REF)
+        return _estado(P, self._h(T), s, self.R * T / P, T, cp=self.cp(T))
+
+    def estado_ph(self, P, h) -> Dict[str, np.ndarray]:
+        """Estado a partir de presión (kPa) y entalpía (kJ/kg)."""
+        P, h = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(h, dtype=float))
+        return self.estado_pt(P, self._temperatura(h, self._h, self.cp))
+
+    def estado_ps(self, P, s) -> Dict[str, np.ndarray]:
+        """Estado a partir de presión (kPa) y entropía (kJ/kg·K)."""
+        P, s = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(s, dtype=float))
+        s0 = s + self.R * np.log(P / P_REF)
+        return self.estado_pt(P, self._temperatura(s0, self._s0, lambda T: self.cp(T) / T))
+
+    def estado_tv(self, T, v) -> Dict[str, np.ndarray]:
+        """Estado a partir de temperatura (K) y volumen específico (m³/kg)."""
+        T, v = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(v, dtype=float))
+        return self.estado_pt(self.R * T / v, T)
+
+    def estado_vs(self, v, s) -> Dict[str, np.ndarray]:
+        """Estado a partir de volumen específico (m³/kg) y entropía (kJ/kg·K)."""
+        v, s = np.broadcast_arrays(np.asarray(v, dtype=float), np.asarray(s, dtype=float))
+        # s = s°(T) - R ln(R T / (v P_ref))  ->  s°(T) - R ln T = s + R ln(R / (v P_ref))
+        objetivo = s + self.R * np.log(self.R / (v * P_REF))
+        T = self._temperatura(objetivo, lambda T: self._s0(T) - self.R * np.log(T),
+                              lambda T: (self.cp(T) - self.R) / T)
+        return self.estado_tv(T, v)
+
+    def estado_ts(self, T, s) -> Dict[str, np.ndarray]:
+        """Estado a partir de temperatura (K) y entropía (kJ/kg·K)."""
+        T, s = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(s, dtype=float))
+        return self.estado_pt(P_REF * np.exp((self._s0(T) - s) / self.R), T)
@@ -0,0 +1,157 @@
+# =============================================================================
+# MÓDULO DE CORRECCIÓN DE BOMBAS PARA PULPAS
+# =============================================================================
+# Propósito: Corregir altura, eficiencia y potencia de bombas centrífugas que
+#            manejan pulpas de sólidos sedimentables (razones de altura y de
+#            eficiencia en función de d50, Cw y SG) y calcular la velocidad
+#            crítica de depositación de la línea de descarga, vectorizado
+#            sobre puntos de trabajo × recetas de pulpa
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Razón de altura (ANSI/HI 12.1-12.6, correlación de Wilson-Addie-Clift):
+#   R_H = 1 - 0.000385 (S_s - 1)(1 + 4/S_s) C_v[%] ln(d50 / 0.0227 mm)
+# y razón de eficiencia R_η = R_H, como recomienda HI para pulpas
+# sedimentables. Las curvas de agua se convierten a pulpa con
+#   H_m = R_H · H_w     η_m = R_η · η_w     P = ρ_m g Q H_m / η_m
+# Tamaños de partícula en mm, caudal en m³/h, eficiencias en fracción.
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Union
+
+G = 9.81
+D50_UMBRAL = 0.0227   # mm; partículas más finas no reducen la altura (HI)
+
+
+def concentracion_volumetrica(Cw, SGs, SGl=1.0):
+    """Concentración en volumen Cv a partir de la concentración en peso Cw (fracciones)."""
+    Cw = np.asarray(Cw, dtype=float)
+    return Cw / SGs / (Cw / SGs + (1 - Cw) / SGl)
+
+
+def gravedad_especifica_mezcla(Cw, SGs, SGl=1.0):
+    """Gravedad específica de la pulpa."""
+    Cw = np.asarray(Cw, dtype=float)
+    return 1.0 / (Cw / SGs + (1 - Cw) / SGl)
+
+
+def razon_altura(d50, Cv, SGs):
+    """
+    Razón de altura R_H = H_pulpa / H_agua (ANSI/HI 12.1-12.6).
+
+    Args:
+        d50: Tamaño medio de partícula (mm)
+        Cv: Concentración en volumen (fracción)
+        SGs: Gravedad específica de los sólidos
+
+    Returns:
+        R_H entre 0 y 1
+    """
+    SGs = np.asarray(SGs, dtype=float)
+    d50 = np.maximum(np.asarray(d50, dtype=float), D50_UMBRAL)
+    K = 0.000385 * (SGs - 1) * (1 + 4 / SGs)
+    return np.clip(1 - K * 100 * np.asarray(Cv, dtype=float) * np.log(d50 / D50_UMBRAL), 0.0, 1.0)
+
+
+def velocidad_deposicion(diametro, d50, d85, Cv, SGs, metodo: str = 'maximo'):
+    """
+    Velocidad crítica de depositación en la tubería (m/s).
+
+    'durand': V = F_L √(2 g D (S_s - 1)), con F_L = 1.3 Cv^0.125 (1 - e^(-6.9 d50))
+    (ajuste de Schiller y Herbich a la gráfica de Durand).
+    'wasp': V = 3.399 Cv^0.2156 (d85/D)^(1/6) √(2 g D (S_s - 1)); se usa d85
+    porque la fracción gruesa es la que se deposita primero.
+    'maximo': el mayor de los dos (criterio conservador).
+
+    Args:
+        diametro: Diámetro interno de la línea (m)
+        d50, d85: Tamaños de partícula (mm)
+        Cv: Concentración en volumen (fracción)
+        SGs: Gravedad específica de los sólidos
+        metodo: 'durand', 'wasp' o 'maximo'
+    """
+    D = np.asarray(diametro, dtype=float)
+    Cv = np.asarray(Cv, dtype=float)
+    base = np.sqrt(2 * G * D * (np.asarray(SGs, dtype=float) - 1))
+    durand = 1.3 * Cv**0.125 * (1 - np.exp(-6.9 * np.asarray(d50, dtype=float))) * base
+    wasp = 3.399 * Cv**0.2156 * (np.asarray(d85, dtype=float) / 1000 / D)**(1 / 6) * base
+    if metodo == 'durand':
+        return durand
+    if metodo == 'wasp':
+        return wasp
+    if metodo == 'maximo':
+        return np.maximum(durand, wasp)
+    raise ValueError(f"Método de depositación no reconocido: {metodo}")
+
+
+def _columnas_receta(recetas) -> Dict[str, np.ndarray]:
+    """Arreglos d50, d85, Cw, SGs (M,) de un DataFrame o dict de recetas."""
+    faltan = [c for c in ('d50', 'd85', 'Cw', 'SGs') if c not in recetas]
+    if faltan:
+        raise ValueError(f"Faltan columnas en las recetas: {faltan}")
+    return {c: np.atleast_1d(np.asarray(recetas[c], dtype=float)) for c in ('d50', 'd85', 'Cw', 'SGs')}
+
+
+def evaluar_pulpas(caudal, altura_agua, eficiencia_agua,
+                   recetas: Union[pd.DataFrame, Dict[str, np.ndarray]],
+                   diametro_descarga=None, SGl: float = 1.0,
+                   metodo_deposicion: str = 'maximo') -> Dict[str, np.ndarray]:
+    """
+    Corrige N puntos de trabajo de agua para M recetas de pulpa a la vez.
+
+    Args:
+        caudal: Caudales (N,) en m³/h
+        altura_agua: Altura de la bomba con agua en cada punto (N,) (m)
+        eficiencia_agua: Eficiencia con agua en cada punto (N,) (fracción)
+        recetas: Columnas d50, d85 (mm), Cw (fracción) y SGs, una fila por receta
+        diametro_descarga: Diámetro interno de la línea de descarga (m);
+            escalar o (N,). Si es None no se evalúa la depositación
+        SGl: Gravedad específica del líquido portador
+        metodo_deposicion: Ver velocidad_deposicion
+
+    Returns:
+        Dict con Cv, SGm, razon_altura y razon_eficiencia (M,); altura,
+        eficiencia y potencia (kW) (N, M); altura_agua_equivalente (N, M), la
+        altura con agua que debe dar la bomba para entregar altura_agua de
+        pulpa; y con diametro_descarga: velocidad (N,), velocidad_deposicion
+        (N, M), razon_deposicion = V/V_D y deposita (N, M)
+    """
+    r = _columnas_receta(recetas)
+    Q = np.atleast_1d(np.asarray(caudal, dtype=float))[:, None]
+    H = np.atleast_1d(np.asarray(altura_agua, dtype=float))[:, None]
+    eta = np.atleast_1d(np.asarray(eficiencia_agua, dtype=float))[:, None]
+
+    Cv = concentracion_volumetrica(r['Cw'], r['SGs'], SGl)
+    SGm = gravedad_especifica_mezcla(r['Cw'], r['SGs'], SGl)
+    RH = razon_altura(r['d50'], Cv, r['SGs'])
+    Reta = RH
+
+    altura = RH * H
+    eficiencia = Reta * eta
+    with np.errstate(divide='ignore'):
+        potencia = SGm * G * (Q / 3600) * altura / eficiencia    # kW con ρ_agua = 1000
+        equivalente = H / RH
+
+    resultado = {
+        'Cv': Cv,
+        'SGm': SGm,
+        'razon_altura': RH,
+        'razon_eficiencia': Reta,
+        'altura': altura,
+        'eficiencia': eficiencia,
+        'potencia': potencia,
+        'altura_agua_equivalente': equivalente,
+    }
+    if diametro_descarga is not None:
+        D = np.broadcast_to(np.asarray(diametro_descarga, dtype=float), Q.shape[:1])[:, None]
+        V = Q[:, 0] / 3600 / (np.pi * D[:, 0]**2 / 4)
+        VD = velocidad_deposicion(D, r['d50'], r['d85'], Cv, r['SGs'], metodo_deposicion)
+        resultado['velocidad'] = V
+        resultado['velocidad_deposicion'] = VD
+        with np.errstate(divide='ignore'):
+            resultado['razon_deposicion'] = V[:, None] / VD
+        resultado['deposita'] = V[:, None] < VD
+    return resultado
@@ -0,0 +1,227 @@
+# =============================================================================
+# MÓDULO DE PUNTO DE OPERACIÓN BOMBA-SISTEMA
+# =============================================================================
+# Propósito: Calcular exactamente las intersecciones entre curvas de bomba y
+#            curvas de sistema polinómicas (analíticas o ajustadas), para miles
+#            de combinaciones en una sola llamada vectorizada, en lugar de tomar
+#            la muestra más cercana de una curva discretizada
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Las curvas son polinomios H(Q) con coeficientes de mayor a menor grado
+# (convención de np.polyfit). Un lote de N curvas es un arreglo (N, grado+1);
+# bomba y sistema se combinan por broadcasting, de modo que una bomba contra
+# N sistemas, N bombas contra un sistema o N pares funcionan igual.
+# Las unidades de caudal y altura son las de los coeficientes.
+# =============================================================================
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+
+def curva_sistema(altura_estatica, coeficiente) -> np.ndarray:
+    """
+    Coeficientes de la curva de sistema H = H_estática + K·Q².
+
+    Args:
+        altura_estatica: Altura estática (escalar o arreglo (N,))
+        coeficiente: Coeficiente de pérdidas K (escalar o arreglo (N,))
+
+    Returns:
+        Coeficientes (N, 3) de mayor a menor grado
+    """
+    Hs, K = np.broadcast_arrays(np.atleast_1d(np.asarray(altura_estatica, dtype=float)),
+                                np.atleast_1d(np.asarray(coeficiente, dtype=float)))
+    return np.stack([K, np.zeros_like(K), Hs], axis=-1)
+
+
+def evaluar_polinomio(coeficientes, Q) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa por Horner un lote de polinomios y su derivada.
+
+    Args:
+        coeficientes: (N, grado+1) de mayor a menor grado
+        Q: Caudales (N,) o (N, m)
+
+    Returns:
+        Tuple (H, dH/dQ) con la forma de Q
+    """
+    c = np.asarray(coeficientes, dtype=float)
+    Q = np.asarray(Q, dtype=float)
+    extra = (slice(None),) + (None,) * (Q.ndim - 1)
+    H = np.zeros(np.broadcast_shapes(Q.shape, c.shape[:1] + (1,) * (Q.ndim - 1)))
+    dH = np.zeros_like(H)
+    for k in range(c.shape[1]):
+        dH = dH * Q + H
+        H = H * Q + c[extra + (k,)]
+    return H, dH
+
+
+def _igualar_grado(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Rellena con ceros a la izquierda y hace broadcasting del lote."""
+    grado = max(a.shape[-1], b.shape[-1])
+    a = np.pad(a, [(0, 0)] * (a.ndim - 1) + [(grado - a.shape[-1], 0)])
+    b = np.pad(b, [(0, 0)] * (b.ndim - 1) + [(grado - b.shape[-1], 0)])
+    return np.broadcast_arrays(np.atleast_2d(a), np.atleast_2d(b))
+
+
+def raices_reales(coeficientes, q_min, q_max) -> np.ndarray:
+    """
+    Raíces reales de un lote de polinomios dentro de [q_min, q_max].
+
+    Usa los valores propios de las matrices compañeras apiladas. Un
+    coeficiente principal nulo (polinomio de grado menor) se sustituye por uno
+    diminuto, que sólo añade una raíz enorme fuera del intervalo.
+
+    Args:
+        coeficientes: (N, grado+1) de mayor a menor grado
+        q_min, q_max: Límites del intervalo (escalares o (N,))
+
+    Returns:
+        (N, grado) con las raíces ordenadas y NaN donde no hay raíz
+    """
+    c = np.atleast_2d(np.asarray(coeficientes, dtype=float))
+    N, g = c.shape[0], c.shape[1] - 1
+    if g < 1:
+        return np.empty((N, 0))
+
+    escala = np.max(np.abs(c), axis=1)
+    escala = np.where(escala > 0, escala, 1.0)
+    principal = c[:, 0]
+    diminuto = 1e-14 * escala
+    principal = np.where(np.abs(principal) < diminuto, diminuto, principal)
+
+    companera = np.zeros((N, g, g))
+    companera[:, 0, :] = -c[:, 1:] / principal[:, None]
+    companera[:, np.arange(1, g), np.arange(g - 1)] = 1.0
+    r = np.linalg.eigvals(companera)
+
+    q_min = np.broadcast_to(np.asarray(q_min, dtype=float), (N,))[:, None]
+    q_max = np.broadcast_to(np.asarray(q_max, dtype=float), (N,))[:, None]
+    real = np.abs(r.imag) <= 1e-9 * (1 + np.abs(r.real))
+    dentro = real & (r.real >= q_min) & (r.real <= q_max)
+    return np.sort(np.where(dentro, r.real, np.nan), axis=1)
+
+
+def _newton_acotado(coeficientes, a, b, fa, tol: float, max_iter: int) -> np.ndarray:
+    """
+    Newton con salvaguarda de bisección sobre brackets [a, b] con cambio de signo.
+
+    Todos los brackets se refinan a la vez; el paso de Newton se acepta sólo
+    si cae dentro del bracket, si no se biseca.
+    """
+    x = 0.5 * (a + b)
+    signo_a = np.sign(fa)
+    for _ in range(max_iter):
+        f, df = evaluar_polinomio(coeficientes, x)
+        mismo = np.sign(f) == signo_a
+        a = np.where(mismo, x, a)
+        b = np.where(mismo, b, x)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_n = x - f / df
+        fuera = ~np.isfinite(x_n) | (x_n <= np.minimum(a, b)) | (x_n >= np.maximum(a, b))
+        x_n = np.where(f == 0, x, np.where(fuera, 0.5 * (a + b), x_n))
+        paso = np.abs(x_n - x)
+        x = x_n
+        if np.all((paso <= tol * (1 + np.abs(x))) | (f == 0)):
+            break
+    return x
+
+
+def puntos_operacion(curva_bomba, curva_sistema, q_max=None, tol: float = 1e-13,
+                     max_iter: int = 60) -> Dict[str, np.ndarray]:
+    """
+    Todas las intersecciones bomba-sistema en [0, q_max] para un lote.
+
+    Los puntos críticos de la diferencia Δ(Q) = H_bomba - H_sistema parten
+    el intervalo en tramos monótonos; cada tramo con cambio de signo contiene
+    exactamente una intersección, que se refina con Newton acotado hasta la
+    precisión de máquina. Así se encuentran todas las intersecciones (curvas
+    con joroba, sistemas con mucha altura estática) sin depender de una malla.
+
+    Un punto es estable si dΔ/dQ < 0 (la bomba cae más rápido que el sistema),
+    el mismo criterio de analizar_estabilidad_bomba.
+
+    Args:
+        curva_bomba: Coeficientes (grado+1,) o (N, grado+1)
+        curva_sistema: Coeficientes (grado+1,) o (N, grado+1)
+        q_max: Caudal máximo a explorar (escalar o (N,)); por defecto el
+            caudal de descarga libre (H_bomba = 0)
+        tol: Tolerancia relativa del caudal
+        max_iter: Iteraciones máximas del refinamiento
+
+    Returns:
+        Dict con caudal, altura, estable, pendiente_bomba (N, K), con NaN o
+        False donde no hay intersección; n_puntos (N,); caudal_principal y
+        altura_principal (N,): la intersección estable de mayor caudal
+    """
+    bomba, sistema = _igualar_grado(np.asarray(curva_bomba, dtype=float),
+                                    np.asarray(curva_sistema, dtype=float))
+    delta = bomba - sistema
+    N, g = delta.shape[0], delta.shape[1] - 1
+
+    if q_max is None:
+        q_max = np.nanmax(raices_reales(bomba, 0.0, np.inf), axis=1, initial=-np.inf) \
+            if g >= 1 else np.full(N, -np.inf)
+        if not np.all(np.isfinite(q_max)):
+            raise ValueError("Alguna curva de bomba no corta H = 0; indique q_max")
+    q_max = np.broadcast_to(np.asarray(q_max, dtype=float), (N,))
+
+    # Tramos monótonos: [0, críticos..., q_max]
+    derivada = delta[:, :-1] * np.arange(g, 0, -1)
+    criticos = raices_reales(derivada, 0.0, q_max) if g >= 2 else np.empty((N, 0))
+    criticos = np.where(np.isnan(criticos), q_max[:, None], criticos)
+    bordes = np.sort(np.column_stack([np.zeros(N), criticos, q_max]), axis=1)
+    f_bordes, _ = evaluar_polinomio(delta, bordes)
+
+    a, b = bordes[:, :-1], bordes[:, 1:]
+    fa, fb = f_bordes[:, :-1], f_bordes[:, 1:]
+    hay = ((fa * fb < 0) | (fb == 0)) & (b > a)
+    hay[:, 0] |= fa[:, 0] == 0
+
+    caudal = np.full(a.shape, np.nan)
+    filas, tramos = np.nonzero(hay)
+    if len(filas):
+        fa_t, fb_t = fa[filas, tramos], fb[filas, tramos]
+        a_t, b_t = a[filas, tramos], b[filas, tramos]
+        x = _newton_acotado(delta[filas], a_t, b_t, fa_t, tol, max_iter)
+        x = np.where(fa_t == 0, a_t, np.where(fb_t == 0, b_t, x))
+        caudal[filas, tramos] = x
+
+    # Compactar: las intersecciones primero, en orden creciente de caudal
+    caudal = np.sort(caudal, axis=1)
+    K = max(int(np.max(np.sum(~np.isnan(caudal), axis=1), initial=0)), 1)
+    caudal = caudal[:, :K]
+    Qe = np.nan_to_num(caudal)
+    altura, pendiente_bomba = evaluar_polinomio(bomba, Qe)
+    _, pendiente_delta = evaluar_polinomio(delta, Qe)
+    valido = ~np.isnan(caudal)
+    altura = np.where(valido, altura, np.nan)
+    pendiente_bomba = np.where(valido, pendiente_bomba, np.nan)
+    estable = valido & (pendiente_delta < 0)
+
+    ultimo = np.where(estable, np.arange(K), -1).max(axis=1)
+    filas = np.arange(N)
+    tiene = ultimo >= 0
+    return {
+        'caudal': caudal,
+        'altura': altura,
+        'estable': estable,
+        'pendiente_bomba': pendiente_bomba,
+        'n_puntos': valido.sum(axis=1),
+        'caudal_principal': np.where(tiene, caudal[filas, ultimo], np.nan),
+        'altura_principal': np.where(tiene, altura[filas, ultimo], np.nan),
+    }
+
+
+def punto_operacion(curva_bomba, curva_sistema,
+                    q_max: Optional[float] = None) -> Tuple[float, float]:
+    """
+    Punto de operación principal de una sola bomba contra un solo sistema.
+
+    Returns:
+        Tuple (caudal, altura); NaN si no hay intersección estable
+    """
+    res = puntos_operacion(curva_bomba, curva_sistema, q_max)
+    return float(res['caudal_principal'][0]), float(res['altura_principal'][0])
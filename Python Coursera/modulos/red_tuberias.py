@@ -0,0 +1,656 @@
+# =============================================================================
+# MÓDULO DE REDES DE TUBERÍAS (ALGORITMO DE GRADIENTE GLOBAL)
+# =============================================================================
+# Propósito: Resolver redes malladas de tuberías con bombas, válvulas y
+#            depósitos mediante el Algoritmo de Gradiente Global de
+#            Todini-Pilati (Newton sobre caudales y cargas con matrices de
+#            incidencia dispersas), en lugar de iterar Hardy Cross malla a malla,
+#            y simular periodos extendidos con tanques y patrones de demanda
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Convenciones:
+#   - Caudal en m³/s (positivo en el sentido desde -> hasta), cargas y cotas
+#     en m, demandas en m³/s (positivas cuando salen de la red).
+#   - La pérdida de carga de cada enlace cumple h(Q) = H_desde - H_hasta; en
+#     una bomba h(Q) = -H_bomba(Q).
+#   - Las curvas de bomba son polinomios H(Q) con coeficientes de mayor a
+#     menor grado (convención de np.polyfit y de ajustar_curva_bomba_datos).
+# =============================================================================
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from modulos.friccion import factor_friccion
+
+G = 9.81
+NU_AGUA = 1.0e-6          # Viscosidad cinemática del agua a 20 °C (m²/s)
+R_CERRADO = 1.0e8         # Resistencia lineal de un enlace cerrado (s/m²)
+RQTOL = 1.0e-7            # Gradiente mínimo de pérdida (evita D = 0 con Q = 0)
+
+TUBERIA, BOMBA, VALVULA = 0, 1, 2
+
+
+def curva_bomba_si(coeficientes: Sequence[float], unidad_caudal: str = 'm3/h') -> np.ndarray:
+    """
+    Convierte los coeficientes de una curva H(Q) a caudal en m³/s.
+
+    Args:
+        coeficientes: Polinomio de altura (m) de mayor a menor grado, p. ej.
+            ajustar_curva_bomba_datos(...)['parametros_altura']
+        unidad_caudal: Unidad de caudal del ajuste: 'm3/h', 'L/min', 'L/s' o 'm3/s'
+
+    Returns:
+        Coeficientes del mismo polinomio con Q en m³/s
+    """
+    factores = {'m3/h': 3600.0, 'L/min': 60000.0, 'L/s': 1000.0, 'm3/s': 1.0}
+    if unidad_caudal not in factores:
+        raise ValueError(f"Unidad de caudal desconocida: {unidad_caudal}")
+    c = np.asarray(coeficientes, dtype=float)
+    grados = np.arange(len(c) - 1, -1, -1)
+    return c * factores[unidad_caudal]**grados
+
+
+class RedTuberias:
+    """
+    Red hidráulica de nodos (uniones con demanda y depósitos de carga fija)
+    y enlaces (tuberías, bombas y válvulas).
+
+    La red se construye con los métodos agregar_* y se resuelve con
+    resolver(), que compila los arreglos y la matriz de incidencia la
+    primera vez y los reutiliza en las llamadas siguientes.
+    """
+
+    def __init__(self, nu: float = NU_AGUA, metodo_friccion: str = 'colebrook'):
+        """
+        Args:
+            nu: Viscosidad cinemática del fluido (m²/s)
+            metodo_friccion: 'colebrook' o 'swamee_jain'
+        """
+        self.nu = nu
+        self.metodo_friccion = metodo_friccion
+
+        self.nodos: List[str] = []
+        self.indice_nodo: Dict[str, int] = {}
+        self._cota: List[float] = []
+        self._demanda: List[float] = []
+        self._carga_fija: List[Optional[float]] = []
+        self._tanques: Dict[int, Dict] = {}
+
+        self.enlaces: List[str] = []
+        self.indice_enlace: Dict[str, int] = {}
+        self._desde: List[int] = []
+        self._hasta: List[int] = []
+        self._tipo: List[int] = []
+        self._datos: List[Dict] = []
+
+        self._compilada = False
+
+    # ------------------------------------------------------------------
+    # Construcción de la red
+    # ------------------------------------------------------------------
+
+    def _nuevo_nodo(self, nombre: str, cota: float, demanda: float,
+                    carga_fija: Optional[float]) -> int:
+        if nombre in self.indice_nodo:
+            raise ValueError(f"El nodo '{nombre}' ya existe")
+        self.indice_nodo[nombre] = len(self.nodos)
+        self.nodos.append(nombre)
+        self._cota.append(float(cota))
+        self._demanda.append(float(demanda))
+        self._carga_fija.append(carga_fija)
+        self._compilada = False
+        return self.indice_nodo[nombre]
+
+    def _nuevo_enlace(self, nombre: str, desde: str, hasta: str, tipo: int, **datos) -> int:
+        if nombre in self.indice_enlace:
+            raise ValueError(f"El enlace '{nombre}' ya existe")
+        for nodo in (desde, hasta):
+            if nodo not in self.indice_nodo:
+                raise KeyError(f"Nodo desconocido: {nodo}")
+        self.indice_enlace[nombre] = len(self.enlaces)
+        self.enlaces.append(nombre)
+        self._desde.append(self.indice_nodo[desde])
+        self._hasta.append(self.indice_nodo[hasta])
+        self._tipo.append(tipo)
+        self._datos.append(datos)
+        self._compilada = False
+        return self.indice_enlace[nombre]
+
+    def agregar_nodo(self, nombre: str, cota: float = 0.0, demanda: float = 0.0) -> int:
+        """Agrega una unión con cota (m) y demanda (m³/s)."""
+        return self._nuevo_nodo(nombre, cota, demanda, None)
+
+    def agregar_deposito(self, nombre: str, carga: float) -> int:
+        """Agrega un depósito (o embalse) de carga total fija (m)."""
+        return self._nuevo_nodo(nombre, carga, 0.0, float(carga))
+
+    def agregar_tanque(self, nombre: str, cota_fondo: float, nivel_inicial: float,
+                       diametro: float, nivel_min: float = 0.0,
+                       nivel_max: float = np.inf) -> int:
+        """
+        Agrega un tanque cilíndrico cuyo nivel evoluciona en simular_periodo.
+
+        En cada solución permanente actúa como carga fija cota_fondo + nivel.
+
+        Args:
+            cota_fondo: Cota del fondo (m)
+            nivel_inicial: Nivel de agua inicial (m)
+            diametro: Diámetro del tanque (m)
+            nivel_min, nivel_max: Límites del nivel (m)
+        """
+        i = self._nuevo_nodo(nombre, cota_fondo, 0.0, float(cota_fondo + nivel_inicial))
+        self._tanques[i] = {'area': np.pi * diametro**2 / 4, 'nivel': float(nivel_inicial),
+                            'nivel_min': nivel_min, 'nivel_max': nivel_max}
+        return i
+
+    def agregar_tuberia(self, nombre: str, desde: str, hasta: str, longitud: float,
+                        diametro: float, rugosidad: float = 4.5e-5,
+                        perdidas_menores: float = 0.0, abierta: bool = True) -> int:
+        """
+        Agrega una tubería (Darcy-Weisbach con factor_friccion).
+
+        Args:
+            longitud: Longitud (m)
+            diametro: Diámetro interno (m)
+            rugosidad: Rugosidad absoluta (m)
+            perdidas_menores: Suma de coeficientes K de accesorios del tramo
+            abierta: Estado inicial
+        """
+        return self._nuevo_enlace(nombre, desde, hasta, TUBERIA, longitud=longitud,
+                                  diametro=diametro, rugosidad=rugosidad,
+                                  km=perdidas_menores, abierta=abierta)
+
+    def agregar_bomba(self, nombre: str, desde: str, hasta: str, curva: Sequence[float],
+                      velocidad: float = 1.0, caudal_inicial: Optional[float] = None) -> int:
+        """
+        Agrega una bomba con curva polinómica H(Q) (Q en m³/s, ver curva_bomba_si).
+
+        La bomba lleva retención implícita: con contrapresión mayor que la
+        altura a válvula cerrada se comporta como un enlace cerrado.
+
+        Args:
+            curva: Coeficientes de H(Q) de mayor a menor grado
+            velocidad: Velocidad relativa n/n_nominal (leyes de afinidad); 0 la apaga
+            caudal_inicial: Caudal de arranque de Newton; por defecto la mitad
+                del caudal de descarga libre
+        """
+        return self._nuevo_enlace(nombre, desde, hasta, BOMBA,
+                                  curva=np.asarray(curva, dtype=float),
+                                  velocidad=velocidad, caudal_inicial=caudal_inicial)
+
+    def agregar_valvula(self, nombre: str, desde: str, hasta: str, diametro: float,
+                        coeficiente: float = 0.2, abierta: bool = True,
+                        retencion: bool = False) -> int:
+        """
+        Agrega una válvula de estrangulación h = K V²/2g.
+
+        Args:
+            diametro: Diámetro nominal (m)
+            coeficiente: Coeficiente de pérdida K en la posición actual
+            abierta: False la cierra por completo
+            retencion: Si es True no admite flujo inverso (válvula check)
+        """
+        return self._nuevo_enlace(nombre, desde, hasta, VALVULA, diametro=diametro,
+                                  coeficiente=coeficiente, abierta=abierta,
+                                  retencion=retencion)
+
+    def fijar_estado(self, enlace: str, abierta: bool) -> None:
+        """Abre o cierra una tubería o válvula."""
+        i = self.indice_enlace[enlace]
+        self._datos[i]['abierta'] = abierta
+        if self._compilada:
+            self._abierta[i] = abierta
+
+    def fijar_velocidad(self, bomba: str, velocidad: float) -> None:
+        """Cambia la velocidad relativa de una bomba (0 la apaga)."""
+        i = self.indice_enlace[bomba]
+        self._datos[i]['velocidad'] = velocidad
+        if self._compilada:
+            self._velocidad[np.searchsorted(self._idx_bomba, i)] = velocidad
+
+    def fijar_demandas(self, demandas) -> None:
+        """Asigna las demandas (m³/s) de todos los nodos en el orden de self.nodos."""
+        demandas = np.asarray(demandas, dtype=float)
+        self._demanda = list(demandas)
+        if self._compilada:
+            self.demanda = demandas.copy()
+
+    @classmethod
+    def malla(cls, n_filas: int, n_columnas: int, separacion: float = 100.0,
+              diametro: float = 0.2, demanda: float = 5e-5, carga_deposito: float = 60.0,
+              rugosidad: float = 4.5e-5, semilla: Optional[int] = 0) -> 'RedTuberias':
+        """
+        Crea una red en cuadrícula alimentada por un depósito en una esquina.
+
+        Útil para pruebas y estimaciones de rendimiento: tiene
+        2·n·m - n - m + 1 tuberías. Con semilla se varían los diámetros.
+        """
+        red = cls()
+        rng = np.random.default_rng(semilla)
+        red.agregar_deposito('R', carga_deposito)
+        for i in range(n_filas):
+            for j in range(n_columnas):
+                red.agregar_nodo(f'N{i}_{j}', 0.0, demanda)
+
+        diametros = diametro * (rng.choice([0.75, 1.0, 1.33], size=2 * n_filas * n_columnas)
+                                if semilla is not None else np.ones(2 * n_filas * n_columnas))
+        k = 0
+        for i in range(n_filas):
+            for j in range(n_columnas):
+                if j + 1 < n_columnas:
+                    red.agregar_tuberia(f'H{i}_{j}', f'N{i}_{j}', f'N{i}_{j + 1}',
+                                        separacion, diametros[k], rugosidad)
+                    k += 1
+                if i + 1 < n_filas:
+                    red.agregar_tuberia(f'V{i}_{j}', f'N{i}_{j}', f'N{i + 1}_{j}',
+                                        separacion, diametros[k], rugosidad)
+                    k += 1
+        caudal_total = demanda * n_filas * n_columnas
+        red.agregar_tuberia('P0', 'R', 'N0_0', separacion,
+                            max(diametro, np.sqrt(4 * caudal_total / (np.pi * 1.5))), rugosidad)
+        return red
+
+    # ------------------------------------------------------------------
+    # Compilación a arreglos
+    # ------------------------------------------------------------------
+
+    def compilar(self) -> None:
+        """Construye los arreglos por tipo de enlace y las matrices de incidencia."""
+        n_nodos, n_enlaces = len(self.nodos), len(self.enlaces)
+        if n_enlaces == 0:
+            raise ValueError("La red no tiene enlaces")
+
+        self.cota = np.array(self._cota)
+        self.demanda = np.array(self._demanda)
+        fijo = np.array([h is not None for h in self._carga_fija])
+        self.idx_fijos = np.flatnonzero(fijo)
+        self.idx_libres = np.flatnonzero(~fijo)
+        if len(self.idx_fijos) == 0:
+            raise ValueError("La red necesita al menos un depósito de carga fija")
+        self.carga_fija = np.array([self._carga_fija[i] for i in self.idx_fijos], dtype=float)
+
+        desde, hasta = np.array(self._desde), np.array(self._hasta)
+        tipo = np.array(self._tipo)
+        self.desde, self.hasta, self.tipo = desde, hasta, tipo
+
+        # A[l, n] = -1 en el nodo inicial y +1 en el final, separada en nodos
+        # libres (A12) y de carga fija (A10)
+        filas = np.repeat(np.arange(n_enlaces), 2)
+        columnas = np.column_stack([desde, hasta]).ravel()
+        valores = np.tile([-1.0, 1.0], n_enlaces)
+        A = sp.csc_matrix((valores, (filas, columnas)), shape=(n_enlaces, n_nodos))
+        self.A12 = A[:, self.idx_libres].tocsr()
+        self.A21 = self.A12.T.tocsr()
+        self.A10 = A[:, self.idx_fijos].tocsr()
+
+        # Toda unión debe estar conectada a algún depósito
+        adyacencia = sp.coo_matrix((np.ones(n_enlaces), (desde, hasta)), shape=(n_nodos, n_nodos))
+        _, etiquetas = connected_components(adyacencia, directed=False)
+        sin_fuente = ~np.isin(etiquetas, etiquetas[self.idx_fijos])
+        if np.any(sin_fuente):
+            aislados = [self.nodos[i] for i in np.flatnonzero(sin_fuente)[:5]]
+            raise ValueError(f"Nodos sin conexión a un depósito: {aislados}")
+
+        # Tanques, como posiciones dentro de los nodos de carga fija
+        self.tanques = [self.nodos[i] for i in self._tanques]
+        self._pos_tanque = np.searchsorted(self.idx_fijos, list(self._tanques))
+        self._area_tanque = np.array([t['area'] for t in self._tanques.values()])
+        self._limites_tanque = np.array([[t['nivel_min'], t['nivel_max']]
+                                         for t in self._tanques.values()]).reshape(-1, 2)
+
+        self._abierta = np.array([d.get('abierta', True) for d in self._datos])
+        # Sentido de flujo bloqueado por enlace (+1 positivo, -1 negativo, 0
+        # ninguno); lo fija simular_periodo en los tanques llenos o vacíos
+        self._bloqueo = np.zeros(n_enlaces)
+
+        # Tuberías
+        self._idx_tuberia = np.flatnonzero(tipo == TUBERIA)
+        datos = [self._datos[i] for i in self._idx_tuberia]
+        self.diametro_tuberia = np.array([d['diametro'] for d in datos])
+        self.longitud_tuberia = np.array([d['longitud'] for d in datos])
+        self.rugosidad_relativa = np.array([d['rugosidad'] for d in datos]) / self.diametro_tuberia
+        area = np.pi * self.diametro_tuberia**2 / 4
+        self._area_tuberia = area
+        self._c_friccion = self.longitud_tuberia / (self.diametro_tuberia * 2 * G * area**2)
+        self._c_menores = np.array([d['km'] for d in datos]) / (2 * G * area**2)
+        self._c_reynolds = self.diametro_tuberia / (self.nu * area)
+        self._d_laminar = 32 * self.nu * self.longitud_tuberia / (G * self.diametro_tuberia**2 * area)
+
+        # Bombas: coeficientes en orden ascendente, rellenos al mayor grado
+        self._idx_bomba = np.flatnonzero(tipo == BOMBA)
+        curvas = [self._datos[i]['curva'][::-1] for i in self._idx_bomba]
+        grado = max((len(c) for c in curvas), default=1)
+        self._curvas = np.zeros((len(curvas), grado))
+        for k, c in enumerate(curvas):
+            self._curvas[k, :len(c)] = c
+        self._velocidad = np.array([self._datos[i]['velocidad'] for i in self._idx_bomba], dtype=float)
+
+        # Válvulas
+        self._idx_valvula = np.flatnonzero(tipo == VALVULA)
+        datos = [self._datos[i] for i in self._idx_valvula]
+        area = np.pi * np.array([d['diametro'] for d in datos], dtype=float)**2 / 4
+        self._c_valvula = np.array([d['coeficiente'] for d in datos], dtype=float) / (2 * G * area**2)
+        self._retencion = np.array([d['retencion'] for d in datos], dtype=bool)
+
+        self._preparar_sistema()
+        self._compilada = True
+
+    def _preparar_sistema(self) -> None:
+        """
+        Análisis simbólico de A = A21 diag(w) A12, hecho una sola vez.
+
+        La topología no cambia entre iteraciones ni entre pasos de tiempo, así
+        que se precalculan: la matriz M que lleva los pesos w de los enlaces a
+        los valores de A en formato CSC (A.data = M @ w) y un orden de
+        eliminación de mínimo grado, ya aplicado a la numeración de nodos.
+        Cada factorización posterior sólo repite la fase numérica con
+        permc_spec='NATURAL'.
+        """
+        n = len(self.idx_libres)
+        coo = self.A12.tocoo()
+        enlace, nodo, signo = coo.row, coo.col, coo.data
+
+        # Diagonal: cada extremo libre de un enlace aporta +w
+        filas, columnas, valores, fuente = [nodo], [nodo], [signo * signo], [enlace]
+        # Fuera de la diagonal: enlaces con ambos extremos libres aportan -w
+        orden = np.argsort(enlace, kind='stable')
+        e, c, v = enlace[orden], nodo[orden], signo[orden]
+        doble = np.flatnonzero(e[1:] == e[:-1])
+        for a, b in ((doble, doble + 1), (doble + 1, doble)):
+            filas.append(c[a])
+            columnas.append(c[b])
+            valores.append(v[a] * v[b])
+            fuente.append(e[a])
+        filas, columnas = np.concatenate(filas), np.concatenate(columnas)
+        valores, fuente = np.concatenate(valores), np.concatenate(fuente)
+
+        # Orden de mínimo grado calculado una vez sobre el patrón
+        if n:
+            patron = sp.csc_matrix((np.abs(valores) + (filas == columnas) * 1.0,
+                                    (filas, columnas)), shape=(n, n))
+            lu = splu(patron, permc_spec='MMD_AT_PLUS_A', diag_pivot_thresh=0.0,
+                      options=dict(SymmetricMode=True))
+            self._orden = np.argsort(lu.perm_c)
+        else:
+            self._orden = np.arange(0)
+        rango = np.argsort(self._orden)
+        filas, columnas = rango[filas], rango[columnas]
+
+        claves = columnas.astype(np.int64) * n + filas
+        unicas, posicion = np.unique(claves, return_inverse=True)
+        self._indices_A = (unicas % max(n, 1)).astype(np.int32)
+        self._indptr_A = np.searchsorted(unicas // max(n, 1), np.arange(n + 1)).astype(np.int32)
+        self._ensamblaje = sp.csr_matrix((valores, (posicion, fuente)),
+                                         shape=(len(unicas), len(self.enlaces)))
+
+    def _resolver_cargas(self, w: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Resuelve (A21 diag(w) A12) H = b reutilizando el análisis simbólico."""
+        n = len(b)
+        if n == 0:
+            return np.zeros(0)
+        A = sp.csc_matrix((self._ensamblaje @ w, self._indices_A, self._indptr_A), shape=(n, n))
+        lu = splu(A, permc_spec='NATURAL', diag_pivot_thresh=0.0,
+                  options=dict(SymmetricMode=True))
+        H = np.empty(n)
+        H[self._orden] = lu.solve(b[self._orden])
+        return H
+
+    # ------------------------------------------------------------------
+    # Pérdidas de carga por enlace
+    # ------------------------------------------------------------------
+
+    def altura_bombas(self, caudal, velocidad=None):
+        """
+        Altura de las bombas con las leyes de afinidad H(Q, s) = s² H₁(Q/s).
+
+        Args:
+            caudal: Caudal de cada bomba (n_bombas,) en m³/s
+            velocidad: Velocidades relativas (n_bombas,); por defecto las actuales
+
+        Returns:
+            Tuple (H, dH/dQ)
+        """
+        s = self._velocidad if velocidad is None else np.asarray(velocidad, dtype=float)
+        grados = np.arange(self._curvas.shape[1])
+        c = self._curvas * s[:, None]**(2 - grados)   # coeficientes escalados
+        Q = np.asarray(caudal, dtype=float)
+        H = np.zeros_like(Q)
+        dH = np.zeros_like(Q)
+        for k in range(c.shape[1] - 1, -1, -1):        # Horner vectorizado
+            dH = dH * Q + H
+            H = H * Q + c[:, k]
+        return H, dH
+
+    def perdidas(self, caudal):
+        """
+        Pérdida de carga h(Q) y su derivada dh/dQ en todos los enlaces.
+
+        Args:
+            caudal: Caudales (n_enlaces,) en m³/s
+
+        Returns:
+            Tuple (h, dh/dQ) con dh/dQ >= RQTOL
+        """
+        Q = np.asarray(caudal, dtype=float)
+        h = np.empty_like(Q)
+        d = np.empty_like(Q)
+
+        # Tuberías: h = (f L/D + K) Q|Q| / (2 g A²)
+        i = self._idx_tuberia
+        if len(i):
+            q = Q[i]
+            aq = np.abs(q)
+            Re = aq * self._c_reynolds
+            if self.metodo_friccion == 'colebrook':
+                f, df = factor_friccion(Re, self.rugosidad_relativa, derivada=True)
+            else:
+                f, df = factor_friccion(Re, self.rugosidad_relativa, self.metodo_friccion), 0.0
+            h[i] = (self._c_friccion * f + self._c_menores) * q * aq
+            d[i] = np.maximum(self._c_friccion * aq * (2 * f + Re * df)
+                              + 2 * self._c_menores * aq, self._d_laminar)
+
+        # Bombas: h = -H(Q) con flujo directo; resistencia de cierre en reversa
+        i = self._idx_bomba
+        if len(i):
+            q = Q[i]
+            H, dH = self.altura_bombas(np.maximum(q, 0.0))
+            activa = self._velocidad > 0
+            inversa = (q < 0) | ~activa
+            h[i] = np.where(inversa, -np.where(activa, H, 0.0) + R_CERRADO * q, -H)
+            d[i] = np.where(inversa, R_CERRADO, -dH)
+
+        # Válvulas: h = K V²/2g, con retención opcional
+        i = self._idx_valvula
+        if len(i):
+            q = Q[i]
+            h[i] = self._c_valvula * q * np.abs(q)
+            d[i] = 2 * self._c_valvula * np.abs(q)
+            cerrada = self._retencion & (q < 0)
+            h[i] = np.where(cerrada, R_CERRADO * q, h[i])
+            d[i] = np.where(cerrada, R_CERRADO, d[i])
+
+        # Enlaces cerrados, y en el sentido bloqueado los que llenan un tanque
+        # lleno o vacían uno vacío (como una válvula de retención)
+        cerrados = ~self._abierta | (self._bloqueo * Q > 0)
+        h[cerrados] = R_CERRADO * Q[cerrados]
+        d[cerrados] = R_CERRADO
+        return h, np.maximum(d, RQTOL)
+
+    def caudales_iniciales(self) -> np.ndarray:
+        """Caudales de arranque: 1 m/s en tuberías y válvulas, mitad de descarga libre en bombas."""
+        Q = np.zeros(len(self.enlaces))
+        Q[self._idx_tuberia] = self._area_tuberia
+        for k, i in enumerate(self._idx_bomba):
+            q0 = self._datos[i]['caudal_inicial']
+            if q0 is None:
+                raices = np.roots(self._curvas[k, ::-1]) if self._curvas.shape[1] > 1 else []
+                positivas = [r.real for r in np.atleast_1d(raices)
+                             if abs(r.imag) < 1e-12 and r.real > 0]
+                q0 = 0.5 * max(self._velocidad[k], 0.0) * min(positivas) if positivas else 1e-3
+            Q[i] = q0
+        for i in self._idx_valvula:
+            Q[i] = np.pi * self._datos[i]['diametro']**2 / 4
+        Q[~self._abierta] = 0.0
+        return Q
+
+    # ------------------------------------------------------------------
+    # Solución
+    # ------------------------------------------------------------------
+
+    def resolver(self, caudal_inicial=None, tol: float = 1e-6,
+                 max_iter: int = 50) -> Dict[str, np.ndarray]:
+        """
+        Resuelve el estado permanente con el Algoritmo de Gradiente Global.
+
+        Cada iteración de Newton arma A = A21 D⁻¹ A12 (simétrica definida
+        positiva, con la dispersión del grafo de la red), obtiene las cargas
+        con una factorización dispersa y corrige los caudales enlace a enlace:
+
+            A H = A21 (Q - D⁻¹ (h(Q) + A10 H0)) - q
+            Q  ← Q - D⁻¹ (h(Q) + A10 H0 + A12 H)
+
+        Args:
+            caudal_inicial: Caudales de arranque (n_enlaces,); por defecto
+                caudales_iniciales()
+            tol: Tolerancia relativa sum|ΔQ| / sum|Q|
+            max_iter: Iteraciones máximas de Newton
+
+        Returns:
+            Dict con nodos, enlaces, caudales, cargas y presiones (todos los
+            nodos), perdidas, velocidades (NaN en bombas), altura_bombas,
+            iteraciones, error y convergencia
+        """
+        if not self._compilada:
+            self.compilar()
+
+        Q = self.caudales_iniciales() if caudal_inicial is None else \
+            np.array(caudal_inicial, dtype=float)
+        Q, H, iteraciones, error = self._newton(Q, self.demanda[self.idx_libres],
+                                                self.carga_fija, tol, max_iter)
+        return self._resultados(Q, H, iteraciones, error, error <= tol)
+
+    def _newton(self, Q: np.ndarray, q: np.ndarray, carga_fija: np.ndarray,
+                tol: float, max_iter: int) -> Tuple[np.ndarray, np.ndarray, int, float]:
+        """Iteraciones de Newton del gradiente global desde los caudales Q."""
+        fuente = self.A10 @ carga_fija
+        error = np.inf
+        iteraciones = 0
+        for iteraciones in range(1, max_iter + 1):
+            h, d = self.perdidas(Q)
+            r = h + fuente
+            H = self._resolver_cargas(1 / d, self.A21 @ (Q - r / d) - q)
+            dQ = (r + self.A12 @ H) / d
+            Q = Q - dQ
+            error = np.sum(np.abs(dQ)) / max(np.sum(np.abs(Q)), 1e-12)
+            if error <= tol:
+                break
+        return Q, H, iteraciones, error
+
+    def simular_periodo(self, duracion: float, paso: float, patron=None,
+                        paso_patron: float = 3600.0, tol: float = 1e-6,
+                        max_iter: int = 50, guardar_cada: int = 1) -> Dict[str, np.ndarray]:
+        """
+        Simulación de periodo extendido (p. ej. 24 h) con tanques variables.
+
+        En cada paso se resuelve el estado permanente con las demandas del
+        patrón y los niveles actuales, arrancando Newton con los caudales del
+        paso anterior (normalmente 1-2 factorizaciones por paso), y los
+        niveles se integran con Euler explícito: dz/dt = Q_entrada / A_tanque.
+        Un tanque en nivel_max cierra sus enlaces en el sentido de llenado y
+        uno en nivel_min en el sentido de vaciado (siguen abiertos en el
+        sentido contrario), de modo que los caudales reportados con el tanque
+        lleno o vacío respetan su capacidad.
+
+        Args:
+            duracion: Tiempo total simulado (s)
+            paso: Paso hidráulico (s)
+            patron: Multiplicadores de demanda por periodo, (n_periodos,) para
+                toda la red o (n_periodos, n_nodos); se repite cíclicamente
+            paso_patron: Duración de cada periodo del patrón (s)
+            tol, max_iter: Criterio de convergencia de cada solución
+            guardar_cada: Guarda uno de cada guardar_cada pasos
+
+        Returns:
+            Dict con tiempos, caudales (n_guardados, n_enlaces), cargas y
+            presiones (n_guardados, n_nodos), niveles (n_guardados, n_tanques),
+            tanques, iteraciones (por paso) y convergencia
+        """
+        if not self._compilada:
+            self.compilar()
+
+        n_pasos = int(round(duracion / paso)) + 1
+        base = self.demanda[self.idx_libres]
+        patron = np.ones(1) if patron is None else np.asarray(patron, dtype=float)
+        if patron.ndim == 2:
+            patron = patron[:, self.idx_libres]
+
+        carga_fija = self.carga_fija.copy()
+        cota_tanque = self.cota[self.idx_fijos[self._pos_tanque]]
+        niveles = carga_fija[self._pos_tanque] - cota_tanque
+        A10_tanques = self.A10[:, self._pos_tanque].T.tocsr()
+
+        guardados = range(0, n_pasos, guardar_cada)
+        res = {
+            'tiempos': np.array(guardados, dtype=float) * paso,
+            'caudales': np.empty((len(guardados), len(self.enlaces))),
+            'cargas': np.empty((len(guardados), len(self.nodos))),
+            'niveles': np.empty((len(guardados), len(self._pos_tanque))),
+            'iteraciones': np.zeros(n_pasos, dtype=int),
+        }
+        convergencia = True
+        Q = self.caudales_iniciales()
+        try:
+            for k in range(n_pasos):
+                t = k * paso
+                q = base * patron[int(t // paso_patron) % len(patron)]
+                carga_fija[self._pos_tanque] = cota_tanque + niveles
+                lleno = niveles >= self._limites_tanque[:, 1]
+                vacio = niveles <= self._limites_tanque[:, 0]
+                self._bloqueo = A10_tanques.T @ (lleno.astype(float) - vacio)
+                Q, H, res['iteraciones'][k], error = self._newton(Q, q, carga_fija, tol, max_iter)
+                convergencia &= error <= tol
+
+                if k % guardar_cada == 0:
+                    j = k // guardar_cada
+                    res['caudales'][j] = Q
+                    res['cargas'][j, self.idx_libres] = H
+                    res['cargas'][j, self.idx_fijos] = carga_fija
+                    res['niveles'][j] = niveles
+
+                entrada = A10_tanques @ Q
+                niveles = np.clip(niveles + entrada * paso / self._area_tanque,
+                                  self._limites_tanque[:, 0], self._limites_tanque[:, 1])
+        finally:
+            self._bloqueo = np.zeros(len(self.enlaces))
+
+        res['presiones'] = res['cargas'] - self.cota
+        res['tanques'] = self.tanques
+        res['convergencia'] = bool(convergencia)
+        return res
+
+    def _resultados(self, Q, H_libres, iteraciones, error, convergencia) -> Dict[str, np.ndarray]:
+        H = np.empty(len(self.nodos))
+        H[self.idx_libres] = H_libres
+        H[self.idx_fijos] = self.carga_fija
+        velocidades = np.full(len(Q), np.nan)
+        velocidades[self._idx_tuberia] = Q[self._idx_tuberia] / self._area_tuberia
+        altura_bombas = self.altura_bombas(np.maximum(Q[self._idx_bomba], 0.0))[0] \
+            if len(self._idx_bomba) else np.zeros(0)
+        return {
+            'nodos': self.nodos,
+            'enlaces': self.enlaces,
+            'caudales': Q,
+            'cargas': H,
+            'presiones': H - self.cota,
+            'perdidas': H[self.desde] - H[self.hasta],
+            'velocidades': velocidades,
+            'altura_bombas': altura_bombas,
+            'iteraciones': iteraciones,
+            'error': error,
+            'convergencia': bool(convergencia),
+        }
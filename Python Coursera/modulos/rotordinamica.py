@@ -0,0 +1,364 @@
+# =============================================================================
+# MÓDULO DE ROTODINÁMICA - VELOCIDADES CRÍTICAS Y DIAGRAMA DE CAMPBELL
+# =============================================================================
+# Propósito: Modelo de rotor por elementos viga (eje, discos y cojinetes con
+#            rigidez dependiente de la velocidad) y barrido de velocidades con
+#            seguimiento de modos para construir el diagrama de Campbell
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+
+import numpy as np
+from scipy import linalg
+from typing import Callable, Dict, List, Union
+
+# Un coeficiente de cojinete puede ser constante o función de omega (rad/s)
+Coeficiente = Union[float, Callable[[float], float]]
+
+GDL_POR_NODO = 4  # [u, du/dz, v, dv/dz]
+
+
+def _evaluar(coeficiente: Coeficiente, omega: float) -> float:
+    """Evalúa un coeficiente constante o dependiente de la velocidad."""
+    return float(coeficiente(omega)) if callable(coeficiente) else float(coeficiente)
+
+
+class ModeloRotor:
+    """
+    Modelo de rotor flexible con elementos viga de Euler-Bernoulli.
+
+    Cada nodo tiene 4 grados de libertad: desplazamientos u (x), v (y) y sus
+    pendientes du/dz, dv/dz. Los discos aportan masa, inercia diametral y el
+    efecto giroscópico (momento polar); los cojinetes aportan rigidez y
+    amortiguamiento directos que pueden depender de la velocidad de giro.
+    """
+
+    def __init__(self, nodos_z: List[float], diametros: List[float],
+                 E: float = 210e9, rho: float = 7850.0):
+        """
+        Inicializa el eje del rotor.
+
+        Args:
+            nodos_z: Posiciones axiales de los nodos (m), crecientes
+            diametros: Diámetro exterior de cada elemento (m), len(nodos_z) - 1
+            E: Módulo de elasticidad del eje (Pa)
+            rho: Densidad del eje (kg/m³)
+        """
+        self.nodos_z = np.asarray(nodos_z, dtype=float)
+        self.diametros = np.broadcast_to(np.asarray(diametros, dtype=float),
+                                         (len(self.nodos_z) - 1,)).copy()
+        if np.any(np.diff(self.nodos_z) <= 0):
+            raise ValueError("Las posiciones de los nodos deben ser crecientes")
+        self.E = E
+        self.rho = rho
+        self.discos = []
+        self.cojinetes = []
+
+        self.n_gdl = GDL_POR_NODO * len(self.nodos_z)
+        self._M, self._K_eje = self._ensamblar_eje()
+        self._G = np.zeros((self.n_gdl, self.n_gdl))
+
+    @classmethod
+    def rotor_simple(cls, masa_disco: float, radio_disco: float, longitud: float,
+                     diametro_eje: float, k_cojinete: Coeficiente, c_cojinete: Coeficiente = 0.0,
+                     n_elementos: int = 8) -> "ModeloRotor":
+        """
+        Construye un rotor tipo Jeffcott: disco centrado entre dos cojinetes.
+
+        Args:
+            masa_disco: Masa del disco (kg)
+            radio_disco: Radio del disco (m)
+            longitud: Distancia entre cojinetes (m)
+            diametro_eje: Diámetro del eje (m)
+            k_cojinete: Rigidez de cada cojinete (N/m) o función de omega
+            c_cojinete: Amortiguamiento de cada cojinete (N·s/m) o función de omega
+            n_elementos: Número de elementos del eje (par)
+
+        Returns:
+            ModeloRotor listo para el análisis
+        """
+        n_elementos += n_elementos % 2
+        rotor = cls(np.linspace(0, longitud, n_elementos + 1), diametro_eje)
+        Ip = 0.5 * masa_disco * radio_disco**2
+        rotor.agregar_disco(n_elementos // 2, masa_disco, Ip, Ip / 2)
+        for nodo in (0, n_elementos):
+            rotor.agregar_cojinete(nodo, k_cojinete, k_cojinete, c_cojinete, c_cojinete)
+        return rotor
+
+    def _ensamblar_eje(self):
+        """Ensambla las matrices de masa consistente y rigidez del eje."""
+        M = np.zeros((self.n_gdl, self.n_gdl))
+        K = np.zeros((self.n_gdl, self.n_gdl))
+
+        for e, (l, d) in enumerate(zip(np.diff(self.nodos_z), self.diametros)):
+            A = np.pi * d**2 / 4
+            I = np.pi * d**4 / 64
+
+            k_e = self.E * I / l**3 * np.array([
+                [12, 6*l, -12, 6*l],
+                [6*l, 4*l**2, -6*l, 2*l**2],
+                [-12, -6*l, 12, -6*l],
+                [6*l, 2*l**2, -6*l, 4*l**2]])
+            m_e = self.rho * A * l / 420 * np.array([
+                [156, 22*l, 54, -13*l],
+                [22*l, 4*l**2, 13*l, -3*l**2],
+                [54, 13*l, 156, -22*l],
+                [-13*l, -3*l**2, -22*l, 4*l**2]])
+
+            # Mismas matrices en los planos XZ (u, du/dz) e YZ (v, dv/dz)
+            base = GDL_POR_NODO * e
+            for desfase in (0, 2):
+                gdl = base + desfase + np.array([0, 1, 4, 5])
+                K[np.ix_(gdl, gdl)] += k_e
+                M[np.ix_(gdl, gdl)] += m_e
+
+        return M, K
+
+    def agregar_disco(self, nodo: int, masa: float, Ip: float, Id: float) -> None:
+        """
+        Agrega un disco rígido en un nodo.
+
+        Args:
+            nodo: Índice del nodo
+            masa: Masa del disco (kg)
+            Ip: Momento polar de inercia (kg·m²)
+            Id: Momento diametral de inercia (kg·m²)
+        """
+        u, bu, v, bv = GDL_POR_NODO * nodo + np.arange(4)
+        self._M[u, u] += masa
+        self._M[v, v] += masa
+        self._M[bu, bu] += Id
+        self._M[bv, bv] += Id
+        self._G[bu, bv] += Ip
+        self._G[bv, bu] -= Ip
+        self.discos.append({'nodo': nodo, 'masa': masa, 'Ip': Ip, 'Id': Id})
+
+    def agregar_cojinete(self, nodo: int, kxx: Coeficiente, kyy: Coeficiente,
+                         cxx: Coeficiente = 0.0, cyy: Coeficiente = 0.0) -> None:
+        """
+        Agrega un cojinete en un nodo.
+
+        Los coeficientes pueden ser valores fijos o funciones f(omega) con
+        omega en rad/s, para representar cojinetes hidrodinámicos cuya rigidez
+        cambia con la velocidad.
+        """
+        self.cojinetes.append({'nodo': nodo, 'kxx': kxx, 'kyy': kyy,
+                               'cxx': cxx, 'cyy': cyy})
+
+    def matrices(self, omega: float):
+        """
+        Calcula las matrices globales a una velocidad de giro.
+
+        Args:
+            omega: Velocidad de giro (rad/s)
+
+        Returns:
+            Tuple (M, C, K) donde C ya incluye el término giroscópico omega·G
+        """
+        K = self._K_eje.copy()
+        C = omega * self._G
+        for cojinete in self.cojinetes:
+            u = GDL_POR_NODO * cojinete['nodo']
+            v = u + 2
+            K[u, u] += _evaluar(cojinete['kxx'], omega)
+            K[v, v] += _evaluar(cojinete['kyy'], omega)
+            C[u, u] += _evaluar(cojinete['cxx'], omega)
+            C[v, v] += _evaluar(cojinete['cyy'], omega)
+        return self._M, C, K
+
+    def matriz_estado(self, omega: float) -> np.ndarray:
+        """Matriz de estado A de primer orden: x' = A x con x = [q, q']."""
+        M, C, K = self.matrices(omega)
+        n = self.n_gdl
+        M_fact = linalg.cho_factor(M)
+        A = np.zeros((2*n, 2*n))
+        A[:n, n:] = np.eye(n)
+        A[n:, :n] = -linalg.cho_solve(M_fact, K)
+        A[n:, n:] = -linalg.cho_solve(M_fact, C)
+        return A
+
+    def valores_propios(self, omega: float, n_modos: int = 6):
+        """
+        Resuelve el problema de valores propios completo a una velocidad.
+
+        Returns:
+            Tuple (lambdas, vectores) de los n_modos de menor frecuencia con
+            parte imaginaria positiva, ordenados por frecuencia
+        """
+        lambdas, vectores = linalg.eig(self.matriz_estado(omega))
+        oscilatorios = np.where(lambdas.imag > 1e-6)[0]
+        orden = oscilatorios[np.argsort(lambdas.imag[oscilatorios])][:n_modos]
+        return lambdas[orden], vectores[:, orden]
+
+    def _precesion(self, vectores: np.ndarray) -> np.ndarray:
+        """Sentido de precesión de cada modo: +1 directa, -1 inversa."""
+        n = self.n_gdl
+        U = vectores[0:n:GDL_POR_NODO]
+        V = vectores[2:n:GDL_POR_NODO]
+        return np.where(np.sum(np.imag(U * np.conj(V)), axis=0) >= 0, 1, -1)
+
+    def diagrama_campbell(self, velocidades_rpm, n_modos: int = 6,
+                          tolerancia: float = 1e-8, max_iter: int = 8) -> Dict:
+        """
+        Barrido de velocidades con seguimiento de modos.
+
+        En la primera velocidad se resuelve el problema completo; en las
+        siguientes cada modo se refina por iteración inversa desplazada usando
+        el valor y vector propio de la velocidad anterior como punto de
+        partida, con una sola factorización LU por modo y velocidad. Si algún
+        modo no converge se recurre al problema completo en ese punto.
+
+        Args:
+            velocidades_rpm: Velocidades de giro (rpm)
+            n_modos: Número de modos a seguir
+            tolerancia: Residuo relativo ||A x - λ x|| / |λ| admisible
+            max_iter: Iteraciones inversas por modo antes de recurrir a eig
+
+        Returns:
+            Dict con velocidades_rpm, frecuencias_hz (n_vel, n_modos),
+            amortiguamiento (razón ζ), precesion (+1/-1) y
+            soluciones_completas (número de puntos resueltos con eig)
+        """
+        velocidades_rpm = np.asarray(velocidades_rpm, dtype=float)
+        omegas = velocidades_rpm * 2*np.pi / 60
+        n_vel = len(omegas)
+
+        lambdas_hist = np.zeros((n_vel, n_modos), dtype=complex)
+        precesion = np.zeros((n_vel, n_modos), dtype=int)
+        soluciones_completas = 0
+        lambdas, vectores = None, None
+
+        for i, omega in enumerate(omegas):
+            A = self.matriz_estado(omega)
+            if lambdas is not None:
+                nuevos = self._seguir_modos(A, lambdas, vectores, tolerancia, max_iter)
+            if lambdas is None or nuevos is None:
+                lambdas, vectores = self.valores_propios(omega, n_modos)
+                soluciones_completas += 1
+                if len(lambdas) < n_modos:
+                    raise ValueError("El modelo tiene menos modos oscilatorios que n_modos")
+            else:
+                lambdas, vectores = nuevos
+            lambdas_hist[i] = lambdas
+            precesion[i] = self._precesion(vectores)
+
+        return {
+            'velocidades_rpm': velocidades_rpm,
+            'frecuencias_hz': lambdas_hist.imag / (2*np.pi),
+            'amortiguamiento': -lambdas_hist.real / np.abs(lambdas_hist),
+            'precesion': precesion,
+            'soluciones_completas': soluciones_completas,
+        }
+
+    @staticmethod
+    def _seguir_modos(A, lambdas, vectores, tolerancia, max_iter):
+        """
+        Iteración inversa desplazada a partir de los modos anteriores.
+
+        Los modos con valores propios casi coincidentes (p. ej. precesión
+        directa e inversa de un rotor simétrico) se refinan juntos como un
+        bloque con una sola factorización y una proyección de Rayleigh-Ritz,
+        para que no converjan al mismo vector.
+        """
+        identidad = np.eye(A.shape[0])
+        nuevos_l = np.empty_like(lambdas)
+        nuevos_v = np.empty_like(vectores)
+
+        pendientes = list(range(len(lambdas)))
+        while pendientes:
+            j = pendientes[0]
+            grupo = [k for k in pendientes
+                     if abs(lambdas[k] - lambdas[j]) <= 1e-6 * abs(lambdas[j])]
+            pendientes = [k for k in pendientes if k not in grupo]
+
+            # Desplazamiento mínimo para no factorizar una matriz singular
+            # cuando el modo no cambia con la velocidad
+            sigma = lambdas[j] * (1 + 1e-7)
+            lu = linalg.lu_factor(A - sigma * identidad, check_finite=False)
+            Q = np.linalg.qr(vectores[:, grupo])[0]
+            theta_anterior = None
+            for _ in range(max_iter):
+                Y = linalg.lu_solve(lu, Q, check_finite=False)
+                if not np.all(np.isfinite(Y)):
+                    return None
+                # Rayleigh-Ritz sobre el operador inverso (mejor condicionado)
+                mu, W = linalg.eig(Q.conj().T @ Y)
+                theta = sigma + 1 / mu
+                orden = np.argsort(theta.imag)
+                theta, W = theta[orden], W[:, orden]
+                if (theta_anterior is not None and
+                        np.all(np.abs(theta - theta_anterior) <= tolerancia * np.abs(theta))):
+                    break
+                theta_anterior = theta
+                Q = np.linalg.qr(Y)[0]
+            else:
+                return None
+            X = Y @ W
+            nuevos_l[grupo] = theta
+            nuevos_v[:, grupo] = X / np.linalg.norm(X, axis=0)
+
+        # Dos modos que convergen al mismo vector indican pérdida del seguimiento
+        mac = np.abs(nuevos_v.conj().T @ nuevos_v)
+        np.fill_diagonal(mac, 0)
+        if np.any(mac > 0.999) or np.any(nuevos_l.imag <= 0):
+            return None
+        return nuevos_l, nuevos_v
+
+    @staticmethod
+    def velocidades_criticas(campbell: Dict, orden: float = 1.0) -> List[Dict]:
+        """
+        Intersecciones de las curvas de Campbell con la línea de excitación.
+
+        Args:
+            campbell: Resultado de diagrama_campbell
+            orden: Orden de la excitación (1 = desbalance 1X)
+
+        Returns:
+            Lista de dicts con modo, velocidad_rpm y precesion
+        """
+        rpm = campbell['velocidades_rpm']
+        diferencia = campbell['frecuencias_hz'] - orden * rpm[:, None] / 60
+        criticas = []
+        for modo in range(diferencia.shape[1]):
+            d = diferencia[:, modo]
+            for i in np.where(np.sign(d[:-1]) * np.sign(d[1:]) < 0)[0]:
+                fraccion = d[i] / (d[i] - d[i + 1])
+                criticas.append({
+                    'modo': modo,
+                    'velocidad_rpm': rpm[i] + fraccion * (rpm[i + 1] - rpm[i]),
+                    'precesion': 'directa' if campbell['precesion'][i, modo] > 0 else 'inversa',
+                })
+        return sorted(criticas, key=lambda c: c['velocidad_rpm'])
+
+
+def graficar_campbell(campbell: Dict, ordenes=(1.0,), ax=None):
+    """
+    Grafica el diagrama de Campbell con las líneas de excitación.
+
+    Args:
+        campbell: Resultado de ModeloRotor.diagrama_campbell
+        ordenes: Órdenes de excitación a dibujar
+        ax: Ejes de matplotlib (opcional)
+
+    Returns:
+        Ejes de matplotlib con el diagrama
+    """
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        _, ax = plt.subplots(figsize=(8, 6))
+
+    rpm = campbell['velocidades_rpm']
+    for modo in range(campbell['frecuencias_hz'].shape[1]):
+        estilo = '-' if campbell['precesion'][-1, modo] > 0 else '--'
+        ax.plot(rpm, campbell['frecuencias_hz'][:, modo], estilo, linewidth=2,
+                label=f'Modo {modo + 1}')
+    for orden in ordenes:
+        ax.plot(rpm, orden * rpm / 60, 'k:', linewidth=1, label=f'{orden:g}X')
+
+    ax.set_xlabel('Velocidad de giro (rpm)')
+    ax.set_ylabel('Frecuencia natural (Hz)')
+    ax.set_title('Diagrama de Campbell')
+    ax.legend()
+    ax.grid(True)
+    return ax
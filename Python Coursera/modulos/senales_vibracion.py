@@ -0,0 +1,347 @@
+# =============================================================================
+# MÓDULO DE PROCESAMIENTO DE SEÑALES DE VIBRACIÓN (MANTENIMIENTO PREDICTIVO)
+# =============================================================================
+# Propósito: Procesamiento por bloques de registros de acelerómetros (WAV, CSV
+#            o binario) mediante mapeo en memoria: espectro de Welch, espectro
+#            de envolvente, espectro de órdenes e indicadores de condición
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Ningún registro se carga completo en RAM: los archivos WAV y binarios se
+# abren con np.memmap y el CSV se lee por bloques de bytes con mmap. Todo el
+# cálculo se hace sobre bloques de tamaño fijo con solape.
+# =============================================================================
+
+import io
+import mmap
+import os
+import struct
+import numpy as np
+from typing import Callable, Dict, Iterator, Optional, Union
+
+# Formatos PCM soportados en WAV: (código de formato, bits) -> dtype
+_DTYPES_WAV = {
+    (1, 16): '<i2',
+    (1, 32): '<i4',
+    (3, 32): '<f4',
+    (3, 64): '<f8',
+}
+
+
+def frecuencias_rodamiento(n_elementos: int, d_elemento: float, d_paso: float,
+                           angulo_contacto: float = 0.0) -> Dict[str, float]:
+    """
+    Frecuencias de falla de un rodamiento en órdenes de la velocidad del eje.
+
+    Args:
+        n_elementos: Número de elementos rodantes
+        d_elemento: Diámetro del elemento rodante
+        d_paso: Diámetro primitivo (mismas unidades que d_elemento)
+        angulo_contacto: Ángulo de contacto (grados)
+
+    Returns:
+        Dict con BPFO, BPFI, BSF y FTF (multiplicar por rpm/60 para Hz)
+    """
+    r = d_elemento / d_paso * np.cos(np.deg2rad(angulo_contacto))
+    return {
+        'BPFO': n_elementos / 2 * (1 - r),
+        'BPFI': n_elementos / 2 * (1 + r),
+        'BSF': d_paso / (2 * d_elemento) * (1 - r**2),
+        'FTF': 0.5 * (1 - r),
+    }
+
+
+class FuenteSenal:
+    """
+    Fuente de una señal de vibración leída por bloques.
+
+    Envuelve un arreglo (normalmente un np.memmap) o un lector incremental de
+    CSV y entrega bloques de tamaño fijo con solape, convertidos a float64
+    sólo al momento de procesarlos.
+    """
+
+    def __init__(self, datos=None, fs: float = 1.0, escala: float = 1.0,
+                 lector_csv: Optional[Callable[[], Iterator[np.ndarray]]] = None):
+        self.datos = datos
+        self.fs = float(fs)
+        self.escala = escala
+        self._lector_csv = lector_csv
+
+    @property
+    def n_muestras(self) -> Optional[int]:
+        """Número de muestras (None si la fuente es un CSV sin recorrer)."""
+        return None if self.datos is None else len(self.datos)
+
+    @classmethod
+    def desde_arreglo(cls, x, fs: float) -> "FuenteSenal":
+        """Fuente a partir de un arreglo ya en memoria."""
+        return cls(np.asarray(x), fs)
+
+    @classmethod
+    def desde_binario(cls, ruta: str, fs: float, dtype='<f4', n_canales: int = 1,
+                      canal: int = 0, offset: int = 0, escala: float = 1.0) -> "FuenteSenal":
+        """Fuente a partir de un archivo binario crudo con canales intercalados."""
+        dtype = np.dtype(dtype)
+        n = (os.path.getsize(ruta) - offset) // (dtype.itemsize * n_canales)
+        datos = np.memmap(ruta, dtype=dtype, mode='r', offset=offset, shape=(n, n_canales))
+        return cls(datos[:, canal], fs, escala)
+
+    @classmethod
+    def desde_wav(cls, ruta: str, canal: int = 0) -> "FuenteSenal":
+        """Fuente a partir de un WAV PCM 16/32 bits o flotante, sin leerlo completo."""
+        with open(ruta, 'rb') as f:
+            riff, _, wave = struct.unpack('<4sI4s', f.read(12))
+            if riff != b'RIFF' or wave != b'WAVE':
+                raise ValueError(f"{ruta} no es un archivo WAV")
+            formato = None
+            while True:
+                cabecera = f.read(8)
+                if len(cabecera) < 8:
+                    raise ValueError(f"{ruta} no contiene datos de audio")
+                nombre, tamano = struct.unpack('<4sI', cabecera)
+                if nombre == b'fmt ':
+                    fmt = f.read(tamano)
+                    codigo, n_canales, fs = struct.unpack('<HHI', fmt[:8])
+                    bits = struct.unpack('<H', fmt[14:16])[0]
+                    if codigo == 0xFFFE:  # WAVE_FORMAT_EXTENSIBLE
+                        codigo = struct.unpack('<H', fmt[24:26])[0]
+                    formato = (codigo, bits)
+                elif nombre == b'data':
+                    offset = f.tell()
+                    break
+                else:
+                    f.seek(tamano + tamano % 2, 1)
+
+        if formato not in _DTYPES_WAV:
+            raise ValueError(f"Formato WAV no soportado (código, bits) = {formato}")
+        dtype = np.dtype(_DTYPES_WAV[formato])
+        escala = 1.0 if formato[0] == 3 else 1.0 / np.iinfo(dtype).max
+        n = tamano // (dtype.itemsize * n_canales)
+        datos = np.memmap(ruta, dtype=dtype, mode='r', offset=offset, shape=(n, n_canales))
+        return cls(datos[:, canal], fs, escala)
+
+    @classmethod
+    def desde_csv(cls, ruta: str, fs: float, columna: int = 0, delimitador: str = ',',
+                  filas_encabezado: int = 0, bytes_bloque: int = 1 << 22) -> "FuenteSenal":
+        """
+        Fuente a partir de un CSV, leído por bloques de bytes con mmap.
+
+        Cada bloque se corta en el último salto de línea y sólo se convierte la
+        columna pedida, por lo que la memoria usada es del orden de bytes_bloque.
+        """
+        def lector():
+            with open(ruta, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                inicio = 0
+                for _ in range(filas_encabezado):
+                    inicio = m.find(b'\n', inicio) + 1
+                while inicio < len(m):
+                    fin = min(inicio + bytes_bloque, len(m))
+                    if fin < len(m):
+                        fin = m.rfind(b'\n', inicio, fin) + 1 or len(m)
+                    texto = m[inicio:fin].decode('utf-8')
+                    inicio = fin
+                    if texto.strip():
+                        yield np.loadtxt(io.StringIO(texto), delimiter=delimitador,
+                                         usecols=columna, ndmin=1)
+
+        return cls(None, fs, lector_csv=lector)
+
+    def bloques(self, tamano: int, paso: int) -> Iterator[np.ndarray]:
+        """
+        Genera bloques de 'tamano' muestras que avanzan 'paso' muestras.
+
+        El último tramo incompleto se descarta, como en el método de Welch.
+        """
+        if self.datos is not None:
+            for inicio in range(0, len(self.datos) - tamano + 1, paso):
+                yield np.asarray(self.datos[inicio:inicio + tamano], dtype=float) * self.escala
+            return
+
+        buffer = np.empty(0)
+        for trozo in self._lector_csv():
+            buffer = np.concatenate([buffer, trozo * self.escala])
+            while len(buffer) >= tamano:
+                yield buffer[:tamano].copy()
+                buffer = buffer[paso:]
+
+
+class ProcesadorVibracion:
+    """
+    Procesador por bloques de señales de vibración.
+
+    procesar() es un generador que entrega los indicadores de condición de
+    cada bloque a medida que se calculan; al terminar, resumen() devuelve los
+    espectros promediados y los indicadores globales del registro.
+    """
+
+    def __init__(self, fs: float, nperseg: int = 4096, solape: float = 0.5,
+                 banda_envolvente: Optional[tuple] = None,
+                 rpm: Union[None, float, Callable[[np.ndarray], np.ndarray]] = None,
+                 frecuencias_falla: Optional[Dict[str, float]] = None,
+                 orden_max: float = 20.0, resolucion_orden: float = 0.05,
+                 n_armonicos: int = 3, ancho_banda: float = 0.02):
+        """
+        Args:
+            fs: Frecuencia de muestreo (Hz)
+            nperseg: Muestras por bloque (potencia de 2 recomendada)
+            solape: Fracción de solape entre bloques (0 a <1)
+            banda_envolvente: (f_min, f_max) del filtro para la envolvente;
+                por defecto (fs/8, 0.4·fs)
+            rpm: Velocidad del eje, constante o función rpm(t) con t en s;
+                necesaria para el espectro de órdenes
+            frecuencias_falla: Frecuencias de falla en órdenes del eje, p. ej.
+                frecuencias_rodamiento(...); requieren rpm
+            orden_max: Orden máximo del espectro de órdenes
+            resolucion_orden: Paso del eje de órdenes
+            n_armonicos: Armónicos incluidos en cada banda de falla
+            ancho_banda: Semiancho relativo de cada banda de falla
+        """
+        if not 0 <= solape < 1:
+            raise ValueError("El solape debe estar en [0, 1)")
+        self.fs = float(fs)
+        self.nperseg = int(nperseg)
+        self.paso = max(1, int(round(self.nperseg * (1 - solape))))
+        self.banda_envolvente = banda_envolvente or (self.fs / 8, 0.4 * self.fs)
+        self.rpm = rpm
+        self.frecuencias_falla = frecuencias_falla or {}
+        self.n_armonicos = n_armonicos
+        self.ancho_banda = ancho_banda
+
+        self.ventana = np.hanning(self.nperseg)
+        self.escala_psd = 1.0 / (self.fs * np.sum(self.ventana**2))
+        self.frecuencias = np.fft.rfftfreq(self.nperseg, 1 / self.fs)
+        self.ordenes = np.arange(0, orden_max + resolucion_orden / 2, resolucion_orden)
+
+        f = np.fft.fftfreq(self.nperseg, 1 / self.fs)
+        f_min, f_max = self.banda_envolvente
+        # Filtro pasa banda y transformada de Hilbert en un solo paso espectral
+        self._mascara_analitica = np.where((f >= f_min) & (f <= f_max), 2.0, 0.0)
+
+        self._reiniciar()
+
+    def _reiniciar(self):
+        self.n_bloques = 0
+        self._psd = np.zeros_like(self.frecuencias)
+        self._env = np.zeros_like(self.frecuencias)
+        self._esp_ordenes = np.zeros_like(self.ordenes)
+        self._n_ordenes = 0
+        self._momentos = np.zeros(5)  # n, S1..S4 de las muestras nuevas
+        self._pico = 0.0
+
+    def _densidad(self, x: np.ndarray) -> np.ndarray:
+        """Densidad espectral unilateral de un bloque con ventana de Hann."""
+        X = np.fft.rfft(self.ventana * x)
+        psd = np.abs(X)**2 * self.escala_psd
+        psd[1:-1 if self.nperseg % 2 == 0 else None] *= 2
+        return psd
+
+    def _envolvente(self, x: np.ndarray) -> np.ndarray:
+        analitica = np.fft.ifft(np.fft.fft(x) * self._mascara_analitica)
+        env = np.abs(analitica)
+        return env - env.mean()
+
+    def _espectro_ordenes(self, x: np.ndarray, t0: float) -> Optional[np.ndarray]:
+        """Remuestreo del bloque a ángulo constante y espectro en órdenes."""
+        t = t0 + np.arange(self.nperseg) / self.fs
+        rpm = self.rpm(t) if callable(self.rpm) else np.full_like(t, float(self.rpm))
+        revoluciones = np.concatenate([[0.0], np.cumsum((rpm[1:] + rpm[:-1]) / 2) / 60 / self.fs])
+        if revoluciones[-1] <= 0:
+            return None
+        angulo_uniforme = np.linspace(0, revoluciones[-1], self.nperseg, endpoint=False)
+        x_ang = np.interp(angulo_uniforme, revoluciones, x)
+        espectro = np.abs(np.fft.rfft(self.ventana * x_ang)) * 2 / np.sum(self.ventana)
+        ordenes = np.fft.rfftfreq(self.nperseg, revoluciones[-1] / self.nperseg)
+        return np.interp(self.ordenes, ordenes, espectro, right=0.0)
+
+    def _energia_bandas(self, env_psd: np.ndarray, rpm_medio: float) -> Dict[str, float]:
+        bandas = {}
+        for nombre, orden in self.frecuencias_falla.items():
+            f0 = orden * rpm_medio / 60
+            mascara = np.zeros(len(self.frecuencias), dtype=bool)
+            for k in range(1, self.n_armonicos + 1):
+                mascara |= np.abs(self.frecuencias - k * f0) <= self.ancho_banda * k * f0
+            bandas[nombre] = float(np.sum(env_psd[mascara]) * self.fs / self.nperseg)
+        return bandas
+
+    def procesar(self, fuente: FuenteSenal) -> Iterator[Dict]:
+        """
+        Procesa la fuente bloque a bloque.
+
+        Yields:
+            Dict por bloque con t_inicio, rms, curtosis, pico, factor_cresta y
+            bandas (energía de envolvente en cada banda de falla)
+        """
+        if abs(fuente.fs - self.fs) > 1e-9 * self.fs:
+            raise ValueError("La frecuencia de muestreo de la fuente no coincide")
+        self._reiniciar()
+
+        for i, x in enumerate(fuente.bloques(self.nperseg, self.paso)):
+            t0 = i * self.paso / self.fs
+
+            # Momentos globales sólo con las muestras nuevas de cada bloque
+            nuevas = x if i == 0 else x[self.nperseg - self.paso:]
+            self._momentos += [len(nuevas), nuevas.sum(), (nuevas**2).sum(),
+                               (nuevas**3).sum(), (nuevas**4).sum()]
+            self._pico = max(self._pico, float(np.max(np.abs(nuevas))))
+
+            self._psd += self._densidad(x)
+            env_psd = self._densidad(self._envolvente(x))
+            self._env += env_psd
+
+            rpm_medio = None
+            if self.rpm is not None:
+                esp = self._espectro_ordenes(x, t0)
+                if esp is not None:
+                    self._esp_ordenes += esp
+                    self._n_ordenes += 1
+                rpm_medio = float(np.mean(self.rpm(t0 + np.arange(self.nperseg) / self.fs))
+                                  if callable(self.rpm) else self.rpm)
+            self.n_bloques += 1
+
+            centrada = x - x.mean()
+            rms = float(np.sqrt(np.mean(x**2)))
+            m2 = np.mean(centrada**2)
+            pico = float(np.max(np.abs(x)))
+            yield {
+                't_inicio': t0,
+                'rms': rms,
+                'curtosis': float(np.mean(centrada**4) / m2**2) if m2 > 0 else 0.0,
+                'pico': pico,
+                'factor_cresta': pico / rms if rms > 0 else 0.0,
+                'bandas': self._energia_bandas(env_psd, rpm_medio) if rpm_medio else {},
+            }
+
+    def resumen(self) -> Dict:
+        """
+        Espectros promediados e indicadores globales del último procesamiento.
+
+        Returns:
+            Dict con frecuencias, psd (Welch), envolvente (PSD de la
+            envolvente), ordenes, espectro_ordenes (amplitud), rms, curtosis,
+            pico y n_bloques
+        """
+        if self.n_bloques == 0:
+            raise ValueError("No se procesó ningún bloque (registro más corto que nperseg)")
+        n, s1, s2, s3, s4 = self._momentos
+        media = s1 / n
+        m2 = s2 / n - media**2
+        m4 = s4 / n - 4*media*s3 / n + 6*media**2*s2 / n - 3*media**4
+        return {
+            'frecuencias': self.frecuencias,
+            'psd': self._psd / self.n_bloques,
+            'envolvente': self._env / self.n_bloques,
+            'ordenes': self.ordenes,
+            'espectro_ordenes': self._esp_ordenes / max(self._n_ordenes, 1),
+            'rms': float(np.sqrt(s2 / n)),
+            'curtosis': float(m4 / m2**2) if m2 > 0 else 0.0,
+            'pico': self._pico,
+            'n_bloques': self.n_bloques,
+        }
+
+    def procesar_todo(self, fuente: FuenteSenal) -> Dict:
+        """Procesa la fuente completa y devuelve el resumen con la tendencia por bloque."""
+        tendencia = list(self.procesar(fuente))
+        resumen = self.resumen()
+        resumen['tendencia'] = tendencia
+        return resumen
@@ -0,0 +1,242 @@
+# =============================================================================
+# MÓDULO DE TABLAS DE CARGA DE GRÚAS
+# =============================================================================
+# Propósito: Ingesta de tablas de carga de fabricante (longitud de pluma ×
+#            radio → capacidad, por grúa y configuración de contrapeso) en
+#            rejillas densas, con consulta conservadora vectorizada y
+#            verificación de trayectorias completas de izaje en una llamada
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Unidades: longitudes y radios en m, capacidades en t (toneladas métricas).
+# Cada configuración se guarda como una matriz C[i, j] = capacidad de la
+# pluma longitudes[i] al radio radios[j]; las celdas que el fabricante no
+# publica quedan en NaN y se leen como capacidad nula.
+#
+# Lectura conservadora (según las notas habituales de las tablas de fabricante):
+#   - entre dos radios tabulados se usa la menor de las dos capacidades
+#     (la del radio mayor en una tabla monótona), nunca la interpolación
+#     lineal, que sobreestima en curvas convexas;
+#   - entre dos longitudes de pluma se usa la menor de las dos;
+#   - fuera de la tabla (radio o pluma menor al primero o mayor al último
+#     publicado, o celda vacía en cualquier esquina) la capacidad es 0.
+# Así la capacidad consultada nunca supera la de ningún punto tabulado que
+# la rodea. La matriz se rellena con un borde de ceros para que todo se
+# reduzca a dos searchsorted y cuatro lecturas indexadas.
+#
+# Verificación: carga total W = carga + deducciones (bloque de gancho,
+# aparejos); utilización u = W · factor / capacidad; izaje admisible si u ≤ 1.
+# Las tablas incluidas en datos/tablas_carga.csv son de referencia para
+# estudio; la planificación real usa la tabla del fabricante del equipo.
+# =============================================================================
+
+import os
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+DIRECTORIO_DATOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datos')
+RUTA_TABLAS = os.path.join(DIRECTORIO_DATOS, 'tablas_carga.csv')
+
+COLUMNAS_TABLA = ('grua', 'configuracion', 'longitud_pluma', 'radio', 'capacidad')
+
+
+class TablaCarga:
+    """Tabla de carga de una configuración de grúa en rejilla pluma × radio."""
+
+    def __init__(self, longitudes, radios, capacidades):
+        """
+        Args:
+            longitudes: Longitudes de pluma tabuladas (m)
+            radios: Radios de operación tabulados (m)
+            capacidades: Matriz (len(longitudes), len(radios)) en t, NaN en
+                         las celdas que la tabla no publica
+        """
+        longitudes = np.asarray(longitudes, dtype=float)
+        radios = np.asarray(radios, dtype=float)
+        capacidades = np.asarray(capacidades, dtype=float)
+        if longitudes.ndim != 1 or radios.ndim != 1 or capacidades.shape != (len(longitudes), len(radios)):
+            raise ValueError("La matriz de capacidades debe tener forma (longitudes, radios)")
+        if len(np.unique(longitudes)) != len(longitudes) or len(np.unique(radios)) != len(radios):
+            raise ValueError("Las longitudes de pluma y los radios no pueden repetirse")
+        if np.any(capacidades < 0):
+            raise ValueError("Las capacidades no pueden ser negativas")
+        orden_l, orden_r = np.argsort(longitudes), np.argsort(radios)
+        self.longitudes = longitudes[orden_l]
+        self.radios = radios[orden_r]
+        self.capacidades = capacidades[np.ix_(orden_l, orden_r)]
+        self._rejilla = np.zeros((len(longitudes) + 2, len(radios) + 2))
+        self._rejilla[1:-1, 1:-1] = np.nan_to_num(self.capacidades, nan=0.0)
+
+    @classmethod
+    def desde_tabla(cls, tabla: pd.DataFrame) -> 'TablaCarga':
+        """Construye la rejilla a partir de filas (longitud_pluma, radio, capacidad)."""
+        if tabla.duplicated(['longitud_pluma', 'radio']).any():
+            raise ValueError("La tabla tiene celdas (longitud_pluma, radio) repetidas")
+        matriz = tabla.pivot(index='longitud_pluma', columns='radio', values='capacidad')
+        return cls(matriz.index.to_numpy(), matriz.columns.to_numpy(), matriz.to_numpy())
+
+    @classmethod
+    def desde_tabla_ancha(cls, tabla: pd.DataFrame) -> 'TablaCarga':
+        """
+        Construye la rejilla desde el formato impreso del fabricante.
+
+        Args:
+            tabla: Índice con los radios (m), una columna por longitud de pluma
+                   (encabezados numéricos en m) y capacidades en t; celdas
+                   vacías donde la tabla no publica valor
+
+        Returns:
+            TablaCarga
+        """
+        longitudes = pd.to_numeric(pd.Index(tabla.columns), errors='raise').to_numpy()
+        return cls(longitudes, tabla.index.to_numpy(dtype=float), tabla.to_numpy(dtype=float).T)
+
+    @property
+    def nominal(self) -> float:
+        """Capacidad máxima publicada en la tabla (t)."""
+        return float(np.nanmax(self.capacidades))
+
+    def capacidad(self, longitud_pluma, radio) -> np.ndarray:
+        """
+        Capacidad conservadora para cualquier combinación de pluma y radio.
+
+        Args:
+            longitud_pluma: Longitud(es) de pluma (m)
+            radio: Radio(s) de operación (m); se difunde con longitud_pluma
+
+        Returns:
+            Capacidad en t (0 fuera de la tabla), con la forma difundida
+        """
+        L, R = np.broadcast_arrays(np.asarray(longitud_pluma, dtype=float), np.asarray(radio, dtype=float))
+        # Índices en la rejilla con borde: la fila/columna tabulada inferior y superior
+        l_inf = np.searchsorted(self.longitudes, L, side='right')
+        l_sup = np.searchsorted(self.longitudes, L, side='left') + 1
+        r_inf = np.searchsorted(self.radios, R, side='right')
+        r_sup = np.searchsorted(self.radios, R, side='left') + 1
+        g = self._rejilla
+        return np.minimum(np.minimum(g[l_inf, r_inf], g[l_inf, r_sup]),
+                          np.minimum(g[l_sup, r_inf], g[l_sup, r_sup]))
+
+
+def _verificar(capacidad: np.ndarray, carga, factor: float, deducciones: float) -> Dict[str, np.ndarray]:
+    if factor <= 0:
+        raise ValueError("El factor debe ser positivo")
+    disponible, total = np.broadcast_arrays(capacidad / factor, np.asarray(carga, dtype=float) + deducciones)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        utilizacion = np.where(disponible > 0, total / disponible, np.inf)
+    return {'capacidad': disponible, 'carga_total': total,
+            'utilizacion': utilizacion, 'margen': disponible - total, 'ok': utilizacion <= 1.0}
+
+
+class CatalogoGruas:
+    """Conjunto de tablas de carga indexadas por (grúa, configuración)."""
+
+    def __init__(self, tablas: Dict[Tuple[str, str], TablaCarga]):
+        """
+        Args:
+            tablas: {(grúa, configuración): TablaCarga}
+        """
+        if not tablas:
+            raise ValueError("El catálogo de grúas está vacío")
+        self.tablas = dict(tablas)
+
+    @classmethod
+    def desde_tabla(cls, tabla: pd.DataFrame) -> 'CatalogoGruas':
+        """Agrupa filas con COLUMNAS_TABLA en una TablaCarga por configuración."""
+        faltantes = [c for c in COLUMNAS_TABLA if c not in tabla.columns]
+        if faltantes:
+            raise ValueError(f"Faltan columnas en las tablas de carga: {faltantes}")
+        return cls({(str(g), str(c)): TablaCarga.desde_tabla(filas)
+                    for (g, c), filas in tabla.groupby(['grua', 'configuracion'], sort=False)})
+
+    @classmethod
+    def cargar(cls, ruta: str = RUTA_TABLAS) -> 'CatalogoGruas':
+        """Lee un archivo de tablas de carga en formato largo (una fila por celda)."""
+        return cls.desde_tabla(pd.read_csv(ruta, dtype={'grua': str, 'configuracion': str}))
+
+    @property
+    def gruas(self) -> List[str]:
+        return list(dict.fromkeys(g for g, _ in self.tablas))
+
+    def configuraciones(self, grua: str) -> List[str]:
+        configuraciones = [c for g, c in self.tablas if g == grua]
+        if not configuraciones:
+            raise ValueError(f"Grúa no encontrada: {grua}")
+        return configuraciones
+
+    def tabla(self, grua: str, configuracion: str) -> TablaCarga:
+        if (grua, configuracion) not in self.tablas:
+            raise ValueError(f"No hay tabla de carga para {grua} con {configuracion}")
+        return self.tablas[(grua, configuracion)]
+
+    def capacidad(self, grua: str, configuracion: str, longitud_pluma, radio) -> np.ndarray:
+        """Capacidad conservadora (t) de una configuración; ver TablaCarga.capacidad."""
+        return self.tabla(grua, configuracion).capacidad(longitud_pluma, radio)
+
+    def verificar_trayectoria(self, grua: str, configuracion: str, longitud_pluma, radios, carga,
+                              factor: float = 1.0, deducciones: float = 0.0) -> Dict[str, object]:
+        """
+        Comprueba si la grúa puede llevar la carga en todos los puntos de una trayectoria.
+
+        Args:
+            grua: Nombre de la grúa
+            configuracion: Configuración de contrapeso/estabilizadores
+            longitud_pluma: Longitud de pluma (m), escalar o un valor por punto
+            radios: Radios de la trayectoria (m)
+            carga: Peso de la carga (t), escalar o un valor por punto
+            factor: Divisor adicional de la capacidad de tabla (≥ 1 reduce)
+            deducciones: Peso del bloque de gancho y aparejos (t)
+
+        Returns:
+            Diccionario con arreglos por punto 'capacidad' (ya dividida por
+            factor), 'carga_total', 'utilizacion', 'margen' y 'ok', más
+            'apta' (todos los puntos admisibles), 'critico' (índice de
+            mayor utilización) y 'utilizacion_maxima'
+        """
+        capacidad = np.atleast_1d(self.capacidad(grua, configuracion, longitud_pluma, radios))
+        resultado = _verificar(capacidad, carga, factor, deducciones)
+        critico = int(np.argmax(resultado['utilizacion']))
+        resultado.update(apta=bool(np.all(resultado['ok'])), critico=critico,
+                         utilizacion_maxima=float(resultado['utilizacion'][critico]))
+        return resultado
+
+    def gruas_aptas(self, carga, radios, factor: float = 1.0, deducciones: float = 0.0,
+                    altura: Optional[float] = None) -> pd.DataFrame:
+        """
+        Evalúa todas las configuraciones y longitudes de pluma del catálogo para una trayectoria.
+
+        Args:
+            carga: Peso de la carga (t), escalar o un valor por punto
+            radios: Radios de la trayectoria (m)
+            factor: Divisor adicional de la capacidad de tabla
+            deducciones: Peso del bloque de gancho y aparejos (t)
+            altura: Altura mínima de la punta sobre el pivote de la pluma (m);
+                    descarta plumas con L² < R² + altura² en algún punto
+
+        Returns:
+            DataFrame con una fila por (grúa, configuración): la longitud de
+            pluma de menor utilización máxima, esa 'utilizacion_maxima', el
+            'radio_critico' y 'apta', ordenado de menor a mayor utilización
+        """
+        radios = np.atleast_1d(np.asarray(radios, dtype=float))
+        filas = []
+        for (grua, configuracion), tabla in self.tablas.items():
+            L = tabla.longitudes[:, None]
+            u = _verificar(tabla.capacidad(L, radios[None, :]), carga, factor, deducciones)['utilizacion']
+            if altura is not None:
+                u = np.where(L ** 2 >= radios ** 2 + altura ** 2, u, np.inf)
+            peor = u.max(axis=1)
+            i = int(np.argmin(peor))
+            filas.append({'grua': grua, 'configuracion': configuracion, 'longitud_pluma': tabla.longitudes[i],
+                          'utilizacion_maxima': peor[i], 'radio_critico': radios[int(np.argmax(u[i]))],
+                          'apta': bool(peor[i] <= 1.0)})
+        return pd.DataFrame(filas).sort_values('utilizacion_maxima', kind='stable').reset_index(drop=True)
+
+
+@lru_cache(maxsize=None)
+def catalogo_gruas(ruta: str = RUTA_TABLAS) -> CatalogoGruas:
+    """Catálogo de tablas de carga compartido por el proceso (se lee una sola vez)."""
+    return CatalogoGruas.cargar(ruta)
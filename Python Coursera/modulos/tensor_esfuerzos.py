@@ -0,0 +1,166 @@
+# =============================================================================
+# MÓDULO DE CAMPOS DE TENSORES DE ESFUERZO
+# =============================================================================
+# Propósito: Post-proceso vectorizado de esfuerzos en muchos puntos
+#            (puntos de integración de elementos finitos o campos
+#            analíticos): esfuerzos principales por solución cerrada del
+#            problema de valores propios, invariantes, von Mises, Tresca y
+#            factores de seguridad de criterios dúctiles y frágiles
+# Autor: Sistema de Ingeniería Mecánica con Python
+# Versión: 1.0
+# =============================================================================
+#
+# Notación de Voigt, arreglos (N, 6): [σxx, σyy, σzz, τxy, τyz, τxz]
+# (para el orden de Abaqus 11, 22, 33, 12, 13, 23 use ORDEN_ABAQUS).
+# Invariantes del desviador s = σ - p·I, con p = I1/3:
+#   J2 = ½ s:s,   J3 = det(s),   cos 3θ = (3√3/2) J3 / J2^(3/2)
+# Esfuerzos principales (solución trigonométrica, σ1 ≥ σ2 ≥ σ3):
+#   σk = p + 2√(J2/3) · cos(θ - 2π(k-1)/3),  θ ∈ [0, π/3]
+# von Mises σ_vm = √(3 J2); Tresca (intensidad) σ1 - σ3.
+# Factores de seguridad: von Mises y Tresca con Sy; Rankine con Su;
+# Mohr-Coulomb frágil con Sut y Suc.
+# Los puntos se procesan por bloques para acotar la memoria temporal.
+# =============================================================================
+
+import numpy as np
+from typing import Dict, Optional
+
+COMPONENTES = ('sxx', 'syy', 'szz', 'sxy', 'syz', 'sxz')
+ORDEN_ABAQUS = (0, 1, 2, 3, 5, 4)   # columnas de COMPONENTES en el orden 11, 22, 33, 12, 13, 23
+BLOQUE = 1 << 20
+
+
+def _validar(tensores) -> np.ndarray:
+    s = np.asarray(tensores, dtype=float)
+    if s.ndim != 2 or s.shape[1] != 6:
+        raise ValueError("Los tensores deben ser un arreglo (N, 6) en notación de Voigt")
+    return s
+
+
+def _por_bloques(funcion, s: np.ndarray, bloque: int) -> Dict[str, np.ndarray]:
+    """Aplica funcion a rebanadas de s y concatena los resultados."""
+    partes = [funcion(s[i:i + bloque]) for i in range(0, max(len(s), 1), bloque)]
+    return {c: np.concatenate([p[c] for p in partes]) for c in partes[0]}
+
+
+def reordenar(tensores, orden=ORDEN_ABAQUS) -> np.ndarray:
+    """Pasa tensores de otro orden de componentes al orden de COMPONENTES."""
+    s = _validar(tensores)
+    return s[:, np.argsort(orden)]
+
+
+def _invariantes(s: np.ndarray) -> Dict[str, np.ndarray]:
+    sxx, syy, szz, sxy, syz, sxz = s.T
+    p = (sxx + syy + szz) / 3.0
+    dx, dy, dz = sxx - p, syy - p, szz - p
+    cortes = sxy * sxy + syz * syz + sxz * sxz
+    J2 = 0.5 * (dx * dx + dy * dy + dz * dz) + cortes
+    J3 = dx * dy * dz + 2.0 * sxy * syz * sxz - dx * syz * syz - dy * sxz * sxz - dz * sxy * sxy
+    return {'p': p, 'J2': J2, 'J3': J3}
+
+
+def invariantes(tensores, bloque: int = BLOQUE) -> Dict[str, np.ndarray]:
+    """
+    Presión media p = I1/3 e invariantes J2, J3 del desviador.
+
+    Args:
+        tensores: Arreglo (N, 6) en notación de Voigt
+        bloque: Puntos procesados por bloque
+
+    Returns:
+        Diccionario con 'p', 'J2' y 'J3' (arreglos de longitud N)
+    """
+    return _por_bloques(_invariantes, _validar(tensores), bloque)
+
+
+def _principales(s: np.ndarray) -> Dict[str, np.ndarray]:
+    inv = _invariantes(s)
+    p, J2, J3 = inv['p'], inv['J2'], inv['J3']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos3t = np.where(J2 > 0, 1.5 * np.sqrt(3.0) * J3 / J2 ** 1.5, 1.0)
+    theta = np.arccos(np.clip(cos3t, -1.0, 1.0)) / 3.0
+    r = 2.0 * np.sqrt(J2 / 3.0)
+    principales = np.empty((len(s), 3))
+    principales[:, 0] = p + r * np.cos(theta)
+    principales[:, 2] = p + r * np.cos(theta + 2.0 * np.pi / 3.0)
+    principales[:, 1] = 3.0 * p - principales[:, 0] - principales[:, 2]
+    return {'principales': principales, 'p': p, 'J2': J2, 'J3': J3, 'lode': theta}
+
+
+def esfuerzos_principales(tensores, bloque: int = BLOQUE) -> np.ndarray:
+    """
+    Esfuerzos principales ordenados σ1 ≥ σ2 ≥ σ3.
+
+    Args:
+        tensores: Arreglo (N, 6) en notación de Voigt
+        bloque: Puntos procesados por bloque
+
+    Returns:
+        Arreglo (N, 3)
+    """
+    return _por_bloques(_principales, _validar(tensores), bloque)['principales']
+
+
+def von_mises(tensores) -> np.ndarray:
+    """Esfuerzo equivalente de von Mises √(3 J2)."""
+    s = _validar(tensores)
+    sxx, syy, szz, sxy, syz, sxz = s.T
+    return np.sqrt(0.5 * ((sxx - syy) ** 2 + (syy - szz) ** 2 + (szz - sxx) ** 2)
+                   + 3.0 * (sxy ** 2 + syz ** 2 + sxz ** 2))
+
+
+def tresca(tensores, bloque: int = BLOQUE) -> np.ndarray:
+    """Intensidad de esfuerzo de Tresca σ1 - σ3 (el doble del corte máximo)."""
+    principales = esfuerzos_principales(tensores, bloque)
+    return principales[:, 0] - principales[:, 2]
+
+
+def _factor(resistencia, esfuerzo) -> np.ndarray:
+    with np.errstate(divide='ignore'):
+        return np.where(esfuerzo > 0, resistencia / np.maximum(esfuerzo, 0.0), np.inf)
+
+
+def analizar_campo(tensores, Sy: Optional[float] = None, Su: Optional[float] = None,
+                   Suc: Optional[float] = None, bloque: int = BLOQUE) -> Dict[str, object]:
+    """
+    Post-proceso completo de un campo de esfuerzos.
+
+    Args:
+        tensores: Arreglo (N, 6) en notación de Voigt
+        Sy: Límite de fluencia (factores de von Mises y Tresca)
+        Su: Resistencia última a tracción (Rankine y Mohr-Coulomb)
+        Suc: Resistencia última a compresión, positiva (Mohr-Coulomb)
+        bloque: Puntos procesados por bloque
+
+    Returns:
+        Diccionario con 'principales' (N, 3), 'von_mises', 'tresca',
+        'presion' (p = I1/3), 'triaxialidad' (p/σ_vm), 'lode' (θ en rad),
+        los factores 'fs_von_mises', 'fs_tresca', 'fs_rankine',
+        'fs_mohr_coulomb' que correspondan a las resistencias dadas, y
+        'critico' con el índice del menor factor de cada criterio
+    """
+    s = _validar(tensores)
+
+    def procesar(b: np.ndarray) -> Dict[str, np.ndarray]:
+        r = _principales(b)
+        s1, s3 = r['principales'][:, 0], r['principales'][:, 2]
+        vm = np.sqrt(3.0 * r['J2'])
+        salida = {'principales': r['principales'], 'von_mises': vm, 'tresca': s1 - s3,
+                  'presion': r['p'], 'lode': r['lode']}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            salida['triaxialidad'] = np.where(vm > 0, r['p'] / vm, np.nan)
+        if Sy is not None:
+            salida['fs_von_mises'] = _factor(Sy, vm)
+            salida['fs_tresca'] = _factor(Sy, s1 - s3)
+        if Su is not None:
+            salida['fs_rankine'] = _factor(Su, s1)
+        if Su is not None and Suc is not None:
+            # Mohr-Coulomb frágil: 1/n = σ1⁺/Sut - σ3⁻/Suc
+            with np.errstate(divide='ignore'):
+                salida['fs_mohr_coulomb'] = 1.0 / (np.maximum(s1, 0.0) / Su - np.minimum(s3, 0.0) / Suc)
+        return salida
+
+    resultado = _por_bloques(procesar, s, bloque)
+    resultado['critico'] = {c[3:]: int(np.argmin(v)) for c, v in resultado.items()
+                            if c.startswith('fs_') and len(v)}
+    return resultado
@@ -57,7 +57,8 @@ class TermodinamicaFluidosApp:
         # Tipo de ciclo
         ttk.Label(left_frame, text="Tipo de Ciclo:").pack(anchor=tk.W)
         self.tipo_ciclo = ttk.Combobox(left_frame, 
-                                     values=["Ciclo de Carnot", "Ciclo de Otto", "Ciclo de Diesel", "Ciclo de Brayton"])
+                                     values=["Ciclo de Carnot", "Ciclo de Otto", "Ciclo de Diesel",
+                                             "Ciclo de Brayton", "Ciclo Rankine"])
         self.tipo_ciclo.pack(fill=tk.X, pady=(0, 10))
         self.tipo_ciclo.set("Ciclo de Otto")
         
@@ -205,6 +206,14 @@ class TermodinamicaFluidosApp:
         self.area_var = tk.StringVar(value="1")
         ttk.Entry(mat_frame, textvariable=self.area_var, width=10).grid(row=2, column=1, padx=5)
         
+        ttk.Label(mat_frame, text="Densidad (kg/m³):").grid(row=3, column=0, sticky=tk.W)
+        self.densidad_pared_var = tk.StringVar(value="7850")
+        ttk.Entry(mat_frame, textvariable=self.densidad_pared_var, width=10).grid(row=3, column=1, padx=5)
+        
+        ttk.Label(mat_frame, text="Calor específico (J/kg·K):").grid(row=4, column=0, sticky=tk.W)
+        self.cp_pared_var = tk.StringVar(value="475")
+        ttk.Entry(mat_frame, textvariable=self.cp_pared_var, width=10).grid(row=4, column=1, padx=5)
+        
         # Temperaturas
         ttk.Label(left_frame, text="Temperaturas:").pack(anchor=tk.W, pady=(10, 0))
         
@@ -277,6 +286,9 @@ class TermodinamicaFluidosApp:
     def analizar_ciclo(self):
         """Analiza el ciclo termodinámico seleccionado"""
         try:
+            from modulos.ciclos import (ciclo_brayton, ciclo_carnot, ciclo_diesel, ciclo_otto,
+                                        ciclo_rankine, tabla_estados)
+
             tipo = self.tipo_ciclo.get()
             T_alta = float(self.T_alta_var.get())
             T_baja = float(self.T_baja_var.get())
@@ -284,36 +296,25 @@ class TermodinamicaFluidosApp:
             P_baja = float(self.P_baja_var.get())
             r = float(self.r_compresion_var.get())
             
+            # Estados reales: aire con cp(T) o agua IAPWS-IF97
             if tipo == "Ciclo de Carnot":
-                eficiencia = 1 - T_baja/T_alta
-                trabajo_neto = 1000  # kJ/kg (ejemplo)
-                calor_entrada = trabajo_neto / eficiencia
-                
+                ciclo = ciclo_carnot(T_alta, T_baja, P_alta, P_baja)
             elif tipo == "Ciclo de Otto":
-                gamma = 1.4  # Para aire
-                eficiencia = 1 - (1/r**(gamma-1))
-                trabajo_neto = 800  # kJ/kg (ejemplo)
-                calor_entrada = trabajo_neto / eficiencia
-                
+                ciclo = ciclo_otto(r, T_alta, T_baja, P_baja)
             elif tipo == "Ciclo de Diesel":
-                gamma = 1.4
-                rc = 2  # Relación de corte
-                eficiencia = 1 - (1/r**(gamma-1)) * ((rc**gamma - 1)/(gamma*(rc - 1)))
-                trabajo_neto = 900  # kJ/kg (ejemplo)
-                calor_entrada = trabajo_neto / eficiencia
-                
+                ciclo = ciclo_diesel(r, T_maxima=T_alta, T_entrada=T_baja, P_entrada=P_baja)
+            elif tipo == "Ciclo Rankine":
+                ciclo = ciclo_rankine(P_alta, T_alta, P_baja)
             else:  # Brayton
-                gamma = 1.4
-                eficiencia = 1 - (1/r**((gamma-1)/gamma))
-                trabajo_neto = 600  # kJ/kg (ejemplo)
-                calor_entrada = trabajo_neto / eficiencia
+                ciclo = ciclo_brayton(r, T_alta, T_baja, P_baja)
             
             # Guardar resultados
             self.datos_ciclo = {
                 'tipo': tipo,
-                'eficiencia': eficiencia,
-                'trabajo_neto': trabajo_neto,
-                'calor_entrada': calor_entrada,
+                'eficiencia': float(ciclo['eficiencia']),
+                'trabajo_neto': float(ciclo['trabajo_neto']),
+                'calor_entrada': float(ciclo['calor_entrada']),
+                'estados': tabla_estados(ciclo),
                 'T_alta': T_alta,
                 'T_baja': T_baja,
                 'P_alta': P_alta,
@@ -337,33 +338,20 @@ class TermodinamicaFluidosApp:
             
         self.ax_ciclo.clear()
         
-        # Generar puntos para el ciclo (ejemplo simplificado)
-        V = np.linspace(0.1, 2, 100)
+        # Puntos de estado calculados, unidos en el orden del ciclo
+        estados = self.datos_ciclo['estados']
+        V_cycle = list(estados['v']) + [estados['v'].iloc[0]]
+        P_cycle = list(estados['P']) + [estados['P'].iloc[0]]
         
-        if self.datos_ciclo['tipo'] == "Ciclo de Otto":
-            # Proceso 1-2: Compresión isentrópica
-            V1, V2 = 2, 2/self.datos_ciclo['r']
-            P1, P2 = self.datos_ciclo['P_baja'], self.datos_ciclo['P_alta']
-            
-            # Proceso 2-3: Adición de calor a volumen constante
-            V3 = V2
-            P3 = P2 * (self.datos_ciclo['T_alta'] / self.datos_ciclo['T_baja'])
-            
-            # Proceso 3-4: Expansión isentrópica
-            V4 = V1
-            P4 = P3 / (self.datos_ciclo['r']**1.4)
-            
-            # Proceso 4-1: Rechazo de calor a volumen constante
-            V_cycle = [V1, V2, V3, V4, V1]
-            P_cycle = [P1, P2, P3, P4, P1]
-            
-            self.ax_ciclo.plot(V_cycle, P_cycle, 'b-', linewidth=2, label='Ciclo Otto')
-            self.ax_ciclo.plot(V_cycle[0], P_cycle[0], 'ro', markersize=8, label='Punto 1')
-            self.ax_ciclo.plot(V_cycle[1], P_cycle[1], 'go', markersize=8, label='Punto 2')
-            self.ax_ciclo.plot(V_cycle[2], P_cycle[2], 'bo', markersize=8, label='Punto 3')
-            self.ax_ciclo.plot(V_cycle[3], P_cycle[3], 'mo', markersize=8, label='Punto 4')
+        self.ax_ciclo.plot(V_cycle, P_cycle, 'b-', linewidth=2, label=self.datos_ciclo['tipo'])
+        self.ax_ciclo.plot(estados['v'], estados['P'], 'ro', markersize=6, label='Puntos de estado')
+        for nombre, fila in estados.iterrows():
+            self.ax_ciclo.annotate(nombre, (fila['v'], fila['P']), textcoords='offset points',
+                                   xytext=(5, 5))
+        if self.datos_ciclo['tipo'] == "Ciclo Rankine":
+            self.ax_ciclo.set_xscale('log')
         
-        self.ax_ciclo.set_xlabel('Volumen (m³)')
+        self.ax_ciclo.set_xlabel('Volumen específico (m³/kg)')
         self.ax_ciclo.set_ylabel('Presión (kPa)')
         self.ax_ciclo.set_title(f'Diagrama P-V: {self.datos_ciclo["tipo"]}')
         self.ax_ciclo.legend()
@@ -389,9 +377,12 @@ Parámetros de operación:
 
 Resultados del análisis:
 - Eficiencia térmica: {self.datos_ciclo['eficiencia']:.3f} ({self.datos_ciclo['eficiencia']*100:.1f}%)
-- Trabajo neto: {self.datos_ciclo['trabajo_neto']} kJ/kg
+- Trabajo neto: {self.datos_ciclo['trabajo_neto']:.1f} kJ/kg
 - Calor de entrada: {self.datos_ciclo['calor_entrada']:.1f} kJ/kg
 
+Puntos de estado:
+{self.datos_ciclo['estados'].to_string(float_format=lambda x: f"{x:.4g}")}
+
 Análisis completado exitosamente.
 """
         
@@ -416,11 +407,12 @@ Análisis completado exitosamente.
             # Determinar régimen de flujo
             if Re < 2300:
                 regimen = "Laminar"
-                f = 64 / Re
             else:
                 regimen = "Turbulento"
-                # Factor de fricción de Colebrook (aproximación)
-                f = 0.02  # Valor típico para flujo turbulento
+            
+            # Factor de fricción: 64/Re laminar, Colebrook-White exacto turbulento
+            from modulos.friccion import factor_friccion
+            f = float(factor_friccion(Re, e / D))
             
             # Calcular pérdidas por fricción
             hf = f * (L/D) * (V**2) / (2 * 9.81)
@@ -436,7 +428,8 @@ Análisis completado exitosamente.
                 'hf': hf,
                 'delta_P': delta_P,
                 'V': V,
-                'D': D
+                'D': D,
+                'rugosidad': e
             }
             
             # Visualizar perfil de velocidad
@@ -455,20 +448,23 @@ Análisis completado exitosamente.
             
         self.ax_fluido.clear()
         
-        # Generar perfil de velocidad
-        r = np.linspace(0, self.datos_fluido['D']/2, 50)
+        # Generar perfil de velocidad: Poiseuille en laminar y ley de potencia
+        # con n = 1/√f en turbulento (más la ley logarítmica de pared)
+        from modulos.flujo_tuberias import perfiles_velocidad
         
-        if self.datos_fluido['regimen'] == "Laminar":
-            # Perfil parabólico para flujo laminar
-            v = self.datos_fluido['V'] * (1 - (r/(self.datos_fluido['D']/2))**2)
-        else:
-            # Perfil de ley de potencia para flujo turbulento
-            n = 7  # Exponente para flujo turbulento
-            v = self.datos_fluido['V'] * (1 - (r/(self.datos_fluido['D']/2)))**(1/n)
+        datos = self.datos_fluido
+        argumentos = (datos['V'], datos['D'], datos['Re'], datos['f'], np.linspace(0, 1, 200))
+        r = argumentos[-1] * datos['D'] / 2
+        v = perfiles_velocidad(*argumentos)['u'][0]
         
         # Graficar perfil
         self.ax_fluido.plot(v, r, 'b-', linewidth=2, label='Perfil de velocidad')
         self.ax_fluido.plot(v, -r, 'b-', linewidth=2)
+        if datos['regimen'] != "Laminar":
+            v_log = perfiles_velocidad(*argumentos, modelo='logaritmico',
+                                       rugosidad=datos.get('rugosidad', 0.0))['u'][0]
+            self.ax_fluido.plot(v_log, r, 'g--', linewidth=1.5, label='Ley logarítmica')
+            self.ax_fluido.plot(v_log, -r, 'g--', linewidth=1.5)
         
         # Dibujar conducto
         self.ax_fluido.axhline(y=self.datos_fluido['D']/2, color='k', linestyle='-', linewidth=2)
@@ -522,20 +518,29 @@ Análisis completado exitosamente.
             tipo = self.tipo_transferencia.get()
             
             if tipo == "Conducción":
-                # Transferencia por conducción
-                q_cond = k * A * (T_hot - T_cold) / L
-                R_cond = L / (k * A)
+                # Transferencia por conducción: calentamiento transitorio de la
+                # placa (inicialmente a T_fría) hasta el perfil estacionario
+                from modulos.conduccion import Capa, Frontera, ParedCompuesta
+                
+                rho = float(self.densidad_pared_var.get())
+                cp = float(self.cp_pared_var.get())
+                pared = ParedCompuesta([Capa(L, k, rho, cp)], nodos_por_capa=50)
+                caliente, fria = Frontera(T_hot, np.inf), Frontera(T_cold, np.inf)
+                estacionario = pared.estacionario(caliente, fria)
+                duracion = 2 * L**2 * rho * cp / k
+                transitorio = pared.transitorio(caliente, fria, T_cold, duracion, duracion / 400,
+                                                guardar_cada=40, iteraciones_radiacion=1)
                 
-                # Distribución de temperatura
-                x = np.linspace(0, L, 100)
-                T = T_hot - (T_hot - T_cold) * x / L
+                q_cond = float(estacionario['q']) * A
+                R_cond = L / (k * A)
                 
                 self.datos_transferencia = {
                     'tipo': tipo,
                     'q': q_cond,
                     'R': R_cond,
-                    'x': x,
-                    'T': T,
+                    'x': estacionario['posicion'],
+                    'T': estacionario['T'],
+                    'transitorio': transitorio,
                     'T_hot': T_hot,
                     'T_cold': T_cold
                 }
@@ -583,8 +588,15 @@ Análisis completado exitosamente.
         self.ax_transferencia.clear()
         
         if self.datos_transferencia['tipo'] == "Conducción":
+            transitorio = self.datos_transferencia.get('transitorio')
+            if transitorio is not None:
+                for t, T in zip(transitorio['t'][1:], transitorio['T'][1:]):
+                    self.ax_transferencia.plot(transitorio['posicion'], T, '--', linewidth=1,
+                                             label=f't = {t:.1f} s')
             self.ax_transferencia.plot(self.datos_transferencia['x'], 
-                                     self.datos_transferencia['T'], 'r-', linewidth=2)
+                                     self.datos_transferencia['T'], 'r-', linewidth=2,
+                                     label='Estacionario')
+            self.ax_transferencia.legend(fontsize=8)
             self.ax_transferencia.set_xlabel('Distancia (m)')
             self.ax_transferencia.set_ylabel('Temperatura (K)')
             self.ax_transferencia.set_title('Distribución de Temperatura - Conducción')
@@ -625,22 +637,248 @@ Análisis completado exitosamente.
     
     # Métodos adicionales (placeholder)
     def calcular_eficiencia(self):
-        messagebox.showinfo("En Desarrollo", "Cálculo de eficiencia en desarrollo")
+        """Compara la eficiencia del ciclo con el límite de Carnot entre las mismas temperaturas"""
+        try:
+            self.analizar_ciclo()
+            if not self.datos_ciclo:
+                return
+            
+            eficiencia = self.datos_ciclo['eficiencia']
+            carnot = 1 - self.datos_ciclo['T_baja'] / self.datos_ciclo['T_alta']
+            
+            resultados = f"""
+=== EFICIENCIA DEL CICLO ===
+Tipo de ciclo: {self.datos_ciclo['tipo']}
+- Eficiencia térmica: {eficiencia*100:.2f}%
+- Eficiencia de Carnot ({self.datos_ciclo['T_baja']} K - {self.datos_ciclo['T_alta']} K): {carnot*100:.2f}%
+- Eficiencia de segunda ley: {eficiencia/carnot*100:.1f}%
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en el cálculo de eficiencia: {str(e)}")
     
     def optimizar_ciclo(self):
-        messagebox.showinfo("En Desarrollo", "Optimización de ciclo en desarrollo")
+        """Optimiza las variables de diseño del ciclo mostrando la convergencia en vivo"""
+        try:
+            from modulos.ciclos import ciclo_brayton, ciclo_rankine
+            from modulos.optimizacion_ciclos import graficar_convergencia, optimizar_ciclo
+
+            tipo = self.tipo_ciclo.get()
+            T_alta = float(self.T_alta_var.get())
+            T_baja = float(self.T_baja_var.get())
+            P_alta = float(self.P_alta_var.get())
+            P_baja = float(self.P_baja_var.get())
+
+            # Brayton: relación de presiones de máximo trabajo neto
+            # Rankine: presiones de recalentamiento y extracción de máxima eficiencia
+            if tipo == "Ciclo de Brayton":
+                problema = dict(ciclo=ciclo_brayton, limites={'relacion_presion': (1.5, 40.0)},
+                                objetivo='trabajo_neto',
+                                fijos={'T_turbina': T_alta, 'T_entrada': T_baja, 'P_entrada': P_baja})
+                etiqueta = 'Trabajo neto (kJ/kg)'
+            elif tipo == "Ciclo Rankine":
+                problema = dict(ciclo=ciclo_rankine,
+                                limites={'P_recalentamiento': (2 * P_baja, P_alta),
+                                         'P_regeneracion': (1.5 * P_baja, P_alta)},
+                                objetivo='eficiencia',
+                                restricciones={'titulo_escape': (0.88, None)},
+                                fijos={'P_caldera': P_alta, 'T_turbina': T_alta, 'P_condensador': P_baja})
+                etiqueta = 'Eficiencia térmica'
+            else:
+                messagebox.showinfo("Optimización",
+                                    "La optimización de variables de diseño está disponible "
+                                    "para los ciclos Brayton y Rankine")
+                return
+
+            historial = []
+
+            def actualizar(registro):
+                historial.append(registro)
+                self.ax_ciclo.clear()
+                self.ax_ciclo.set_xscale('linear')
+                graficar_convergencia(historial, self.ax_ciclo, etiqueta)
+                self.ax_ciclo.set_title(f'Convergencia: {tipo}')
+                self.canvas_ciclo.draw()
+                self.root.update()
+
+            optimo = optimizar_ciclo(**problema, semilla=0, callback=actualizar)
+
+            variables = "\n".join(f"- {nombre}: {valor:.4g}" for nombre, valor in optimo['variables'].items())
+            resultados = f"""
+=== OPTIMIZACIÓN DE CICLO ===
+Tipo de ciclo: {tipo}
+Objetivo: {etiqueta} = {optimo['objetivo']:.4g}
+Factible: {'Sí' if optimo['factible'] else 'No'}
+Variables óptimas:
+{variables}
+- Eficiencia térmica: {float(optimo['resultado']['eficiencia'])*100:.2f}%
+- Trabajo neto: {float(optimo['resultado']['trabajo_neto']):.1f} kJ/kg
+- Evaluaciones del ciclo: {optimo['evaluaciones']}
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la optimización del ciclo: {str(e)}")
     
     def calcular_perdidas(self):
-        messagebox.showinfo("En Desarrollo", "Cálculo de pérdidas en desarrollo")
+        """Pérdidas por fricción y por accesorios leídos de una tabla CSV"""
+        try:
+            import pandas as pd
+            from modulos.flujo_tuberias import evaluar_tramos
+            
+            rho = float(self.densidad_var.get())
+            mu = float(self.viscosidad_var.get())
+            V = float(self.velocidad_var.get())
+            D = float(self.diametro_var.get())
+            L = float(self.longitud_var.get())
+            e = float(self.rugosidad_var.get())
+            
+            # Tabla de accesorios con columnas accesorio y cantidad (opcional)
+            archivo = filedialog.askopenfilename(
+                title="Tabla de accesorios (accesorio, cantidad)",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+            accesorios = None
+            if archivo:
+                accesorios = pd.read_csv(archivo)
+                accesorios['segmento'] = 0
+            
+            tramo = {'segmento': [0], 'diametro': [D], 'longitud': [L], 'rugosidad': [e],
+                     'caudal': [V * np.pi * D**2 / 4]}
+            r = evaluar_tramos(tramo, accesorios, densidad=rho, viscosidad=mu).iloc[0]
+            
+            detalle = ""
+            if accesorios is not None:
+                detalle = "\n".join(f"- {fila.accesorio}: {getattr(fila, 'cantidad', 1)}"
+                                     for fila in accesorios.itertuples())
+            resultados = f"""
+=== PÉRDIDAS DE CARGA ===
+- Régimen: {r['regimen']} (Re = {r['Re']:.0f})
+- Factor de fricción: {r['f']:.4f}
+- Pérdida por fricción: {r['perdida_friccion']:.3f} m
+- Coeficiente total de accesorios ΣK: {r['K_accesorios']:.2f}
+- Pérdidas menores: {r['perdida_menores']:.3f} m
+- Pérdida total: {r['perdida_total']:.3f} m
+- Caída de presión: {r['caida_presion']:.1f} Pa
+Accesorios:
+{detalle or '- (sin tabla de accesorios)'}
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en el cálculo de pérdidas: {str(e)}")
     
     def analisis_presion(self):
         messagebox.showinfo("En Desarrollo", "Análisis de presión en desarrollo")
     
+    def _pared_transferencia(self):
+        """Pared, fronteras y área a partir de los parámetros de la pestaña"""
+        from modulos.conduccion import Capa, Frontera, ParedCompuesta
+        
+        k = float(self.conductividad_var.get())
+        L = float(self.espesor_var.get())
+        A = float(self.area_var.get())
+        T_hot = float(self.T_caliente_var.get())
+        T_cold = float(self.T_fria_var.get())
+        h = float(self.h_conveccion_var.get())
+        rho = float(self.densidad_pared_var.get())
+        cp = float(self.cp_pared_var.get())
+        
+        # Cara caliente a temperatura impuesta; la fría convecta (y radia
+        # con ε = 0.9 si el tipo incluye radiación) hacia el ambiente
+        emisividad = 0.9 if self.tipo_transferencia.get() in ("Radiación", "Combinada") else 0.0
+        pared = ParedCompuesta([Capa(L, k, rho, cp)])
+        return pared, Frontera(T_hot, np.inf), Frontera(T_cold, h, emisividad), A
+    
     def analisis_resistencia(self):
-        messagebox.showinfo("En Desarrollo", "Análisis de resistencia en desarrollo")
+        """Desglose de la red de resistencias térmicas de la pared"""
+        try:
+            from modulos.conduccion import SIGMA
+            
+            pared, caliente, ambiente, A = self._pared_transferencia()
+            red = pared.estacionario(caliente, ambiente)
+            Ts = float(red['T_interfaces'][-1])
+            T_amb = ambiente.temperatura()
+            h_r = ambiente.emisividad * SIGMA * (Ts**2 + T_amb**2) * (Ts + T_amb)
+            
+            R_cond = float(red['resistencias'][0]) / A
+            R_conv = 1 / (ambiente.h * A)
+            R_rad = 1 / (h_r * A) if h_r > 0 else np.inf
+            R_sup = float(red['R_exterior']) / A
+            R_total = R_cond + R_sup
+            
+            nombres = ['Conducción', 'Superficie (conv. ∥ rad.)']
+            valores = [R_cond, R_sup]
+            
+            self.ax_transferencia.clear()
+            self.ax_transferencia.bar(nombres, valores, color=['#c0392b', '#2980b9'])
+            self.ax_transferencia.set_ylabel('Resistencia térmica (K/W)')
+            self.ax_transferencia.set_title('Red de Resistencias Térmicas')
+            self.ax_transferencia.grid(True)
+            self.canvas_transferencia.draw()
+            
+            resultados = f"""
+=== ANÁLISIS DE RESISTENCIA TÉRMICA ===
+- Conducción: {R_cond:.4g} K/W ({R_cond/R_total*100:.1f}%)
+- Convección exterior: {R_conv:.4g} K/W
+- Radiación exterior (ε = {ambiente.emisividad}): {R_rad:.4g} K/W
+- Superficie (convección y radiación en paralelo): {R_sup:.4g} K/W ({R_sup/R_total*100:.1f}%)
+- Resistencia total: {R_total:.4g} K/W
+- Temperatura de la superficie exterior: {Ts:.1f} K
+- Tasa de transferencia de calor: {float(red['q'])*A:.1f} W
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en el análisis de resistencia: {str(e)}")
     
     def optimizar_aislamiento(self):
-        messagebox.showinfo("En Desarrollo", "Optimización de aislamiento en desarrollo")
+        """Espesor económico de aislamiento para cada material del catálogo"""
+        try:
+            from modulos.conduccion import optimizar_aislamiento
+            
+            pared, caliente, ambiente, A = self._pared_transferencia()
+            espesores = np.linspace(0, 0.3, 301)
+            resultado = optimizar_aislamiento(pared, caliente, ambiente, espesores)
+            
+            self.ax_transferencia.clear()
+            for j, material in enumerate(resultado['materiales']):
+                costo = np.where(resultado['factible'][:, j], resultado['costo_total'][:, j] * A, np.nan)
+                linea, = self.ax_transferencia.plot(espesores * 1000, costo, label=material)
+                if np.isfinite(resultado['espesor_optimo'][j]):
+                    self.ax_transferencia.plot(resultado['espesor_optimo'][j] * 1000,
+                                               resultado['costo_optimo'][j] * A, 'o',
+                                               color=linea.get_color())
+            self.ax_transferencia.set_xlabel('Espesor de aislamiento (mm)')
+            self.ax_transferencia.set_ylabel('Costo anual total')
+            self.ax_transferencia.set_title('Optimización de Aislamiento')
+            self.ax_transferencia.legend(fontsize=8)
+            self.ax_transferencia.grid(True)
+            self.canvas_transferencia.draw()
+            
+            lineas = "\n".join(
+                f"- {m}: {e*1000:.0f} mm, costo anual {c*A:.2f}"
+                for m, e, c in zip(resultado['materiales'], resultado['espesor_optimo'],
+                                   resultado['costo_optimo']))
+            optimo = resultado['optimo']
+            mejor = (f"{optimo['material']} de {optimo['espesor']*1000:.0f} mm "
+                     f"(pérdida {optimo['q']*A:.1f} W)") if optimo else "ninguno factible"
+            resultados = f"""
+=== OPTIMIZACIÓN DE AISLAMIENTO ===
+Energía a 0.08 por kWh, 8760 h/año, amortización en 10 años al 8%
+Espesor óptimo por material:
+{lineas}
+Mejor opción: {mejor}
+"""
+            self.texto_resultados.insert(tk.END, resultados)
+            self.texto_resultados.see(tk.END)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la optimización de aislamiento: {str(e)}")
     
     def generar_reporte(self):
         """Genera un reporte completo de los análisis"""
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from modulos.ajuste_bombas import ajustar_banco_pruebas, ajustar_polinomios, banda_confianza
+
+
+def _banco(n_bombas=200, n_puntos=10, ruido=0.2, semilla=0, atipicos=False):
+    rng = np.random.default_rng(semilla)
+    verdad = np.column_stack([-rng.uniform(1e-4, 1e-3, n_bombas),
+                              rng.uniform(-0.02, 0.02, n_bombas),
+                              rng.uniform(30, 60, n_bombas)])
+    filas = []
+    for b in range(n_bombas):
+        rpm = rng.choice([1450.0, 1160.0], n_puntos)
+        s = rpm / 1450
+        x = np.linspace(0, 300, n_puntos)
+        Q = s * x
+        H = s**2 * np.polyval(verdad[b], x) + rng.normal(0, ruido, n_puntos)
+        if atipicos:
+            H[n_puntos // 2] += 10.0
+        filas += [(f'B{b:03d}', Q[i], H[i], rpm[i]) for i in range(n_puntos)]
+    return pd.DataFrame(filas, columns=['bomba', 'caudal', 'altura', 'rpm']), verdad
+
+
+def test_sin_huber_coincide_con_polyfit_por_grupo():
+    rng = np.random.default_rng(3)
+    tamanos = rng.integers(6, 15, 40)
+    grupos = np.repeat(np.arange(40), tamanos)
+    x = rng.uniform(0, 200, len(grupos))
+    y = 50 - 1e-3 * x**2 + rng.normal(0, 1, len(grupos))
+    y[::17] = np.nan
+    ajuste = ajustar_polinomios(x, y, 3, grupos, huber=None)
+    for g in range(40):
+        m = (grupos == g) & np.isfinite(y)
+        np.testing.assert_allclose(ajuste['coeficientes'][g], np.polyfit(x[m], y[m], 3),
+                                   rtol=1e-7, atol=1e-12)
+
+
+def test_huber_descarta_lecturas_atipicas():
+    datos, verdad = _banco(100, 12, atipicos=True)
+    robusto = ajustar_banco_pruebas(datos, columna_velocidad='rpm')['altura']
+    ordinario = ajustar_banco_pruebas(datos, columna_velocidad='rpm', huber=None)['altura']
+
+    error_robusto = np.abs(robusto['coeficientes'][:, 2] - verdad[:, 2])
+    error_ordinario = np.abs(ordinario['coeficientes'][:, 2] - verdad[:, 2])
+    assert np.median(error_robusto) < 0.5 * np.median(error_ordinario)
+    assert np.all(robusto['pesos'][6::12] < 0.2)
+    assert np.median(robusto['pesos']) == 1.0
+
+
+def test_leyes_de_afinidad_unifican_velocidades():
+    datos, verdad = _banco(50, 12, ruido=0.05)
+    con = ajustar_banco_pruebas(datos, columna_velocidad='rpm', velocidad_nominal=1450)
+    sin = ajustar_banco_pruebas(datos)
+    tabla = con['altura']['tabla']
+    assert list(tabla.columns) == ['c0', 'c1', 'c2', 'sigma', 'r2']
+    np.testing.assert_allclose(tabla[['c0', 'c1', 'c2']].to_numpy()[:, 2], verdad[:, 2], atol=0.2)
+    assert np.all(con['altura']['sigma'] < sin['altura']['sigma'])
+
+
+def test_cobertura_de_la_banda_de_confianza():
+    datos, verdad = _banco(400, 10, ruido=0.5, semilla=7)
+    ajuste = ajustar_banco_pruebas(datos, columna_velocidad='rpm', velocidad_nominal=1450,
+                                   huber=None)['altura']
+    x = np.array([50.0, 150.0, 250.0])
+    banda = banda_confianza(ajuste, x, 0.95)
+    real = np.array([np.polyval(c, x) for c in verdad])
+    cobertura = np.mean((real >= banda['inferior']) & (real <= banda['superior']))
+    assert 0.92 < cobertura < 0.98
+
+    prediccion = banda_confianza(ajuste, x, 0.95, prediccion=True)
+    assert np.all(prediccion['superior'] - prediccion['valor'] > banda['superior'] - banda['valor'])
+
+
+def test_grupos_con_pocos_puntos():
+    with pytest.raises(ValueError, match='grado 2'):
+        ajustar_polinomios([1.0, 2.0, 3.0, 1.0], [1.0, 2.0, 3.0, 4.0], 2, ['a', 'a', 'a', 'b'])
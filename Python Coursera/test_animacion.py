@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from PIL import Image
+from modulos.animacion import cinematica_4_barras, RenderizadorMecanismo, animar_4_barras
+
+
+def test_cinematica_respeta_longitudes_de_barras():
+    sol = cinematica_4_barras(1.0, 3.0, 2.5, 3.0, np.linspace(0, 2*np.pi, 500))
+    assert sol['valido'].all()
+    np.testing.assert_allclose(np.linalg.norm(sol['C'] - sol['B'], axis=1), 3.0)
+    np.testing.assert_allclose(np.linalg.norm(sol['C'] - sol['D'], axis=1), 2.5)
+
+
+def test_cinematica_marca_posiciones_inalcanzables():
+    # Biela y balancín cortos: la manivela no completa la vuelta
+    sol = cinematica_4_barras(2.0, 1.0, 1.0, 3.0, np.linspace(0, 2*np.pi, 100))
+    assert not sol['valido'].all()
+    assert np.isnan(sol['C'][~sol['valido']]).all()
+
+
+def test_cuadros_cambian_con_la_trayectoria():
+    sol = cinematica_4_barras(1.0, 3.0, 2.5, 3.0, np.linspace(0, np.pi, 3))
+    posiciones = np.stack([sol['A'], sol['B'], sol['C'], sol['D']], axis=1)
+    render = RenderizadorMecanismo(posiciones, tamano=(2, 2), dpi=50)
+    cuadros = [c.copy() for c in render.cuadros()]
+    assert len(cuadros) == 3
+    assert cuadros[0].shape == (100, 100, 4)
+    assert not np.array_equal(cuadros[0], cuadros[2])
+
+
+def test_animacion_gif_y_cuadros_png(tmp_path):
+    ruta_gif = animar_4_barras(1.0, 3.0, 2.5, 3.0, 2*np.pi, 1.0, str(tmp_path / 'm.gif'),
+                               fps=10, tamano=(2, 2), dpi=50)
+    with Image.open(ruta_gif) as gif:
+        assert gif.n_frames == 10
+
+    animar_4_barras(1.0, 3.0, 2.5, 3.0, 2*np.pi, 0.5, str(tmp_path / 'cuadros'),
+                                 fps=10, tamano=(2, 2), dpi=50)
+    assert len(list((tmp_path / 'cuadros').glob('cuadro_*.png'))) == 5
+
+
+def test_animacion_rechaza_mecanismo_sin_vuelta_completa(tmp_path):
+    with pytest.raises(ValueError):
+        animar_4_barras(2.0, 1.0, 1.0, 3.0, 1.0, 1.0, str(tmp_path / 'm.gif'))
+
+
+def test_gif_con_pillow_se_escribe_cuadro_a_cuadro(tmp_path):
+    sol = cinematica_4_barras(1.0, 3.0, 2.5, 3.0, np.linspace(0, np.pi, 4))
+    posiciones = np.stack([sol['A'], sol['B'], sol['C'], sol['D']], axis=1)
+    render = RenderizadorMecanismo(posiciones, fps=20, tamano=(2, 2), dpi=50)
+    originales = [c[..., :3].astype(int) for c in render.cuadros()]
+    render._guardar_gif_pillow(str(tmp_path / 'm.gif'))
+    with Image.open(tmp_path / 'm.gif') as gif:
+        assert gif.n_frames == 4 and gif.info['loop'] == 0 and gif.info['duration'] == 50
+        for i, original in enumerate(originales):
+            gif.seek(i)
+            assert np.abs(np.asarray(gif.convert('RGB'), dtype=int) - original).mean() < 1
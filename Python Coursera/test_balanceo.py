@@ -0,0 +1,47 @@
+import numpy as np
+from modulos.balanceo import fasor, polar, balancear, balancear_flota
+
+
+def _simular(alpha, desbalance, pesos_prueba):
+    """Lecturas de una máquina lineal con coeficientes de influencia conocidos."""
+    V0 = alpha @ desbalance
+    V_prueba = np.array([alpha @ (desbalance + np.eye(len(pesos_prueba))[k] * pesos_prueba[k])
+                         for k in range(len(pesos_prueba))])
+    return V0, V_prueba
+
+
+def test_fasor_polar_ida_y_vuelta():
+    amplitud, fase = polar(fasor([2.0, 5.0], [30.0, 300.0]))
+    np.testing.assert_allclose(amplitud, [2.0, 5.0])
+    np.testing.assert_allclose(fase, [30.0, 300.0])
+
+
+def test_balanceo_dos_planos_dos_velocidades_cancela_desbalance():
+    rng = np.random.default_rng(0)
+    # 2 sensores x 2 velocidades = 4 mediciones, 2 planos
+    alpha = rng.normal(size=(4, 2)) + 1j * rng.normal(size=(4, 2))
+    desbalance = fasor([0.02, 0.015], [40, 200])
+    pesos_prueba = fasor([0.01, 0.01], [0, 90])
+    V0, V_prueba = _simular(alpha, desbalance, pesos_prueba)
+
+    res = balancear(V0, V_prueba, pesos_prueba)
+    np.testing.assert_allclose(res['correccion'], -desbalance, atol=1e-12)
+    np.testing.assert_allclose(res['residual'], 0, atol=1e-12)
+
+
+def test_flota_agrupa_formas_distintas():
+    rng = np.random.default_rng(1)
+    registros = []
+    for i, (m, n) in enumerate([(4, 2), (2, 1), (4, 2)]):
+        alpha = rng.normal(size=(m, n)) + 1j * rng.normal(size=(m, n))
+        desbalance = rng.normal(size=n) + 1j * rng.normal(size=n)
+        pesos_prueba = np.full(n, 0.5 + 0j)
+        V0, V_prueba = _simular(alpha, desbalance, pesos_prueba)
+        registros.append({'maquina': f'M{i}', 'V0': V0, 'V_prueba': V_prueba,
+                          'pesos_prueba': pesos_prueba, 'esperado': -desbalance})
+
+    resultados = balancear_flota(registros)
+    assert [r['maquina'] for r in resultados] == ['M0', 'M1', 'M2']
+    for registro, resultado in zip(registros, resultados):
+        np.testing.assert_allclose(resultado['correccion'], registro['esperado'], atol=1e-10)
+        assert resultado['reduccion'] > 0.999
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from modulos.base_materiales import (INDICES, BaseMateriales, base_materiales, construir_base_materiales)
+
+
+def test_base_compilada_coincide_con_el_catalogo(tmp_path):
+    base = base_materiales()
+    assert base is base_materiales()
+    assert len(base) >= 300 and base.indice.is_unique
+    compilada = construir_base_materiales(ruta_base=str(tmp_path / 'materiales.npz'))
+    recargada = BaseMateriales.cargar(str(tmp_path / 'materiales.npz'))
+    for c, valores in base.columnas.items():
+        np.testing.assert_array_equal(compilada[c], valores)
+        np.testing.assert_array_equal(recargada[c], valores)
+    # Propiedades físicamente coherentes en todo el catálogo
+    assert np.all(base['Su'] > 0) and np.all(base['rho'] > 0) and np.all(base['E'] > 0)
+    assert np.all((base['nu'] > 0) & (base['nu'] < 0.5))
+    con_fluencia = np.isfinite(base['Sy'])
+    assert np.all(base['Sy'][con_fluencia] <= base['Su'][con_fluencia])
+
+
+def test_fatiga_estimada_y_basquin():
+    base = base_materiales()
+    p = base.propiedades('AISI 1045 HR')
+    assert p['Se'] == pytest.approx(0.5 * 570) and p['N_e'] == 1e6
+    assert p['sigma_f'] * 1e3 ** p['b'] == pytest.approx(0.9 * 570)
+    assert p['sigma_f'] * p['N_e'] ** p['b'] == pytest.approx(p['Se'])
+    assert base.propiedades('ASTM A48 clase 30')['Se'] == 97          # tabulado, no estimado
+    assert base.propiedades('AISI 52100 templado 150')['Se'] == 700   # tope de los aceros
+    assert base.propiedades('Al 7075-T6')['Se'] == 130
+    N = base.vida_fatiga('AISI 1045 HR', [0.9 * 570, 400, 200])
+    np.testing.assert_allclose(N[:2], [1e3, (400 / p['sigma_f']) ** (1 / p['b'])])
+    assert np.isinf(N[2])
+
+
+def test_seleccion_coincide_con_ordenamiento_completo():
+    base = base_materiales()
+    restricciones = {'Sy': (300, None), 'costo': (None, 10), 'familia': ['aluminio_forjado', 'acero_aleado',
+                                                                        'titanio', 'magnesio']}
+    top = base.seleccionar('viga_rigidez', n=8, restricciones=restricciones)
+    tabla = base.como_dataframe()
+    tabla['M'] = tabla['E'] ** 0.5 / tabla['rho']
+    tabla = tabla[(tabla['Sy'] >= 300) & (tabla['costo'] <= 10) & tabla['familia'].isin(restricciones['familia'])]
+    esperado = tabla.sort_values('M', ascending=False, kind='stable').head(8)
+    np.testing.assert_allclose(top['indice'], esperado['M'])
+    assert top['relativo'].iloc[0] == 1.0 and np.all(np.diff(top['indice']) <= 0)
+    assert set(top['familia']) <= set(restricciones['familia']) and top['Sy'].min() >= 300
+    # Sy NaN (materiales frágiles) no entra en índices de resistencia
+    ductiles = base.seleccionar('viga_resistencia', n=len(base))
+    assert np.all(np.isfinite(ductiles['Sy']))
+    menor = base.seleccionar({'rho': 1.0}, n=3, maximizar=False)
+    assert list(menor['rho']) == sorted(base['rho'])[:3]
+    assert set(INDICES) >= {'viga_rigidez', 'tirante_resistencia', 'resorte'}
+
+
+def test_errores():
+    base = base_materiales()
+    with pytest.raises(ValueError):
+        base.propiedades('Unobtainium')
+    with pytest.raises(ValueError):
+        base.seleccionar('indice_inexistente')
+    with pytest.raises(ValueError):
+        base.filtrar({'dureza': (100, None)})
+    with pytest.raises(ValueError):
+        base.indice_desempeno({'familia': 1.0})
@@ -0,0 +1,63 @@
+import numpy as np
+from modulos.cavitacion import (CAVITACION, MARGINAL, SEGURO, LineaSuccion, densidad_agua,
+                                mapa_cavitacion, npsh_disponible, npsh_requerido,
+                                presion_vapor)
+
+CURVA_NPSHR = [4e-5, 0.0, 2.0]          # NPSHr₁ = 2 + 4e-5 Q² (m, Q en m³/h)
+
+
+def test_propiedades_del_agua():
+    # Tabla de vapor IAPWS: 0.101418 MPa a 100 °C, 3.1699 kPa a 25 °C
+    np.testing.assert_allclose(presion_vapor([100.0, 25.0]), [101418.0, 3169.9], rtol=2e-4)
+    np.testing.assert_allclose(densidad_agua([4.0, 20.0, 80.0]), [999.97, 998.21, 971.8],
+                               atol=0.1)
+
+
+def test_npsha_con_linea_sin_perdidas():
+    succion = LineaSuccion(longitud=0.0, diametro=0.3, cota_bomba=1.0)
+    npsha = npsh_disponible(0.0, 3.0, succion, temperatura=20.0, gravedad_especifica=1.5)
+    esperado = (101325.0 - presion_vapor(20.0)) / (1.5 * densidad_agua(20.0) * 9.81) + 2.0
+    np.testing.assert_allclose(npsha, esperado)
+
+
+def test_npshr_sigue_las_leyes_de_afinidad():
+    Q = np.array([100.0, 200.0])
+    np.testing.assert_allclose(npsh_requerido(0.8 * Q, 0.8, CURVA_NPSHR),
+                               0.64 * np.polyval(CURVA_NPSHR, Q))
+
+
+def test_mapa_coincide_con_evaluacion_punto_a_punto():
+    succion = LineaSuccion(longitud=15.0, diametro=0.25, cota_bomba=0.0,
+                           perdidas_menores=2.5, factor_pulpa=1.2)
+    Q = np.linspace(20, 600, 40)
+    s = np.linspace(0.6, 1.0, 9)
+    z = np.array([-2.0, 0.0, 2.0])
+    mapa = mapa_cavitacion(Q, s, z, succion, CURVA_NPSHR, temperatura=35.0,
+                           gravedad_especifica=1.4, altitud=2500.0)
+    assert mapa['riesgo'].shape == (40, 9, 3)
+
+    i, j, k = 25, 4, 1
+    npsha = npsh_disponible(Q[i], z[k], succion, 35.0, 1.4, 2500.0)
+    npshr = npsh_requerido(Q[i], s[j], CURVA_NPSHR)
+    np.testing.assert_allclose(mapa['margen'][i, j, k], npsha - npshr)
+
+    margen, razon = mapa['margen'], mapa['razon']
+    assert np.all((mapa['riesgo'] == CAVITACION) == (margen < 0))
+    assert np.all((razon[mapa['riesgo'] == SEGURO]) >= 1.3)
+    assert np.any(mapa['riesgo'] == MARGINAL)
+    # El riesgo crece con el caudal y con la velocidad, y baja al subir el nivel
+    assert np.all(np.diff(mapa['riesgo'], axis=0) >= 0)
+    assert np.all(np.diff(mapa['riesgo'], axis=2) <= 0)
+
+
+def test_caudal_limite_en_el_borde_seguro():
+    succion = LineaSuccion(longitud=10.0, diametro=0.3, perdidas_menores=1.0)
+    Q = np.linspace(10, 800, 200)
+    mapa = mapa_cavitacion(Q, [0.7, 1.0], [-1.0, 1.0], succion, CURVA_NPSHR)
+    limite = mapa['caudal_limite']
+    assert np.all(np.isfinite(limite))
+    assert limite[0, 1] > limite[1, 1] and limite[1, 1] > limite[1, 0]
+    for j, k in np.ndindex(limite.shape):
+        a = npsh_disponible(limite[j, k], mapa['niveles'][k], succion)
+        r = npsh_requerido(limite[j, k], mapa['velocidades'][j], CURVA_NPSHR)
+        assert abs(min(a / r - 1.3, (a - r - 0.6) / 0.6)) < 2e-3
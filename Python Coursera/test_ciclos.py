@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from modulos.ciclos import (ciclo_brayton, ciclo_carnot, ciclo_diesel, ciclo_otto, ciclo_rankine,
+                            tabla_estados)
+from modulos.propiedades import MezclaGasIdeal
+
+
+def test_rankine_simple_ideal():
+    # 8 MPa, 500 °C, 10 kPa (caso clásico de texto): η ≈ 39.4 %, x ≈ 0.81
+    r = ciclo_rankine(8000, 773.15, 10)
+    np.testing.assert_allclose(r['eficiencia'], 0.394, atol=2e-3)
+    np.testing.assert_allclose(r['titulo_escape'], 0.810, atol=2e-3)
+    tabla = tabla_estados(r)
+    assert list(tabla.columns) == ['P', 'T', 'h', 's', 'v', 'x']
+    np.testing.assert_allclose(tabla.loc['9', 's'], tabla.loc['5', 's'])
+
+
+@pytest.mark.parametrize('P_regeneracion', [500.0, 6000.0])
+def test_rankine_recalentamiento_y_regeneracion(P_regeneracion):
+    base = ciclo_rankine(15000, 873.15, 10, 0.87, 0.8)
+    r = ciclo_rankine(15000, 873.15, 10, 0.87, 0.8, P_recalentamiento=4000,
+                      P_regeneracion=P_regeneracion)
+    np.testing.assert_allclose(r['calor_entrada'] - r['calor_salida'], r['trabajo_neto'], atol=1e-8)
+    assert 0 < r['fraccion_extraccion'] < 0.4
+    assert r['eficiencia'] > base['eficiencia']
+    assert r['titulo_escape'] > base['titulo_escape']
+    # El calentador abierto entrega líquido saturado a su presión
+    np.testing.assert_allclose(r['estados']['3']['P'], P_regeneracion)
+    assert r['estados']['3']['x'] == 0
+
+
+def test_brayton_aproxima_aire_frio_y_regenera():
+    aire = MezclaGasIdeal()
+    ideal = ciclo_brayton(10, 1400)
+    assert 0.44 < ideal['eficiencia'] < 1 - 10**(-0.4 / 1.4)
+    real = ciclo_brayton(6, 1300, eta_compresor=0.85, eta_turbina=0.88)
+    regen = ciclo_brayton(6, 1300, eta_compresor=0.85, eta_turbina=0.88, efectividad_regenerador=0.8)
+    recal = ciclo_brayton(6, 1300, eta_compresor=0.85, eta_turbina=0.88, efectividad_regenerador=0.8,
+                          recalentamiento=True)
+    assert regen['eficiencia'] > real['eficiencia']
+    assert recal['trabajo_neto'] > regen['trabajo_neto']
+    for c in (real, regen, recal):
+        np.testing.assert_allclose(c['calor_entrada'] - c['calor_salida'], c['trabajo_neto'], atol=1e-8)
+    np.testing.assert_allclose(ideal['estados']['2']['s'], ideal['estados']['1']['s'])
+    assert aire.R > 0
+
+
+def test_barrido_vectorizado_igual_a_puntos_sueltos():
+    rp = np.linspace(2, 40, 200)[:, None]
+    T = np.linspace(1000, 1700, 200)[None, :]
+    barrido = ciclo_brayton(rp, T, eta_compresor=0.85, eta_turbina=0.88, efectividad_regenerador=0.7)
+    assert barrido['eficiencia'].shape == (200, 200)
+    for i, j in [(0, 0), (57, 140), (199, 199)]:
+        punto = ciclo_brayton(rp[i, 0], T[0, j], eta_compresor=0.85, eta_turbina=0.88,
+                              efectividad_regenerador=0.7)
+        np.testing.assert_allclose(barrido['eficiencia'][i, j], punto['eficiencia'], rtol=1e-10)
+    tabla = tabla_estados(barrido, (57, 140))
+    np.testing.assert_allclose(tabla.loc['3', 'T'], T[0, 140])
+
+def test_barrido_solo_recalentamiento_y_extraccion():
+    # Solo las presiones de recalentamiento/extracción son arreglos (modo paramétrico)
+    Prh = np.linspace(1000, 6000, 6)[:, None]
+    Pr = np.array([300.0, 2000.0, 8000.0])[None, :]
+    barrido = ciclo_rankine(15000, 873.15, 10, 0.87, 0.8, P_recalentamiento=Prh, P_regeneracion=Pr)
+    assert barrido['eficiencia'].shape == (6, 3)
+    for i, j in [(0, 0), (2, 1), (5, 2)]:
+        punto = ciclo_rankine(15000, 873.15, 10, 0.87, 0.8, P_recalentamiento=Prh[i, 0],
+                              P_regeneracion=Pr[0, j])
+        np.testing.assert_allclose(barrido['eficiencia'][i, j], punto['eficiencia'], rtol=1e-10)
+    solo = ciclo_rankine(15000, 873.15, 10, P_recalentamiento=4000, P_regeneracion=Pr[0])
+    assert solo['fraccion_extraccion'].shape == (3,)
+
+
+def test_ciclos_de_piston():
+    otto = ciclo_otto([6.0, 8.0, 10.0], 1800)
+    assert np.all(np.diff(otto['eficiencia']) > 0)
+    assert np.all(otto['eficiencia'] < 1 - np.array([6.0, 8.0, 10.0])**-0.4)
+    np.testing.assert_allclose(otto['estados']['3']['v'], otto['estados']['2']['v'])
+    np.testing.assert_allclose(otto['estados']['4']['v'], otto['estados']['1']['v'])
+
+    diesel = ciclo_diesel(18, relacion_corte=2.0)
+    np.testing.assert_allclose(diesel['relacion_corte'], 2.0)
+    np.testing.assert_allclose(diesel['estados']['3']['P'], diesel['estados']['2']['P'])
+    assert ciclo_otto(18, diesel['estados']['3']['T'])['eficiencia'] > diesel['eficiencia']
+    with pytest.raises(ValueError):
+        ciclo_diesel(18)
+
+
+def test_carnot():
+    # Valores por defecto de la GUI: relación 10, menor que la de las isentrópicas
+    c = ciclo_carnot(800, 300, 1000, 100)
+    np.testing.assert_allclose(c['eficiencia'], 1 - 300 / 800)
+    e = c['estados']
+    np.testing.assert_allclose([e['3']['P'], e['4']['P']], [1000, 100])
+    np.testing.assert_allclose([e['1']['T'], e['2']['T']], [300, 300])
+    np.testing.assert_allclose([e['1']['s'], e['2']['s']], [e['4']['s'], e['3']['s']], atol=1e-9)
+    assert e['1']['P'] < e['2']['P'] < e['3']['P']
+    np.testing.assert_allclose(c['trabajo_neto'], c['calor_entrada'] - c['calor_salida'])
+    with pytest.raises(ValueError):
+        ciclo_carnot(800, 300, 100, 1000)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from scipy.special import erf
+from modulos.conduccion import (Capa, Frontera, MATERIALES, ParedCompuesta, factor_recuperacion_capital,
+                                optimizar_aislamiento)
+
+
+def _horno():
+    capas = [Capa.de_material('ladrillo_refractario', 0.2), Capa.de_material('lana_mineral', 0.1),
+             Capa.de_material('acero_carbono', 0.005)]
+    return ParedCompuesta(capas), Frontera(1200, 50.0, 0.8), Frontera(300, 10.0, 0.9, T_alrededores=290)
+
+
+def test_transitorio_solido_semi_infinito():
+    p = ParedCompuesta([Capa.de_material('acero_carbono', 0.5)], nodos_por_capa=400)
+    r = p.transitorio(Frontera(400, np.inf), Frontera(300, 0.0), 300, 600, 1.0, guardar_cada=600)
+    assert r['T'].shape == (2, 400)
+    alfa = 45 / (7850 * 475)
+    exacta = 400 - 100 * erf(r['posicion'] / (2 * np.sqrt(alfa * 600)))
+    np.testing.assert_allclose(r['T'][-1], exacta, atol=0.05)
+
+
+def test_estacionario_con_radiacion_y_balance_de_energia():
+    pared, interior, exterior = _horno()
+    s = pared.estacionario(interior, exterior)
+    # Balance de la superficie exterior: conducción = convección + radiación
+    Ts = s['T_interfaces'][-1]
+    salida = 10 * (Ts - 300) + 0.9 * 5.670374419e-8 * (Ts**4 - 290**4)
+    np.testing.assert_allclose(s['q'], salida, rtol=1e-8)
+    np.testing.assert_allclose(np.diff(s['T_interfaces']), -s['q'] * s['resistencias'], rtol=1e-10)
+
+    largo = pared.transitorio(interior, exterior, 300, 3e6, 600, guardar_cada=1000)
+    np.testing.assert_allclose(largo['q_interior'][-1], s['q'], rtol=1e-6)
+    np.testing.assert_allclose(largo['q_exterior'][-1], s['q'], rtol=1e-6)
+
+    # Euler implícito conserva la energía exactamente
+    corto = pared.transitorio(interior, exterior, 300, 36000, 60)
+    neto = np.sum(corto['q_interior'][1:] - corto['q_exterior'][1:]) * 60
+    np.testing.assert_allclose(corto['energia_almacenada'][-1], neto, rtol=1e-9)
+
+
+def test_cilindro_resistencias_logaritmicas():
+    tubo = ParedCompuesta([Capa.de_material('acero_carbono', 0.005), Capa.de_material('lana_mineral', 0.05)],
+                          'cilindrica', radio_interior=0.05)
+    s = tubo.estacionario(Frontera(450, np.inf), Frontera(300, 10))
+    R = (np.log(0.055 / 0.05) / (2 * np.pi * 45) + np.log(0.105 / 0.055) / (2 * np.pi * 0.04)
+         + 1 / (10 * 2 * np.pi * 0.105))
+    np.testing.assert_allclose(s['q'], 150 / R)
+    r = tubo.transitorio(Frontera(450, np.inf), Frontera(300, 10), 300, 2e5, 200, guardar_cada=1000)
+    np.testing.assert_allclose(r['q_exterior'][-1], 150 / R, rtol=1e-4)
+    with pytest.raises(ValueError):
+        ParedCompuesta([Capa(0.01, 1.0)], 'cilindrica')
+    with pytest.raises(ValueError):
+        ParedCompuesta([Capa(0.01, 1.0)]).transitorio(Frontera(400, 10), Frontera(300, 10), 300, 10, 1)
+
+
+def test_optimizacion_de_aislamiento():
+    tubo = ParedCompuesta([Capa.de_material('acero_carbono', 0.005)], 'cilindrica', radio_interior=0.05)
+    interior, exterior = Frontera(450, np.inf), Frontera(300, 10, 0.9)
+    espesores = np.linspace(0, 0.2, 201)
+    r = optimizar_aislamiento(tubo, interior, exterior, espesores, costo_energia=0.05)
+    assert r['costo_total'].shape == (201, len(r['materiales']))
+    # Cada punto de la malla coincide con la solución de la pared completa
+    j = r['materiales'].index('silicato_calcio')
+    completa = ParedCompuesta([Capa.de_material('acero_carbono', 0.005),
+                               Capa.de_material('silicato_calcio', espesores[50])],
+                              'cilindrica', radio_interior=0.05)
+    np.testing.assert_allclose(r['q'][50, j], completa.estacionario(interior, exterior)['q'], rtol=1e-8)
+    # El óptimo es un mínimo interior de la curva de costo de su material
+    i = int(np.argmin(r['costo_total'][:, j]))
+    assert 0 < i < 200
+    np.testing.assert_allclose(r['espesor_optimo'][j], espesores[i])
+    assert r['optimo']['costo_total'] == pytest.approx(np.nanmin(r['costo_optimo']))
+    # El poliuretano no resiste 450 K sobre la tubería
+    assert not r['factible'][1:, r['materiales'].index('poliuretano')].any()
+    assert MATERIALES['poliuretano']['T_max'] < 450
+    np.testing.assert_allclose(factor_recuperacion_capital(0.0, 10), 0.1)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from scipy import integrate, stats
+from modulos.confiabilidad import (VariableAleatoria, form, monte_carlo, muestreo_importancia, sorm)
+
+
+def _resistencia_carga():
+    variables = {'R': VariableAleatoria('normal', 300.0, 30.0), 'S': VariableAleatoria('normal', 200.0, 20.0)}
+    return (lambda R, S: R - S), variables, 100.0 / np.hypot(30.0, 20.0)
+
+
+def test_variables_reproducen_media_y_desviacion():
+    u = np.random.default_rng(0).standard_normal(400_000)
+    for distribucion in ('normal', 'lognormal', 'gumbel', 'weibull', 'uniforme'):
+        v = VariableAleatoria(distribucion, 250.0, 25.0)
+        x = v.desde_normal(u)
+        assert x.mean() == pytest.approx(250.0, rel=2e-3) and x.std() == pytest.approx(25.0, rel=1e-2)
+        np.testing.assert_allclose(v.a_normal(v.desde_normal([-4.0, 0.0, 4.0])), [-4.0, 0.0, 4.0], atol=1e-8)
+    with pytest.raises(ValueError):
+        VariableAleatoria('lognormal', -1.0, 1.0)
+    with pytest.raises(ValueError):
+        VariableAleatoria('beta', 1.0, 1.0)
+
+
+def test_form_y_muestreo_en_estado_limite_lineal():
+    g, variables, beta = _resistencia_carga()
+    r = form(g, variables)
+    assert r['convergio'] and r['beta'] == pytest.approx(beta, rel=1e-8)
+    np.testing.assert_allclose([r['alfa']['R'], r['alfa']['S']], [-30, 20] / np.hypot(30.0, 20.0), atol=1e-8)
+    assert r['x']['R'] == pytest.approx(r['x']['S'])
+    exacta = stats.norm.cdf(-beta)
+    for resultado in (monte_carlo(g, variables, n=1_000_000, semilla=1),
+                      monte_carlo(g, variables, n=1_000_000, lote=100_000, metodo='lhs', semilla=1),
+                      muestreo_importancia(g, variables, n=50_000, semilla=1)):
+        assert resultado['ic'][0] <= exacta <= resultado['ic'][1], resultado['metodo']
+        assert resultado['cov'] < 0.05
+    assert muestreo_importancia(g, variables, n=50_000, semilla=1)['evaluaciones'] > 50_000
+
+
+def test_sorm_en_superficie_parabolica():
+    variables = {'x1': VariableAleatoria('normal', 0.0, 1.0), 'x2': VariableAleatoria('normal', 0.0, 1.0)}
+    g = lambda x1, x2: 3.0 - x2 + 0.1 * x1 ** 2
+    exacta = integrate.quad(lambda x: stats.norm.pdf(x) * stats.norm.sf(3 + 0.1 * x * x), -10, 10)[0]
+    r = sorm(g, variables)
+    np.testing.assert_allclose(r['curvaturas'], [0.2], rtol=1e-4)
+    assert r['pf_breitung'] == pytest.approx(stats.norm.cdf(-3) / np.sqrt(1.6), rel=1e-4)
+    assert abs(r['pf_hohenbichler'] - exacta) < abs(r['pf'] - exacta) / 10
+    ri = muestreo_importancia(g, variables, n=100_000, semilla=2)
+    assert ri['ic'][0] <= exacta <= ri['ic'][1]
+
+
+def test_estado_limite_de_fatiga_con_fijos():
+    # Recta de Basquin por (10³, 0.9·Su) y (10⁶, Se) con dispersión en la amplitud y en Se
+    def g(Sa, Se, N_requerido, Su):
+        b = np.log10(Se / (0.9 * Su)) / 3.0
+        return 3.0 + np.log10(Sa / (0.9 * Su)) / b - np.log10(N_requerido)
+
+    variables = {'Sa': VariableAleatoria('normal', 260.0, 20.0), 'Se': VariableAleatoria('lognormal', 300.0, 24.0)}
+    fijos = {'N_requerido': 1e6, 'Su': 600.0}
+    r = sorm(g, variables, fijos=fijos)
+    mc = monte_carlo(g, variables, n=400_000, fijos=fijos, semilla=3)
+    ri = muestreo_importancia(g, variables, n=50_000, punto_diseno=r['u'], fijos=fijos, semilla=3)
+    assert r['convergio'] and r['alfa']['Sa'] > 0 > r['alfa']['Se']
+    assert ri['ic'][0] <= mc['ic'][1] and mc['ic'][0] <= ri['ic'][1]
+    assert r['pf_hohenbichler'] == pytest.approx(mc['pf'], rel=0.05)
+    with pytest.raises(ValueError):
+        monte_carlo(g, variables, metodo='sobol', fijos=fijos)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from modulos.energia_bombeo import OptimizadorEnergia, tarifa_por_periodos
+from modulos.estacion_bombeo import EstacionBombeo, ModeloBomba
+
+BOMBA = ModeloBomba([-0.0005, 0.0, 60.0], [-2e-5, 0.008, 0.0])
+PERIODOS = {'punta': (0.20, range(18, 22)),
+            'llano': (0.12, list(range(7, 18)) + [22]),
+            'valle': (0.08, list(range(0, 7)) + [23])}
+
+
+def _demanda_anual():
+    t = np.arange(8760)
+    rng = np.random.default_rng(0)
+    Q = 280 + 150 * np.sin(2 * np.pi * t / 24) + 40 * np.sin(2 * np.pi * t / 8760) \
+        + rng.normal(0, 10, 8760)
+    return Q, 20 + 1e-4 * Q**2
+
+
+def test_tarifa_por_periodos():
+    precio, periodo = tarifa_por_periodos(PERIODOS, 48)
+    assert precio[19] == 0.20 and periodo[43] == 'punta'
+    assert precio[3] == 0.08 and periodo[34] == 'llano'
+    with pytest.raises(ValueError, match='Horas sin periodo'):
+        tarifa_por_periodos({'punta': (0.2, range(18, 22))})
+    with pytest.raises(ValueError, match='repite'):
+        tarifa_por_periodos({'a': (0.1, range(24)), 'b': (0.2, [5])})
+
+
+def test_superficies_reproducen_la_optimizacion_directa():
+    estacion = EstacionBombeo([BOMBA, BOMBA, BOMBA])
+    rng = np.random.default_rng(1)
+    Q = rng.uniform(100, 450, 500)
+    H = 20 + 1e-4 * Q**2
+    optimizador = OptimizadorEnergia.desde_demanda(estacion, Q, H)
+    horario = optimizador.evaluar(Q, H)
+    directo = estacion.optimizar(Q, H)
+
+    np.testing.assert_array_equal(horario['factible'], np.isfinite(directo['potencia_optima']))
+    igual = horario['combinacion'] == directo['mejor']
+    assert igual.mean() > 0.95
+    np.testing.assert_allclose(horario['potencia'][igual & horario['factible']],
+                               directo['potencia_optima'][igual & horario['factible']], rtol=2e-3)
+    # Cerca de los cambios de combinación la interpolación es conservadora
+    assert np.all(horario['potencia'][horario['factible']]
+                  >= directo['potencia_optima'][horario['factible']] * (1 - 2e-3))
+
+
+def test_simulacion_anual_con_tarifas():
+    estacion = EstacionBombeo([BOMBA, BOMBA, BOMBA])
+    Q, H = _demanda_anual()
+    precio, periodo = tarifa_por_periodos(PERIODOS)
+    optimizador = OptimizadorEnergia.desde_demanda(estacion, Q, H)
+    res = optimizador.simular(Q, H, precio, periodo)
+
+    horario = res['horario']
+    assert res['horas_no_factibles'] == 0
+    assert res['energia_kwh'] == pytest.approx(horario['potencia'].sum())
+    assert res['costo'] == pytest.approx(np.sum(horario['potencia'] * precio))
+    assert sum(p['energia_kwh'] for p in res['por_periodo'].values()) == pytest.approx(res['energia_kwh'])
+    assert res['por_periodo']['punta']['horas'] == 4 * 365
+    assert res['horas_por_combinacion'].sum() == 8760
+    # En las horas de mayor demanda se requieren más bombas en marcha
+    n_bombas = horario['bombas'].sum(axis=1)
+    assert n_bombas[np.argmax(Q)] > n_bombas[np.argmin(Q)]
+    # Una hora fuera del alcance de la estación deja los totales incompletos (NaN)
+    Q[0] = 1e4
+    res = optimizador.simular(Q, H, precio, periodo)
+    assert res['horas_no_factibles'] == 1
+    assert np.isnan(res['energia_kwh']) and np.isnan(res['costo'])
+    assert np.isnan(res['por_periodo'][periodo[0]]['energia_kwh'])
+
+
+def test_demanda_baja_y_horas_atipicas():
+    # Con 30 m de altura estática las bombas cierran en s ≈ 0.71: las horas de
+    # poca demanda operan justo por encima del cierre
+    estacion = EstacionBombeo([BOMBA, BOMBA, BOMBA])
+    t = np.arange(24 * 28)
+    Q = 150 + 140 * np.sin(2 * np.pi * t / 24)
+    Q[100] = 400.0
+    H = 30 + 1e-4 * Q**2
+    optimizador = OptimizadorEnergia.desde_demanda(estacion, Q, H)
+    # La hora atípica no estira la malla
+    assert optimizador.caudales[-1] < 300
+    res = optimizador.simular(Q, H, 0.1)
+    assert res['horas_no_factibles'] == 0 and np.isfinite(res['energia_kwh'])
+    directo = estacion.optimizar(Q[[100, 18]], H[[100, 18]])
+    assert res['horario']['potencia'][100] == pytest.approx(directo['potencia_optima'][0])
+    assert res['horario']['combinacion'][100] == directo['mejor'][0]
+    assert res['horario']['potencia'][18] == pytest.approx(directo['potencia_optima'][1], rel=2e-3)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from modulos.estacion_bombeo import EstacionBombeo, ModeloBomba
+
+BOMBA_A = ModeloBomba([-0.0005, 0.0, 60.0], [-2e-5, 0.008, 0.0], 'A')
+BOMBA_B = ModeloBomba([-0.0003, 0.0, 70.0], [-1e-5, 0.006, 0.0], 'B')
+
+
+def test_una_bomba_recupera_la_velocidad_de_afinidad():
+    estacion = EstacionBombeo([BOMBA_A])
+    x = 180.0
+    Q, H = 0.9 * x, BOMBA_A.altura(0.9 * x, 0.9)
+    res = estacion.optimizar(Q, H)
+    assert res['velocidad_optima'][0] == pytest.approx(0.9, rel=1e-8)
+    eta = BOMBA_A.eficiencia(x)
+    assert res['potencia_optima'][0] == pytest.approx(1000 * 9.81 * Q / 3600 * H / (eta * 1000),
+                                                      rel=1e-7)
+
+
+def _fuerza_bruta_paralelo(estacion, Q, H):
+    s = np.linspace(estacion.velocidad_min, estacion.velocidad_max, 20001)
+    mejor = np.inf
+    for combinacion in estacion.combinaciones:
+        total, potencia = 0.0, 0.0
+        for bomba in np.array(estacion.bombas)[combinacion]:
+            c = bomba.curva_altura
+            x = np.sqrt(np.where(H / s**2 < c[2], (c[2] - H / s**2) / -c[0], np.nan))
+            total = total + x * s
+            potencia = potencia + estacion.potencia(x * s, H, bomba.eficiencia(x * s, s))
+        i = np.nanargmin(np.abs(total - Q)) if np.any(np.isfinite(total)) else None
+        if i is not None and abs(total[i] - Q) < 0.05:
+            mejor = min(mejor, potencia[i])
+    return mejor
+
+
+def test_paralelo_coincide_con_busqueda_exhaustiva():
+    estacion = EstacionBombeo([BOMBA_A, BOMBA_A, BOMBA_B], 'paralelo')
+    Q = np.array([150.0, 300.0, 500.0, 700.0])
+    H = np.array([40.0, 45.0, 50.0, 55.0])
+    res = estacion.optimizar(Q, H)
+
+    assert res['combinaciones'].shape == (7, 3)
+    for d in range(3):
+        assert res['potencia_optima'][d] == pytest.approx(
+            _fuerza_bruta_paralelo(estacion, Q[d], H[d]), rel=1e-3)
+        caudales = res['caudales_bomba'][d, res['mejor'][d]]
+        assert caudales.sum() == pytest.approx(Q[d], rel=1e-8)
+    np.testing.assert_array_equal(res['bombas_optimas'][2], [True, True, True])
+    # 700 m³/h a 55 m excede la estación completa
+    assert res['mejor'][3] == -1 and np.isnan(res['potencia_optima'][3])
+
+
+def test_serie_suma_alturas_al_mismo_caudal():
+    estacion = EstacionBombeo([BOMBA_A, BOMBA_B], 'serie')
+    res = estacion.optimizar([150.0, 200.0], [80.0, 90.0])
+    for d, (Q, H) in enumerate([(150.0, 80.0), (200.0, 90.0)]):
+        s = res['velocidad_optima'][d]
+        activas = np.array(estacion.bombas)[res['bombas_optimas'][d]]
+        assert sum(b.altura(Q, s) for b in activas) == pytest.approx(H, rel=1e-8)
+    # Una sola bomba no llega a 90 m
+    assert res['bombas_optimas'][1].all()
+
+
+def test_curva_combinada_en_paralelo_duplica_el_caudal():
+    estacion = EstacionBombeo([BOMBA_A, BOMBA_A])
+    curva = estacion.curva_combinada([True, True], velocidad=0.8)
+    simple = estacion.curva_combinada([True, False], velocidad=0.8)
+    np.testing.assert_allclose(curva['caudales'], 2 * simple['caudales'])
+    assert curva['alturas'][0] == pytest.approx(0.64 * 60.0)
+
+
+def test_requisito_justo_por_encima_del_cierre():
+    # A 30 m la bomba cierra en s = √(30/40) ≈ 0.866: la malla de velocidades
+    # tiene puntos que no llegan a la altura justo debajo del cruce
+    bomba = ModeloBomba([-0.002, 0.0, 40.0], [-2e-5, 0.008, 0.1])
+    estacion = EstacionBombeo([bomba, bomba])
+    res = estacion.optimizar([0.1, 10.0, 20.0], [30.0, 30.0, 30.0])
+    assert res['factible'].all()
+    for d, Q in enumerate([0.1, 10.0, 20.0]):
+        s = res['velocidad'][d]
+        # Una bomba: Q = s·x con 40 - 0.002·x² = 30/s²
+        assert bomba.altura(Q, s[0]) == pytest.approx(30.0, rel=1e-8)
+        assert bomba.altura(Q / 2, s[2]) == pytest.approx(30.0, rel=1e-8)
+        np.testing.assert_allclose(res['caudales_bomba'][d].sum(axis=-1), Q, rtol=1e-8)
+    assert res['velocidad'][1, 0] == pytest.approx(0.869, abs=1e-3)
+    np.testing.assert_array_equal(res['bombas_optimas'].sum(axis=1), [1, 1, 1])
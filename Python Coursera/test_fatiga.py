@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from modulos.fatiga import (ContadorRainflow, CurvaSN, amplitud_equivalente, analizar_historia,
+                            contar_ciclos, dano_miner)
+
+
+def _resumen(ciclos):
+    rangos = {}
+    for r, n in zip(ciclos['rango'], ciclos['cuenta']):
+        rangos[r] = rangos.get(r, 0) + n
+    return rangos
+
+
+def test_rainflow_ejemplo_astm_e1049():
+    ciclos = contar_ciclos([-2, 1, -3, 5, -1, 3, -4, 4, -2])
+    assert _resumen(ciclos) == {3: 0.5, 4: 1.5, 6: 0.5, 8: 1.0, 9: 0.5}
+    # Mesetas y puntos intermedios de rampas no son reversiones
+    assert _resumen(contar_ciclos([0, 1, 1, 2, 2, -2, -1, 0, 3])) == _resumen(contar_ciclos([0, 2, -2, 3]))
+
+
+def test_bloques_coinciden_con_la_historia_completa():
+    rng = np.random.default_rng(3)
+    x = np.cumsum(rng.normal(size=300_000)) + 40 * np.sin(np.arange(300_000) * 0.02)
+    completo = contar_ciclos(x)
+    contador = ContadorRainflow()
+    partes = [contador.agregar(x[i:i + 7919]) for i in range(0, len(x), 7919)] + [contador.finalizar()]
+    for c in ('rango', 'media', 'cuenta'):
+        np.testing.assert_array_equal(np.concatenate([p[c] for p in partes]), completo[c])
+    assert contador.muestras == len(x)
+    d = np.diff(x)
+    assert contador.reversiones == np.count_nonzero(d[:-1] * d[1:] < 0) + 2
+    # Todo el recorrido se cuenta una vez: Σ rango·cuenta = variación total / 2
+    assert np.sum(completo['rango'] * completo['cuenta']) <= np.abs(d).sum()
+
+
+def test_correcciones_esfuerzo_medio():
+    Sa, Sm, Su = 100.0, 200.0, 600.0
+    np.testing.assert_allclose(amplitud_equivalente(Sa, Sm, 'goodman', Su=Su), 150.0)
+    np.testing.assert_allclose(amplitud_equivalente(Sa, Sm, 'gerber', Su=Su), 100 / (1 - 1 / 9))
+    np.testing.assert_allclose(amplitud_equivalente(Sa, Sm, 'swt'), np.sqrt(300 * 100))
+    np.testing.assert_allclose(amplitud_equivalente(Sa, Sm, 'morrow', sigma_f=1000.0), 125.0)
+    # Media de compresión no se acredita; media ≥ Su es falla inmediata
+    np.testing.assert_allclose(amplitud_equivalente(Sa, [-200.0, 600.0], 'goodman', Su=Su), [100.0, np.inf])
+    assert amplitud_equivalente(50.0, -100.0, 'swt') == 0.0
+    with pytest.raises(ValueError):
+        amplitud_equivalente(Sa, Sm, 'goodman')
+    with pytest.raises(ValueError):
+        amplitud_equivalente(Sa, Sm, 'soderberg', Su=Su)
+
+
+def test_dano_miner_de_amplitud_constante():
+    curva = CurvaSN.desde_puntos(Su=600.0, Se=250.0)
+    assert curva.ciclos(0.9 * 600) == pytest.approx(1e3)
+    assert curva.ciclos(250.0) == np.inf and curva.ciclos(250.0 + 1e-9) == pytest.approx(1e6)
+    n, Sa = 20000, 350.0
+    x = np.tile([-Sa, Sa], n)
+    r = analizar_historia(np.array_split(x, 13), curva, correccion='goodman',
+                          bordes_rango=np.linspace(0, 1000, 11))
+    N = curva.ciclos(Sa)
+    assert r['ciclos'] == pytest.approx(n - 0.5)
+    np.testing.assert_allclose(r['dano'], (n - 0.5) / N, rtol=1e-9)
+    assert r['repeticiones'] == pytest.approx(N / (n - 0.5))
+    assert r['matriz'].sum() == pytest.approx(r['ciclos']) and r['matriz'][7] == pytest.approx(n - 0.5)
+    assert r['dano_por_bloque'].shape == (13,)
+    # El daño de un ciclo con media positiva crece con la corrección
+    d = dano_miner([2 * Sa] * 3, [0.0, 100.0, 100.0], [1, 1, 1], curva, 'goodman')
+    assert d[0] < d[1] and d[1] == d[2]
+
+
+def test_curva_de_la_base_de_materiales():
+    curva = CurvaSN.de_material('AISI 1045 HR', factor_Se=0.8)
+    assert curva.Se == pytest.approx(0.8 * 285) and curva.Su == 570
+    with pytest.raises(ValueError):
+        CurvaSN.de_material('Alúmina 99.5%')
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from modulos.flujo_tuberias import (ACCESORIOS, acumular_accesorios, evaluar_tramos, exportar_parquet,
+                                    factor_turbulento, perfiles_velocidad, tabla_perfiles)
+from modulos.friccion import factor_friccion, perdida_carga
+
+
+def _rack(N=2000, semilla=0):
+    rng = np.random.default_rng(semilla)
+    tramos = pd.DataFrame({
+        'segmento': [f'L{i:04d}' for i in range(N)],
+        'diametro': rng.uniform(0.02, 0.4, N),
+        'longitud': rng.uniform(1.0, 80.0, N),
+        'caudal': rng.uniform(1e-5, 0.2, N),
+        'desnivel': rng.uniform(-5.0, 5.0, N),
+    })
+    accesorios = pd.DataFrame({
+        'segmento': rng.choice(tramos['segmento'], 3 * N),
+        'accesorio': rng.choice(list(ACCESORIOS), 3 * N),
+        'cantidad': rng.integers(1, 4, 3 * N),
+    })
+    return tramos, accesorios
+
+
+def test_tramos_en_lote_coinciden_con_el_calculo_individual():
+    tramos, accesorios = _rack()
+    r = evaluar_tramos(tramos, accesorios)
+    assert len(r) == len(tramos) and list(r['segmento']) == list(tramos['segmento'])
+    np.testing.assert_allclose(r['perdida_friccion'],
+                               perdida_carga(tramos['caudal'], tramos['diametro'], tramos['longitud'], 4.5e-5))
+    # ΣK de un tramo sumado a mano
+    i = 17
+    propios = accesorios[accesorios['segmento'] == tramos['segmento'][i]]
+    f_T = factor_turbulento(tramos['diametro'][i], 4.5e-5)
+    K = sum(c * (ACCESORIOS[a].get('K', 0.0) + ACCESORIOS[a].get('L_D', 0.0) * f_T)
+            for a, c in zip(propios['accesorio'], propios['cantidad']))
+    np.testing.assert_allclose(r['K_accesorios'][i], K)
+    V = r['velocidad'].to_numpy()
+    np.testing.assert_allclose(r['caida_presion'],
+                               1000 * 9.81 * (r['perdida_total'] + tramos['desnivel']))
+    np.testing.assert_allclose(r['perdida_menores'], r['K_accesorios'] * V * np.abs(V) / (2 * 9.81))
+    assert set(r['regimen']) <= {'laminar', 'transicion', 'turbulento'}
+
+
+def test_accesorios_invalidos():
+    tramos, _ = _rack(5)
+    with pytest.raises(ValueError):
+        evaluar_tramos(tramos, pd.DataFrame({'segmento': ['L0000'], 'accesorio': ['codo_raro']}))
+    with pytest.raises(ValueError):
+        acumular_accesorios(pd.DataFrame({'segmento': ['X'], 'accesorio': ['salida']}),
+                            tramos['segmento'], tramos['diametro'], 4.5e-5)
+
+
+@pytest.mark.parametrize('modelo', ['auto', 'poiseuille', 'potencia'])
+def test_perfiles_conservan_el_caudal(modelo):
+    Re = np.array([800.0, 1e4, 1e5, 1e6])
+    if modelo == 'poiseuille':
+        Re = Re[:1]
+    f = factor_friccion(Re, 0.0)
+    r = 1 - np.geomspace(1e-9, 1, 20001)[::-1]
+    r[0] = 0.0
+    p = perfiles_velocidad(np.full(len(Re), 1.5), 0.1, Re, f, r, modelo)
+    np.testing.assert_allclose(2 * np.trapezoid(p['u'] * r, r, axis=1), 1.5, rtol=1e-5)
+
+
+def test_ley_logaritmica_y_tabla_de_perfiles():
+    Re = np.array([1e5, 1e5])
+    f = factor_friccion(Re, [0.0, 1e-3])
+    p = perfiles_velocidad([2.0, 2.0], 0.1, Re, f, modelo='logaritmico', rugosidad=[0.0, 1e-4])
+    assert p['u'].shape == (2, 50)
+    assert np.all(p['u'][:, -1] == 0) and np.all(np.diff(p['u'], axis=1) <= 1e-12)
+    # Cerca de la pared lisa la subcapa viscosa cumple u⁺ = y⁺
+    u_tau = 2.0 * np.sqrt(f[0] / 8)
+    y = 0.02 * 1e-3 / 2
+    nu = 2.0 * 0.1 / 1e5
+    liso = perfiles_velocidad(2.0, 0.1, 1e5, f[0], [1 - 2 * y / 0.1], 'logaritmico')
+    np.testing.assert_allclose(liso['u'][0, 0], u_tau**2 * y / nu, rtol=1e-10)
+    tabla = tabla_perfiles(['A', 'B'], p)
+    assert list(tabla.columns) == ['segmento', 'r_relativo', 'u'] and len(tabla) == 100
+    with pytest.raises(ValueError):
+        perfiles_velocidad(1.0, 0.1, 1e5, 0.02, modelo='otro')
+
+
+def test_exportar_parquet(tmp_path):
+    tramos, accesorios = _rack(50)
+    r = evaluar_tramos(tramos, accesorios)
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match='pyarrow'):
+            exportar_parquet(r, tmp_path / 'tramos.parquet')
+        return
+    ruta = exportar_parquet(r, tmp_path / 'tramos.parquet')
+    pd.testing.assert_frame_equal(pd.read_parquet(ruta), r)
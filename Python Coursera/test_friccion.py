@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from modulos.friccion import colebrook, factor_friccion, perdida_carga, swamee_jain
+
+
+def test_colebrook_satisface_la_ecuacion_implicita():
+    rng = np.random.default_rng(0)
+    Re = 10**rng.uniform(3.7, 8, 10000)
+    rr = 10**rng.uniform(-6, -1.5, 10000)
+    f = colebrook(Re, rr)
+    residuo = 1/np.sqrt(f) + 2*np.log10(rr/3.7 + 2.51/(Re*np.sqrt(f)))
+    assert np.max(np.abs(residuo)) < 1e-10
+    np.testing.assert_allclose(swamee_jain(Re, rr), f, rtol=0.03)
+
+
+def test_valor_de_referencia_moody():
+    # Re = 1e5, e/D = 1e-3 -> f ≈ 0.0222 (diagrama de Moody)
+    assert colebrook(1e5, 1e-3) == pytest.approx(0.02218, rel=1e-3)
+
+
+def test_regimenes_y_continuidad_en_transicion():
+    Re = np.array([0.0, 500.0, 1999.0, 4001.0])
+    f = factor_friccion(Re, 1e-4)
+    assert np.isfinite(f).all()
+    assert f[1] == pytest.approx(64 / 500)
+    assert f[3] == pytest.approx(colebrook(4001.0, 1e-4), rel=1e-12)
+
+    Re = np.linspace(1900, 4100, 2201)
+    f = factor_friccion(Re, 1e-4)
+    assert np.max(np.abs(np.diff(f))) < 1e-4
+
+
+def test_derivada_coincide_con_diferencias_finitas():
+    Re = np.array([1500.0, 2500.0, 3500.0, 1e5, 1e7])
+    f, df = factor_friccion(Re, 2e-4, derivada=True)
+    h = Re * 1e-6
+    df_num = (factor_friccion(Re + h, 2e-4) - factor_friccion(Re - h, 2e-4)) / (2*h)
+    np.testing.assert_allclose(df, df_num, rtol=1e-5)
+
+
+def test_perdida_carga_antisimetrica_y_nula_sin_caudal():
+    Q = np.array([-0.02, 0.0, 0.02])
+    hf = perdida_carga(Q, 0.1, 100.0, 4.5e-5)
+    assert hf[1] == 0
+    assert hf[0] == pytest.approx(-hf[2])
+    assert hf[2] > 0
+
+
+def test_escalares_conservan_la_forma():
+    f = factor_friccion(1e5, 1e-3)
+    assert np.ndim(f) == 0
+    assert float(f) == pytest.approx(colebrook(1e5, 1e-3))
+    assert np.ndim(perdida_carga(0.02, 0.1, 100.0, 4.5e-5)) == 0
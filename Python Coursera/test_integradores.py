@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from modulos.integradores import rk4, integrar_hamiltoniano, PenduloDoble
+
+
+class OsciladorArmonico:
+    separable = True
+
+    def dH_dq(self, q, p):
+        return q
+
+    def dH_dp(self, q, p):
+        return p
+
+    def hamiltoniano(self, q, p):
+        return 0.5 * (q**2 + p**2).sum(axis=-1)
+
+
+def test_rk4_vectorizado_decaimiento_exponencial():
+    t, y = rk4(lambda t, y: -y, np.array([1.0, 2.0]), 0, 1, 0.01)
+    np.testing.assert_allclose(y[-1], np.array([1.0, 2.0]) * np.exp(-1), rtol=1e-8)
+
+
+@pytest.mark.parametrize("metodo, orden", [("verlet", 2), ("punto_medio", 2), ("yoshida4", 4)])
+def test_orden_de_convergencia(metodo, orden):
+    errores = []
+    for h in (0.1, 0.05):
+        r = integrar_hamiltoniano(OsciladorArmonico(), [[1.0]], [[0.0]], h, int(round(2*np.pi / h)), metodo)
+        errores.append(abs(r['q'][-1, 0, 0] - np.cos(r['t'][-1])))
+    assert np.log2(errores[0] / errores[1]) == pytest.approx(orden, abs=0.3)
+
+
+def test_verlet_rechaza_hamiltoniano_no_separable():
+    with pytest.raises(ValueError):
+        integrar_hamiltoniano(PenduloDoble(), [0.1, 0.0], [0.0, 0.0], 1e-3, 10, 'verlet')
+
+
+def test_energia_acotada_con_paso_100_veces_mayor():
+    pendulo = PenduloDoble()
+    q0 = np.array([1.3*np.pi/2, 0.0])
+    p0 = np.zeros(2)
+    simplectico = integrar_hamiltoniano(pendulo, q0, p0, 2e-3, 2000, 'yoshida4', guardar_cada=20)
+
+    # Esquema explícito de los scripts de vpython con el mismo paso grande
+    q, p, h = q0.copy(), p0.copy(), 2e-3
+    E0 = pendulo.hamiltoniano(q, p)
+    for _ in range(2000):
+        p = p - h * pendulo.dH_dq(q, p)
+        q = q + h * pendulo.dH_dp(q, p)
+    deriva_explicita = abs(pendulo.hamiltoniano(q, p) - E0) / abs(E0)
+
+    assert simplectico['deriva_energia'] < 1e-4
+    assert simplectico['deriva_energia'] < deriva_explicita / 10
+
+
+def test_momentos_y_velocidades_son_inversos():
+    pendulo = PenduloDoble(M1=1.5, M2=0.7, L1=0.8, L2=0.6)
+    rng = np.random.default_rng(0)
+    q = rng.uniform(-3, 3, (50, 2))
+    w = rng.normal(size=(50, 2))
+    np.testing.assert_allclose(pendulo.velocidades(q, pendulo.momentos(q, w)), w)
+    energia = pendulo.energias(q, pendulo.momentos(q, w))
+    np.testing.assert_allclose(energia['total'], energia['K_trans'] + energia['K_rot'] + energia['U'])
+
+
+def test_mapa_de_volteo_en_lote():
+    th1, th2 = np.meshgrid(np.linspace(-3, 3, 8), np.linspace(-3, 3, 8))
+    volteo = PenduloDoble().tiempo_volteo(th1, th2, t_final=1.0, h=5e-3)
+    assert volteo.shape == (8, 8)
+    # Ángulos pequeños no tienen energía para voltear
+    assert np.isinf(PenduloDoble().tiempo_volteo(0.1, 0.1, t_final=1.0, h=5e-3))
+    assert np.isfinite(volteo).any()
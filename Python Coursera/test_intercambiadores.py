@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+from modulos.intercambiadores import (TIPOS, coeficiente_global, coeficiente_tubos, dimensionar_intercambiador,
+                                      dtml, efectividad, evaluar_intercambiadores, ntu_requerido)
+
+
+def test_efectividad_casos_limite_y_factor_F():
+    NTU = np.array([0.5, 1.0, 2.0, 3.0])
+    np.testing.assert_allclose(efectividad(NTU, 1.0), NTU / (1 + NTU))
+    np.testing.assert_allclose(efectividad(NTU, 1.0, 'paralelo'), (1 - np.exp(-2 * NTU)) / 2)
+    for tipo in TIPOS:
+        np.testing.assert_allclose(efectividad(NTU, 0.0, tipo), 1 - np.exp(-NTU))
+    # Dos carcasas en serie equivalen a dos intercambiadores 1-2 de NTU/2 en contraflujo
+    e1 = efectividad(NTU / 2, 0.5, 'carcasa_tubos')
+    razon = ((1 - e1 * 0.5) / (1 - e1))**2
+    np.testing.assert_allclose(efectividad(NTU, 0.5, 'carcasa_tubos', 2), (razon - 1) / (razon - 0.5))
+    assert np.all(efectividad(NTU, 0.5, 'paralelo') < efectividad(NTU, 0.5, 'carcasa_tubos'))
+    assert np.all(efectividad(NTU, 0.5, 'carcasa_tubos') < efectividad(NTU, 0.5, 'contraflujo'))
+    with pytest.raises(ValueError):
+        efectividad(1.0, 0.5, 'espiral')
+
+
+@pytest.mark.parametrize('tipo', TIPOS)
+@pytest.mark.parametrize('Cr', [0.0, 0.4, 1.0])
+def test_ntu_requerido_invierte_la_efectividad(tipo, Cr):
+    NTU = np.array([0.05, 0.8, 3.0, 12.0])
+    np.testing.assert_allclose(ntu_requerido(efectividad(NTU, Cr, tipo, 2), Cr, tipo, 2), NTU, rtol=1e-7)
+    # Efectividad por encima del máximo de la configuración
+    assert np.isnan(ntu_requerido(0.999, 1.0, 'paralelo'))
+
+
+def _tabla():
+    equipos = pd.DataFrame({
+        'tipo': ['carcasa_tubos', 'placas', 'carcasa_tubos'],
+        'area': [12.0, 8.0, 30.0],
+        'h_caliente': [350.0, 900.0, 350.0],
+        'h_fria': [3000.0, 4000.0, 3000.0],
+        'ensuciamiento_caliente': [1.76e-4, 5e-5, 3.5e-4],
+        'ensuciamiento_fria': [1.76e-4, 5e-5, 1.76e-4],
+        'pasos_carcasa': [1, 1, 2],
+        'flujo_caliente_nominal': [2.0, 2.0, 4.0],
+        'flujo_frio_nominal': [3.0, 3.0, 6.0],
+    })
+    condiciones = pd.DataFrame({
+        'flujo_caliente': np.linspace(1.0, 4.0, 40), 'cp_caliente': 2000.0, 'T_caliente_entrada': 75.0,
+        'flujo_frio': 3.0, 'cp_frio': 4180.0, 'T_fria_entrada': np.linspace(18.0, 32.0, 40),
+    })
+    return equipos, condiciones
+
+
+def test_evaluacion_en_lote_consistente():
+    equipos, condiciones = _tabla()
+    r = evaluar_intercambiadores(equipos, condiciones)
+    assert r['q'].shape == (3, 40)
+    m_h = condiciones['flujo_caliente'].to_numpy()
+    np.testing.assert_allclose(r['q'], m_h * 2000 * (75 - r['T_caliente_salida']))
+    np.testing.assert_allclose(r['q'], 3.0 * 4180 * (r['T_fria_salida'] - condiciones['T_fria_entrada'].to_numpy()))
+    # q = U·A·F·DTML
+    np.testing.assert_allclose(r['q'], r['U'] * equipos['area'].to_numpy()[:, None] * r['F'] * r['dtml'])
+    assert np.all((r['F'] > 0.5) & (r['F'] <= 1 + 1e-12))
+    np.testing.assert_allclose(r['F'][1], 1.0)       # placas = contraflujo
+    assert np.all(r['factor_limpieza'] < 1)
+    # En el punto nominal U coincide con la suma de resistencias
+    U = coeficiente_global(350.0, 3000.0, 1.76e-4, 1.76e-4)
+    i = np.argmin(np.abs(m_h - 2.0))
+    np.testing.assert_allclose(r['U'][0, i], coeficiente_global(350 * (m_h[i] / 2)**0.8, 3000.0, 1.76e-4, 1.76e-4))
+    assert abs(r['U'][0, i] - U) / U < 0.05
+
+
+def test_dimensionamiento_recupera_el_area():
+    equipos, condiciones = _tabla()
+    r = evaluar_intercambiadores(equipos, condiciones)
+    d = dimensionar_intercambiador(condiciones, r['U'][2], 'carcasa_tubos',
+                                   T_caliente_salida=r['T_caliente_salida'][2], pasos_carcasa=2)
+    np.testing.assert_allclose(d['area'], 30.0, rtol=1e-8)
+    np.testing.assert_allclose(d['dtml'], r['dtml'][2])
+    imposible = dimensionar_intercambiador(condiciones.iloc[:1], 500.0, 'paralelo',
+                                           T_caliente_salida=condiciones['T_fria_entrada'].iloc[0] + 0.1)
+    assert np.isnan(imposible['area'][0])
+    with pytest.raises(ValueError):
+        dimensionar_intercambiador(condiciones, 500.0, q=1e5, T_fria_salida=40.0)
+
+
+def test_dtml_y_coeficiente_tubos():
+    np.testing.assert_allclose(dtml(100, 60, 20, 40), 20 / np.log(1.5))
+    np.testing.assert_allclose(dtml(100, 60, 20, 60), 40.0)
+    h = coeficiente_tubos([1000.0, 1e4, 1e5], 5.0, 0.6, 0.02)
+    np.testing.assert_allclose(h[0], 3.66 * 0.6 / 0.02)
+    assert h[1] < h[2]
@@ -0,0 +1,63 @@
+import warnings
+import numpy as np
+import pytest
+from modulos.ciclos import ciclo_brayton, ciclo_rankine
+from modulos.optimizacion_ciclos import graficar_convergencia, optimizar_ciclo
+
+
+def test_brayton_relacion_presion_de_maximo_trabajo():
+    fijos = dict(T_turbina=1300, eta_compresor=0.85, eta_turbina=0.88)
+    registros = []
+    optimo = optimizar_ciclo(ciclo_brayton, {'relacion_presion': (2, 40)}, objetivo='trabajo_neto',
+                             fijos=fijos, semilla=1, callback=registros.append)
+    rp = np.linspace(2, 40, 20001)
+    w = ciclo_brayton(rp, **fijos)['trabajo_neto']
+    np.testing.assert_allclose(optimo['variables']['relacion_presion'], rp[w.argmax()], rtol=1e-3)
+    np.testing.assert_allclose(optimo['objetivo'], w.max(), rtol=1e-8)
+    historial = optimo['historial']
+    assert len(registros) == len(historial)
+    assert set(historial['fase']) == {'poblacion', 'gradiente'}
+    assert np.all(np.diff(historial.loc[historial['fase'] == 'poblacion', 'mejor']) >= 0)
+    assert graficar_convergencia(historial).get_xlabel() == 'Evaluaciones del ciclo'
+
+
+def test_rankine_con_restriccion_activa_de_titulo():
+    # Sin recalentamiento la eficiencia crece con la presión de caldera
+    # hasta que el título de escape llega al mínimo permitido
+    fijos = dict(T_turbina=823.15, P_condensador=10, eta_turbina=0.87)
+    optimo = optimizar_ciclo(ciclo_rankine, {'P_caldera': (1000, 20000)},
+                             restricciones={'titulo_escape': (0.85, None)}, fijos=fijos, semilla=2)
+    assert optimo['factible']
+    np.testing.assert_allclose(optimo['resultado']['titulo_escape'], 0.85, atol=1e-5)
+    P = np.geomspace(1000, 20000, 501)
+    barrido = ciclo_rankine(P, **fijos)
+    factible = barrido['titulo_escape'] >= 0.85
+    assert optimo['objetivo'] >= barrido['eficiencia'][factible].max() - 1e-6
+
+
+def test_rankine_recalentamiento_y_extraccion():
+    fijos = dict(P_caldera=15000, T_turbina=873.15, P_condensador=10, eta_turbina=0.87, eta_bomba=0.85)
+    optimo = optimizar_ciclo(ciclo_rankine, {'P_recalentamiento': (200, 14000), 'P_regeneracion': (20, 14000)},
+                             restricciones={'titulo_escape': (0.9, None)}, fijos=fijos, semilla=1)
+    Prh = np.geomspace(200, 14000, 60)[:, None]
+    Pr = np.geomspace(20, 14000, 60)[None, :]
+    malla = ciclo_rankine(P_recalentamiento=Prh, P_regeneracion=Pr, **fijos)
+    mejor_malla = np.max(np.where(malla['titulo_escape'] >= 0.9, malla['eficiencia'], 0.0))
+    assert optimo['objetivo'] >= mejor_malla - 1e-6
+    assert 2000 < optimo['variables']['P_recalentamiento'] < 6000
+
+
+def test_rankine_escape_sobrecalentado_es_factible():
+    # Valores por defecto de la GUI: 1000/100 kPa, 800 K; el escape sale sobrecalentado
+    fijos = dict(P_caldera=1000, T_turbina=800, P_condensador=100)
+    assert ciclo_rankine(**fijos)['titulo_escape'] > 1
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        optimo = optimizar_ciclo(ciclo_rankine, {'P_recalentamiento': (200, 1000), 'P_regeneracion': (150, 1000)},
+                                 restricciones={'titulo_escape': (0.88, None)}, fijos=fijos, semilla=0)
+    assert optimo['factible'] and 'gradiente' in set(optimo['historial']['fase'])
+
+
+def test_limites_invalidos():
+    with pytest.raises(ValueError):
+        optimizar_ciclo(ciclo_brayton, {'relacion_presion': (10, 2)}, fijos={'T_turbina': 1300})
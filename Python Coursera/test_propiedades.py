@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from modulos.propiedades import (Agua, MezclaGasIdeal, TablaAgua, presion_saturacion, tabla_agua,
+                                 temperatura_saturacion)
+
+
+def test_verificacion_if97_regiones_1_2_3():
+    # Tablas de verificación de IAPWS-IF97 (P en kPa, T en K)
+    agua = Agua()
+    e = agua.estado_pt([3000, 80000, 3000], [300, 300, 500])
+    np.testing.assert_allclose(e['v'], [0.100215168e-2, 0.971180894e-3, 0.120241800e-2], rtol=1e-8)
+    np.testing.assert_allclose(e['h'], [115.331273, 184.142828, 975.542239], rtol=1e-8)
+    np.testing.assert_allclose(e['cp'], [4.17301218, 4.01008987, 4.65580682], rtol=1e-8)
+    e = agua.estado_pt([3.5, 3.5, 30000], [300, 700, 700])
+    np.testing.assert_allclose(e['v'], [39.4913866, 92.3015898, 0.542946619e-2], rtol=1e-8)
+    np.testing.assert_allclose(e['s'], [8.52238967, 10.1749996, 5.17540298], rtol=1e-8)
+    e = agua.estado_pt([25583.7018, 22293.0643, 78309.5639], [650, 650, 750])
+    np.testing.assert_allclose(e['rho'], [500, 200, 500], rtol=1e-7)
+    np.testing.assert_allclose(e['h'], [1863.43019, 2375.12401, 2258.68845], rtol=1e-7)
+    assert list(agua.region([3000, 3.5, 25583.7], [300, 700, 650])) == [1, 2, 3]
+
+
+def test_saturacion():
+    np.testing.assert_allclose(presion_saturacion([300, 500, 600]),
+                               [3.53658941, 2638.89776, 12344.3146], rtol=1e-8)
+    np.testing.assert_allclose(temperatura_saturacion([100, 1000, 10000]),
+                               [372.755919, 453.035632, 584.149488], rtol=1e-8)
+    sat = Agua().saturacion([101.325, 20000])
+    np.testing.assert_allclose(sat['h_f'], [419.1, 1827.1], atol=0.2)
+    np.testing.assert_allclose(sat['h_g'], [2675.6, 2411.4], atol=0.5)
+
+
+def test_inversas_ph_y_ps():
+    agua = Agua()
+    P = np.array([10.0, 1000.0, 10000.0, 30000.0, 10000.0])
+    T = np.array([300.0, 600.0, 800.0, 650.0, 500.0])
+    e = agua.estado_pt(P, T)
+    np.testing.assert_allclose(agua.estado_ph(P, e['h'])['T'], T, rtol=1e-9)
+    np.testing.assert_allclose(agua.estado_ps(P, e['s'])['T'], T, rtol=1e-9)
+
+    sat = agua.saturacion(10.0)
+    h = sat['h_f'] + 0.9 * (sat['h_g'] - sat['h_f'])
+    mezcla = agua.estado_ph(10.0, h)
+    np.testing.assert_allclose(mezcla['x'], 0.9)
+    np.testing.assert_allclose(mezcla['T'], sat['T'])
+    np.testing.assert_allclose(agua.estado_ps(10.0, mezcla['s'])['h'], h)
+
+
+def test_tabla_frente_a_exacto(tmp_path):
+    tabla = TablaAgua(P_min=5.0, P_max=20000.0, tol=1e-4, max_nodos=40)
+    agua = tabla.agua
+    rng = np.random.default_rng(1)
+    P = np.exp(rng.uniform(np.log(5.0), np.log(20000.0), 3000))
+    T = rng.uniform(280, 1000, 3000)
+    exacto = agua.estado_pt(P, T)
+    for consulta, X in ((tabla.estado_pt, T), (tabla.estado_ph, exacto['h']),
+                        (tabla.estado_ps, exacto['s'])):
+        aprox = consulta(P, X)
+        for c in ('T', 'h', 's', 'v'):
+            error = np.abs(aprox[c] - exacto[c]) / np.maximum(np.abs(exacto[c]), 1)
+            # Las celdas que no alcanzan tol al agotar los nodos se evalúan exactas
+            assert error.max() < 5 * tabla.tol
+
+    tabla.guardar(tmp_path / 'agua.npz')
+    cargada = TablaAgua.cargar(tmp_path / 'agua.npz')
+    np.testing.assert_allclose(cargada.estado_ph(P, exacto['h'])['s'], tabla.estado_ph(P, exacto['h'])['s'])
+    assert cargada.tablas['h']['vapor']['error_maximo'] == tabla.tablas['h']['vapor']['error_maximo']
+
+
+def test_tabla_compartida_se_carga_del_disco(tmp_path):
+    ruta = str(tmp_path / 'agua.npz')
+    TablaAgua(P_min=1.0, tol=1e-3, max_nodos=12).guardar(ruta)
+    tabla = tabla_agua(tol=1e-3, max_nodos=12, ruta=ruta)
+    assert tabla is tabla_agua(tol=1e-3, max_nodos=12, ruta=ruta)
+    # Cerca del punto crítico la malla gruesa no basta y la consulta es exacta
+    np.testing.assert_allclose(tabla.estado_pt(22700.0, 648.0)['h'], Agua().estado_pt(22700.0, 648.0)['h'],
+                               rtol=1e-9)
+
+
+def test_tabla_compartida_regenera_archivos_obsoletos(tmp_path):
+    ruta = tmp_path / 'cache' / 'agua.npz'
+    ruta.parent.mkdir()
+    TablaAgua(P_min=1.0, tol=1e-3, max_nodos=12).guardar(ruta)
+    datos = dict(np.load(ruta))
+    for clave, valor in (('version', np.array(0)), ('huella', datos['huella'] * 1.001)):
+        np.savez_compressed(ruta, **{**datos, clave: valor})
+        with pytest.raises(ValueError):
+            TablaAgua.cargar(ruta)
+    # Otro modelo: se reconstruye y se sobrescribe el archivo
+    tabla = tabla_agua(tol=1e-3, max_nodos=12, ruta=str(ruta))
+    assert TablaAgua.cargar(ruta).tol == tabla.tol == 1e-3
+    assert [p.name for p in ruta.parent.iterdir()] == ['agua.npz']
+
+
+def test_mezcla_gas_ideal():
+    aire = MezclaGasIdeal()
+    np.testing.assert_allclose(aire.R, 0.287, rtol=2e-3)
+    np.testing.assert_allclose(aire.cp(300), 1.005, rtol=1e-2)
+    assert aire.gamma(1500) < aire.gamma(300) < 1.41
+
+    P, T = np.array([100.0, 800.0]), np.array([300.0, 1200.0])
+    e = aire.estado_pt(P, T)
+    np.testing.assert_allclose(aire.estado_ph(P, e['h'])['T'], T)
+    np.testing.assert_allclose(aire.estado_ps(P, e['s'])['T'], T)
+    np.testing.assert_allclose(e['v'], aire.R * T / P)
+
+    # Compresión isentrópica 1:10 con cp variable: T2 algo menor que con γ = 1.4
+    T2 = aire.estado_ps(1000.0, aire.estado_pt(100.0, 300.0)['s'])['T']
+    assert 570 < T2 < 300 * 10**(0.4 / 1.4)
+
+    gases = MezclaGasIdeal({'CO2': 0.1, 'H2O': 0.1, 'N2': 0.75, 'O2': 0.05})
+    assert gases.cp(1000) > aire.cp(1000)
+    with pytest.raises(ValueError):
+        MezclaGasIdeal({'Xe': 1.0})
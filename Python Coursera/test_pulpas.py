@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+from modulos.pulpas import (concentracion_volumetrica, evaluar_pulpas, gravedad_especifica_mezcla,
+                            razon_altura, velocidad_deposicion)
+
+RECETAS = pd.DataFrame({'d50': [0.01, 0.15, 0.3, 0.6],
+                        'd85': [0.05, 0.4, 0.8, 1.5],
+                        'Cw': [0.0, 0.35, 0.5, 0.6],
+                        'SGs': [2.65, 2.65, 2.8, 3.2]},
+                       index=['agua', 'relave', 'alimentacion_ciclon', 'concentrado'])
+
+
+def test_concentraciones_y_densidad():
+    Cv = concentracion_volumetrica(0.5, 2.65)
+    SGm = gravedad_especifica_mezcla(0.5, 2.65)
+    np.testing.assert_allclose(SGm, 1 + Cv * 1.65)
+    np.testing.assert_allclose(SGm * 0.5, Cv * 2.65)
+
+
+def test_razon_altura_hi():
+    # 0.3 mm, Cv 20 %, Ss 2.65: 1 - 0.000385·1.65·(1+4/2.65)·20·ln(0.3/0.0227)
+    np.testing.assert_allclose(razon_altura(0.3, 0.2, 2.65), 0.9177, atol=1e-4)
+    assert razon_altura(0.01, 0.3, 2.65) == 1.0
+    assert razon_altura(0.6, 0.3, 2.65) < razon_altura(0.3, 0.3, 2.65) < razon_altura(0.3, 0.1, 2.65)
+
+
+def test_velocidad_deposicion():
+    durand = velocidad_deposicion(0.2, 0.3, 0.6, 0.2, 2.65, 'durand')
+    wasp = velocidad_deposicion(0.2, 0.3, 0.6, 0.2, 2.65, 'wasp')
+    base = np.sqrt(2 * 9.81 * 0.2 * 1.65)
+    np.testing.assert_allclose(durand, 1.3 * 0.2**0.125 * (1 - np.exp(-2.07)) * base)
+    np.testing.assert_allclose(velocidad_deposicion(0.2, 0.3, 0.6, 0.2, 2.65), max(durand, wasp))
+    assert velocidad_deposicion(0.4, 0.3, 0.6, 0.2, 2.65) > velocidad_deposicion(0.2, 0.3, 0.6, 0.2, 2.65)
+    with pytest.raises(ValueError):
+        velocidad_deposicion(0.2, 0.3, 0.6, 0.2, 2.65, 'otro')
+
+
+def test_evaluacion_puntos_por_recetas():
+    Q = np.linspace(100, 900, 50)
+    H = 60 - 4e-5 * Q**2
+    eta = 0.75 - 1e-6 * (Q - 600)**2
+    res = evaluar_pulpas(Q, H, eta, RECETAS, diametro_descarga=0.25)
+    assert res['altura'].shape == (50, 4) and res['deposita'].shape == (50, 4)
+
+    # Agua limpia: sin corrección, potencia hidráulica ρ g Q H / η
+    np.testing.assert_allclose(res['altura'][:, 0], H)
+    np.testing.assert_allclose(res['potencia'][:, 0], 9.81 * Q / 3600 * H / eta)
+    np.testing.assert_allclose(res['altura_agua_equivalente'] * res['razon_altura'],
+                               np.repeat(H[:, None], 4, axis=1))
+
+    # Cada columna coincide con la evaluación de una sola receta
+    una = evaluar_pulpas(Q, H, eta, RECETAS.iloc[[2]], diametro_descarga=0.25)
+    np.testing.assert_allclose(una['potencia'][:, 0], res['potencia'][:, 2])
+
+    # Caudales bajos depositan, y la velocidad crítica crece con la receta más pesada
+    assert res['deposita'][0, 3] and not res['deposita'][-1, 1]
+    assert np.all(np.diff(res['velocidad_deposicion'][0, 1:]) > 0)
+
+
+def test_receta_incompleta():
+    with pytest.raises(ValueError):
+        evaluar_pulpas(100, 50, 0.7, {'d50': [0.2], 'Cw': [0.3], 'SGs': [2.65]})
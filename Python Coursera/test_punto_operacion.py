@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from modulos.punto_operacion import (curva_sistema, evaluar_polinomio, punto_operacion,
+                                     puntos_operacion, raices_reales)
+
+
+def test_interseccion_analitica_cuadratica():
+    # 40 - 0.002 Q² = 20 + 0.001 Q²  ->  Q = sqrt(20 / 0.003)
+    Q, H = punto_operacion([-0.002, 0.0, 40.0], curva_sistema(20.0, 0.001))
+    assert Q == pytest.approx(np.sqrt(20 / 0.003), rel=1e-13)
+    assert H == pytest.approx(40 - 0.002 * Q**2, rel=1e-13)
+
+
+def test_curva_con_joroba_da_dos_puntos_y_clasifica_estabilidad():
+    # Bomba con máximo de 35 m en Q = 50 contra sistema de 32 m estáticos
+    res = puntos_operacion([-0.002, 0.2, 30.0], [0.0002, 0.0, 32.0])
+    esperado = np.sort(np.roots(np.array([-0.0022, 0.2, -2.0])))
+    assert res['n_puntos'][0] == 2
+    np.testing.assert_allclose(res['caudal'][0], esperado, rtol=1e-12)
+    np.testing.assert_array_equal(res['estable'][0], [False, True])
+    assert res['pendiente_bomba'][0, 0] > 0
+    assert res['caudal_principal'][0] == pytest.approx(esperado[1], rel=1e-12)
+
+
+def test_sin_interseccion_devuelve_nan():
+    res = puntos_operacion([-0.002, 0.0, 40.0], curva_sistema(50.0, 0.001))
+    assert res['n_puntos'][0] == 0
+    assert np.isnan(res['caudal_principal'][0])
+
+
+def test_lote_de_miles_de_combinaciones_coincide_con_np_roots():
+    rng = np.random.default_rng(1)
+    N = 5000
+    bombas = np.column_stack([-rng.uniform(1e-3, 3e-3, N), rng.uniform(-0.1, 0.3, N),
+                              rng.uniform(30, 50, N)])
+    sistemas = curva_sistema(rng.uniform(0, 35, N), rng.uniform(1e-4, 2e-3, N))
+    res = puntos_operacion(bombas, sistemas)
+
+    for i in rng.choice(N, 200, replace=False):
+        r = np.roots(bombas[i] - sistemas[i])
+        r = np.sort(r[(np.abs(r.imag) < 1e-12) & (r.real >= 0)].real)
+        obtenido = res['caudal'][i][~np.isnan(res['caudal'][i])]
+        np.testing.assert_allclose(obtenido, r, rtol=1e-10)
+
+    residuo, _ = evaluar_polinomio(bombas - sistemas, np.nan_to_num(res['caudal']))
+    assert np.max(np.abs(residuo[~np.isnan(res['caudal'])])) < 1e-9
+
+
+def test_una_bomba_contra_varios_sistemas_y_raices_reales():
+    res = puntos_operacion([-0.002, 0.0, 40.0], curva_sistema([10.0, 20.0, 30.0], 0.001))
+    np.testing.assert_allclose(res['caudal_principal'], np.sqrt(np.array([30, 20, 10]) / 0.003))
+
+    # Un polinomio de grado menor (coeficiente principal nulo) también funciona
+    r = raices_reales([[1.0, -3.0, 2.0], [0.0, 1.0, -3.0]], 0.0, 4.0)
+    np.testing.assert_allclose(r[0], [1.0, 2.0])
+    np.testing.assert_allclose(r[1, 0], 3.0)
+    assert np.isnan(r[1, 1])
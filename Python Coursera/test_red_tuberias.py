@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+from modulos.friccion import perdida_carga
+from modulos.red_tuberias import RedTuberias, curva_bomba_si
+
+
+def test_tuberia_entre_depositos_coincide_con_darcy():
+    red = RedTuberias()
+    red.agregar_deposito('A', 50.0)
+    red.agregar_deposito('B', 30.0)
+    red.agregar_nodo('J', 10.0)
+    red.agregar_tuberia('T1', 'A', 'J', 400.0, 0.2, 1e-4)
+    red.agregar_tuberia('T2', 'J', 'B', 600.0, 0.2, 1e-4)
+    res = red.resolver()
+
+    esperado = brentq(lambda Q: perdida_carga(Q, 0.2, 1000.0, 1e-4) - 20.0, 1e-6, 1.0)
+    assert res['convergencia']
+    np.testing.assert_allclose(res['caudales'], esperado, rtol=1e-6)
+    assert res['presiones'][red.indice_nodo['J']] == pytest.approx(
+        50.0 - perdida_carga(esperado, 0.2, 400.0, 1e-4) - 10.0, rel=1e-6)
+
+
+def test_malla_conserva_masa_y_energia_en_los_lazos():
+    red = RedTuberias.malla(6, 6, demanda=2e-3, diametro=0.15)
+    res = red.resolver()
+    assert res['convergencia']
+    continuidad = red.A21 @ res['caudales'] - red.demanda[red.idx_libres]
+    assert np.max(np.abs(continuidad)) < 1e-10
+
+    h, _ = red.perdidas(res['caudales'])
+    np.testing.assert_allclose(h, res['perdidas'], atol=1e-6)
+
+
+def test_bomba_eleva_a_deposito_superior():
+    # Curva ajustada en m³/h: H = 40 - 0.002 Q² (descarga libre ≈ 141 m³/h)
+    curva = curva_bomba_si([-0.002, 0.0, 40.0], 'm3/h')
+    red = RedTuberias()
+    red.agregar_deposito('S', 0.0)
+    red.agregar_nodo('D', 0.0)
+    red.agregar_deposito('T', 20.0)
+    red.agregar_bomba('B1', 'S', 'D', curva)
+    red.agregar_tuberia('T1', 'D', 'T', 500.0, 0.15)
+    res = red.resolver()
+
+    Q = res['caudales'][red.indice_enlace['B1']]
+    altura = 40.0 - 0.002 * (Q * 3600)**2
+    assert altura == pytest.approx(20.0 + perdida_carga(Q, 0.15, 500.0, 4.5e-5), rel=1e-6)
+    assert res['altura_bombas'][0] == pytest.approx(altura)
+
+    # A media velocidad no vence la altura estática: la retención bloquea el retorno
+    red.fijar_velocidad('B1', 0.5)
+    res = red.resolver()
+    assert abs(res['caudales'][red.indice_enlace['B1']]) < 1e-6
+
+
+def test_valvulas_cerradas_y_de_retencion():
+    red = RedTuberias()
+    red.agregar_deposito('A', 40.0)
+    red.agregar_deposito('B', 20.0)
+    red.agregar_nodo('J')
+    red.agregar_tuberia('T1', 'A', 'J', 100.0, 0.1)
+    red.agregar_valvula('V1', 'J', 'B', 0.1, coeficiente=5.0)
+    assert red.resolver()['caudales'][1] > 0.01
+
+    red.fijar_estado('V1', False)
+    assert abs(red.resolver()['caudales'][1]) < 1e-6
+
+    red.fijar_estado('V1', True)
+    red2 = RedTuberias()
+    red2.agregar_deposito('A', 20.0)
+    red2.agregar_deposito('B', 40.0)
+    red2.agregar_nodo('J')
+    red2.agregar_tuberia('T1', 'A', 'J', 100.0, 0.1)
+    red2.agregar_valvula('V1', 'J', 'B', 0.1, retencion=True)
+    assert abs(red2.resolver()['caudales'][1]) < 1e-6
+
+
+def test_red_grande_converge_en_pocas_factorizaciones():
+    red = RedTuberias.malla(32, 32)
+    res = red.resolver()
+    assert len(red.enlaces) > 1900
+    assert res['convergencia']
+    assert res['iteraciones'] <= 12
+
+
+def test_nodos_sin_fuente_se_rechazan():
+    red = RedTuberias()
+    red.agregar_deposito('A', 10.0)
+    red.agregar_nodo('J1')
+    red.agregar_nodo('J2')
+    red.agregar_nodo('J3')
+    red.agregar_tuberia('T1', 'A', 'J1', 10.0, 0.1)
+    red.agregar_tuberia('T2', 'J2', 'J3', 10.0, 0.1)
+    with pytest.raises(ValueError, match='J2'):
+        red.resolver()
+
+
+def test_periodo_extendido_tanque_balance_de_masa_y_patron():
+    red = RedTuberias()
+    red.agregar_tanque('T', 30.0, 4.0, diametro=10.0)
+    red.agregar_nodo('J', 0.0, demanda=0.01)
+    red.agregar_tuberia('T1', 'T', 'J', 300.0, 0.15)
+    area = np.pi * 10.0**2 / 4
+
+    # Dos periodos de 1 h con multiplicadores 1 y 2, paso de 1 min
+    res = red.simular_periodo(7200.0, 60.0, patron=[1.0, 2.0], paso_patron=3600.0)
+    assert res['convergencia']
+    assert res['niveles'].shape == (121, 1)
+    np.testing.assert_allclose(res['caudales'][:60, 0], 0.01, rtol=1e-8)
+    np.testing.assert_allclose(res['caudales'][60:120, 0], 0.02, rtol=1e-8)
+    caida = (0.01 * 3600 + 0.02 * 3600) / area
+    assert res['niveles'][-1, 0] == pytest.approx(4.0 - caida, rel=1e-9)
+    np.testing.assert_allclose(res['cargas'][:, 0], 30.0 + res['niveles'][:, 0])
+
+
+def test_periodo_extendido_arranque_en_caliente_y_llenado():
+    red = RedTuberias.malla(10, 10, demanda=1e-4)
+    red.agregar_tanque('T', 45.0, 5.0, diametro=8.0, nivel_max=6.0)
+    red.agregar_tuberia('PT', 'T', 'N9_9', 200.0, 0.2)
+    patron = 1 + 0.5 * np.sin(2 * np.pi * np.arange(24) / 24)
+    res = red.simular_periodo(6 * 3600.0, 60.0, patron, guardar_cada=10)
+
+    assert res['convergencia']
+    assert len(res['tiempos']) == 37
+    # Tras el primer paso, Newton arranca desde el paso anterior; sólo el
+    # llenado del tanque y los cambios de periodo piden alguna iteración más
+    assert res['iteraciones'][0] > 3
+    assert np.mean(res['iteraciones'][1:] <= 3) > 0.95
+    # El tanque se llena desde el depósito y se satura en nivel_max; lleno,
+    # la tubería que lo alimenta queda cerrada en el sentido de llenado
+    assert np.all(np.diff(res['niveles'][:, 0]) >= 0)
+    assert res['niveles'][-1, 0] == pytest.approx(6.0)
+    caudal_tanque = res['caudales'][res['niveles'][:, 0] == 6.0, red.indice_enlace['PT']]
+    assert len(caudal_tanque) > 30 and np.abs(caudal_tanque).max() < 1e-6
+
+
+def test_periodo_extendido_tanque_vacio_no_entrega():
+    red = RedTuberias()
+    red.agregar_deposito('R', 20.0)
+    red.agregar_tanque('T', 30.0, 1.0, diametro=4.0, nivel_min=0.5)
+    red.agregar_nodo('J', 0.0, demanda=0.02)
+    red.agregar_tuberia('TR', 'R', 'J', 500.0, 0.15)
+    red.agregar_tuberia('TT', 'T', 'J', 100.0, 0.15)
+    res = red.simular_periodo(3600.0, 60.0)
+    assert res['convergencia']
+    vacio = res['niveles'][:, 0] == 0.5
+    assert vacio[-1] and not vacio[0]
+    # Vacío, el tanque deja de entregar y el depósito cubre toda la demanda
+    np.testing.assert_allclose(res['caudales'][vacio, 1], 0.0, atol=1e-6)
+    np.testing.assert_allclose(res['caudales'][vacio, 0], 0.02, rtol=1e-4)
+    assert np.all(res['caudales'][~vacio, 1] > 0)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from modulos.rotordinamica import ModeloRotor
+
+
+@pytest.fixture
+def rotor():
+    return ModeloRotor.rotor_simple(200, 0.4, longitud=1.2, diametro_eje=0.08,
+                                    k_cojinete=lambda w: 5e7 * (1 + w / 500))
+
+
+def test_seguimiento_coincide_con_solucion_completa(rotor):
+    velocidades = np.linspace(0, 6000, 120)
+    campbell = rotor.diagrama_campbell(velocidades, n_modos=4)
+    assert campbell['soluciones_completas'] < 5
+    lambdas, _ = rotor.valores_propios(velocidades[-1] * np.pi / 30, 4)
+    np.testing.assert_allclose(campbell['frecuencias_hz'][-1], lambdas.imag / (2*np.pi), rtol=1e-6)
+
+
+def test_efecto_giroscopico_separa_precesiones(rotor):
+    campbell = rotor.diagrama_campbell(np.linspace(0, 6000, 60), n_modos=4)
+    f = campbell['frecuencias_hz']
+    # Modo de precesión directa se rigidiza y el inverso se ablanda
+    assert f[-1, 3] > f[0, 3]
+    assert f[-1, 2] < f[0, 2]
+    assert campbell['precesion'][-1, 3] == 1
+
+
+def test_velocidad_critica_rotor_jeffcott():
+    # Cojinetes muy rígidos: primera crítica ≈ sqrt(48EI/L³/m) del eje biapoyado
+    m, L, d = 100.0, 1.0, 0.05
+    rotor = ModeloRotor.rotor_simple(m, 0.05, longitud=L, diametro_eje=d, k_cojinete=1e12)
+    campbell = rotor.diagrama_campbell(np.linspace(0, 3000, 100), n_modos=2)
+    criticas = rotor.velocidades_criticas(campbell)
+    EI = 210e9 * np.pi * d**4 / 64
+    masa_efectiva = m + 0.49 * 7850 * np.pi * d**2 / 4 * L
+    rpm_teorica = np.sqrt(48 * EI / L**3 / masa_efectiva) * 60 / (2*np.pi)
+    assert criticas[0]['velocidad_rpm'] == pytest.approx(rpm_teorica, rel=0.02)
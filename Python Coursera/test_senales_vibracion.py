@@ -0,0 +1,75 @@
+import wave
+import numpy as np
+import pytest
+from scipy import signal
+from modulos.senales_vibracion import FuenteSenal, ProcesadorVibracion, frecuencias_rodamiento
+
+FS = 10000.0
+
+
+@pytest.fixture
+def senal():
+    rng = np.random.default_rng(0)
+    t = np.arange(int(4 * FS)) / FS
+    return np.sin(2*np.pi*50*t) + 0.1 * rng.normal(size=t.size)
+
+
+def test_welch_coincide_con_scipy(senal):
+    proc = ProcesadorVibracion(FS, nperseg=2048, solape=0.5)
+    res = proc.procesar_todo(FuenteSenal.desde_arreglo(senal, FS))
+    f, psd = signal.welch(senal, FS, window='hann', nperseg=2048, noverlap=1024, detrend=False)
+    # np.hanning es la ventana simétrica; scipy usa la periódica
+    np.testing.assert_allclose(res['psd'][1:-1], psd[1:-1], rtol=0.05)
+    assert res['rms'] == pytest.approx(np.sqrt(np.mean(senal[:res['n_bloques']*1024 + 1024]**2)), rel=1e-9)
+
+
+def test_fuentes_wav_csv_y_binario_equivalentes(senal, tmp_path):
+    ruta_bin = tmp_path / 'acel.bin'
+    senal.astype('<f4').tofile(ruta_bin)
+    ruta_csv = tmp_path / 'acel.csv'
+    np.savetxt(ruta_csv, np.column_stack([np.arange(senal.size) / FS, senal]),
+               delimiter=',', header='t,acel', comments='')
+    ruta_wav = tmp_path / 'acel.wav'
+    with wave.open(str(ruta_wav), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(int(FS))
+        w.writeframes((senal / 2 * 32767).astype('<i2').tobytes())
+
+    proc = ProcesadorVibracion(FS, nperseg=1024)
+    fuentes = [FuenteSenal.desde_binario(str(ruta_bin), FS),
+               FuenteSenal.desde_csv(str(ruta_csv), FS, columna=1, filas_encabezado=1,
+                                     bytes_bloque=50000),
+               FuenteSenal.desde_wav(str(ruta_wav))]
+    rms = []
+    for fuente in fuentes:
+        res = proc.procesar_todo(fuente)
+        rms.append(res['rms'] * (2 if fuente is fuentes[2] else 1))
+        assert res['n_bloques'] == (senal.size - 1024) // 512 + 1
+    np.testing.assert_allclose(rms, rms[0], rtol=1e-3)
+
+
+def test_envolvente_detecta_falla_pista_externa():
+    rpm = 1800.0
+    ordenes = frecuencias_rodamiento(9, 7.9, 34.5)
+    bpfo = ordenes['BPFO'] * rpm / 60
+    t = np.arange(int(4 * FS)) / FS
+    impactos = (np.sin(2*np.pi*bpfo*t) > 0.95).astype(float)
+    x = (1 + 5 * impactos) * np.sin(2*np.pi*3000*t)
+
+    proc = ProcesadorVibracion(FS, nperseg=4096, rpm=rpm, frecuencias_falla=ordenes)
+    bloques = list(proc.procesar(FuenteSenal.desde_arreglo(x, FS)))
+    bandas = bloques[-1]['bandas']
+    assert bandas['BPFO'] > 10 * bandas['BPFI']
+    assert bloques[-1]['curtosis'] > 3
+
+
+def test_espectro_ordenes_con_velocidad_variable():
+    t = np.arange(int(8 * FS)) / FS
+    rpm = lambda t: 1200 + 150 * t
+    angulo = 2*np.pi * (1200 * t + 75 * t**2) / 60
+    x = np.sin(3 * angulo)
+
+    proc = ProcesadorVibracion(FS, nperseg=8192, rpm=rpm, orden_max=10)
+    res = proc.procesar_todo(FuenteSenal.desde_arreglo(x, FS))
+    assert res['ordenes'][np.argmax(res['espectro_ordenes'])] == pytest.approx(3, abs=0.1)
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+from modulos.tablas_carga import CatalogoGruas, TablaCarga, catalogo_gruas
+
+# Tabla impresa: filas = radio (m), columnas = longitud de pluma (m)
+IMPRESA = pd.DataFrame({'12': [40.0, 30.0, 22.0, np.nan],
+                        '18': [35.0, 28.0, 20.0, 12.0],
+                        '24': [np.nan, 25.0, 18.0, 11.0]}, index=[3.0, 4.0, 6.0, 9.0])
+
+
+def test_lectura_conservadora():
+    tabla = TablaCarga.desde_tabla_ancha(IMPRESA)
+    np.testing.assert_array_equal(tabla.longitudes, [12, 18, 24])
+    assert tabla.nominal == 40.0
+    # Puntos tabulados exactos
+    np.testing.assert_array_equal(tabla.capacidad(18, [3, 4, 6, 9]), [35, 28, 20, 12])
+    # Entre radios: el menor de los dos vecinos; entre plumas: la menor pluma vecina
+    assert tabla.capacidad(18, 5.0) == 20.0 and tabla.capacidad(15, 4.0) == 28.0
+    assert tabla.capacidad(20, 5.0) == 18.0
+    # Fuera de la tabla o junto a una celda no publicada: capacidad nula
+    np.testing.assert_array_equal(tabla.capacidad([18, 18, 10, 30, 15, 21], [2.9, 9.5, 4, 4, 8, 3.5]), 0.0)
+    # Nunca supera ningún punto tabulado vecino
+    rng = np.random.default_rng(1)
+    L, R = rng.uniform(12, 24, 5000), rng.uniform(3, 9, 5000)
+    c = tabla.capacidad(L, R)
+    for i, j in [(0, 0), (-1, -1)]:
+        li = np.searchsorted(tabla.longitudes, L, 'right') - 1 - i
+        rj = np.searchsorted(tabla.radios, R, 'right') - 1 - j
+        vecino = np.nan_to_num(tabla.capacidades[np.clip(li, 0, 2), np.clip(rj, 0, 3)])
+        assert np.all(c <= vecino)
+    # La forma larga da la misma rejilla
+    larga = IMPRESA.rename_axis('radio').reset_index().melt('radio', var_name='longitud_pluma',
+                                                             value_name='capacidad').dropna()
+    larga['longitud_pluma'] = larga['longitud_pluma'].astype(float)
+    np.testing.assert_array_equal(TablaCarga.desde_tabla(larga).capacidades, tabla.capacidades)
+
+
+def test_verificar_trayectoria():
+    catalogo = CatalogoGruas({('G-40', 'base'): TablaCarga.desde_tabla_ancha(IMPRESA)})
+    radios = np.array([3.0, 4.0, 5.0, 6.0, 8.0])
+    r = catalogo.verificar_trayectoria('G-40', 'base', 18, radios, 15.0, factor=1.25, deducciones=1.0)
+    np.testing.assert_allclose(r['capacidad'], np.array([35, 28, 20, 20, 12]) / 1.25)
+    np.testing.assert_allclose(r['utilizacion'], 16.0 / r['capacidad'])
+    np.testing.assert_array_equal(r['ok'], [True, True, True, True, False])
+    assert not r['apta'] and r['critico'] == 4 and r['utilizacion_maxima'] == pytest.approx(16 / 9.6)
+    # Pluma telescópica y carga variables a lo largo de la trayectoria
+    r = catalogo.verificar_trayectoria('G-40', 'base', [12, 18, 24], [3.0, 6.0, 9.0], [28.0, 15.0, 8.0])
+    assert r['apta'] and r['critico'] == 1
+    assert catalogo.verificar_trayectoria('G-40', 'base', 24, 3.0, 1.0)['utilizacion'][0] == np.inf
+
+
+def test_catalogo_incluido():
+    catalogo = catalogo_gruas()
+    assert catalogo is catalogo_gruas()
+    assert set(catalogo.gruas) >= {'TT-50', 'TT-100', 'OR-250'}
+    for (grua, configuracion), tabla in catalogo.tablas.items():
+        c = tabla.capacidades
+        # Capacidad no creciente con el radio en cada pluma publicada
+        assert np.all(np.diff(c, axis=1)[np.isfinite(np.diff(c, axis=1))] <= 0)
+        assert configuracion in catalogo.configuraciones(grua)
+    completo = catalogo.tabla('TT-50', 'contrapeso completo')
+    reducido = catalogo.tabla('TT-50', 'contrapeso reducido')
+    assert np.all(completo.capacidad(27, [6, 12, 20]) > reducido.capacidad(27, [6, 12, 20]))
+    aptas = catalogo.gruas_aptas(8.0, np.linspace(6, 24, 40), factor=1.25, altura=10.0)
+    assert len(aptas) == len(catalogo.tablas) and np.all(np.diff(aptas['utilizacion_maxima']) >= 0)
+    for fila in aptas.itertuples():
+        r = catalogo.verificar_trayectoria(fila.grua, fila.configuracion, fila.longitud_pluma,
+                                           np.linspace(6, 24, 40), 8.0, factor=1.25)
+        assert r['apta'] == fila.apta and r['utilizacion_maxima'] == pytest.approx(fila.utilizacion_maxima)
+    assert aptas['apta'].iloc[0] and not aptas['apta'].iloc[-1]
+
+
+def test_errores():
+    with pytest.raises(ValueError):
+        TablaCarga([12, 18], [3, 4, 6], np.ones((3, 2)))
+    with pytest.raises(ValueError):
+        TablaCarga([12, 12], [3], [[1.0], [2.0]])
+    with pytest.raises(ValueError):
+        TablaCarga([12], [3], [[-1.0]])
+    with pytest.raises(ValueError):
+        catalogo_gruas().capacidad('Inexistente', 'base', 20, 10)
+    with pytest.raises(ValueError):
+        catalogo_gruas().verificar_trayectoria('TT-50', 'contrapeso completo', 20, 10, 5.0, factor=0.0)
+    with pytest.raises(ValueError):
+        CatalogoGruas.desde_tabla(pd.DataFrame({'grua': ['A'], 'radio': [3.0]}))
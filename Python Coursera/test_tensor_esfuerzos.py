@@ -0,0 +1,63 @@
+import warnings
+import numpy as np
+import pytest
+from modulos.tensor_esfuerzos import (ORDEN_ABAQUS, analizar_campo, esfuerzos_principales, invariantes,
+                                      reordenar, tresca, von_mises)
+
+
+def _matrices(s):
+    T = np.zeros((len(s), 3, 3))
+    for k, (i, j) in enumerate([(0, 0), (1, 1), (2, 2), (0, 1), (1, 2), (0, 2)]):
+        T[:, i, j] = T[:, j, i] = s[:, k]
+    return T
+
+
+def test_principales_coinciden_con_eigvalsh():
+    rng = np.random.default_rng(0)
+    s = rng.normal(size=(20000, 6)) * 100
+    s[:5] = [80, 80, 80, 0, 0, 0]          # hidrostático
+    s[5:10] = [100, 20, 20, 0, 0, 0]       # dos principales iguales
+    s[10:15] = 0.0
+    principales = esfuerzos_principales(s, bloque=3000)
+    esperado = np.linalg.eigvalsh(_matrices(s))[:, ::-1]
+    np.testing.assert_allclose(principales, esperado, atol=1e-6 * 100)
+    assert np.all(np.diff(principales, axis=1) <= 0)
+    inv = invariantes(s)
+    np.testing.assert_allclose(inv['p'], esperado.mean(axis=1), atol=1e-9)
+    np.testing.assert_allclose(inv['J3'], np.prod(esperado - inv['p'][:, None], axis=1), rtol=1e-6, atol=1e-3)
+
+
+def test_criterios_de_falla_y_factores():
+    # Tracción simple, corte puro y estado biaxial
+    s = np.array([[200.0, 0, 0, 0, 0, 0],
+                  [0, 0, 0, 100.0, 0, 0],
+                  [100.0, -100.0, 0, 0, 0, 0]])
+    np.testing.assert_allclose(von_mises(s), [200.0, 100 * np.sqrt(3), 100 * np.sqrt(3)])
+    np.testing.assert_allclose(tresca(s), [200.0, 200.0, 200.0])
+    r = analizar_campo(s, Sy=400.0, Su=500.0, Suc=1000.0)
+    np.testing.assert_allclose(r['fs_von_mises'], 400 / r['von_mises'])
+    np.testing.assert_allclose(r['fs_tresca'], [2.0, 2.0, 2.0])
+    np.testing.assert_allclose(r['fs_rankine'], [2.5, 5.0, 5.0])
+    np.testing.assert_allclose(r['fs_mohr_coulomb'], [2.5, 1 / (100 / 500 + 100 / 1000), 1 / (100 / 500 + 100 / 1000)])
+    np.testing.assert_allclose(r['triaxialidad'], [1 / 3, 0.0, 0.0], atol=1e-12)
+    assert r['critico'] == {'von_mises': 0, 'tresca': 0, 'rankine': 0, 'mohr_coulomb': 0}
+    assert 'fs_rankine' not in analizar_campo(s, Sy=400.0)
+    # Sin esfuerzos el factor es infinito (sin advertencias de división por cero)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        nulo = analizar_campo(np.zeros((1, 6)), Sy=250.0, Su=500.0, Suc=1000.0)
+    assert np.isinf(nulo['fs_von_mises'][0]) and np.isinf(nulo['fs_mohr_coulomb'][0])
+
+
+def test_invariancia_ante_rotaciones_y_orden_abaqus():
+    rng = np.random.default_rng(1)
+    s = rng.normal(size=(500, 6)) * 50
+    q, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    T = q @ _matrices(s) @ q.T
+    rotado = np.stack([T[:, 0, 0], T[:, 1, 1], T[:, 2, 2], T[:, 0, 1], T[:, 1, 2], T[:, 0, 2]], axis=1)
+    np.testing.assert_allclose(esfuerzos_principales(rotado), esfuerzos_principales(s), atol=1e-8)
+    np.testing.assert_allclose(von_mises(rotado), von_mises(s), rtol=1e-12)
+    abaqus = s[:, list(ORDEN_ABAQUS)]
+    np.testing.assert_array_equal(reordenar(abaqus), s)
+    with pytest.raises(ValueError):
+        von_mises(np.zeros((3, 5)))